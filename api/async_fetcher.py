@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+
+try:
+    import aiohttp
+except ImportError:  # Only the scraper's fetch stage needs it
+    aiohttp = None
+
+from directionalscalper.core.utils import loads_json
+from rate_limit import RateLimiter
+
+log = logging.getLogger(__name__)
+
+# Public REST budget per exchange in weight per second, below the per-IP limits:
+# Bybit counts requests (600 per 5 s), Binance counts request weight (2400 per minute)
+PUBLIC_RATE_LIMITS = {
+    "bybit": {"rate": 100, "burst": 100},
+    "binance": {"rate": 35, "burst": 200},
+}
+BINANCE_WEIGHT_LIMIT = 2400
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_public_limiter(exchange_name: str) -> RateLimiter:
+    """Process-wide limiter for an exchange's public endpoints, kept across scraper cycles."""
+    with _limiters_lock:
+        if exchange_name not in _limiters:
+            _limiters[exchange_name] = RateLimiter(groups={exchange_name: PUBLIC_RATE_LIMITS[exchange_name]})
+        return _limiters[exchange_name]
+
+
+class AsyncMarketFetcher:
+    """
+    Downloads the scraper's market data for a whole symbol universe on one event loop.
+
+    Requests are built and parsed by the exchange adapter, so the results are the same
+    as its blocking ``get_futures_kline``. At most
+    ``concurrency`` requests are in flight, and each takes its weight from the
+    exchange's public limiter first. The limiter also follows the quota the exchange
+    reports back (Bybit ``X-Bapi-Limit-Status``, Binance ``X-MBX-USED-WEIGHT-1M``).
+    """
+
+    def __init__(self, exchange, concurrency: int = 32, max_retries: int = 5, timeout: float = 30, limiter: RateLimiter | None = None):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp is not available, install it to use the scraper's fetch stage")
+        self.exchange = exchange
+        self.group = exchange.exchange
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.limiter = limiter or get_public_limiter(self.group)
+        self.requests = 0
+        self.failures = 0
+
+    def quota_endpoint(self, url_path: str) -> str:
+        # Binance weight is one budget per IP, Bybit reports a quota per endpoint
+        return "weight" if self.group == "binance" else url_path
+
+    def update_quota(self, url_path: str, headers):
+        if self.group == "binance":
+            used = headers.get("X-MBX-USED-WEIGHT-1M")
+            if used is not None:
+                self.limiter.update_quota(
+                    "weight",
+                    BINANCE_WEIGHT_LIMIT - int(used),
+                    BINANCE_WEIGHT_LIMIT,
+                    (time.time() // 60 + 1) * 60,
+                )
+        else:
+            self.limiter.update_quota_from_headers(url_path, headers)
+
+    async def get(self, session, semaphore, url_path: str, params: dict, weight: int = 1):
+        """Decoded JSON of a public GET, None when every attempt failed."""
+        url = f"{self.exchange.futures_api_url}{url_path}"
+        for attempt in range(self.max_retries):
+            await self.limiter.acquire_async(self.group, weight, endpoint=self.quota_endpoint(url_path))
+            try:
+                async with semaphore:
+                    async with session.get(url, params=params) as response:
+                        self.requests += 1
+                        self.update_quota(url_path, response.headers)
+                        body = await response.read()
+                        if response.status == 200:
+                            return loads_json(body)
+                        log.warning(f"HTTP {response.status} from {url} {params}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.warning(f"Request to {url} {params} failed: {e}")
+            except ValueError as e:  # json and orjson decode errors
+                log.warning(f"JSON decode error at {url}: {e}")
+            await asyncio.sleep(min(0.5 * 2 ** attempt + random.uniform(0, 0.5), 10))
+        self.failures += 1
+        log.error(f"All retries failed for {url} {params}")
+        return None
+
+    async def fetch_klines(self, session, semaphore, symbol: str, interval: str, limit: int, transform=None):
+        url_path, params = self.exchange.futures_kline_request(symbol, interval, limit)
+        raw_json = await self.get(session, semaphore, url_path, params, self.exchange.kline_weight(limit))
+        if raw_json is None:
+            return None
+        candles = self.exchange.parse_futures_kline(raw_json)
+        return transform(candles) if transform is not None and candles else candles
+
+    async def fetch_universe(self, symbols: list, series: dict, transform=None) -> dict:
+        """
+        Klines of every ``series`` ({interval: limit}) for every symbol. ``transform`` is
+        applied to each series as it arrives (e.g. to turn the candles into a DataFrame).
+
+        Returns {symbol: {interval: candles}}. A symbol is left out when one of its series
+        could not be fetched.
+        """
+        requests = {(symbol, interval): limit for symbol in symbols for interval, limit in series.items()}
+        candles = await self.fetch_requests(requests, transform)
+
+        klines = {}
+        failed = {symbol for symbol, interval in requests if (symbol, interval) not in candles}
+        for (symbol, interval), rows in candles.items():
+            if symbol not in failed:
+                klines.setdefault(symbol, {})[interval] = rows
+        return klines
+
+    async def fetch_requests(self, requests: dict, transform=None) -> dict:
+        """
+        Klines for each {(symbol, interval): limit} of ``requests``, each with its own limit.
+
+        Returns {(symbol, interval): candles} without the requests that failed or came
+        back empty.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            kline_jobs = [
+                (key, self.fetch_klines(session, semaphore, key[0], key[1], limit, transform))
+                for key, limit in requests.items()
+            ]
+            results = await asyncio.gather(*(job for _, job in kline_jobs))
+
+        return {
+            key: rows
+            for (key, _), rows in zip(kline_jobs, results)
+            if rows is not None and len(rows) > 0
+        }
+
+    def fetch(self, symbols: list, series: dict, transform=None) -> dict:
+        """``fetch_universe`` for synchronous callers, on a fresh event loop."""
+        return asyncio.run(self.fetch_universe(symbols, series, transform))
+
+    def fetch_many(self, requests: dict, transform=None) -> dict:
+        """``fetch_requests`` for synchronous callers, on a fresh event loop."""
+        return asyncio.run(self.fetch_requests(requests, transform))
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+
+from api.snapshot import VIEWS, select_records, view_for, write_snapshot
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="EmbeddedScraper", filename="EmbeddedScraper.log", stream=True)
+
+# Same universe as the hosted scraper (api/multiprocessing_api.py)
+DEFAULT_FILTERS = {"quote_symbols": ["USDT"], "top_volume": 400}
+
+
+def run_embedded_scraper(exchange_name: str, connection, refresh_seconds: float, filters: dict):
+    """Side process: run the CombinedScraper pipeline and send a columnar snapshot per pass."""
+    # Imported here so only the side process loads the scraper stack (pandas, ta, the Pool)
+    from api.multiprocessing_api import IncrementalScraper
+
+    logging.info(f"Embedded scraper for {exchange_name} started (pid {os.getpid()}), refreshing every {refresh_seconds}s")
+    scraper = None
+    while True:
+        started_at = time.time()
+        try:
+            if scraper is None:
+                scraper = IncrementalScraper(exchange_name=exchange_name, filters=filters)
+            df = scraper.analyse_all_symbols()
+            connection.send({
+                "columns": {column: df[column].tolist() for column in df.columns},
+                "generated_at": time.time(),
+            })
+            logging.info(f"Published {len(df)} assets in {time.time() - started_at:.1f}s")
+        except (BrokenPipeError, EOFError):
+            logging.info("Manager connection closed, stopping the embedded scraper")
+            return
+        except Exception as e:
+            logging.error(f"Exception caught in embedded scraper pass: {e}")
+        time.sleep(max(0.0, refresh_seconds - (time.time() - started_at)))
+
+
+def columns_to_records(columns: dict) -> list:
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*(columns[name] for name in names))]
+
+
+class EmbeddedDataSource:
+    """
+    Runs the scraper pipeline in a side process and receives its snapshots over a pipe.
+
+    Each snapshot is turned into the views of ``api.snapshot.VIEWS`` the Manager
+    reads (all assets, the rotator cut and its bullish and bearish halves, ...) and
+    published by swapping one dict, so readers always see a complete snapshot.
+
+    With ``snapshot_path`` each snapshot is also written there as an Arrow snapshot,
+    so other processes (the workers of a supervised bot) read this scraper's data in
+    'snapshot' mode instead of running their own.
+    """
+
+    def __init__(self, exchange_name: str, refresh_seconds: float = 10, filters: dict | None = None, snapshot_path=None):
+        self.exchange_name = exchange_name
+        self.refresh_seconds = refresh_seconds
+        self.filters = filters or DEFAULT_FILTERS
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.datasets = {}
+        self.generated_at = None
+        self.ready = threading.Event()
+        self.process = None
+        self.receiver = None
+
+    def start(self):
+        # Spawned and not daemonic: the scraper runs its own process Pool
+        context = multiprocessing.get_context("spawn")
+        self.receiver, sender = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=run_embedded_scraper,
+            args=(self.exchange_name, sender, self.refresh_seconds, self.filters),
+            name=f"EmbeddedScraper-{self.exchange_name}",
+        )
+        self.process.start()
+        sender.close()
+        threading.Thread(target=self._receive_loop, name="EmbeddedReceiver", daemon=True).start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5)
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        return self.ready.wait(timeout)
+
+    def _receive_loop(self):
+        while True:
+            try:
+                snapshot = self.receiver.recv()
+            except (EOFError, OSError):
+                logging.error(f"Embedded scraper for {self.exchange_name} exited")
+                return
+            try:
+                self.publish(snapshot)
+            except Exception as e:
+                logging.error(f"Exception caught publishing embedded snapshot: {e}")
+
+    def publish(self, snapshot: dict):
+        assets = columns_to_records(snapshot["columns"])
+        self.datasets = {view: select_records(assets, view) for view in VIEWS}
+        self.generated_at = snapshot["generated_at"]
+        if self.snapshot_path is not None:
+            self.share(snapshot)
+        self.ready.set()
+
+    def share(self, snapshot: dict):
+        # Imported here like the scraper stack, pandas is only needed to share the snapshot
+        import pandas as pd
+
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        write_snapshot(pd.DataFrame(snapshot["columns"]), self.snapshot_path, {"generated_at": snapshot["generated_at"]})
+
+    def dataset_for(self, url: str):
+        """Dataset standing in for a volumedata URL, None when the scraper does not produce it."""
+        view = view_for(url)
+        if view is None:
+            return None
+        return self.datasets.get(view, [])
+
+    def age(self):
+        if self.generated_at is None:
+            return None
+        return time.time() - self.generated_at
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import logging
 
-from directionalscalper.api.exchanges.exchange import Exchange
-from directionalscalper.api.exchanges.utils import Intervals
+from api.exchanges.exchange import Exchange
+from api.exchanges.utils import Intervals
 from directionalscalper.core.utils import send_public_request, send_signed_request
 
 log = logging.getLogger(__name__)
@@ -18,6 +18,7 @@ class Binance(Exchange):
     exchange = "binance"
     futures_api_url = "https://fapi.binance.com"
     max_weight = 1000
+    kline_includes_open_candle = True
 
     def get_futures_symbols(self) -> dict:
         self.check_weight()
@@ -199,6 +200,33 @@ class Binance(Exchange):
                 volumes[pair["symbol"]] = float(pair["volume"])
         return volumes
 
+    def get_futures_tickers(self) -> dict:
+        # Price and 24h volume from the 24h tickers, funding from the premium index, each one call for every symbol
+        self.check_weight()
+        header, tickers_json = send_public_request(
+            url=self.futures_api_url,
+            url_path="/fapi/v1/ticker/24hr",
+            payload={},
+        )
+        self.check_weight()
+        header, premium_json = send_public_request(
+            url=self.futures_api_url,
+            url_path="/fapi/v1/premiumIndex",
+            payload={},
+        )
+        premium = {entry["symbol"]: entry for entry in premium_json} if isinstance(premium_json, list) else {}
+        tickers = {}
+        if isinstance(tickers_json, list):
+            for pair in tickers_json:
+                index = premium.get(pair["symbol"], {})
+                tickers[pair["symbol"]] = {
+                    "price": float(pair["lastPrice"]),
+                    "volume": float(pair["volume"]),
+                    "funding_rate": float(index["lastFundingRate"]) if index.get("lastFundingRate") else None,
+                    "next_funding_time": int(index["nextFundingTime"]) if index.get("nextFundingTime") else None,
+                }
+        return tickers
+
     def get_futures_kline(
         self,
         symbol: str,
@@ -206,14 +234,28 @@ class Binance(Exchange):
         limit: int = 200,
     ) -> list:
         self.check_weight()
-
-        params = {"symbol": symbol, "limit": limit, "interval": interval}
+        url_path, params = self.futures_kline_request(symbol, interval, limit)
         header, raw_json = send_public_request(
             url=self.futures_api_url,
-            url_path="/fapi/v1/klines",
+            url_path=url_path,
             payload=params,
         )
+        return self.parse_futures_kline(raw_json)
+
+    def futures_kline_request(self, symbol: str, interval: Intervals, limit: int) -> tuple:
+        return "/fapi/v1/klines", {"symbol": symbol, "limit": limit, "interval": interval}
+
+    def kline_weight(self, limit: int) -> int:
+        # /fapi/v1/klines request weight by limit
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
 
+    def parse_futures_kline(self, raw_json: list) -> list:
         if len(raw_json) > 0:
             return [
                 {
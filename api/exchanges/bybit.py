@@ -4,8 +4,8 @@ import logging
 import time
 from datetime import datetime
 
-from directionalscalper.api.exchanges.exchange import Exchange
-from directionalscalper.api.exchanges.utils import Intervals
+from api.exchanges.exchange import Exchange
+from api.exchanges.utils import Intervals
 from directionalscalper.core.utils import send_public_request
 
 log = logging.getLogger(__name__)
@@ -87,6 +87,26 @@ class Bybit(Exchange):
                     volumes[pair["symbol"]] = float(pair["volume24h"])
         return volumes
 
+    def get_futures_tickers(self) -> dict:
+        # One /v5/market/tickers call carries price, 24h volume and funding of every linear symbol
+        self.check_weight()
+        params = {"category": "linear"}
+        header, raw_json = send_public_request(
+            url=self.futures_api_url, url_path="/v5/market/tickers", payload=params
+        )
+        tickers = {}
+        if "result" in [*raw_json]:
+            if "list" in [*raw_json["result"]]:
+                for pair in raw_json["result"]["list"]:
+                    tickers[pair["symbol"]] = {
+                        "price": float(pair["lastPrice"]),
+                        "volume": float(pair["volume24h"]),
+                        # Empty for dated futures, which have no funding
+                        "funding_rate": float(pair["fundingRate"]) if pair.get("fundingRate") else None,
+                        "next_funding_time": int(pair["nextFundingTime"]) if pair.get("nextFundingTime") else None,
+                    }
+        return tickers
+
     def get_futures_kline(
         self,
         symbol: str,
@@ -94,6 +114,13 @@ class Bybit(Exchange):
         limit: int = 200,
     ) -> list:
         self.check_weight()
+        url_path, params = self.futures_kline_request(symbol, interval, limit)
+        header, raw_json = send_public_request(
+            url=self.futures_api_url, url_path=url_path, payload=params
+        )
+        return self.parse_futures_kline(raw_json)
+
+    def futures_kline_request(self, symbol: str, interval: Intervals, limit: int) -> tuple:
         custom_intervals = {
             "1m": 1,
             "5m": 5,
@@ -111,10 +138,9 @@ class Bybit(Exchange):
             "limit": limit + 1,
             "interval": custom_intervals[interval],
         }
-        header, raw_json = send_public_request(
-            url=self.futures_api_url, url_path="/v5/market/kline", payload=params
-        )
+        return "/v5/market/kline", params
 
+    def parse_futures_kline(self, raw_json: dict) -> list:
         if "result" in [*raw_json]:
             if "list" in [*raw_json["result"]]:
                 if len(raw_json["result"]["list"]) > 1:  # Ensuring there's more than one candlestick
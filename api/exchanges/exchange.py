@@ -4,7 +4,7 @@ import logging
 import time
 from multiprocessing import Lock
 
-from directionalscalper.api.exchanges.utils import Intervals
+from api.exchanges.utils import Intervals
 
 log = logging.getLogger(__name__)
 
@@ -14,6 +14,7 @@ class Exchange:
     futures_api_url: str | None = None
     weight: int = 0
     max_weight: int = 100
+    kline_includes_open_candle: bool = False  # Whether get_futures_kline ends with the forming candle
 
     def __init__(self):
         # If there was any other initialization logic, it would go here.
@@ -55,6 +56,10 @@ class Exchange:
     def get_futures_volumes(self) -> dict:
         return {}
 
+    def get_futures_tickers(self) -> dict:
+        """{symbol: {"price", "volume", "funding_rate", "next_funding_time"}} for every symbol in one snapshot."""
+        return {}
+
     def get_futures_kline(
         self,
         symbol: str,
@@ -63,6 +68,16 @@ class Exchange:
     ) -> list:
         return []
 
+    def futures_kline_request(self, symbol: str, interval: Intervals, limit: int) -> tuple:
+        """URL path and query of a kline request, so other clients can send it."""
+        raise NotImplementedError
+
+    def parse_futures_kline(self, raw_json) -> list:
+        return []
+
+    def kline_weight(self, limit: int) -> int:
+        return 1
+
     def get_funding_rate(self, symbol) -> float:
         return 0.0
 
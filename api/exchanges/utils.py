@@ -4,6 +4,8 @@ from enum import Enum
 
 import requests  # type: ignore
 
+from directionalscalper.core.utils import HTTPSessionPool, loads_json
+
 log = logging.getLogger(__name__)
 
 
@@ -25,9 +27,9 @@ class Intervals(str, Enum):
 def get_api_data(url: str, endpoint: str):
     response_json = {}
     try:
-        response = requests.get(f"{url}{endpoint}")
+        response = HTTPSessionPool.get_instance().request("GET", f"{url}{endpoint}")
         response.raise_for_status()  # Raise an exception if an HTTP error occurs
-        response_json = response.json()
+        response_json = loads_json(response.content)
     except (requests.exceptions.HTTPError, json.JSONDecodeError) as e:
         log.warning(f"{e}")
     return response_json
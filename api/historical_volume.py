@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from api.async_fetcher import AsyncMarketFetcher
+from api.kline_buffers import KlineBuffers
+
+log = logging.getLogger(__name__)
+
+
+class HistoricalVolumeCollector:
+    """
+    Volumes of the last ``bars`` ``interval`` klines of every symbol, as written to
+    total_historical_volume_*.json.
+
+    Requests go through an AsyncMarketFetcher, so at most ``concurrency`` are in flight
+    and each takes its weight from the exchange's public limiter, the budget the
+    scraper's fetch stage also draws from. The klines are kept in KlineBuffers between
+    collections: after the first one only the bars closed since are requested, which
+    for hourly bars on Bybit is one request per symbol an hour.
+    """
+
+    def __init__(self, exchange, interval: str = "1h", bars: int = 24, concurrency: int = 16, max_retries: int = 5):
+        self.exchange = exchange
+        self.interval = interval
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.klines = KlineBuffers(exchange, {interval: bars})
+
+    def collect(self, symbols: list) -> dict:
+        """{symbol: (symbol, volumes)}, oldest first, without the symbols whose klines could not be fetched."""
+        started_at = time.time()
+        fetcher = AsyncMarketFetcher(self.exchange, concurrency=self.concurrency, max_retries=self.max_retries)
+        current, series = self.klines.update(fetcher, symbols, int(started_at * 1000))
+        self.klines.prune(symbols)
+        log.info(f"Historical volume of {len(current)}/{len(symbols)} symbols, {series} updated with "
+                 f"{fetcher.requests} requests in {time.time() - started_at:.1f}s")
+        return {symbol: (symbol, self.klines.column(symbol, self.interval, "volume")) for symbol in current}
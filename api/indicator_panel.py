@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+CANDLE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def rolling(values: np.ndarray, window: int, reducer) -> np.ndarray:
+    """Trailing ``window`` reduction along the bars axis, NaN for the first window - 1 bars like pandas."""
+    out = np.full(values.shape, np.nan)
+    if values.shape[1] >= window:
+        out[:, window - 1:] = reducer(sliding_window_view(values, window, axis=1), axis=-1)
+    return out
+
+
+def ewm_mean(values: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+    """
+    pandas ``ewm(alpha=alpha, adjust=False).mean()`` for every row. Leading NaNs are
+    skipped, each row starts at its first value like pandas does.
+    """
+    out = np.full(values.shape, np.nan)
+    state = np.full(values.shape[0], np.nan)
+    seen = np.zeros(values.shape[0], dtype=int)
+    for bar in range(values.shape[1]):
+        column = values[:, bar]
+        valid = ~np.isnan(column)
+        state = np.where(valid, np.where(np.isnan(state), column, (1 - alpha) * state + alpha * column), state)
+        seen += valid
+        out[:, bar] = np.where(seen >= max(min_periods, 1), state, np.nan)
+    return out
+
+
+class CandlePanel:
+    """Candles of many symbols as (symbols x bars) arrays, every row on the same bar timestamps."""
+
+    def __init__(self, timestamps: np.ndarray, open, high, low, close, volume):
+        self.timestamps = timestamps
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_frames(cls, frames: list) -> "CandlePanel":
+        """Stack same-length candle frames by position, on the timestamps of the first one."""
+        fields = {field: np.stack([frame[field].to_numpy(dtype=float) for frame in frames]) for field in CANDLE_FIELDS}
+        return cls(frames[0]["timestamp"].to_numpy(), **fields)
+
+    def tail(self, bars: int) -> "CandlePanel":
+        return CandlePanel(self.timestamps[-bars:], *(getattr(self, field)[:, -bars:] for field in CANDLE_FIELDS))
+
+    def resample(self, minutes: int, include_open_candle: bool = False) -> "CandlePanel":
+        """Same buckets as CombinedScraper.resample_candles, for every row at once."""
+        bucket_ms = minutes * 60000
+        buckets = self.timestamps // bucket_ms * bucket_ms
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(buckets)]
+        keep = (ends - starts) == minutes
+        if include_open_candle and len(keep) > 0:
+            keep[-1] = True
+        return CandlePanel(
+            buckets[starts][keep],
+            self.open[:, starts][:, keep],
+            np.maximum.reduceat(self.high, starts, axis=1)[:, keep],
+            np.minimum.reduceat(self.low, starts, axis=1)[:, keep],
+            self.close[:, ends - 1][:, keep],
+            np.add.reduceat(self.volume, starts, axis=1)[:, keep],
+        )
+
+
+def spread_pct(panel: CandlePanel, bars: int) -> np.ndarray:
+    """CombinedScraper.get_spread over the last ``bars`` candles."""
+    highest_high = panel.high[:, -bars:].max(axis=1)
+    lowest_low = panel.low[:, -bars:].min(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(highest_high > 0, (highest_high - lowest_low) / highest_high * 100, 0.0)
+
+
+def sma_trend_pct(close: np.ndarray, window: int) -> np.ndarray:
+    """CombinedScraper.get_sma: last close vs its ``window`` SMA, in percent."""
+    sma = close[:, -window:].mean(axis=1)
+    return (close[:, -1] - sma) / close[:, -1] * 100
+
+
+def hma_trend_pct(close: np.ndarray, window: int) -> np.ndarray:
+    """CombinedScraper.get_hma: last close vs compute_hma, in percent."""
+    series2 = 2 * rolling(close, int(window / 2), np.mean) - rolling(close, window, np.mean)
+    hma = rolling(series2, int(np.sqrt(window)), np.mean)[:, -1]
+    return (close[:, -1] - hma) / close[:, -1] * 100
+
+
+def rsi(close: np.ndarray, window: int = 14) -> np.ndarray:
+    """ta.momentum.rsi for every row."""
+    diff = np.diff(close, axis=1, prepend=np.nan)
+    up = np.where(diff > 0, diff, 0.0)
+    down = np.where(diff < 0, -diff, 0.0)
+    emaup = ewm_mean(up, 1 / window, min_periods=window)
+    emadn = ewm_mean(down, 1 / window, min_periods=window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(emadn == 0, 100, 100 - (100 / (1 + emaup / emadn)))
+
+
+def mfi(panel: CandlePanel, window: int = 14) -> np.ndarray:
+    """ta.volume.MFIIndicator(...).money_flow_index() for every row."""
+    typical_price = (panel.high + panel.low + panel.close) / 3.0
+    previous = np.concatenate([np.full((typical_price.shape[0], 1), np.nan), typical_price[:, :-1]], axis=1)
+    up_down = np.where(typical_price > previous, 1, np.where(typical_price < previous, -1, 0))
+    mfr = typical_price * panel.volume * up_down
+    positive = rolling(np.where(mfr >= 0.0, mfr, 0.0), window, np.sum)
+    negative = np.abs(rolling(np.where(mfr < 0.0, mfr, 0.0), window, np.sum))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + positive / negative))
+
+
+def mfi_signal(panel: CandlePanel, lookback: int = 30) -> np.ndarray:
+    """CombinedScraper.get_mfi: the latest MFI/RSI extreme in the last ``lookback`` bars."""
+    money_flow = mfi(panel)
+    strength = rsi(panel.close)
+    rising = panel.open < panel.close
+    with np.errstate(invalid="ignore"):
+        buy = (money_flow < 30) & (strength < 40) & rising
+        sell = (money_flow > 80) & (strength > 70) & ~rising
+    buy, sell = buy[:, -lookback:], sell[:, -lookback:]
+    signal = buy | sell
+    # Index of the most recent bar with a signal, counted from the end
+    latest = np.argmax(signal[:, ::-1], axis=1)
+    rows = np.arange(signal.shape[0])
+    latest_buy = buy[rows, signal.shape[1] - 1 - latest]
+    return np.where(~signal.any(axis=1), "neutral", np.where(latest_buy, "long", "short"))
+
+
+def eri(panel: CandlePanel, len_slow_ma: int = 64, len_power_ema: int = 13) -> tuple:
+    """CombinedScraper.calculate_advanced_eri: (trend, bull power, bear power) for every row."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwma = rolling(panel.close * panel.volume, len_slow_ma, np.sum) / rolling(panel.volume, len_slow_ma, np.sum)
+    slow_vwma_ema = ewm_mean(vwma, 2 / (len_slow_ma + 1))
+    bull_power = ewm_mean(panel.high - slow_vwma_ema, 2 / (len_power_ema + 1))[:, -1]
+    bear_power = ewm_mean(panel.low - slow_vwma_ema, 2 / (len_power_ema + 1))[:, -1]
+    trend = np.where(panel.close[:, -1] > slow_vwma_ema[:, -1], "bullish", "bearish")
+    return trend, bull_power, bear_power
+
+
+def top_bottom_signals(panel: CandlePanel, pd_tb: int = 22, ph_tb: float = 0.90, pl_tb: float = 1.10) -> tuple:
+    """CombinedScraper.detect_top_bottom_signals_*: Williams' Vix Fix (top, bottom) on the last bar."""
+    highest_close = rolling(panel.close, pd_tb, np.max)
+    wvf = (highest_close - panel.low) / highest_close * 100
+    range_high = rolling(wvf, pd_tb, np.max)[:, -1] * ph_tb
+    range_low = rolling(wvf, pd_tb, np.min)[:, -1] * pl_tb
+    with np.errstate(invalid="ignore"):
+        return wvf[:, -1] >= range_high, wvf[:, -1] <= range_low
+
+
+class IndicatorPanel:
+    """
+    The analyse_symbol columns for a whole universe in one vectorised pass.
+
+    The 1m candles of every symbol are stacked into one (symbols x bars) panel on a
+    shared timestamp grid, so the 5m, 30m and 1h views are resampled once for all of
+    them. ``split`` leaves out the symbols whose series do not fit the panel (short
+    history, gaps, a stale last bar) so they can go through analyse_symbol instead.
+    """
+
+    def __init__(self, series: dict, resampled_minutes: dict, include_open_candle: bool = False):
+        self.series = series  # {interval: bars} of the fetched base series
+        self.resampled_minutes = resampled_minutes
+        self.include_open_candle = include_open_candle
+
+    def split(self, frames: dict) -> tuple:
+        """(symbols for the panel, the others), by the shape and timestamps of their series."""
+        bars_1m = self.series["1m"]
+        full = [
+            symbol for symbol, series in frames.items()
+            if all(len(series[interval]) == bars for interval, bars in self.series.items())
+        ]
+        if not full:
+            return [], list(frames)
+        last_bars = pd.Series([frames[symbol]["1m"]["timestamp"].iat[-1] for symbol in full])
+        grid = last_bars.mode().iat[0] - 60000 * np.arange(bars_1m - 1, -1, -1)
+        aligned = [symbol for symbol in full if np.array_equal(frames[symbol]["1m"]["timestamp"].to_numpy(), grid)]
+        aligned_set = set(aligned)
+        return aligned, [symbol for symbol in frames if symbol not in aligned_set]
+
+    # Output volume columns and the view whose last bar they price
+    VOLUME_COLUMNS = {
+        "1m 1x Volume (USDT)": "1m",
+        "5m 1x Volume (USDT)": "5m",
+        "30m 1x Volume (USDT)": "30m",
+        "1h 1x Volume (USDT)": "1h",
+    }
+
+    def analyse(self, symbols: list, frames: dict, prices: dict, min_qtys: dict, funding: dict, timestamp: str) -> pd.DataFrame:
+        """One row per symbol with the same columns and values as analyse_symbol."""
+        return self.with_market(self.candle_columns(symbols, frames), prices, min_qtys, funding, timestamp)
+
+    def candle_columns(self, symbols: list, frames: dict) -> pd.DataFrame:
+        """
+        The columns that only depend on the candles, indexed by symbol. The volume
+        columns hold the last bar's base volume until ``with_market`` prices them, so the
+        rows stay valid until a symbol gets a new candle.
+        """
+        panel_1m = CandlePanel.from_frames([frames[symbol]["1m"] for symbol in symbols])
+        views = {
+            interval: panel_1m.resample(minutes, self.include_open_candle)
+            for interval, minutes in self.resampled_minutes.items()
+        }
+        views["1m"] = panel_1m
+        panel_15m = CandlePanel.from_frames([frames[symbol]["15m"] for symbol in symbols])
+
+        columns = {name: views[interval].volume[:, -1] for name, interval in self.VOLUME_COLUMNS.items()}
+        # Python's round, like analyse_symbol, so values match to the last digit
+        for name, bars in (("1m Spread", 1), ("5m Spread", 5), ("30m Spread", 30), ("1h Spread", 60), ("4h Spread", 240)):
+            columns[name] = [round(value, 4) for value in spread_pct(panel_1m, bars).tolist()]
+
+        trend_pct = [round(value, 4) for value in sma_trend_pct(panel_1m.close[:, -30:], 14).tolist()]
+        hma_pct = [round(value, 4) for value in hma_trend_pct(panel_1m.close[:, -30:], 14).tolist()]
+        columns["trend%"] = trend_pct
+        columns["Trend"] = ["short" if value > 0 else "long" for value in trend_pct]
+        columns["HMA Trend"] = ["short" if value > 0 else "long" for value in hma_pct]
+
+        columns["5m MA6 high"] = views["5m"].high[:, -6:].mean(axis=1)
+        columns["5m MA6 low"] = views["5m"].low[:, -6:].mean(axis=1)
+        columns["MFI"] = mfi_signal(panel_1m.tail(200), lookback=30)
+
+        trend, bull_power, bear_power = eri(panel_15m)
+        columns["ERI Bull Power"] = bull_power
+        columns["ERI Bear Power"] = bear_power
+        columns["ERI Trend"] = trend
+
+        columns["Top Signal 5m"], columns["Bottom Signal 5m"] = top_bottom_signals(views["5m"].tail(240))
+        columns["Top Signal 1m"], columns["Bottom Signal 1m"] = top_bottom_signals(panel_1m.tail(240))
+        return pd.DataFrame(columns, index=pd.Index(symbols, name="Asset"))
+
+    def with_market(self, candle_columns: pd.DataFrame, prices: dict, min_qtys: dict, funding: dict, timestamp: str) -> pd.DataFrame:
+        """``candle_columns`` rows completed with this cycle's prices, minimum quantities and funding."""
+        symbols = candle_columns.index.tolist()
+        price = np.array([prices[symbol] for symbol in symbols], dtype=float)
+        df = candle_columns.reset_index()
+        df.insert(1, "Min qty", [min_qtys[symbol] for symbol in symbols])
+        df.insert(2, "Price", [prices[symbol] for symbol in symbols])
+        for name in self.VOLUME_COLUMNS:
+            df[name] = [round(value) for value in (price * df[name].to_numpy(dtype=float)).tolist()]
+        df["Funding"] = [funding[symbol] for symbol in symbols]
+        df["Timestamp"] = timestamp
+        return df
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+
+from directionalscalper.core.exchanges.candle_store import TIMEFRAME_MS, CandleBuffer
+
+log = logging.getLogger(__name__)
+
+CANDLE_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+def candle_rows(candles: list) -> list:
+    """Parsed klines as CandleBuffer rows."""
+    return [[candle[column] for column in CANDLE_COLUMNS] for candle in candles]
+
+
+class KlineBuffers:
+    """
+    The last ``bars`` klines of each (symbol, interval) of ``series`` ({interval: bars}),
+    kept current across cycles with as few requests as possible.
+
+    Each series lives in a CandleBuffer. ``update`` only asks for the bars closed since
+    the newest one held, with one bar of overlap (the forming candle again where the
+    exchange returns it), and skips a series with nothing new. A series without enough
+    history, or behind by a whole window, is fetched in full; one that comes back with
+    a gap is refetched in full in the same update. ``revision`` changes whenever a
+    series does, so results computed from it can be cached against it.
+    """
+
+    def __init__(self, exchange, series: dict):
+        self.exchange = exchange
+        self.series = series
+        self.buffers = {}  # {(symbol, interval): CandleBuffer}
+        self.revisions = {}  # {(symbol, interval): updates applied to the buffer}
+
+    def missing_bars(self, symbol: str, interval: str, now_ms: int) -> int:
+        """Bars to request for a series, 0 when nothing is new."""
+        limit = self.series[interval]
+        buffer = self.buffers.get((symbol, interval))
+        if buffer is None or buffer.size < limit:
+            return limit
+        step = TIMEFRAME_MS[interval]
+        newest = now_ms // step * step
+        if not self.exchange.kline_includes_open_candle:
+            newest -= step  # Only closed candles are returned
+        missing = int((newest - buffer.last_timestamp) // step)
+        if missing <= 0 and not self.exchange.kline_includes_open_candle:
+            return 0
+        return limit if missing >= limit else max(missing, 0) + 1
+
+    def apply(self, key: tuple, rows: list, full: bool) -> bool:
+        """Merge fetched rows into a buffer. False when they leave a gap after the newest bar held."""
+        buffer = self.buffers.get(key)
+        if full or buffer is None:
+            buffer = self.buffers[key] = CandleBuffer(self.series[key[1]])
+        elif rows[0][0] > buffer.last_timestamp + TIMEFRAME_MS[key[1]]:
+            return False
+        buffer.extend(rows)
+        self.revisions[key] = self.revisions.get(key, 0) + 1
+        return True
+
+    def update(self, fetcher, symbols: list, now_ms: int) -> tuple:
+        """
+        Bring the series of ``symbols`` up to date with an AsyncMarketFetcher. Returns
+        (symbols whose series are all current, series requested).
+        """
+        requests = {}
+        for symbol in symbols:
+            for interval in self.series:
+                bars = self.missing_bars(symbol, interval, now_ms)
+                if bars:
+                    requests[(symbol, interval)] = bars
+
+        candles = fetcher.fetch_many(requests, transform=candle_rows)
+        failed = {key[0] for key in requests if key not in candles}
+        refetch = {}
+        for key, rows in candles.items():
+            if not self.apply(key, rows, full=requests[key] == self.series[key[1]]):
+                refetch[key] = self.series[key[1]]
+        if refetch:
+            log.info(f"Refetching {len(refetch)} series with a gap")
+            candles = fetcher.fetch_many(refetch, transform=candle_rows)
+            for key in refetch:
+                if key in candles:
+                    self.apply(key, candles[key], full=True)
+                else:
+                    failed.add(key[0])
+
+        current = [
+            symbol for symbol in symbols
+            if symbol not in failed and all((symbol, interval) in self.buffers for interval in self.series)
+        ]
+        return current, len(requests)
+
+    def prune(self, symbols):
+        """Drop the series of symbols that are not in ``symbols`` any more."""
+        keep = set(symbols)
+        for key in [key for key in self.buffers if key[0] not in keep]:
+            del self.buffers[key]
+            self.revisions.pop(key, None)
+
+    def frame(self, symbol: str, interval: str) -> pd.DataFrame:
+        """A series as the DataFrame a kline request would give, oldest first."""
+        frame = pd.DataFrame(self.buffers[(symbol, interval)].view(), columns=CANDLE_COLUMNS)
+        frame["timestamp"] = frame["timestamp"].astype("int64")
+        return frame
+
+    def column(self, symbol: str, interval: str, column: str) -> list:
+        return self.buffers[(symbol, interval)].view()[:, CANDLE_COLUMNS.index(column)].tolist()
+
+    def revision(self, symbol: str) -> tuple:
+        return tuple(self.revisions[(symbol, interval)] for interval in self.series)
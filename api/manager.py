@@ -1,5 +1,5 @@
 from __future__ import annotations
-from threading import Thread, Lock
+from threading import Thread, Lock, Event
 
 import fnmatch
 import time
@@ -9,22 +9,34 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import pandas as pd
 
-import requests  # type: ignore
-
-from directionalscalper.core.utils import send_public_request
+from directionalscalper.core.utils import HTTPSessionPool, send_public_request
+from api.embedded import EmbeddedDataSource
+from api.snapshot import SnapshotReader, view_for
 from directionalscalper.core.strategies.logger import Logger
 
 logging = Logger(logger_name="Manager", filename="Manager.log", stream=True)
 
 #log = logging.getLogger(__name__)
 
-from time import sleep
-
 class InvalidAPI(Exception):
     def __init__(self, message="Invalid Manager setup"):
         self.message = message
         super().__init__(self.message)
 
+class CachedURL:
+    """
+    Parsed payload of a URL with its validators and expiry time. A new payload is
+    published as a new entry, ``data`` of an entry is never modified.
+    """
+
+    def __init__(self, data, etag=None, last_modified=None, expires_at=0.0):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.fetched_at = time.time()  # Last download or 304 revalidation
+        self.refreshing = False
+
 class Manager:
     def __init__(
         self,
@@ -36,6 +48,11 @@ class Manager:
         asset_value_cache_life_seconds: int = 60,
         path: Path | None = None,
         url: str = "",
+        http_pool_maxsize: int | None = None,
+        background_refresh: bool = True,
+        embedded_refresh_seconds: int = 10,
+        embedded_ready_timeout: int = 600,
+        embedded_snapshot_path: Path | None = None,
     ):
         self.exchange = exchange
         self.exchange_name = exchange_name
@@ -49,12 +66,26 @@ class Manager:
         self.path = path
         self.url = url
 
+        if http_pool_maxsize:
+            HTTPSessionPool.configure(pool_maxsize=http_pool_maxsize)
+
         # Initialize the time when data was last checked
         self.last_checked = 0.0
         
         # Initialize the main data cache and its expiry
         self.data = {}
-        self.data_cache_expiry = datetime.now() - timedelta(seconds=self.cache_life_seconds)
+
+        # Per-URL payload cache of fetch_data_from_url
+        self.url_cache = {}
+        self.url_cache_lock = Lock()
+
+        # Background refresher owning the remote pulls, and the data age alert thresholds
+        self.refresher_thread = None
+        self.refresher_stop = Event()
+        self.stale_warning_seconds = self.cache_life_seconds * 3
+        self.stale_error_seconds = self.cache_life_seconds * 10
+        self.refresh_retry_seconds = min(10, self.cache_life_seconds)  # Wait after a failed refresh before the next one
+        self.stale_alerts = {}  # url -> alert level already logged
         
         # Initialize the asset value cache and its expiry
         self.asset_value_cache = {}
@@ -68,6 +99,12 @@ class Manager:
         self.api_data_cache = None
         self.api_data_cache_expiry = datetime.now() - timedelta(seconds=self.cache_life_seconds)
 
+        # Per-snapshot indexes, rebuilt only when a fetch returns a new dataset
+        self.snapshot_lock = Lock()
+        self.asset_indexes = {}  # id(data) -> (data, {symbol: record})
+        self.api_data_snapshot = None  # (data, funding_data, {symbol: api_data}, symbols)
+        self.metrics_cache = {}  # symbol -> (api_data, metrics)
+
         # Attributes for 'everything' data cache
         self.everything_cache = None
         self.everything_cache_expiry = datetime.now() - timedelta(seconds=1)  # Initialize to an old timestamp to force first fetch
@@ -83,6 +120,31 @@ class Manager:
                 self.url = f"https://api.quantumvoid.org/volumedata/quantdatav2_{self.exchange_name.replace('_', '')}.json"
             logging.info(f"Remote API URL: {self.url}")
             self.data = self.get_remote_data()
+            if background_refresh:
+                self.start_refresher()
+
+        elif self.api == "embedded":
+            # The scraper runs in a side process of this bot, no remote volumedata API involved
+            logging.info(f"API manager mode: embedded, refreshing every {embedded_refresh_seconds}s")
+            self.cache_life_seconds = min(self.cache_life_seconds, embedded_refresh_seconds)
+            self.embedded_source = EmbeddedDataSource(
+                self.data_source_exchange,
+                refresh_seconds=embedded_refresh_seconds,
+                snapshot_path=embedded_snapshot_path,
+            )
+            self.embedded_source.start()
+            if not self.embedded_source.wait_ready(embedded_ready_timeout):
+                logging.warning(f"Embedded scraper produced no data within {embedded_ready_timeout}s, starting without it")
+            self.data = self.get_embedded_data()
+
+        elif self.api == "snapshot":
+            # Memory-maps the Arrow snapshot a scraper on this host publishes (api/snapshot.py)
+            if len(str(self.path)) < 6:
+                self.path = Path("volumedata", f"quantdatav2_{self.exchange_name.replace('_', '')}.arrow")
+            self.path = Path(self.path).with_suffix(".arrow")  # The snapshot next to a configured JSON file
+            logging.info(f"API manager mode: snapshot, reading {self.path}")
+            self.snapshot_reader = SnapshotReader(self.path)
+            self.data = self.get_snapshot_data()
 
         elif self.api == "local":
             # You might also want to consider adjusting the local path based on the exchange_name in the future.
@@ -92,8 +154,8 @@ class Manager:
             self.data = self.get_local_data()
 
         else:
-            logging.error("API must be 'local' or 'remote'")
-            raise InvalidAPI(message="API must be 'local' or 'remote'")
+            logging.error("API must be 'local', 'remote', 'embedded' or 'snapshot'")
+            raise InvalidAPI(message="API must be 'local', 'remote', 'embedded' or 'snapshot'")
 
         self.update_last_checked()
 
@@ -104,71 +166,21 @@ class Manager:
         if self.everything_cache and not self.is_everything_cache_expired():
             return self.everything_cache
 
-        symbols = []
         url = f"https://api.quantumvoid.org/volumedata/everything_{self.exchange_name.replace('_', '')}.json"
+        raw_json = self.fetch_data_from_url(url, max_retries)
 
-        for retry in range(max_retries):
-            delay = 2**retry  # exponential backoff
-            delay = min(58, delay)  # cap the delay to 58 seconds
-
-            try:
-                logging.info(f"Sending request to {url} (Attempt: {retry + 1})")
-                header, raw_json = send_public_request(url=url)
-
-                if isinstance(raw_json, list):
-                    logging.info(f"Received {len(raw_json)} assets from API")
-
-                    for asset in raw_json:
-                        symbol = asset.get("Asset", "")
-                        min_qty = asset.get("Min qty", 0)
-                        usd_price = asset.get("Price", float('inf'))
-
-                        logging.info(f"Processing symbol {symbol} with min_qty {min_qty} and USD price {usd_price}")
-
-                        if blacklist and any(fnmatch.fnmatch(symbol, pattern) for pattern in blacklist):
-                            logging.info(f"Skipping {symbol} as it's in blacklist")
-                            continue
-
-                        if whitelist:
-                            logging.info(f"Whitelist provided: {whitelist}")
-                            if symbol not in whitelist:
-                                logging.info(f"Skipping {symbol} as it's not in whitelist")
-                                continue
-
-                        # Check against the max_usd_value, if provided
-                        if max_usd_value is not None and usd_price > max_usd_value:
-                            logging.info(f"Skipping {symbol} as its USD price {usd_price} is greater than the max allowed {max_usd_value}")
-                            continue
+        if not isinstance(raw_json, list):
+            logging.warning(f"Unexpected data format from {url}. Expected a list of assets. Using cached symbols.")
+            return self.everything_cache or []
 
-                        if min_qty_threshold is None or min_qty <= min_qty_threshold:
-                            symbols.append(symbol)
-
-                    logging.info(f"Returning {len(symbols)} symbols")
-
-                    # If successfully fetched, update the cache and its expiry time
-                    if symbols:
-                        self.everything_cache = symbols
-                        self.everything_cache_expiry = datetime.now() + timedelta(seconds=self.cache_life_seconds)
-
-                    return symbols
-
-                else:
-                    logging.warning("Unexpected data format. Expected a list of assets.")
-
-            except requests.exceptions.RequestException as e:
-                logging.warning(f"Request failed: {e}")
-            except json.decoder.JSONDecodeError as e:
-                logging.warning(f"Failed to parse JSON: {e}. Response: {raw_json}")
-            except Exception as e:
-                logging.warning(f"Unexpected error occurred: {e}")
+        logging.info(f"Received {len(raw_json)} assets from API")
+        symbols = [asset.get("Asset", "") for asset in self._filter_assets(raw_json, min_qty_threshold, blacklist, whitelist, max_usd_value)]
+        logging.info(f"Returning {len(symbols)} symbols")
 
-            # Wait before the next retry
-            if retry < max_retries - 1:
-                time.sleep(delay)
-
-        # Return cached symbols if all retries fail
-        logging.warning(f"Couldn't fetch everything symbols after {max_retries} attempts. Using cached symbols.")
-        return self.everything_cache or []
+        if symbols:
+            self.everything_cache = symbols
+            self.everything_cache_expiry = datetime.now() + timedelta(seconds=self.cache_life_seconds)
+        return symbols
 
 
     # def get_everything(self, min_qty_threshold: float = None, blacklist: list = None, whitelist: list = None, max_usd_value: float = None, max_retries: int = 5):
@@ -247,35 +259,163 @@ class Manager:
         self.last_checked = datetime.now().timestamp()
 
     def fetch_data_from_url(self, url, max_retries: int = 5):
-        current_time = datetime.now()
-        if current_time <= self.data_cache_expiry:
-            return self.data
-        for retry in range(max_retries):
-            delay = 2**retry  # exponential backoff
-            delay = min(60, delay)  # cap the delay to 60 seconds
+        """
+        Parsed payload of a URL, cached per URL for cache_life_seconds. Once a URL has been
+        fetched, an expired entry is still returned while a background thread revalidates it
+        with a conditional request, so callers only wait on the first fetch of a URL.
+        """
+        if self.api == "embedded":
+            return self.get_embedded_dataset(url)
+        if self.api == "snapshot":
+            return self.get_snapshot_dataset(url)
+
+        with self.url_cache_lock:
+            entry = self.url_cache.get(url)
+            if entry is not None:
+                # With the refresher running it revalidates every cached URL on schedule
+                if not self.is_refresher_running() and time.time() >= entry.expires_at and not entry.refreshing:
+                    entry.refreshing = True
+                    Thread(target=self.refresh_url, args=(url, max_retries), daemon=True).start()
+                return entry.data
+        return self.refresh_url(url, max_retries)
+
+    def refresh_url(self, url, max_retries: int = 5):
+        entry = self.url_cache.get(url)
+        request_headers = {}
+        if entry is not None:
+            if entry.etag:
+                request_headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request_headers["If-Modified-Since"] = entry.last_modified
+        try:
+            header, raw_json = send_public_request(url=url, max_retries=max_retries, headers=request_headers)
+            now = time.time()
+            if header is None:
+                logging.error(f"Couldn't fetch {url} after {max_retries} attempts, using cached data")
+                if entry is not None:
+                    entry.expires_at = now + self.refresh_retry_seconds
+            elif raw_json is None and entry is not None:
+                # 304 Not Modified, the parsed payload (and indexes built on it) stay valid
+                entry.expires_at = now + self.cache_life_seconds
+                entry.fetched_at = now
+            else:
+                entry = CachedURL(raw_json, header.get("ETag"), header.get("Last-Modified"), now + self.cache_life_seconds)
+                with self.url_cache_lock:
+                    self.url_cache[url] = entry
+        except Exception as e:
+            logging.error(f"Unexpected error occurred fetching {url}: {e}")
+            if entry is not None:
+                entry.expires_at = time.time() + self.refresh_retry_seconds
+        finally:
+            if entry is not None:
+                entry.refreshing = False
+        return entry.data if entry is not None else []
+
+    def get_snapshot(self, url):
+        """Latest payload of a URL and its age in seconds, without waiting once the URL is cached."""
+        data = self.fetch_data_from_url(url)
+        return data, self.data_age(url)
+
+    def data_age(self, url=None):
+        """Seconds since the payload of a URL (the main dataset by default) was fetched or revalidated."""
+        if self.api == "embedded":
+            return self.embedded_source.age()
+        if self.api == "snapshot":
+            return self.snapshot_reader.age()
+        entry = self.url_cache.get(url or self.url)
+        if entry is None:
+            return None
+        return time.time() - entry.fetched_at
+
+    def data_ages(self):
+        return {url: time.time() - entry.fetched_at for url, entry in list(self.url_cache.items())}
+
+    def is_refresher_running(self):
+        return self.refresher_thread is not None and self.refresher_thread.is_alive()
+
+    def start_refresher(self, poll_seconds: float = 1.0):
+        """Revalidate every cached URL in one background thread as its entry expires."""
+        if self.is_refresher_running():
+            return
+        self.refresher_stop.clear()
+        self.refresher_thread = Thread(target=self._refresh_loop, args=(poll_seconds,), name="ManagerRefresher", daemon=True)
+        self.refresher_thread.start()
+        logging.info("Started Manager background refresher")
+
+    def stop_refresher(self):
+        self.refresher_stop.set()
+        if self.refresher_thread is not None:
+            self.refresher_thread.join(timeout=5)
+
+    def _refresh_loop(self, poll_seconds):
+        while not self.refresher_stop.is_set():
             try:
-                header, raw_json = send_public_request(url=url)
-                # Update the data cache and its expiry time
-                self.data = raw_json
-                self.data_cache_expiry = current_time + timedelta(seconds=self.cache_life_seconds)
-                return raw_json
-            except requests.exceptions.RequestException as e:
-                logging.error(f"Request failed: {e}")
-            except json.decoder.JSONDecodeError as e:
-                logging.error(f"Failed to parse JSON: {e}")
+                self.check_data_age()
+                for url, entry in list(self.url_cache.items()):
+                    if time.time() >= entry.expires_at and not entry.refreshing:
+                        entry.refreshing = True
+                        self.refresh_url(url)
             except Exception as e:
-                logging.error(f"Unexpected error occurred: {e}")
-            
-            # Wait before the next retry
-            if retry < max_retries - 1:
-                sleep(delay)
+                logging.error(f"Exception caught in Manager refresher: {e}")
+            self.refresher_stop.wait(poll_seconds)
+
+    def check_data_age(self):
+        """Log once when a payload gets older than the warning or error threshold, and when it recovers."""
+        for url, age in self.data_ages().items():
+            if age >= self.stale_error_seconds:
+                level = "error"
+            elif age >= self.stale_warning_seconds:
+                level = "warning"
+            else:
+                level = None
+
+            if level == self.stale_alerts.get(url):
+                continue
+            if level == "error":
+                logging.error(f"Data from {url} is {age:.0f}s old (error threshold {self.stale_error_seconds}s)")
+            elif level == "warning":
+                logging.warning(f"Data from {url} is {age:.0f}s old (warning threshold {self.stale_warning_seconds}s)")
+            else:
+                logging.info(f"Data from {url} is fresh again ({age:.0f}s old)")
+            self.stale_alerts[url] = level
+
+    def get_embedded_dataset(self, url):
+        data = self.embedded_source.dataset_for(url)
+        if data is None:
+            logging.warning(f"{url} has no embedded equivalent, returning no data")
+            return []
+        return data
 
-        # Return cached data if all retries fail
+    def get_embedded_data(self):
+        self.data = self.embedded_source.dataset_for(self.url or "quantdatav2.json")
+        self.update_last_checked()
         return self.data
-    
+
+    def get_snapshot_dataset(self, url):
+        view = view_for(url)
+        if view is None:
+            logging.warning(f"{url} has no snapshot view, returning no data")
+            return []
+        return self.snapshot_reader.records(view)
+
+    def get_snapshot_data(self):
+        self.data = self.get_snapshot_dataset(self.url or "quantdatav2.json")
+        self.update_last_checked()
+        return self.data
+
+    def get_snapshot_column(self, column: str):
+        """A column of the latest snapshot as a zero-copy Arrow array (snapshot mode only), None without one."""
+        if self.api != "snapshot":
+            raise InvalidAPI(message="Column access needs the 'snapshot' API")
+        return self.snapshot_reader.column(column)
+
     def get_data(self):
         if self.api == "remote":
             return self.get_remote_data()
+        if self.api == "embedded":
+            return self.get_embedded_data()
+        if self.api == "snapshot":
+            return self.get_snapshot_data()
         if self.api == "local":
             return self.get_local_data()
 
@@ -300,96 +440,57 @@ class Manager:
 
     def get_all_possible_symbols(self, max_retries: int = 5):
         url = f"https://api.quantumvoid.org/volumedata/quantdatav2_{self.exchange_name.replace('_', '')}.json"
-        
-        for retry in range(max_retries):
-            delay = 2**retry  # exponential backoff
-            delay = min(58, delay)  # cap the delay to 30 seconds
+        raw_json = self.fetch_data_from_url(url, max_retries)
 
-            try:
-                logging.info(f"Sending request to {url} (Attempt: {retry + 1})")
-                header, raw_json = send_public_request(url=url)
-                
-                if isinstance(raw_json, list):
-                    logging.info(f"Received {len(raw_json)} symbols from API")
-                    
-                    symbols = [asset.get("Asset", "") for asset in raw_json if "Asset" in asset]
-                    logging.info(f"Returning {len(symbols)} symbols")
-                    return symbols
-                else:
-                    logging.warning("Unexpected data format. Expected a list of symbols.")
-                    
-            except requests.exceptions.RequestException as e:
-                logging.warning(f"Request failed: {e}")
-            except json.decoder.JSONDecodeError as e:
-                logging.warning(f"Failed to parse JSON: {e}. Response: {raw_json}")
-            except Exception as e:
-                logging.warning(f"Unexpected error occurred: {e}")
+        if not isinstance(raw_json, list):
+            logging.warning(f"Unexpected data format from {url}. Expected a list of symbols.")
+            return []
 
-            # Wait before the next retry
-            if retry < max_retries - 1:
-                sleep(delay)
-        
-        # If all retries fail, return an empty list
-        logging.warning(f"Couldn't fetch symbols after {max_retries} attempts.")
-        return []
+        symbols = [asset.get("Asset", "") for asset in raw_json if "Asset" in asset]
+        logging.info(f"Returning {len(symbols)} symbols")
+        return symbols
+
+    def _filter_assets(self, raw_json, min_qty_threshold=None, blacklist=None, whitelist=None, max_usd_value=None):
+        """Assets of a rotator payload that pass the blacklist, whitelist, max USD value and min qty filters."""
+        assets = []
+        for asset in raw_json:
+            if not isinstance(asset, dict):
+                continue
+            symbol = asset.get("Asset", "")
+            min_qty = asset.get("Min qty", 0)
+            usd_price = asset.get("Price", float('inf'))
+
+            logging.info(f"Processing symbol {symbol} with min_qty {min_qty} and USD price {usd_price}")
+
+            if blacklist and any(fnmatch.fnmatch(symbol, pattern) for pattern in blacklist):
+                logging.info(f"Skipping {symbol} as it's in blacklist")
+                continue
+
+            if whitelist and symbol not in whitelist:
+                logging.info(f"Skipping {symbol} as it's not in whitelist")
+                continue
+
+            # Check against the max_usd_value, if provided
+            if max_usd_value is not None and usd_price > max_usd_value:
+                logging.info(f"Skipping {symbol} as its USD price {usd_price} is greater than the max allowed {max_usd_value}")
+                continue
+
+            if min_qty_threshold is None or min_qty <= min_qty_threshold:
+                assets.append(asset)
+        return assets
 
     def get_atrp_sorted_rotator_symbols(self, min_qty_threshold: float = None, blacklist: list = None, whitelist: list = None, max_usd_value: float = None, max_retries: int = 5):
         url = f"https://api.quantumvoid.org/volumedata/rotatorsymbols_{self.data_source_exchange.replace('_', '')}_atrp.json"
-        
-        for retry in range(max_retries):
-            delay = 2**retry  # exponential backoff
-            delay = min(58, delay)  # cap the delay to 30 seconds
+        raw_json = self.fetch_data_from_url(url, max_retries)
 
-            try:
-                logging.info(f"Sending request to {url} (Attempt: {retry + 1})")
-                header, raw_json = send_public_request(url=url)
-                
-                if isinstance(raw_json, list):
-                    logging.info(f"Received {len(raw_json)} ATRP sorted rotator symbols from API")
-                    
-                    filtered_symbols = []
-                    for asset in raw_json:
-                        symbol = asset.get("Asset", "")
-                        min_qty = asset.get("Min qty", 0)
-                        usd_price = asset.get("Price", float('inf'))
-
-                        logging.info(f"Processing symbol {symbol} with min_qty {min_qty} and USD price {usd_price}")
-
-                        if blacklist and any(fnmatch.fnmatch(symbol, pattern) for pattern in blacklist):
-                            logging.info(f"Skipping {symbol} as it's in blacklist")
-                            continue
-
-                        if whitelist and symbol not in whitelist:
-                            logging.info(f"Skipping {symbol} as it's not in whitelist")
-                            continue
-
-                        # Check against the max_usd_value, if provided
-                        if max_usd_value is not None and usd_price > max_usd_value:
-                            logging.info(f"Skipping {symbol} as its USD price {usd_price} is greater than the max allowed {max_usd_value}")
-                            continue
-
-                        if min_qty_threshold is None or min_qty <= min_qty_threshold:
-                            filtered_symbols.append(asset)
-
-                    logging.info(f"Returning {len(filtered_symbols)} ATRP sorted rotator symbols")
-                    return filtered_symbols
-                else:
-                    logging.warning("Unexpected data format. Expected a list of ATRP sorted rotator symbols.")
-                    
-            except requests.exceptions.RequestException as e:
-                logging.warning(f"Request failed: {e}")
-            except json.decoder.JSONDecodeError as e:
-                logging.warning(f"Failed to parse JSON: {e}. Response: {raw_json}")
-            except Exception as e:
-                logging.warning(f"Unexpected error occurred: {e}")
+        if not isinstance(raw_json, list):
+            logging.warning(f"Unexpected data format from {url}. Expected a list of ATRP sorted rotator symbols.")
+            return []
 
-            # Wait before the next retry
-            if retry < max_retries - 1:
-                sleep(delay)
-        
-        # If all retries fail, return an empty list
-        logging.warning(f"Couldn't fetch ATRP sorted rotator symbols after {max_retries} attempts.")
-        return []
+        logging.info(f"Received {len(raw_json)} ATRP sorted rotator symbols from API")
+        filtered_symbols = self._filter_assets(raw_json, min_qty_threshold, blacklist, whitelist, max_usd_value)
+        logging.info(f"Returning {len(filtered_symbols)} ATRP sorted rotator symbols")
+        return filtered_symbols
 
     def get_bullish_rotator_symbols(self, min_qty_threshold: float = None, blacklist: list = None, whitelist: list = None, max_usd_value: float = None, max_retries: int = 5):
         url = f"https://api.quantumvoid.org/volumedata/rotatorsymbols_{self.data_source_exchange.replace('_', '')}_bullish.json"
@@ -400,176 +501,78 @@ class Manager:
         return self._get_rotator_symbols(url, min_qty_threshold, blacklist, whitelist, max_usd_value, max_retries)
 
     def _get_rotator_symbols(self, url, min_qty_threshold, blacklist, whitelist, max_usd_value, max_retries):
-        for retry in range(max_retries):
-            delay = 2**retry  # exponential backoff
-            delay = min(58, delay)  # cap the delay to 30 seconds
-
-            try:
-                logging.info(f"Sending request to {url} (Attempt: {retry + 1})")
-                header, raw_json = send_public_request(url=url)
-
-                if isinstance(raw_json, list):
-                    logging.info(f"Received {len(raw_json)} assets from API")
-                    symbols = []
-                    for asset in raw_json:
-                        symbol = asset.get("Asset", "")
-                        min_qty = asset.get("Min qty", 0)
-                        usd_price = asset.get("Price", float('inf'))
-
-                        logging.info(f"Processing symbol {symbol} with min_qty {min_qty} and USD price {usd_price}")
-
-                        if blacklist and any(fnmatch.fnmatch(symbol, pattern) for pattern in blacklist):
-                            logging.info(f"Skipping {symbol} as it's in blacklist")
-                            continue
-
-                        if whitelist and symbol not in whitelist:
-                            logging.info(f"Skipping {symbol} as it's not in whitelist")
-                            continue
-
-                        # Check against the max_usd_value, if provided
-                        if max_usd_value is not None and usd_price > max_usd_value:
-                            logging.info(f"Skipping {symbol} as its USD price {usd_price} is greater than the max allowed {max_usd_value}")
-                            continue
-
-                        if min_qty_threshold is None or min_qty <= min_qty_threshold:
-                            symbols.append(symbol)
-
-                    logging.info(f"Returning {len(symbols)} symbols")
-                    return symbols
-                else:
-                    logging.warning("Unexpected data format. Expected a list of assets.")
-
-            except requests.exceptions.RequestException as e:
-                logging.warning(f"Request failed: {e}")
-            except json.decoder.JSONDecodeError as e:
-                logging.warning(f"Failed to parse JSON: {e}. Response: {raw_json}")
-            except Exception as e:
-                logging.warning(f"Unexpected error occurred: {e}")
+        raw_json = self.fetch_data_from_url(url, max_retries)
 
-            # Wait before the next retry
-            if retry < max_retries - 1:
-                sleep(delay)
+        if not isinstance(raw_json, list):
+            logging.warning(f"Unexpected data format from {url}. Expected a list of assets.")
+            return []
 
-        # If all retries fail, return an empty list
-        logging.warning(f"Couldn't fetch rotator symbols after {max_retries} attempts.")
-        return []
+        logging.info(f"Received {len(raw_json)} assets from API")
+        symbols = [asset.get("Asset", "") for asset in self._filter_assets(raw_json, min_qty_threshold, blacklist, whitelist, max_usd_value)]
+        logging.info(f"Returning {len(symbols)} symbols")
+        return symbols
 
     def get_auto_rotate_symbols(self, min_qty_threshold: float = None, blacklist: list = None, whitelist: list = None, max_usd_value: float = None, max_retries: int = 5):
         if self.rotator_symbols_cache and not self.is_cache_expired():
             return self.rotator_symbols_cache
 
-        symbols = []
         url = f"https://api.quantumvoid.org/volumedata/rotatorsymbols_{self.data_source_exchange.replace('_', '')}.json"
-        
-        for retry in range(max_retries):
-            delay = 2**retry  # exponential backoff
-            delay = min(58, delay)  # cap the delay to 30 seconds
+        raw_json = self.fetch_data_from_url(url, max_retries)
 
-            try:
-                logging.info(f"Sending request to {url} (Attempt: {retry + 1})")
-                header, raw_json = send_public_request(url=url)
-                
-                if isinstance(raw_json, list):
-                    logging.info(f"Received {len(raw_json)} assets from API")
-                    
-                    for asset in raw_json:
-                        symbol = asset.get("Asset", "")
-                        min_qty = asset.get("Min qty", 0)
-                        usd_price = asset.get("Price", float('inf')) 
-                        
-                        logging.info(f"Processing symbol {symbol} with min_qty {min_qty} and USD price {usd_price}")
-
-                        if blacklist and any(fnmatch.fnmatch(symbol, pattern) for pattern in blacklist):
-                            logging.info(f"Skipping {symbol} as it's in blacklist")
-                            continue
-
-                        if whitelist and symbol not in whitelist:
-                            logging.info(f"Skipping {symbol} as it's not in whitelist")
-                            continue
-
-                        # Check against the max_usd_value, if provided
-                        if max_usd_value is not None and usd_price > max_usd_value:
-                            logging.info(f"Skipping {symbol} as its USD price {usd_price} is greater than the max allowed {max_usd_value}")
-                            continue
-
-                        if min_qty_threshold is None or min_qty <= min_qty_threshold:
-                            symbols.append(symbol)
-
-                    logging.info(f"Returning {len(symbols)} symbols")
-                    
-                    # If successfully fetched, update the cache and its expiry time
-                    if symbols:
-                        self.rotator_symbols_cache = symbols
-                        self.rotator_symbols_cache_expiry = datetime.now() + timedelta(seconds=self.cache_life_seconds)
-
-                    return symbols
-
-                else:
-                    logging.warning("Unexpected data format. Expected a list of assets.")
-                    
-            except requests.exceptions.RequestException as e:
-                logging.warning(f"Request failed: {e}")
-            except json.decoder.JSONDecodeError as e:
-                logging.warning(f"Failed to parse JSON: {e}. Response: {raw_json}")
-            except Exception as e:
-                logging.warning(f"Unexpected error occurred: {e}")
+        if not isinstance(raw_json, list):
+            logging.warning(f"Unexpected data format from {url}. Expected a list of assets. Using cached symbols.")
+            return self.rotator_symbols_cache or []
 
-            # Wait before the next retry
-            if retry < max_retries - 1:
-                time.sleep(delay)
-        
-        # Return cached symbols if all retries fail
-        logging.warning(f"Couldn't fetch rotator symbols after {max_retries} attempts. Using cached symbols.")
-        return self.rotator_symbols_cache or []
+        logging.info(f"Received {len(raw_json)} assets from API")
+        symbols = [asset.get("Asset", "") for asset in self._filter_assets(raw_json, min_qty_threshold, blacklist, whitelist, max_usd_value)]
+        logging.info(f"Returning {len(symbols)} symbols")
+
+        # If successfully fetched, update the cache and its expiry time
+        if symbols:
+            self.rotator_symbols_cache = symbols
+            self.rotator_symbols_cache_expiry = datetime.now() + timedelta(seconds=self.cache_life_seconds)
+        return symbols
 
     def get_symbols(self):
         url = f"https://api.quantumvoid.org/volumedata/quantdatav2_{self.exchange_name.replace('_', '')}.json"
-        try:
-            header, raw_json = send_public_request(url=url)
-            if isinstance(raw_json, list):
-                return raw_json
-            else:
-                logging.info("Unexpected data format. Expected a list of symbols.")
-                return []
-        except requests.exceptions.RequestException as e:
-            logging.info(f"Request failed: {e}")
-            return []
-        except json.decoder.JSONDecodeError as e:
-            logging.info(f"Failed to parse JSON: {e}")
-            return []
-        except Exception as e:
-            logging.info(f"Unexpected error occurred: {e}")
-            return []
+        raw_json = self.fetch_data_from_url(url)
+        if isinstance(raw_json, list):
+            return raw_json
+        logging.info("Unexpected data format. Expected a list of symbols.")
+        return []
 
     def get_remote_data(self):
-            if not self.check_timestamp():
-                return self.data
-            while True:  # Keep trying until a successful request is made
-                try:
-                    header, raw_json = send_public_request(url=self.url)
-                    self.data = raw_json
-                    break  # if the request was successful, break the loop
-                except requests.exceptions.RequestException as e:
-                    logging.info(f"Request failed: {e}, retrying...")
-                except json.decoder.JSONDecodeError as e:
-                    logging.info(f"Failed to parse JSON: {e}, retrying...")
-                except Exception as e:
-                    logging.info(f"Unexpected error occurred: {e}, retrying...")
-                finally:
-                    self.update_last_checked()
-            return self.data
+        self.data = self.fetch_data_from_url(self.url)
+        self.update_last_checked()
+        return self.data
 
     def check_timestamp(self):
         return datetime.now().timestamp() - self.last_checked > self.cache_life_seconds
 
-    def get_asset_data(self, symbol: str, data):
+    def get_asset_index(self, data):
+        """Symbol -> record index of a dataset, built once per fetched snapshot."""
+        with self.snapshot_lock:
+            cached = self.asset_indexes.get(id(data))
+            if cached is not None and cached[0] is data:
+                return cached[1]
+
+        index = {}
         try:
             for asset in data:
-                if asset["Asset"] == symbol:
-                    return asset
+                if isinstance(asset, dict) and "Asset" in asset:
+                    index.setdefault(asset["Asset"], asset)
         except Exception as e:
             logging.info(f"{e}")
-        return None
+
+        with self.snapshot_lock:
+            # Only the current quant and funding datasets are looked up, drop older snapshots
+            if len(self.asset_indexes) >= 4:
+                self.asset_indexes.clear()
+            self.asset_indexes[id(data)] = (data, index)
+        return index
+
+    def get_asset_data(self, symbol: str, data):
+        return self.get_asset_index(data).get(symbol)
 
     def get_1m_moving_averages(self, symbol, num_bars=20):
         return self.exchange.get_moving_averages(symbol, "1m", num_bars)
@@ -580,9 +583,9 @@ class Manager:
     def get_asset_value(self, symbol: str, data, value: str):
         try:
             if value == "Funding":
-                for asset_data in data:
-                    if asset_data.get("Asset") == symbol:
-                        return asset_data.get("Funding", 0)
+                asset_data = self.get_asset_data(symbol, data)
+                if asset_data is not None:
+                    return asset_data.get("Funding", 0)
             else:
                 asset_data = self.get_asset_data(symbol, data)
                 if asset_data is not None:
@@ -636,9 +639,12 @@ class Manager:
         return datetime.now() > self.api_data_cache_expiry
 
     def get_api_data(self, symbol):
+        """
+        Metrics of a symbol from the current quant and funding snapshots. The values of every
+        symbol are built once per snapshot, so this is a dict lookup; treat the result as read-only.
+        """
         api_data_url = f"https://api.quantumvoid.org/volumedata/quantdatav2_{self.data_source_exchange.replace('_', '')}.json"
         data = self.fetch_data_from_url(api_data_url)
-        symbols = [asset.get("Asset", "") for asset in data if "Asset" in asset]
 
         # Fetch funding rate data from the new URL
         funding_data_url = f"https://api.quantumvoid.org/volumedata/funding_{self.data_source_exchange.replace('_', '')}.json"
@@ -646,6 +652,31 @@ class Manager:
 
         #logging.info(f"Funding data: {funding_data}")
 
+        snapshot, symbols = self.get_api_data_snapshot(data, funding_data)
+        api_data = snapshot.get(symbol)
+        if api_data is None:
+            api_data = self.build_api_data(symbol, data, funding_data, symbols)
+            with self.snapshot_lock:
+                api_data = snapshot.setdefault(symbol, api_data)
+        return api_data
+
+    def get_api_data_snapshot(self, data, funding_data):
+        """{symbol: api_data} for every asset of a snapshot, and the list of assets."""
+        with self.snapshot_lock:
+            cached = self.api_data_snapshot
+            if cached is not None and cached[0] is data and cached[1] is funding_data:
+                return cached[2], cached[3]
+
+        index = self.get_asset_index(data)
+        symbols = list(index)
+        snapshot = {symbol: self.build_api_data(symbol, data, funding_data, symbols) for symbol in index}
+
+        with self.snapshot_lock:
+            self.api_data_snapshot = (data, funding_data, snapshot, symbols)
+            self.metrics_cache = {}
+        return snapshot, symbols
+
+    def build_api_data(self, symbol, data, funding_data, symbols):
         api_data = {
             '1mVol': self.get_asset_value(symbol, data, "1mVol"),
             '5mVol': self.get_asset_value(symbol, data, "5mVol"),
@@ -670,6 +701,14 @@ class Manager:
         return api_data
 
     def extract_metrics(self, api_data, symbol):
+        cached = self.metrics_cache.get(symbol)
+        if cached is not None and cached[0] is api_data:
+            return cached[1]
+        metrics = self.compute_metrics(api_data, symbol)
+        self.metrics_cache[symbol] = (api_data, metrics)
+        return metrics
+
+    def compute_metrics(self, api_data, symbol):
         try:
             one_minute_volume = api_data.get('1mVol', 0)
             five_minute_volume = api_data.get('5mVol', 0)
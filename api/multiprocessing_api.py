@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import sys
 import time
 import os
@@ -17,17 +16,61 @@ from decimal import Decimal, ROUND_HALF_UP
 from datetime import datetime
 
 sys.path.append(".")
-from directionalscalper.api.exchanges.binance import Binance
-from directionalscalper.api.exchanges.bybit import Bybit
-from directionalscalper.core.utils import send_public_request
+from api.async_fetcher import AsyncMarketFetcher
+from api.indicator_panel import IndicatorPanel
+from api.kline_buffers import CANDLE_COLUMNS, KlineBuffers
+from api.historical_volume import HistoricalVolumeCollector
+from api.snapshot import ARROW_AVAILABLE, write_json, write_snapshot
+from api.exchanges.binance import Binance
+from api.exchanges.bybit import Bybit
 from directionalscalper.core.logger import Logger
 log = Logger(filename="combined_scraper.log", stream=True)
 
-funding_cache = {}  # We will handle cache differently in multiprocessing if needed
+funding_cache = {}  # {exchange_name: {symbol: (fetched_at, rate %)}}, shared by the scrapers of this process across cycles
 
 class CombinedScraper:
+    # Base kline series analyse_symbol fetches per symbol, and how many bars of each.
+    # 1m also feeds the 5m, 30m and 1h views by resampling. 15m (ERI) and 4h (levels)
+    # need far more history than one 1m request returns, so they are fetched natively.
+    KLINE_SERIES = {"1m": 240, "15m": 128, "4h": 200}
+    RESAMPLED_MINUTES = {"5m": 5, "30m": 30, "1h": 60}
+
+    OUTPUT_COLUMNS = [
+        "Asset",
+        "Min qty",
+        "Price",
+        "1m 1x Volume (USDT)",
+        "5m 1x Volume (USDT)",
+        "30m 1x Volume (USDT)",
+        "1h 1x Volume (USDT)",
+        "1m Spread",
+        "5m Spread",
+        "30m Spread",
+        "1h Spread",
+        "4h Spread",
+        "trend%",
+        "Trend",
+        "HMA Trend",
+        "5m MA6 high",
+        "5m MA6 low",
+        "Funding",
+        "Timestamp",
+        "MFI", #OR MFIRSI
+        "ERI Bull Power",
+        "ERI Bear Power",
+        "ERI Trend",
+        "Top Signal 5m",
+        "Bottom Signal 5m",
+        "Top Signal 1m",
+        "Bottom Signal 1m"
+    ]
+
+    FETCH_CONCURRENCY = 32  # Requests in flight during the fetch stage
+    ANALYSIS_PROCESSES = min(4, os.cpu_count() or 1)  # Indicator stage runs in-process with 1
+
     def __init__(self, exchange_name, filters: dict):
-        self.funding_cache = {}  # Local cache for each process
+        self.funding_cache = funding_cache.setdefault(exchange_name, {})
+        self.volume_collectors = {}  # {(interval, limit): HistoricalVolumeCollector}
         self.exchange_name = exchange_name
         self.FUNDING_CACHE_DURATION = timedelta(hours=4)  # Set cache duration
 
@@ -40,61 +83,54 @@ class CombinedScraper:
         
         log.info("Scraper initializing for " + exchange_name)
         self.filters = filters
+        self.load_universe()
+
+    def load_universe(self):
+        """Symbols, instrument info and prices from the exchange, then the filtered symbol list."""
         self.symbols = self.exchange.get_futures_symbols()
-        self.prices = self.exchange.get_futures_prices()
-        log.info(f"{len(self.symbols)} symbols found for " + exchange_name)
+        self.symbols_info = self.symbols  # Kept whole for per-symbol lookups once symbols is filtered
+        self.load_tickers()
+        log.info(f"{len(self.symbols)} symbols found for " + self.exchange_name)
         
         if "quote_symbols" in self.filters:
             self.symbols = self.filter_quote(symbols=self.symbols, quotes=self.filters["quote_symbols"])
         
         if "top_volume" in self.filters:
-            self.volumes = self.exchange.get_futures_volumes()
             self.symbols = self.filter_volume(symbols=self.symbols, volumes=self.volumes, limit=self.filters["top_volume"])
 
     def get_all_historical_volume(self, exchange_name: str, interval: str, limit: int) -> dict:
-        all_volume = {}
-
-        if exchange_name == "bybit":
-            for symbol in self.symbols:
-                try:
-                    volume = self.get_historical_volume_bybit(symbol, interval, limit)
-                    all_volume[symbol] = volume
-                except Exception as e:
-                    log.error(f"Error getting historical volume for {symbol} on Bybit: {e}")
-        elif exchange_name == "binance":
-            for symbol in self.symbols:
-                try:
-                    volume = self.get_historical_volume_binance(symbol, interval, limit)
-                    all_volume[symbol] = volume
-                except Exception as e:
-                    log.error(f"Error getting historical volume for {symbol} on Binance: {e}")
-        else:
+        """
+        {symbol: (symbol, volumes)} of the last ``limit`` ``interval`` klines of every
+        symbol, fetched concurrently. The collector is kept on the scraper, so an
+        IncrementalScraper only fetches the bars closed since its previous call.
+        """
+        if exchange_name not in ("bybit", "binance"):
             raise ValueError(f"Unsupported exchange: {exchange_name}")
-
-        return all_volume
-
-    def get_historical_volume_bybit(self, symbol: str, interval: str, limit: int):
-        data = self.exchange.get_futures_kline(
-            symbol=symbol, interval=interval, limit=limit
-        )
-        return symbol, [candle["volume"] for candle in data]
-
-    def get_historical_volume_binance(self, symbol: str, interval: str, limit: int) -> tuple:
-        endpoint = "/fapi/v1/klines"
-        payload = {
-            "symbol": symbol,
-            "interval": interval,
-            "limit": limit
-        }
-        _, raw_json = send_public_request(
-            url=self.exchange.futures_api_url, 
-            url_path=endpoint, 
-            payload=payload
-        )
-        volumes = [entry[5] for entry in raw_json]  # Assuming volume is at index 5 in the klines data
-        return symbol, volumes
+        collector = self.volume_collectors.get((interval, limit))
+        if collector is None:
+            collector = HistoricalVolumeCollector(self.exchange, interval=interval, bars=limit, concurrency=self.FETCH_CONCURRENCY)
+            self.volume_collectors[(interval, limit)] = collector
+        return collector.collect(self.symbols)
+
+    def historical_volume_frame(self, all_volume: dict) -> pd.DataFrame:
+        """get_all_historical_volume as one row per symbol with its volumes as a list, for write_snapshot."""
+        return pd.DataFrame({
+            "Asset": list(all_volume),
+            "Volumes": [[float(volume) for volume in volumes] for _, volumes in all_volume.values()],
+        })
+
+    def load_tickers(self):
+        """Price, 24h volume and funding rate of every symbol from one tickers snapshot."""
+        tickers = self.exchange.get_futures_tickers()
+        self.prices = {symbol: ticker["price"] for symbol, ticker in tickers.items()}
+        self.volumes = {symbol: ticker["volume"] for symbol, ticker in tickers.items()}
+        now = datetime.now()
+        for symbol, ticker in tickers.items():
+            if ticker["funding_rate"] is not None:
+                self.funding_cache[symbol] = (now, ticker["funding_rate"] * 100)
 
     def get_cached_funding(self, symbol):
+        # Filled for the whole universe by load_tickers, a request is only made for symbols the tickers lack
         now = datetime.now()
 
         # Check if data is in cache and still valid
@@ -119,6 +155,8 @@ class CombinedScraper:
             dataframe.to_csv(path, index=False)
         elif to == "parquet":
             dataframe.to_parquet(path)
+        elif to == "arrow":
+            write_snapshot(dataframe, path, metadata={"exchange": self.exchange_name})
         elif to == "dict":
             dataframe.to_dict(path, orient="records")
         else:
@@ -159,6 +197,52 @@ class CombinedScraper:
         log.info(f"Filtered to {len(filtered)} symbols")
         return filtered
 
+    def get_candles(self, symbol: str, interval: str, limit: int, df: pd.DataFrame | None = None) -> pd.DataFrame:
+        """Last ``limit`` candles, sliced from ``df`` when the caller already holds the series."""
+        if df is None:
+            bars = self.exchange.get_futures_kline(symbol=symbol, interval=interval, limit=limit)
+            return pd.DataFrame(bars, columns=CANDLE_COLUMNS)
+        return df.tail(limit).reset_index(drop=True)
+
+    def resample_candles(self, df: pd.DataFrame, minutes: int) -> pd.DataFrame:
+        """
+        Aggregate 1m candles into ``minutes`` candles on the exchange's clock boundaries.
+
+        Only full buckets are kept, except the last one when the exchange also returns the
+        forming candle, so the result ends where a native kline request would.
+        """
+        bucket_ms = minutes * 60000
+        buckets = df.groupby(df["timestamp"] // bucket_ms * bucket_ms, sort=True)
+        resampled = buckets.agg(
+            open=("open", "first"),
+            high=("high", "max"),
+            low=("low", "min"),
+            close=("close", "last"),
+            volume=("volume", "sum"),
+            bars=("close", "size"),
+        )
+        keep = resampled["bars"] == minutes
+        if self.exchange.kline_includes_open_candle and len(keep) > 0:
+            keep.iloc[-1] = True
+        resampled = resampled[keep].drop(columns="bars").rename_axis("timestamp").reset_index()
+        return resampled[CANDLE_COLUMNS]
+
+    def fetch_series(self, symbol: str) -> dict:
+        """One kline request per base series, plus the timeframes resampled from 1m."""
+        return self.build_series({
+            interval: self.get_candles(symbol=symbol, interval=interval, limit=limit)
+            for interval, limit in self.KLINE_SERIES.items()
+        })
+
+    def build_series(self, frames: dict) -> dict:
+        series = dict(frames)
+        for interval, minutes in self.RESAMPLED_MINUTES.items():
+            series[interval] = self.resample_candles(series["1m"], minutes)
+        return series
+
+    def candles_frame(self, candles: list) -> pd.DataFrame:
+        return pd.DataFrame(candles, columns=CANDLE_COLUMNS)
+
     def get_spread(self, symbol: str, limit: int, timeframe: str = "1m", data: list | None = None) -> float:
         if data is None:
             data = self.exchange.get_futures_kline(symbol=symbol, interval=timeframe, limit=limit)
@@ -194,13 +278,8 @@ class CombinedScraper:
 
         return df
 
-    def get_candle_data(self, symbol: str, interval: str, limit: int):
-        bars = self.exchange.get_futures_kline(
-            symbol=symbol, interval=interval, limit=limit
-        )
-        df = pd.DataFrame(
-            bars, columns=["timestamp", "open", "high", "low", "close", "volume"]
-        )
+    def get_candle_data(self, symbol: str, interval: str, limit: int, df: pd.DataFrame | None = None):
+        df = self.get_candles(symbol=symbol, interval=interval, limit=limit, df=df)
         df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
         df["MA_3_High"] = df.high.rolling(3).mean()
         df["MA_3_Low"] = df.low.rolling(3).mean()
@@ -214,13 +293,8 @@ class CombinedScraper:
             "low_6": df["MA_6_Low"].iat[-1],
         }
 
-    def get_hma(self, symbol: str, interval: str, limit: int, column: str, window: int):
-        bars = self.exchange.get_futures_kline(
-            symbol=symbol, interval=interval, limit=limit
-        )
-        df = pd.DataFrame(
-            bars, columns=["timestamp", "open", "high", "low", "close", "volume"]
-        )
+    def get_hma(self, symbol: str, interval: str, limit: int, column: str, window: int, df: pd.DataFrame | None = None):
+        df = self.get_candles(symbol=symbol, interval=interval, limit=limit, df=df)
         df['HMA'] = self.compute_hma(df, column, window)
         hma_order_pct = round((df[column].iloc[-1] - df['HMA'].iloc[-1]) / df[column].iloc[-1] * 100, 4)
 
@@ -240,33 +314,23 @@ class CombinedScraper:
         hma = series2.rolling(window=int(np.sqrt(window))).mean()
         return hma
 
-    def get_ema(self, symbol: str, interval: str, limit: int, column: str, window: int):
-        bars = self.exchange.get_futures_kline(
-            symbol=symbol, interval=interval, limit=limit
-        )  # 1m, 18, 6
-        df = pd.DataFrame(
-            bars, columns=["timestamp", "open", "high", "low", "close", "volume"]
-        )
+    def get_ema(self, symbol: str, interval: str, limit: int, column: str, window: int, df: pd.DataFrame | None = None):
+        df = self.get_candles(symbol=symbol, interval=interval, limit=limit, df=df)  # 1m, 18, 6
         df[f"EMA{window} {column}"] = ta.trend.EMAIndicator(
             df[column], window=window
         ).ema_indicator()
         return round(
-            (df[f"EMA{window} {column}"][limit - 1]).astype(float),
+            (df[f"EMA{window} {column}"].iloc[-1]).astype(float),
             self.symbols["price_scale"],
         )
 
-    def get_sma(self, symbol: str, interval: str, limit: int, column: str, window: int):
-        bars = self.exchange.get_futures_kline(
-            symbol=symbol, interval=interval, limit=limit
-        )
-        df = pd.DataFrame(
-            bars, columns=["timestamp", "open", "high", "low", "close", "volume"]
-        )
+    def get_sma(self, symbol: str, interval: str, limit: int, column: str, window: int, df: pd.DataFrame | None = None):
+        df = self.get_candles(symbol=symbol, interval=interval, limit=limit, df=df)
         sma = ta.trend.SMAIndicator(df[column], window=window).sma_indicator()
 
-        current_sma = float(sma[limit - 1])
+        current_sma = float(sma.iloc[-1])
 
-        last_close_price = bars[limit - 1]["close"]
+        last_close_price = df["close"].iloc[-1]
 
         return round((last_close_price - current_sma) / last_close_price * 100, 4)
 
@@ -286,7 +350,7 @@ class CombinedScraper:
         tr = data[["high-low", "high-pc", "low-pc"]].max(axis=1)
         return tr
 
-    def calculate_advanced_eri(self, symbol, timeframe, len_slow_ma=64, len_power_ema=13, limit=128):
+    def calculate_advanced_eri(self, symbol, timeframe, len_slow_ma=64, len_power_ema=13, limit=128, df=None):
         """
         Calculate an Elder-ray Index (ERI) similar to RustyC's approach, using VWMA followed by EMA.
 
@@ -295,13 +359,11 @@ class CombinedScraper:
         :param len_slow_ma: Length for slow moving average (VWMA followed by EMA).
         :param len_power_ema: Length for EMA of bull and bear power.
         :param limit: Number of candlesticks to fetch.
+        :param df: Candles already fetched for this timeframe, used instead of fetching.
         :return: A dictionary containing ERI trend, bull power, and bear power.
         """
         # Fetching data
-        data = self.exchange.get_futures_kline(symbol=symbol, interval=timeframe, limit=limit)
-
-        # Create a DataFrame from the data
-        df = pd.DataFrame(data, columns=["timestamp", "open", "high", "low", "close", "volume"])
+        df = self.get_candles(symbol=symbol, interval=timeframe, limit=limit, df=df)
         df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].apply(pd.to_numeric)
 
         # Calculate VWMA (Volume Weighted Moving Average)
@@ -445,9 +507,8 @@ class CombinedScraper:
         return eri_trend, bull_power_smoothed.values[-1], bear_power_smoothed.values[-1]
 
     # Get MFIRSI
-    def get_mfi(self, symbol: str, interval: str, limit: int, lookback: int = 30) -> str:
-        bars = self.exchange.get_futures_kline(symbol=symbol, interval=interval, limit=limit)
-        df = pd.DataFrame(bars, columns=["timestamp", "open", "high", "low", "close", "volume"])
+    def get_mfi(self, symbol: str, interval: str, limit: int, lookback: int = 30, df: pd.DataFrame | None = None) -> str:
+        df = self.get_candles(symbol=symbol, interval=interval, limit=limit, df=df)
 
         # Calculate MFI, RSI, MA and whether open < close
         df['mfi'] = ta.volume.MFIIndicator(
@@ -503,10 +564,9 @@ class CombinedScraper:
         data['bottomSignal'] = wvf <= rangeLow_tb
         return data
 
-    def detect_top_bottom_signals_1m(self, symbol: str):
+    def detect_top_bottom_signals_1m(self, symbol: str, df: pd.DataFrame | None = None):
         # Fetching 1-minute kline data
-        data_1m = self.exchange.get_futures_kline(symbol=symbol, interval="1m", limit=240)
-        df_1m = pd.DataFrame(data_1m, columns=["timestamp", "open", "high", "low", "close", "volume"])
+        df_1m = self.get_candles(symbol=symbol, interval="1m", limit=240, df=df)
         df_1m[['open', 'high', 'low', 'close', 'volume']] = df_1m[['open', 'high', 'low', 'close', 'volume']].apply(pd.to_numeric)
 
         # Parameters for Top & Bottom Detection
@@ -529,10 +589,9 @@ class CombinedScraper:
         # Return the latest signals
         return df_1m['top_signal'].iloc[-1], df_1m['bottom_signal'].iloc[-1]
     
-    def detect_top_bottom_signals_5m(self, symbol: str):
-        # Fetching 1-minute kline data
-        data_1m = self.exchange.get_futures_kline(symbol=symbol, interval="5m", limit=240)
-        df_1m = pd.DataFrame(data_1m, columns=["timestamp", "open", "high", "low", "close", "volume"])
+    def detect_top_bottom_signals_5m(self, symbol: str, df: pd.DataFrame | None = None):
+        # Fetching 5-minute kline data
+        df_1m = self.get_candles(symbol=symbol, interval="5m", limit=240, df=df)
         df_1m[['open', 'high', 'low', 'close', 'volume']] = df_1m[['open', 'high', 'low', 'close', 'volume']].apply(pd.to_numeric)
 
         # Parameters for Top & Bottom Detection
@@ -555,10 +614,9 @@ class CombinedScraper:
         # Return the latest signals
         return df_1m['top_signal'].iloc[-1], df_1m['bottom_signal'].iloc[-1]
 
-    def detect_top_bottom_signals_1m(self, symbol: str):
+    def detect_top_bottom_signals_1m(self, symbol: str, df: pd.DataFrame | None = None):
         # Fetching 1-minute kline data for the last 240 minutes
-        data_1m = self.exchange.get_futures_kline(symbol=symbol, interval="1m", limit=240)
-        df_1m = pd.DataFrame(data_1m, columns=["timestamp", "open", "high", "low", "close", "volume"])
+        df_1m = self.get_candles(symbol=symbol, interval="1m", limit=240, df=df)
         df_1m[['open', 'high', 'low', 'close', 'volume']] = df_1m[['open', 'high', 'low', 'close', 'volume']].apply(pd.to_numeric)
 
         # Parameters for Top & Bottom Detection
@@ -620,72 +678,56 @@ class CombinedScraper:
         return df
 
 
-    def analyse_symbol(self, symbol: str) -> dict:
+    def analyse_symbol(self, symbol: str, series: dict | None = None) -> dict:
 
         len_slow_ma = 64
         len_power_ema = 13
         log.info(f"Analysing: {symbol}")
         values = {"Asset": symbol}
 
-        values["Min qty"] = self.exchange.get_symbol_info(
-            symbol=symbol, info="min_order_qty"
-        )
+        values["Min qty"] = self.symbols_info[symbol]["min_order_qty"]
 
         values["Price"] = self.prices[symbol]
 
-        candles_1h = self.exchange.get_futures_kline(
-            symbol=symbol, interval="1h", limit=5
-        )
+        # Every indicator below reads from these frames, fetched once per symbol
+        if series is None:
+            series = self.fetch_series(symbol)
+        df = series["1m"]
 
-        candles_30m = self.exchange.get_futures_kline(
-            symbol=symbol, interval="30m", limit=5
-        )
-        candles_5m = self.exchange.get_futures_kline(
-            symbol=symbol, interval="5m", limit=5
-        )
-        candles_1m = self.exchange.get_futures_kline(
-            symbol=symbol, interval="1m", limit=5
-        )
-
-        data = self.exchange.get_futures_kline(symbol=symbol, interval="1m", limit=240)
-        df = pd.DataFrame(data, columns=["timestamp", "open", "high", "low", "close", "volume"])
-        df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].apply(pd.to_numeric)
-
-        values["1m Spread"] = self.get_spread(symbol=symbol, limit=1, data=data[-1:])
-        values["5m Spread"] = self.get_spread(symbol=symbol, limit=5, data=data[-5:])
-        values["30m Spread"] = self.get_spread(symbol=symbol, limit=30, data=data[-30:])
-        values["1h Spread"] = self.get_spread(symbol=symbol, limit=60, data=data[-60:])
-        values["4h Spread"] = self.get_spread(symbol=symbol, limit=240, data=data)
+        values["1m Spread"] = self.get_spread(symbol=symbol, limit=1, data=df.tail(1))
+        values["5m Spread"] = self.get_spread(symbol=symbol, limit=5, data=df.tail(5))
+        values["30m Spread"] = self.get_spread(symbol=symbol, limit=30, data=df.tail(30))
+        values["1h Spread"] = self.get_spread(symbol=symbol, limit=60, data=df.tail(60))
+        values["4h Spread"] = self.get_spread(symbol=symbol, limit=240, data=df.tail(240))
 
         # Define 1x 5m candle volume
-        onexcandlevol = candles_5m[-1]["volume"]
+        onexcandlevol = series["5m"]["volume"].iloc[-1]
         volume_1x_5m = values["Price"] * onexcandlevol
         values["5m 1x Volume (USDT)"] = round(volume_1x_5m)
 
         # Define 1x 1m candle volume
-        onex1mcandlevol = candles_1m[-1]["volume"]
+        onex1mcandlevol = df["volume"].iloc[-1]
         volume_1x = values["Price"] * onex1mcandlevol
         values["1m 1x Volume (USDT)"] = round(volume_1x)
 
         # Define 1x 30m candle volume
-        onex30mcandlevol = candles_30m[-1]["volume"]
+        onex30mcandlevol = series["30m"]["volume"].iloc[-1]
         volume_1x_30m = values["Price"] * onex30mcandlevol
         values["30m 1x Volume (USDT)"] = round(volume_1x_30m)
 
-        onex1hcandlevol = candles_1h[-1]["volume"]
+        onex1hcandlevol = series["1h"]["volume"].iloc[-1]
         volume_1x_1h = values["Price"] * onex1hcandlevol
         values["1h 1x Volume (USDT)"] = round(volume_1x_1h)
 
         # Define MA data
-        values["5m MA6 high"] = self.get_candle_data(
-            symbol=symbol, interval="5m", limit=20
-        )["high_6"]
-        values["5m MA6 low"] = self.get_candle_data(
-            symbol=symbol, interval="5m", limit=20
-        )["low_6"]
+        candle_data_5m = self.get_candle_data(
+            symbol=symbol, interval="5m", limit=20, df=series["5m"]
+        )
+        values["5m MA6 high"] = candle_data_5m["high_6"]
+        values["5m MA6 low"] = candle_data_5m["low_6"]
 
         ma_order_pct = self.get_sma(
-            symbol=symbol, interval="1m", limit=30, column="close", window=14
+            symbol=symbol, interval="1m", limit=30, column="close", window=14, df=df
         )
         values["trend%"] = ma_order_pct
 
@@ -708,7 +750,7 @@ class CombinedScraper:
         # Most recent: 
         #mfi = self.get_mfi(symbol=symbol, interval="5m", limit=200, lookback=100)
 
-        mfi = self.get_mfi(symbol=symbol, interval="1m", limit=200, lookback=30)
+        mfi = self.get_mfi(symbol=symbol, interval="1m", limit=200, lookback=30, df=df)
 
 
         # mfi = self.get_mfi(symbol=symbol, interval="1m", limit=200, lookback=100)
@@ -722,14 +764,14 @@ class CombinedScraper:
         eri_timeframe = "15m"  # 60 minutes for 1 hour
 
         # Calculating ERI
-        eri_result = self.calculate_advanced_eri(symbol, eri_timeframe)
+        eri_result = self.calculate_advanced_eri(symbol, eri_timeframe, df=series[eri_timeframe])
         # eri_result = self.calculate_original_eri(symbol, eri_timeframe)
 
         # Adding ERI values to the dictionary
         values.update(eri_result)
 
         # Calculate HMA trend
-        hma_order_pct = self.get_hma(symbol=symbol, interval="1m", limit=30, column="close", window=14)
+        hma_order_pct = self.get_hma(symbol=symbol, interval="1m", limit=30, column="close", window=14, df=df)
         values["hma_trend%"] = hma_order_pct
 
         #print(f"HMA ORDER PCT {hma_order_pct}")
@@ -747,17 +789,17 @@ class CombinedScraper:
         # values["Top Signal 1m"] = top_signal_1m
         # values["Bottom Signal 1m"] = bottom_signal_1m
 
-        top_signal_5m, bottom_signal_5m = self.detect_top_bottom_signals_5m(symbol)
+        top_signal_5m, bottom_signal_5m = self.detect_top_bottom_signals_5m(symbol, df=series["5m"])
 
         values["Top Signal 5m"] = top_signal_5m
         values["Bottom Signal 5m"] = bottom_signal_5m
 
-        top_signal_1m, bottom_signal_1m = self.detect_top_bottom_signals_1m(symbol)
+        top_signal_1m, bottom_signal_1m = self.detect_top_bottom_signals_1m(symbol, df=df)
 
         values["Top Signal 1m"] = top_signal_1m
         values["Bottom Signal 1m"] = bottom_signal_1m
 
-        significant_levels = self.lin_peaks_troughs_highlow_algo(symbol, '4h')
+        significant_levels = self.lin_peaks_troughs_highlow_algo(symbol, '4h', df=series["4h"])
 
         #print(f"Significant levels for {symbol} : {significant_levels}")
         log.info(f"Significant levels for {symbol} : {significant_levels}")
@@ -823,9 +865,12 @@ class CombinedScraper:
         line_price = (slope * index) + intercept
         return abs(line_price - price)
 
-    def lin_peaks_troughs_highlow_algo(self, symbol, interval, threshold_percentage=0.05):
-        data = self.exchange.get_futures_kline(symbol, interval)
-        close_prices = [candle['close'] for candle in data]
+    def lin_peaks_troughs_highlow_algo(self, symbol, interval, threshold_percentage=0.05, df=None):
+        if df is None:
+            data = self.exchange.get_futures_kline(symbol, interval)
+            close_prices = [candle['close'] for candle in data]
+        else:
+            close_prices = df['close'].tolist()
 
         peaks, troughs = self.detect_peaks_and_troughs(close_prices)
         slope, intercept = self.linear_regression(close_prices)
@@ -851,68 +896,210 @@ class CombinedScraper:
         # This wrapper will be used to pass multiple arguments to the function used with Pool
         return self.retry_analyse_symbol(*args)
 
-    def analyse_all_symbols(self, retry_limit: int = 5):
-        # Create a pool of 14 worker processes
-        with Pool(processes=14) as pool:
-            # Map the analyse_symbol_wrapper function to all symbols with the retry_limit
-            data = pool.map(self.analyse_symbol_wrapper, [(symbol, retry_limit) for symbol in self.symbols])
+    def analyse_frames_wrapper(self, args):
+        symbol, frames = args
+        try:
+            return self.analyse_symbol(symbol, self.build_series(frames))
+        except Exception as e:
+            log.error(f"Exception while analysing {symbol}: {e}")
+            return None
+
+    def fetch_all_symbols(self, retry_limit: int = 5) -> dict:
+        """
+        Fetch stage: every kline series of the universe, concurrently on one event loop.
+        Returns {symbol: {interval: DataFrame}}.
+        """
+        started_at = time.time()
+        fetcher = AsyncMarketFetcher(self.exchange, concurrency=self.FETCH_CONCURRENCY, max_retries=retry_limit)
+        frames = fetcher.fetch(self.symbols, self.KLINE_SERIES, transform=self.candles_frame)
+        log.info(f"Fetched {len(frames)}/{len(self.symbols)} symbols with {fetcher.requests} requests "
+                 f"({fetcher.failures} failed) in {time.time() - started_at:.1f}s")
+        return frames
+
+    def analyse_all_symbols(self, retry_limit: int = 5, processes: int | None = None, vectorised: bool = True):
+        frames = self.fetch_all_symbols(retry_limit=retry_limit)
+        return self.analyse_frames(frames, processes=processes, vectorised=vectorised)
+
+    def analyse_frames(self, frames: dict, processes: int | None = None, vectorised: bool = True):
+        """
+        Indicator stage: CPU only, everything it reads is in ``frames``. Symbols that fit
+        the panel are analysed together in one vectorised pass, the rest (and all of
+        them with ``vectorised=False``) one by one with analyse_symbol.
+        """
+        symbols = [symbol for symbol in self.symbols if symbol in frames]
+        results = []
+        if vectorised:
+            panel = self.indicator_panel()
+            panel_symbols, _ = panel.split(self.panel_candidates(frames, symbols))
+            in_panel = set(panel_symbols)
+            symbols = [symbol for symbol in symbols if symbol not in in_panel]
+            if panel_symbols:
+                results.append(self.market_rows(panel, panel.candle_columns(panel_symbols, frames)))
+        results.append(self.analyse_each(frames, symbols, processes))
+        return self.combine_results(results)
+
+    def indicator_panel(self) -> IndicatorPanel:
+        return IndicatorPanel(self.KLINE_SERIES, self.RESAMPLED_MINUTES, self.exchange.kline_includes_open_candle)
+
+    def panel_candidates(self, frames: dict, symbols: list) -> dict:
+        # The panel takes price and minimum quantity from the universe, analyse_symbol copes without them
+        return {symbol: frames[symbol] for symbol in symbols if symbol in self.prices and symbol in self.symbols_info}
+
+    def market_rows(self, panel: IndicatorPanel, candle_columns: pd.DataFrame) -> pd.DataFrame:
+        symbols = candle_columns.index.tolist()
+        return panel.with_market(
+            candle_columns,
+            prices=self.prices,
+            min_qtys={symbol: self.symbols_info[symbol]["min_order_qty"] for symbol in symbols},
+            funding={symbol: self.get_cached_funding(symbol) for symbol in symbols},
+            timestamp=str(int(datetime.now().timestamp())),
+        )[self.OUTPUT_COLUMNS]
+
+    def analyse_each(self, frames: dict, symbols: list, processes: int | None = None):
+        """analyse_symbol rows of ``symbols``, on a Pool when there are processes to spare. None without any."""
+        jobs = [(symbol, frames[symbol]) for symbol in symbols]
+        processes = self.ANALYSIS_PROCESSES if processes is None else processes
+        if processes > 1 and len(jobs) > 1:
+            with Pool(processes=processes) as pool:
+                data = pool.map(self.analyse_frames_wrapper, jobs, chunksize=max(1, len(jobs) // (processes * 4)))
+        else:
+            data = [self.analyse_frames_wrapper(job) for job in jobs]
 
         # Filter out None results if any failed analyses returned None
         data = [result for result in data if result is not None]
+        return pd.DataFrame(data, columns=self.OUTPUT_COLUMNS) if data else None
 
+    def combine_results(self, results: list) -> pd.DataFrame:
+        results = [result for result in results if result is not None and len(result) > 0]
+        if not results:
+            return pd.DataFrame(columns=self.OUTPUT_COLUMNS)
         # Create the DataFrame with the collected data
-        df = pd.DataFrame(
-            data,
-            columns=[
-                "Asset",
-                "Min qty",
-                "Price",
-                "1m 1x Volume (USDT)",
-                "5m 1x Volume (USDT)",
-                "30m 1x Volume (USDT)",
-                "1h 1x Volume (USDT)",
-                "1m Spread",
-                "5m Spread",
-                "30m Spread",
-                "1h Spread",
-                "4h Spread",
-                "trend%",
-                "Trend",
-                "HMA Trend",
-                "5m MA6 high",
-                "5m MA6 low",
-                "Funding",
-                "Timestamp",
-                "MFI", #OR MFIRSI
-                "ERI Bull Power",
-                "ERI Bear Power",
-                "ERI Trend",
-                "Top Signal 5m",
-                "Bottom Signal 5m",
-                "Top Signal 1m",
-                "Bottom Signal 1m"
-            ],
-        )
+        df = pd.concat(results, ignore_index=True) if len(results) > 1 else results[0].reset_index(drop=True)
         # Sort the DataFrame as required
         df.sort_values(by=["1m 1x Volume (USDT)", "5m Spread"], inplace=True, ascending=[False, False])
         return df
 
-def run_scraper_for_exchange(exchange_name: str):
-    log.info(f"Starting scraper for {exchange_name}")
+class IncrementalScraper(CombinedScraper):
+    """
+    A CombinedScraper that lives across cycles instead of being rebuilt for each one.
+
+    The base series of every symbol are kept in KlineBuffers, so a cycle only requests
+    the bars closed since the previous one and skips the series that have none. The
+    panel's candle columns are kept per symbol and only recomputed for symbols whose
+    candles changed; prices and funding are applied to every row each cycle. Prices,
+    volumes and funding come from one tickers snapshot per cycle, the symbol universe
+    is reloaded every UNIVERSE_REFRESH seconds. The rows are the same as those of a
+    fresh CombinedScraper.
+    """
+
+    UNIVERSE_REFRESH = 300  # Seconds between reloads of the symbols and instrument info, and the top volume selection
+
+    def __init__(self, exchange_name, filters: dict):
+        super().__init__(exchange_name, filters)
+        self.universe_loaded_at = time.time()
+        self.tickers_current = True  # __init__ just loaded them, the first cycle can use them
+        self.klines = KlineBuffers(self.exchange, self.KLINE_SERIES)
+        self.candle_state = None  # IndicatorPanel.candle_columns rows by symbol
+        self.state_keys = {}  # {symbol: series revisions its candle_state row was computed from}
+        self.cycle_requests = 0
+
+    def __getstate__(self):
+        # Pool workers of analyse_each only need the universe, not the buffers
+        state = self.__dict__.copy()
+        state.update(klines=None, volume_collectors={}, candle_state=None, state_keys={})
+        return state
+
+    def refresh_market(self):
+        if self.tickers_current:
+            self.tickers_current = False
+        elif time.time() - self.universe_loaded_at >= self.UNIVERSE_REFRESH:
+            self.load_universe()
+            self.universe_loaded_at = time.time()
+            self.klines.prune(self.symbols)
+            universe = set(self.symbols)
+            for symbol in [symbol for symbol in self.state_keys if symbol not in universe]:
+                del self.state_keys[symbol]
+        else:
+            self.load_tickers()
+
+    def update_buffers(self, retry_limit: int = 5) -> list:
+        """
+        Fetch stage: the new bars of every series. Returns the symbols whose series are
+        all current.
+        """
+        fetcher = AsyncMarketFetcher(self.exchange, concurrency=self.FETCH_CONCURRENCY, max_retries=retry_limit)
+        symbols, series = self.klines.update(fetcher, self.symbols, int(time.time() * 1000))
+        self.cycle_requests = fetcher.requests
+        log.info(f"Updated {series} series of {len(symbols)}/{len(self.symbols)} symbols with {fetcher.requests} "
+                 f"requests ({fetcher.failures} failed)")
+        return symbols
+
+    def series_frames(self, symbol: str) -> dict:
+        return {interval: self.klines.frame(symbol, interval) for interval in self.KLINE_SERIES}
+
+    def fetch_all_symbols(self, retry_limit: int = 5) -> dict:
+        return {symbol: self.series_frames(symbol) for symbol in self.update_buffers(retry_limit)}
+
+    def analyse_all_symbols(self, retry_limit: int = 5, processes: int | None = None, vectorised: bool = True):
+        started_at = time.time()
+        self.refresh_market()
+        if not vectorised:
+            return self.analyse_frames(self.fetch_all_symbols(retry_limit), processes=processes, vectorised=False)
+
+        symbols = self.update_buffers(retry_limit)
+        keys = {symbol: self.klines.revision(symbol) for symbol in symbols}
+        changed = [symbol for symbol in symbols if self.state_keys.get(symbol) != keys[symbol]]
+        frames = {symbol: self.series_frames(symbol) for symbol in changed}
+
+        panel = self.indicator_panel()
+        panel_symbols, _ = panel.split(self.panel_candidates(frames, changed))
+        for symbol in changed:
+            self.state_keys.pop(symbol, None)
+        state = self.candle_state
+        if state is not None:
+            state = state[state.index.isin(self.state_keys.keys())]
+        if panel_symbols:
+            rows = panel.candle_columns(panel_symbols, frames)
+            state = rows if state is None or state.empty else pd.concat([state, rows])
+            self.state_keys.update((symbol, keys[symbol]) for symbol in panel_symbols)
+        self.candle_state = state
+
+        in_panel = set(panel_symbols)
+        current = [symbol for symbol in symbols if symbol in self.state_keys and symbol in self.prices and symbol in self.symbols_info]
+        results = [self.market_rows(panel, state.loc[current])] if current else []
+        results.append(self.analyse_each(frames, [symbol for symbol in changed if symbol not in in_panel], processes))
+        df = self.combine_results(results)
+        log.info(f"Cycle: {len(df)} assets, {len(panel_symbols)} recomputed, {self.cycle_requests} kline "
+                 f"requests in {time.time() - started_at:.1f}s")
+        return df
+
+def run_scraper_for_exchange(exchange_name: str, incremental: bool = True):
+    log.info(f"Starting scraper for {exchange_name}" + (" (incremental)" if incremental else ""))
+    if not ARROW_AVAILABLE:
+        log.warning("pyarrow is not installed, only the JSON files will be written")
 
     # User-defined parameters
     quote_symbols = ["USDT"]
     top_volume = 400
     filters = {"quote_symbols": quote_symbols, "top_volume": top_volume}
 
+    scraper = None
     while True:
         start_time = time.time()
         try:
             with pidfile.PIDFile(f"{exchange_name}_scraper.pid"):
-                scraper = CombinedScraper(exchange_name=exchange_name, filters=filters)
-                
+                # Incremental: one scraper keeps its candles and indicator state across cycles
+                if scraper is None or not incremental:
+                    scraper_class = IncrementalScraper if incremental else CombinedScraper
+                    scraper = scraper_class(exchange_name=exchange_name, filters=filters)
+
                 # Analyzing all symbols with multiprocessing
                 df = scraper.analyse_all_symbols()
+
+                # Columnar snapshot, the filtered files below are views of it (api/snapshot.py).
+                # The JSON files stay for consumers that do not read the snapshot
+                if ARROW_AVAILABLE:
+                    scraper.output_df(dataframe=df, path=f"/var/www/api/data/quantdatav2_{exchange_name}.arrow", to="arrow")
                 
                 # Define the main path and temporary path for the JSON file
                 log.info(f"Setting file paths for exchange: {exchange_name}")
@@ -965,7 +1152,8 @@ def run_scraper_for_exchange(exchange_name: str):
                 )
 
                 # Sorting rotator_symbols
-                rotator_symbols = rotator_symbols.sort_values(by="1m 1x Volume (USDT)", ascending=False)
+                # Stable, so ties keep the analysis order like the snapshot's rotatorsymbols view
+                rotator_symbols = rotator_symbols.sort_values(by="1m 1x Volume (USDT)", ascending=False, kind="stable")
 
                 #rotator_symbols = rotator_symbols.sort_values(by=["1m 1x Volume (USDT)", "5m Spread"], ascending=[False, False])
 
@@ -1018,8 +1206,13 @@ def run_scraper_for_exchange(exchange_name: str):
                 total_historical_volume = scraper.get_all_historical_volume(exchange_name=exchange_name, interval="1h", limit=24)
 
                 # Then save the JSON
-                with open(f"/var/www/api/data/total_historical_volume_{exchange_name}.json", "w") as outfile:
-                    json.dump(total_historical_volume, outfile)
+                write_json(total_historical_volume, f"/var/www/api/data/total_historical_volume_{exchange_name}.json")
+                if ARROW_AVAILABLE:
+                    scraper.output_df(
+                        dataframe=scraper.historical_volume_frame(total_historical_volume),
+                        path=f"/var/www/api/data/total_historical_volume_{exchange_name}.arrow",
+                        to="arrow",
+                    )
 
         except pidfile.AlreadyRunningError:
             log.warning(f"{exchange_name} scraper already running.")
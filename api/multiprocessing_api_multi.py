@@ -17,8 +17,8 @@ from decimal import Decimal, ROUND_HALF_UP
 from datetime import datetime
 
 sys.path.append(".")
-from directionalscalper.api.exchanges.binance import Binance
-from directionalscalper.api.exchanges.bybit import Bybit
+from api.exchanges.binance import Binance
+from api.exchanges.bybit import Bybit
 from directionalscalper.core.utils import send_public_request
 from directionalscalper.core.logger import Logger
 log = Logger(filename="combined_scraper.log", stream=True)
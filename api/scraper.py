@@ -11,8 +11,7 @@ import pidfile
 import ta
 
 sys.path.append(".")
-from directionalscalper.api.exchanges.binance import Binance
-from directionalscalper.api.exchanges.bybit import Bybit
+from api.exchanges.bybit import Bybit
 from directionalscalper.core.logger import Logger
 
 log = Logger(filename="scraper.log", stream=True)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import json
+import logging
+import operator
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # Only the columnar snapshot needs it, the JSON exports do not
+    pa = None
+    pc = None
+
+log = logging.getLogger(__name__)
+
+ARROW_AVAILABLE = pa is not None
+
+ROTATOR_MIN_VOLUME = 15000
+FUNDING_COLUMNS = ["Asset", "1m 1x Volume (USDT)", "Funding"]
+
+# The datasets the scraper used to write as separate JSON files, as predicates on the
+# one snapshot: (column, operator, value) filters like CombinedScraper.filter_df, an
+# optional descending sort and an optional column subset
+VIEWS = {
+    "assets": {},
+    "whattotrade": {"filters": [("5m 1x Volume (USDT)", ">", ROTATOR_MIN_VOLUME)]},
+    "rotatorsymbols": {
+        "filters": [("1m 1x Volume (USDT)", ">", ROTATOR_MIN_VOLUME)],
+        "sort": "1m 1x Volume (USDT)",
+    },
+    "rotatorsymbols_bullish": {
+        "filters": [("1m 1x Volume (USDT)", ">", ROTATOR_MIN_VOLUME), ("ERI Trend", "==", "bullish")],
+        "sort": "1m 1x Volume (USDT)",
+    },
+    "rotatorsymbols_bearish": {
+        "filters": [("1m 1x Volume (USDT)", ">", ROTATOR_MIN_VOLUME), ("ERI Trend", "==", "bearish")],
+        "sort": "1m 1x Volume (USDT)",
+    },
+    "negativefunding": {"filters": [("Funding", "<", 0)], "columns": FUNDING_COLUMNS},
+    "positivefunding": {"filters": [("Funding", ">", 0)], "columns": FUNDING_COLUMNS},
+}
+
+
+def view_for(url: str) -> str | None:
+    """View standing in for a volumedata URL or file name, None when the snapshot does not hold it."""
+    name = str(url).rsplit("/", 1)[-1]
+    if name.startswith(("quantdatav2", "everything", "funding")):
+        return "assets"
+    if name.startswith("rotatorsymbols"):
+        if "_bullish" in name:
+            return "rotatorsymbols_bullish"
+        if "_bearish" in name:
+            return "rotatorsymbols_bearish"
+        if "_atrp" in name:
+            return None
+        return "rotatorsymbols"
+    for view in ("whattotrade", "negativefunding", "positivefunding"):
+        if name.startswith(view):
+            return view
+    return None
+
+
+COMPARISONS = {">": operator.gt, "<": operator.lt, "==": operator.eq}
+
+
+def select_records(records: list, view: str) -> list:
+    """``select`` over a list of dicts. Missing values match no filter, like nulls in Arrow."""
+    spec = VIEWS[view]
+    filters = []
+    for column, op, value in spec.get("filters", ()):
+        if op not in COMPARISONS:
+            raise ValueError(f"Operator {op} not implemented")
+        filters.append((column, COMPARISONS[op], value))
+    rows = [
+        record for record in records
+        if all(record.get(column) is not None and compare(record[column], value) for column, compare, value in filters)
+    ]
+    if "sort" in spec:
+        rows.sort(key=lambda record: record[spec["sort"]], reverse=True)
+    if "columns" in spec:
+        rows = [{column: record.get(column) for column in spec["columns"]} for record in rows]
+    return rows
+
+
+def select(table, view: str):
+    """The rows and columns of ``view`` from a snapshot table."""
+    spec = VIEWS[view]
+    mask = None
+    for column, operator, value in spec.get("filters", ()):
+        if operator == ">":
+            condition = pc.greater(table[column], value)
+        elif operator == "<":
+            condition = pc.less(table[column], value)
+        elif operator == "==":
+            condition = pc.equal(table[column], value)
+        else:
+            raise ValueError(f"Operator {operator} not implemented")
+        mask = condition if mask is None else pc.and_(mask, condition)
+    if mask is not None:
+        table = table.filter(mask)
+    if "sort" in spec:
+        table = table.sort_by([(spec["sort"], "descending")])
+    if "columns" in spec:
+        table = table.select(spec["columns"])
+    return table
+
+
+def write_snapshot(dataframe, path, metadata: dict | None = None):
+    """
+    Write a DataFrame as an Arrow IPC file and publish it atomically: readers see the
+    previous file or the new one, never a partial write. Record batches are left
+    uncompressed so a reader can memory-map the columns without copying them.
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow is not available, install it to write columnar snapshots")
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[b"generated_at"] = str(time.time()).encode()
+    for key, value in (metadata or {}).items():
+        schema_metadata[str(key).encode()] = str(value).encode()
+    table = table.replace_schema_metadata(schema_metadata)
+
+    path = str(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(temp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(temp_path, path)
+
+
+def write_json(data, path):
+    """``json.dump`` published atomically like ``write_snapshot``, for the compatibility exports."""
+    path = str(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as outfile:
+        json.dump(data, outfile)
+    os.replace(temp_path, path)
+
+
+class SnapshotReader:
+    """
+    Memory-mapped view of the latest snapshot a scraper published with ``write_snapshot``.
+
+    ``refresh`` maps the file again once it has been replaced; until then every read
+    is served from the current mapping. Columns are Arrow arrays over the mapped
+    pages, so ``column`` does not copy or parse anything. ``records`` turns a view
+    into the list of dicts the JSON files held, once per snapshot.
+    """
+
+    def __init__(self, path):
+        if pa is None:
+            raise RuntimeError("pyarrow is not available, install it to read columnar snapshots")
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.table = None
+        self.version = None  # (inode, mtime, size) of the mapped file
+        self.generated_at = None
+        self.records_cache = {}  # view -> list of dicts of the mapped snapshot
+
+    def refresh(self) -> bool:
+        """Map the file again if it was replaced. False while there is no snapshot to read."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return self.table is not None
+        version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if version == self.version:
+            return True
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(self.path), "r")).read_all()
+        except (OSError, pa.ArrowInvalid) as e:
+            log.error(f"Could not map snapshot {self.path}: {e}")
+            return self.table is not None
+        generated_at = (table.schema.metadata or {}).get(b"generated_at")
+        with self.lock:
+            self.table = table
+            self.version = version
+            self.generated_at = float(generated_at) if generated_at else stat.st_mtime
+            self.records_cache = {}
+        return True
+
+    def column(self, name: str):
+        """A column of the latest snapshot as a zero-copy Arrow array, None without a snapshot."""
+        if not self.refresh():
+            return None
+        return self.table[name]
+
+    def view(self, name: str):
+        if not self.refresh():
+            return None
+        return select(self.table, name)
+
+    def records(self, name: str) -> list:
+        """A view as a list of dicts, the same object for as long as the snapshot is unchanged."""
+        if not self.refresh():
+            return []
+        with self.lock:
+            table = self.table
+            records = self.records_cache.get(name)
+        if records is None:
+            records = select(table, name).to_pylist()
+            with self.lock:
+                if self.table is table:
+                    self.records_cache[name] = records
+        return records
+
+    def age(self):
+        if self.generated_at is None:
+            return None
+        return time.time() - self.generated_at
@@ -0,0 +1,203 @@
+"""
+Per-iteration latency of the thread runtime vs the async runtime.
+
+Each symbol fetches its order book and ticker every iteration, on public endpoints
+so no API keys are needed. The thread runtime runs one thread per symbol with
+blocking calls, the async runtime runs one coroutine per symbol on one event loop.
+Both go through the same shared rate limiter, like the bots.
+
+With ``--stand-in LATENCY`` both clients talk to a local HTTP/1.1 stand-in for the
+Bybit public endpoints (instruments, order book, tickers) that answers after LATENCY
+seconds, so the runtimes can be compared without network access.
+
+    python benchmark_async_runtime.py --symbols 50 200 --iterations 5
+    python benchmark_async_runtime.py --symbols 50 200 --iterations 5 --stand-in 0.05
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Process, Queue
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from directionalscalper.core.exchanges.async_bybit import AsyncBybitExchange
+from directionalscalper.core.exchanges.bybit import BybitExchange
+from directionalscalper.core.strategies.bybit.async_runtime import AsyncBybitStrategy, AsyncStrategyRuntime
+
+
+class BybitStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections open between requests
+    symbols = []
+    latency = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        time.sleep(self.latency)
+        if url.path == "/v5/market/time":
+            result = {"timeSecond": str(int(time.time())), "timeNano": str(time.time_ns())}
+        elif url.path == "/v5/market/instruments-info":
+            result = {"category": "linear", "list": [self.instrument(symbol) for symbol in self.symbols], "nextPageCursor": ""}
+        elif url.path == "/v5/market/orderbook":
+            result = {"s": query["symbol"], "b": [["99.9", "10"], ["99.8", "20"]], "a": [["100.1", "10"], ["100.2", "20"]],
+                      "ts": int(time.time() * 1000), "u": 1}
+        elif url.path == "/v5/market/tickers":
+            result = {"category": "linear", "list": [self.ticker(query["symbol"])]}
+        else:
+            self.send_error(404)
+            return
+        body = json.dumps({"retCode": 0, "retMsg": "OK", "result": result, "time": int(time.time() * 1000)}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+    @staticmethod
+    def instrument(symbol):
+        return {
+            "symbol": symbol, "contractType": "LinearPerpetual", "status": "Trading", "baseCoin": symbol[:-4],
+            "quoteCoin": "USDT", "settleCoin": "USDT", "launchTime": "1600000000000", "deliveryTime": "0", "priceScale": "1",
+            "leverageFilter": {"minLeverage": "1", "maxLeverage": "50", "leverageStep": "0.01"},
+            "priceFilter": {"minPrice": "0.1", "maxPrice": "100000", "tickSize": "0.1"},
+            "lotSizeFilter": {"maxOrderQty": "1000", "minOrderQty": "1", "qtyStep": "1", "postOnlyMaxOrderQty": "1000"},
+            "fundingInterval": 480,
+        }
+
+    @staticmethod
+    def ticker(symbol):
+        return {"symbol": symbol, "lastPrice": "100", "bid1Price": "99.9", "ask1Price": "100.1", "volume24h": "1000",
+                "turnover24h": "100000", "highPrice24h": "101", "lowPrice24h": "99", "prevPrice24h": "100"}
+
+
+def serve(symbols, latency, port_queue):
+    BybitStandIn.symbols = symbols
+    BybitStandIn.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BybitStandIn)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def point_at(client, base_url):
+    """Send every request of a ccxt bybit client to ``base_url``, loading linear markets only."""
+    client.urls['api'] = {name: base_url for name in client.urls['api']}
+    client.options['fetchMarkets'] = ['linear']
+
+
+class StandInBybitExchange(BybitExchange):
+    base_url = None
+
+    def initialise(self):
+        super().initialise()
+        point_at(self.exchange, self.base_url)
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+def pick_symbols(exchange, count):
+    markets = exchange.exchange.markets.values()
+    symbols = [market['id'] for market in markets if market.get('linear') and market.get('active') and market['quote'] == 'USDT']
+    return sorted(symbols)[:count]
+
+
+def run_threads(exchange, symbols, iterations):
+    latencies = []
+    lock = threading.Lock()
+
+    def run_symbol(symbol):
+        for _ in range(iterations):
+            started_at = time.monotonic()
+            exchange.get_orderbook(symbol)
+            exchange.exchange.fetch_ticker(symbol)
+            with lock:
+                latencies.append(time.monotonic() - started_at)
+
+    started_at = time.monotonic()
+    threads = [threading.Thread(target=run_symbol, args=(symbol,), daemon=True) for symbol in symbols]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, time.monotonic() - started_at
+
+
+class BenchmarkStrategy(AsyncBybitStrategy):
+    iteration_interval = 0
+    private_data = False
+
+    def __init__(self, exchange, iterations):
+        super().__init__(exchange, None, None)
+        self.iterations = iterations
+        self.done = {}
+
+    async def iterate(self, symbol, snapshot):
+        self.done[symbol] = self.done.get(symbol, 0) + 1
+        return self.done[symbol] < self.iterations
+
+
+async def run_async(symbols, iterations, base_url=None):
+    exchange = AsyncBybitExchange()
+    if base_url:
+        point_at(exchange.exchange, base_url)
+    try:
+        await exchange.load_markets()
+        strategy = BenchmarkStrategy(exchange, iterations)
+        runtime = AsyncStrategyRuntime(exchange, strategy, latency_window=iterations)
+        started_at = time.monotonic()
+        await runtime.run(symbols)
+        elapsed = time.monotonic() - started_at
+        latencies = [value for values in runtime.iteration_latency.values() for value in values]
+        return latencies, elapsed
+    finally:
+        await exchange.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare thread and async runtime iteration latency')
+    parser.add_argument('--symbols', type=int, nargs='+', default=[50, 200], help='Symbol counts to benchmark')
+    parser.add_argument('--iterations', type=int, default=5, help='Iterations per symbol')
+    parser.add_argument('--stand-in', type=float, default=None, metavar='LATENCY', help='Use a local Bybit stand-in answering after LATENCY seconds')
+    args = parser.parse_args()
+
+    base_url = None
+    exchange_class = BybitExchange
+    if args.stand_in is not None:
+        # In its own process so the stand-in does not compete with the runtimes for the GIL
+        port_queue = Queue()
+        stand_in = Process(target=serve, args=([f"SYM{i}USDT" for i in range(max(args.symbols))], args.stand_in, port_queue), daemon=True)
+        stand_in.start()
+        base_url = f"http://127.0.0.1:{port_queue.get()}"
+        StandInBybitExchange.base_url = base_url
+        exchange_class = StandInBybitExchange
+
+    exchange = exchange_class(None, None, use_market_data_stream=False, use_account_stream=False)
+
+    for count in args.symbols:
+        symbols = pick_symbols(exchange, count)
+
+        thread_latencies, thread_elapsed = run_threads(exchange, symbols, args.iterations)
+        async_latencies, async_elapsed = asyncio.run(run_async(symbols, args.iterations, base_url))
+
+        print(f"{len(symbols)} symbols, {args.iterations} iterations each")
+        for name, latencies, elapsed in (("thread", thread_latencies, thread_elapsed), ("async", async_latencies, async_elapsed)):
+            stats = summarize(latencies)
+            print(f"  {name:6} iteration mean {stats['mean']:.3f}s  median {stats['median']:.3f}s  p95 {stats['p95']:.3f}s  total {elapsed:.1f}s")
@@ -0,0 +1,109 @@
+"""
+Startup wall time and peak memory of the exchange adapters of a symbol rotation.
+
+Before ExchangeRegistry every symbol thread of an account built its own
+BybitExchange, with its own ccxt client, HTTP session and copy of the markets.
+With it, the threads share one adapter per account. Each mode runs in a fresh
+process: ``--adapters`` threads start at once and each asks for the account's
+adapter, like the runners start one thread per rotator symbol. The adapters talk
+to a local HTTP/1.1 stand-in for the Bybit v5 endpoints with ``--markets`` linear
+instruments, answering after ``--latency`` seconds. The WebSocket streams are
+left off in both modes, they are process-wide already.
+
+Peak memory is the process's high-water resident size (VmHWM, Linux), and the
+growth over the resident size before the first adapter.
+
+    python benchmark_exchange_registry.py --adapters 30 --markets 500 --latency 0.05
+"""
+import argparse
+import sys
+import threading
+import time
+from multiprocessing import get_context
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from benchmark_async_runtime import point_at
+from benchmark_grid_reissue import BybitStandIn
+from directionalscalper.core.exchanges.bybit import BybitExchange
+from directionalscalper.core.exchanges.exchange_registry import ExchangeRegistry
+
+
+def serve(symbols, latency, port_queue):
+    BybitStandIn.symbols = symbols
+    BybitStandIn.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BybitStandIn)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+class StandInBybitExchange(BybitExchange):
+    base_url = None
+
+    def initialise(self):
+        super().initialise()
+        point_at(self.exchange, self.base_url)
+
+
+def memory_kb(field):
+    with open("/proc/self/status") as status:
+        return next(int(line.split()[1]) for line in status if line.startswith(f"{field}:"))
+
+
+def start_rotation(mode, adapters, base_url, results):
+    # Runs in a fresh process, so the market registry and the adapter registry start empty
+    StandInBybitExchange.base_url = base_url
+
+    def create_exchange():
+        return StandInBybitExchange("key", "secret", use_market_data_stream=False, use_account_stream=False)
+
+    def symbol_thread(built):
+        if mode == "registry":
+            built.append(ExchangeRegistry.get_or_create(("bybit", "account"), create_exchange))
+        else:
+            built.append(create_exchange())
+
+    rss_before = memory_kb("VmRSS")
+    started_at = time.monotonic()
+    built = []
+    threads = [threading.Thread(target=symbol_thread, args=(built,)) for _ in range(adapters)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started_at
+    peak = memory_kb("VmHWM")
+    results.put({
+        "mode": mode, "elapsed": elapsed, "peak_kb": peak, "growth_kb": peak - rss_before,
+        "adapters": len({id(adapter) for adapter in built}), "clients": len({id(adapter.exchange) for adapter in built}),
+    })
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time and measure adapter startup with and without ExchangeRegistry')
+    parser.add_argument('--adapters', type=int, default=30, help='Symbol threads asking for the account adapter')
+    parser.add_argument('--markets', type=int, default=500, help='Linear instruments the stand-in lists')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds the stand-in waits before answering')
+    args = parser.parse_args()
+
+    context = get_context("spawn")
+    port_queue = context.Queue()
+    stand_in = context.Process(target=serve, args=([f"SYM{i}USDT" for i in range(args.markets)], args.latency, port_queue), daemon=True)
+    stand_in.start()
+    base_url = f"http://127.0.0.1:{port_queue.get()}"
+
+    print(f"{args.adapters} symbol threads, {args.markets} markets, {args.latency * 1000:.0f} ms per request")
+    for mode in ("per-thread", "registry"):
+        results = context.Queue()
+        process = context.Process(target=start_rotation, args=(mode, args.adapters, base_url, results))
+        process.start()
+        result = results.get()
+        process.join()
+        print(f"  {mode:10}: {result['elapsed']:.2f}s, peak RSS {result['peak_kb'] / 1024:.0f} MiB "
+              f"(+{result['growth_kb'] / 1024:.0f} MiB), {result['adapters']} adapters, {result['clients']} ccxt clients")
+
+    stand_in.terminate()
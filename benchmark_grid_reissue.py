@@ -0,0 +1,209 @@
+"""
+Grid reissue latency with one cancel request per order vs /v5/order/cancel-batch.
+
+A reissue cancels both grids of a symbol (BybitStrategy.cancel_grid_orders for each
+side) and lays them again with create_tagged_limit_orders_bybit, like a grid moved
+past its reissue threshold. The BybitExchange under test talks to a local HTTP/1.1
+stand-in for the Bybit v5 endpoints that keeps the open orders of each symbol and
+answers after ``--latency`` seconds, so the numbers count round trips, not the
+exchange's matching engine. Requests go through the adapter's RateLimiter as in a
+bot, which paces the create-batch of both modes alike.
+
+Modes:
+  single  what cancel_grid_orders did before: cancel_order_by_id for each order
+  batch   cancel_orders_by_side_bybit, up to 10 orders per cancel-batch request
+
+    python benchmark_grid_reissue.py --levels 5 10 --rounds 10 --latency 0.05
+"""
+import argparse
+import itertools
+import json
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from multiprocessing import Process, Queue
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from benchmark_async_runtime import BybitStandIn as PublicStandIn, point_at
+from directionalscalper.core.exchanges.bybit import BybitExchange
+from directionalscalper.core.strategies.bybit.bybit_strategy import BybitStrategy
+
+SYMBOL = "SYM0USDT"
+
+
+class BybitStandIn(PublicStandIn):
+    """Public endpoints of the async runtime stand-in, plus the order endpoints a reissue uses."""
+
+    orders = {}  # orderId -> Bybit v5 order
+    ids = itertools.count(1)
+    counts = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path == "/stats":
+            with self.lock:
+                result = dict(self.counts)
+                self.counts.clear()
+            self.respond(result)
+            return
+        if url.path == "/v5/order/realtime":
+            self.count(url.path)
+            with self.lock:
+                orders = [dict(order) for order in self.orders.values() if order["symbol"] == query.get("symbol", order["symbol"])]
+            self.respond({"retCode": 0, "retMsg": "OK", "result": {"category": "linear", "list": orders, "nextPageCursor": ""}})
+            return
+        if url.path == "/v5/asset/coin/query-info":
+            self.respond({"retCode": 0, "retMsg": "OK", "result": {"rows": []}})
+            return
+        if url.path in ("/v5/user/query-api", "/v5/account/info"):
+            self.respond({"retCode": 0, "retMsg": "OK", "result": {"unified": 1, "uta": 1, "unifiedMarginStatus": 4}})
+            return
+        super().do_GET()
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        self.count(url.path)
+        if url.path == "/v5/order/create-batch":
+            placed = [self.place(request) for request in body["request"]]
+            result = {"list": [{"orderId": order["orderId"], "orderLinkId": order["orderLinkId"], "symbol": order["symbol"],
+                                "category": "linear", "createAt": order["createdTime"]} for order in placed]}
+            ext = {"list": [{"code": 0, "msg": "OK"} for _ in placed]}
+        elif url.path == "/v5/order/cancel":
+            with self.lock:
+                self.orders.pop(body["orderId"], None)
+            result, ext = {"orderId": body["orderId"], "orderLinkId": ""}, {}
+        elif url.path == "/v5/order/cancel-batch":
+            with self.lock:
+                for request in body["request"]:
+                    self.orders.pop(request["orderId"], None)
+            result = {"list": [{"orderId": request["orderId"], "orderLinkId": "", "symbol": request["symbol"], "category": "linear"}
+                               for request in body["request"]]}
+            ext = {"list": [{"code": 0, "msg": "OK"} for _ in body["request"]]}
+        else:
+            self.send_error(404)
+            return
+        self.respond({"retCode": 0, "retMsg": "OK", "result": result, "retExtInfo": ext, "time": int(time.time() * 1000)})
+
+    def count(self, path):
+        with self.lock:
+            self.counts[path] += 1
+        time.sleep(self.latency)
+
+    def place(self, request):
+        now = str(int(time.time() * 1000))
+        order = {
+            "orderId": str(next(self.ids)), "orderLinkId": request.get("orderLinkId", ""), "symbol": request["symbol"],
+            "side": request["side"], "orderType": "Limit", "price": request["price"], "qty": request["qty"],
+            "leavesQty": request["qty"], "cumExecQty": "0", "cumExecValue": "0", "avgPrice": "0", "orderStatus": "New",
+            "timeInForce": request.get("timeInForce", "GTC"), "reduceOnly": False, "positionIdx": request.get("positionIdx", 0),
+            "createdTime": now, "updatedTime": now,
+        }
+        with self.lock:
+            self.orders[order["orderId"]] = order
+        return order
+
+    def respond(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(latency, port_queue):
+    BybitStandIn.symbols = [SYMBOL]
+    BybitStandIn.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BybitStandIn)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+class StandInBybitExchange(BybitExchange):
+    base_url = None
+
+    def initialise(self):
+        super().initialise()
+        point_at(self.exchange, self.base_url)
+
+
+def cancel_grid_orders_single(strategy, symbol, side):
+    # What cancel_grid_orders did before the batch path
+    open_orders = strategy.retry_api_call(strategy.exchange.get_open_orders, symbol)
+    for order in open_orders:
+        if order['side'].lower() == side.lower():
+            strategy.exchange.cancel_order_by_id(order['id'], symbol)
+    strategy.active_grids.discard(symbol)
+
+
+def grid(side, levels):
+    prices = [100 - 0.5 * (level + 1) if side == "buy" else 100 + 0.5 * (level + 1) for level in range(levels)]
+    return [{"side": side, "qty": 1, "price": price, "positionIdx": 1 if side == "buy" else 2,
+             "orderLinkId": BybitStrategy.generate_order_link_id(None, SYMBOL, side, level)} for level, price in enumerate(prices)]
+
+
+def take_counts(exchange, base_url):
+    return Counter(exchange.exchange.session.get(f"{base_url}/stats").json())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time grid reissues with single and batch cancels against a local Bybit stand-in')
+    parser.add_argument('--levels', type=int, nargs='+', default=[5, 10], help='Grid levels per side')
+    parser.add_argument('--rounds', type=int, default=10, help='Reissues per mode')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds the stand-in waits before answering')
+    args = parser.parse_args()
+
+    port_queue = Queue()
+    stand_in = Process(target=serve, args=(args.latency, port_queue), daemon=True)
+    stand_in.start()
+    base_url = f"http://127.0.0.1:{port_queue.get()}"
+    StandInBybitExchange.base_url = base_url
+
+    exchange = StandInBybitExchange("key", "secret", use_market_data_stream=False, use_account_stream=False)
+    exchange.exchange.load_markets()
+    symbol = exchange.exchange.market(SYMBOL)['symbol']
+    strategy = BybitStrategy.__new__(BybitStrategy)
+    strategy.exchange = exchange
+    strategy.active_grids = set()
+
+    cancel_modes = {
+        "single": lambda side: cancel_grid_orders_single(strategy, symbol, side),
+        "batch": lambda side: strategy.cancel_grid_orders(symbol, side),
+    }
+    print(f"{args.rounds} reissues of both grids per mode, {args.latency * 1000:.0f} ms per request")
+    for levels in args.levels:
+        for mode, cancel in cancel_modes.items():
+            for side in ("buy", "sell"):
+                exchange.create_tagged_limit_orders_bybit(symbol, grid(side, levels))
+            take_counts(exchange, base_url)
+            latencies, cancel_latencies = [], []
+            for _ in range(args.rounds):
+                started_at = time.monotonic()
+                cancelling = 0.0
+                for side in ("buy", "sell"):
+                    cancel_started_at = time.monotonic()
+                    cancel(side)
+                    cancelling += time.monotonic() - cancel_started_at
+                    exchange.create_tagged_limit_orders_bybit(symbol, grid(side, levels))
+                latencies.append(time.monotonic() - started_at)
+                cancel_latencies.append(cancelling)
+            counts = take_counts(exchange, base_url)
+            cancels = counts["/v5/order/cancel"] + counts["/v5/order/cancel-batch"]
+            print(f"  {levels:2} levels {mode:6}: mean {statistics.fmean(latencies):.3f}s, median {statistics.median(latencies):.3f}s "
+                  f"(cancelling {statistics.fmean(cancel_latencies):.3f}s), "
+                  f"{cancels / args.rounds:.0f} cancel and {sum(counts.values()) / args.rounds:.0f} total requests per reissue")
+            strategy.cancel_grid_orders(symbol, "buy")
+            strategy.cancel_grid_orders(symbol, "sell")
+
+    stand_in.terminate()
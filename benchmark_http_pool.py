@@ -0,0 +1,98 @@
+"""
+Requests per second of a kline sweep with one connection per request vs the pooled sessions.
+
+A local HTTP/1.1 server answers /v5/market/kline with a gzipped 200-candle payload,
+so the numbers measure connection handling and decoding, not the exchange.
+
+    python benchmark_http_pool.py --symbols 400 --threads 20 --rounds 3
+"""
+import argparse
+import gzip
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests  # type: ignore
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from directionalscalper.core.utils import HTTPSessionPool, orjson, send_public_request
+
+
+def kline_payload(limit=200):
+    now = int(time.time() * 1000)
+    candles = []
+    for i in range(limit):
+        price = 100 + random.random()
+        candles.append([str(now - i * 60000), f"{price:.4f}", f"{price + 0.5:.4f}", f"{price - 0.5:.4f}", f"{price:.4f}", "1234.5", "123456.7"])
+    return json.dumps({"retCode": 0, "retMsg": "OK", "result": {"category": "linear", "list": candles}}).encode()
+
+
+class KlineHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections open between requests
+    body = kline_payload()
+    gzipped_body = gzip.compress(body)
+
+    def do_GET(self):
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        body = self.gzipped_body if gzipped else self.body
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def fetch_unpooled(url):
+    # What send_public_request did before: a new connection for every call
+    response = requests.request("GET", url, timeout=30)
+    return response.json()
+
+
+def fetch_pooled(url):
+    _, raw_json = send_public_request(url=url, max_retries=1)
+    return raw_json
+
+
+def sweep(fetch, base_url, symbols, threads):
+    urls = [f"{base_url}/v5/market/kline?category=linear&symbol={symbol}&interval=1&limit=200" for symbol in symbols]
+    started_at = time.monotonic()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(fetch, urls))
+    elapsed = time.monotonic() - started_at
+    assert all(result and result["retCode"] == 0 for result in results)
+    return len(urls) / elapsed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare kline sweep throughput with and without pooled sessions')
+    parser.add_argument('--symbols', type=int, default=400, help='Symbols per sweep')
+    parser.add_argument('--threads', type=int, default=20, help='Concurrent requests')
+    parser.add_argument('--rounds', type=int, default=3, help='Sweeps per mode')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KlineHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    HTTPSessionPool.configure(pool_maxsize=args.threads)
+    symbols = [f"SYM{i}USDT" for i in range(args.symbols)]
+
+    print(f"{args.symbols} symbol kline sweep, {args.threads} threads, JSON decoder: {'orjson' if orjson else 'json'}")
+    for name, fetch in (("unpooled", fetch_unpooled), ("pooled", fetch_pooled)):
+        rates = [sweep(fetch, base_url, symbols, args.threads) for _ in range(args.rounds)]
+        print(f"  {name:9} {max(rates):8.0f} req/s best, {sum(rates) / len(rates):8.0f} req/s mean")
+
+    server.shutdown()
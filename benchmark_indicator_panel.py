@@ -0,0 +1,53 @@
+"""
+Parity and speed of the vectorised indicator panel against analyse_symbol.
+
+Builds synthetic candles for a universe (1m, 15m and 4h like the fetch stage, with a
+few short-history symbols that go through the per-symbol fallback), runs the
+indicator stage both ways, checks every output column matches and times both.
+No network is used.
+
+    python benchmark_indicator_panel.py --symbols 400 --bars 240 --rounds 3
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from api.multiprocessing_api import CombinedScraper
+from tests.indicator_fixtures import compare, offline_scraper, synthetic_universe
+
+
+def time_it(function, rounds):
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started_at)
+    return result, min(timings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the vectorised indicator panel with analyse_symbol')
+    parser.add_argument('--symbols', type=int, default=400, help='Symbols in the universe')
+    parser.add_argument('--bars', type=int, default=240, help='1m bars per symbol')
+    parser.add_argument('--short', type=int, default=5, help='Extra symbols with a short history (per-symbol fallback)')
+    parser.add_argument('--rounds', type=int, default=3, help='Timed runs per implementation, the best is reported')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    CombinedScraper.KLINE_SERIES = {**CombinedScraper.KLINE_SERIES, "1m": args.bars}
+    universe = synthetic_universe(args.symbols, args.short, bars=args.bars, seed=args.seed)
+    scraper = offline_scraper(universe)
+
+    per_symbol, per_symbol_time = time_it(lambda: scraper.analyse_frames(universe, processes=1, vectorised=False), args.rounds)
+    panel, panel_time = time_it(lambda: scraper.analyse_frames(universe, processes=1, vectorised=True), args.rounds)
+
+    mismatches = compare(per_symbol, panel)
+    print(f"{args.symbols} symbols x {args.bars} bars (+{args.short} short-history symbols)")
+    print(f"  analyse_symbol  {per_symbol_time:8.3f}s")
+    print(f"  panel           {panel_time:8.3f}s  ({per_symbol_time / panel_time:.0f}x)")
+    print(f"  parity: {len(panel)} rows, " + ("all columns match" if not mismatches else f"mismatches {mismatches}"))
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,159 @@
+"""
+Throughput and rejections of the shared RateLimiter against Bybit's per-endpoint limits.
+
+Bot threads run a strategy-like request mix (position and open order reads, market
+data, a wallet balance now and then, and an order write every ``--write-every``
+iterations) against an
+in-process stand-in that enforces Bybit v5's per-second endpoint limits, counts a
+batch request once per order, and rejects whatever goes over like a 10006 response.
+
+Modes:
+  runner    every request weighs 1 and also passes the runners' old 50/s wrapper
+  flat      every request weighs 1 (what Exchange._limit_requests charged before)
+  weighted  rate_limit.request_weight: reads at their 50/s limit, batches per order
+
+    python benchmark_rate_limit.py --bots 20 --duration 30 --latency 0.02
+    python benchmark_rate_limit.py --write-every 4
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from rate_limit import RateLimiter, TokenBucket, request_weight
+
+# Requests per second Bybit v5 allows each endpoint (per UID for private ones)
+ENDPOINT_LIMITS = {
+    "/v5/order/create": 10,
+    "/v5/order/amend": 10,
+    "/v5/order/cancel": 10,
+    "/v5/order/realtime": 50,
+    "/v5/position/list": 50,
+    "/v5/account/wallet-balance": 50,
+    "/v5/market/tickers": 120,
+    "/v5/market/orderbook": 120,
+}
+
+# Batch requests count against the limit of the single-order endpoint
+BATCH_LIMITS = {
+    "/v5/order/create-batch": "/v5/order/create",
+    "/v5/order/amend-batch": "/v5/order/amend",
+    "/v5/order/cancel-batch": "/v5/order/cancel",
+}
+
+
+def endpoint_group(path):
+    # Same grouping as Exchange.endpoint_group
+    if 'order' in path and 'orderbook' not in path:
+        if 'amend' in path:
+            return 'order_amend'
+        if 'cancel' in path:
+            return 'order_cancel'
+        return 'orders'
+    if any(hint in path for hint in ('market', 'ticker', 'kline', 'orderbook', 'instrument', 'public')):
+        return 'market_data'
+    return 'account'
+
+
+class BybitLimitStandIn:
+    """Counts requests per endpoint in one-second windows and rejects those over the limit."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.windows = Counter()
+        self.accepted = Counter()
+        self.rejected = Counter()
+        self.orders = 0
+
+    def request(self, path, body=None):
+        orders = len(json.loads(body)["request"]) if path in BATCH_LIMITS else 1
+        counted = BATCH_LIMITS.get(path, path)
+        with self.lock:
+            window = (counted, int(time.time()))
+            if self.windows[window] + orders > ENDPOINT_LIMITS[counted]:
+                self.rejected[path] += 1
+                accepted = False
+            else:
+                self.windows[window] += orders
+                self.accepted[path] += 1
+                if counted in BATCH_LIMITS.values():
+                    self.orders += orders
+                accepted = True
+        time.sleep(self.latency)
+        return accepted
+
+
+def order_write(iteration):
+    # The grid and take profit upkeep of one iteration: amend the grid, replace a take profit, trim levels
+    kind = iteration % 3
+    if kind == 0:
+        return "/v5/order/amend-batch", json.dumps({"category": "linear", "request": [{"orderId": str(i)} for i in range(5)]})
+    if kind == 1:
+        return "/v5/order/create", None
+    return "/v5/order/cancel-batch", json.dumps({"category": "linear", "request": [{"orderId": str(i)} for i in range(2)]})
+
+
+def bot(exchange, limiter, runner_limiter, weighted, write_every, deadline, iterations, first_iteration):
+    iteration = first_iteration  # Bots out of step, as they are after a while
+    while time.time() < deadline:
+        requests = [
+            ("/v5/position/list", None),
+            ("/v5/order/realtime", None),
+            ("/v5/market/tickers", None),
+            ("/v5/market/orderbook", None),
+        ]
+        if iteration % 5 == 0:
+            requests.append(("/v5/account/wallet-balance", None))
+        if iteration % write_every == 0:
+            requests.append(order_write(iteration // write_every))
+        for path, body in requests:
+            weight = request_weight(path, body) if weighted else 1
+            if runner_limiter is not None:
+                runner_limiter.acquire()
+            limiter.acquire(endpoint_group(path), weight, path)
+            exchange.request(path, body)
+        iteration += 1
+        iterations.append(1)
+
+
+def run(mode, bots, duration, latency, write_every):
+    exchange = BybitLimitStandIn(latency)
+    limiter = RateLimiter()
+    # general_rate_limiter, the RateLimit(50, 1) the signalscreener runners wrapped calls in
+    runner_limiter = TokenBucket(50, 50) if mode == "runner" else None
+    iterations = []
+    deadline = time.time() + duration
+    threads = [threading.Thread(target=bot, args=(exchange, limiter, runner_limiter, mode == "weighted", write_every, deadline, iterations, index))
+               for index in range(bots)]
+    started_at = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - started_at
+    accepted = sum(exchange.accepted.values())
+    rejected = sum(exchange.rejected.values())
+    return (f"  {mode:8}: {accepted / elapsed:6.1f} req/s accepted, {exchange.orders / elapsed:5.1f} orders/s written, "
+            f"{len(iterations) / elapsed:5.1f} iterations/s, {rejected} rejected ({rejected / max(accepted + rejected, 1):.2%})")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare flat and endpoint weights of the shared rate limiter against Bybit limits')
+    parser.add_argument('--bots', type=int, default=20, help='Bot threads sharing the limiter')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds per mode')
+    parser.add_argument('--latency', type=float, default=0.02, help='Seconds each request takes')
+    parser.add_argument('--write-every', type=int, default=1, help='Iterations per order write')
+    parser.add_argument('--modes', nargs='*', default=['runner', 'flat', 'weighted'], choices=['runner', 'flat', 'weighted'])
+    args = parser.parse_args()
+
+    print(f"{args.bots} bots, {args.duration:.0f}s per mode, {args.latency * 1000:.0f} ms per request, "
+          f"an order write every {args.write_every} iterations")
+    for mode in args.modes:
+        print(run(mode, args.bots, args.duration, args.latency, args.write_every))
@@ -0,0 +1,267 @@
+"""
+Requests, cycle time and peak memory of CombinedScraper.analyse_all_symbols.
+
+A local HTTP/1.1 stand-in for the Bybit public endpoints (instruments, tickers and
+klines) runs in its own process, counts every request and answers after ``--latency``
+seconds, so the numbers
+measure how many calls a cycle makes and how long they keep it waiting. Peak memory
+is the summed resident size of the benchmark process and its children, without the
+stand-in (Linux).
+
+Modes:
+  pool         one retry_analyse_symbol per symbol on Pool(14), fetching while analysing
+  async        the fetch stage on one event loop, then the indicator stage
+  incremental  one IncrementalScraper kept across cycles, ``--interval`` seconds apart
+
+The stand-in's candles only depend on symbol, interval and timestamp, so ``--check``
+compares the incremental rows with a fresh fetch and analysis of the same bars.
+``--volume`` times the 24h hourly volume collection the run loop does after each
+cycle, one request at a time as before and with HistoricalVolumeCollector (a first
+and a second collection).
+
+    python benchmark_scraper.py --symbols 400 --latency 0.05 --cycles 2 --modes pool async
+    python benchmark_scraper.py --modes async incremental --cycles 8 --interval 10 --check
+    python benchmark_scraper.py --modes --volume
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.request
+from collections import Counter
+from multiprocessing import Pool, Process, Queue
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from api.exchanges.bybit import Bybit
+from api.multiprocessing_api import CombinedScraper, IncrementalScraper
+
+INTERVAL_MINUTES = {"1": 1, "5": 5, "15": 15, "30": 30, "60": 60, "240": 240}
+
+
+def tree_rss(pid=None, exclude=()):
+    """Resident bytes of a process and all its descendants but ``exclude``."""
+    pid = pid or os.getpid()
+    if pid in exclude:
+        return 0
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            rss = next(int(line.split()[1]) * 1024 for line in status if line.startswith("VmRSS:"))
+        with open(f"/proc/{pid}/task/{pid}/children") as children:
+            return rss + sum(tree_rss(int(child), exclude) for child in children.read().split())
+    except (OSError, StopIteration):
+        return 0
+
+
+class PeakMemory:
+    def __init__(self, interval=0.05, exclude=()):
+        self.interval = interval
+        self.exclude = exclude
+        self.peak = 0
+        self.running = False
+
+    def __enter__(self):
+        self.running = True
+        self.peak = tree_rss(exclude=self.exclude)
+        self.thread = threading.Thread(target=self._sample, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.running = False
+        self.thread.join()
+
+    def _sample(self):
+        while self.running:
+            self.peak = max(self.peak, tree_rss(exclude=self.exclude))
+            time.sleep(self.interval)
+
+
+def analyse_with_pool(scraper, retry_limit=5):
+    # What analyse_all_symbols did before the fetch stage: each of 14 processes fetches and analyses a symbol at a time
+    with Pool(processes=14) as pool:
+        data = pool.map(scraper.analyse_symbol_wrapper, [(symbol, retry_limit) for symbol in scraper.symbols])
+    return [result for result in data if result is not None]
+
+
+class BybitStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections open between requests
+    symbols = []
+    latency = 0.0
+    counts = Counter()
+    counts_lock = threading.Lock()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path == "/stats":
+            with self.counts_lock:
+                result = dict(self.counts)
+                if "reset" in query:
+                    self.counts.clear()
+            self.respond(result)
+            return
+        with self.counts_lock:
+            self.counts[url.path] += 1
+        time.sleep(self.latency)
+
+        if url.path == "/v5/market/instruments-info":
+            result = {"list": [self.instrument(symbol) for symbol in self.symbols]}
+        elif url.path == "/v5/market/tickers":
+            tickers = [self.ticker(symbol) for symbol in self.symbols if query.get("symbol", symbol) == symbol]
+            result = {"list": tickers}
+        elif url.path == "/v5/market/kline":
+            result = {"list": self.klines(query["symbol"], int(INTERVAL_MINUTES[query["interval"]]), int(query["limit"]))}
+        else:
+            self.send_error(404)
+            return
+
+        self.respond({"retCode": 0, "retMsg": "OK", "result": result})
+
+    def respond(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+    @staticmethod
+    def instrument(symbol):
+        return {
+            "symbol": symbol, "status": "Trading", "launchTime": "1600000000000", "priceScale": "4",
+            "leverageFilter": {"maxLeverage": "50"}, "priceFilter": {"tickSize": "0.0001"},
+            "lotSizeFilter": {"minOrderQty": "1", "qtyStep": "1"},
+        }
+
+    @staticmethod
+    def ticker(symbol):
+        return {"symbol": symbol, "lastPrice": "100", "volume24h": str(random.randint(10**5, 10**8)), "fundingRate": "0.0001",
+                "nextFundingTime": str((int(time.time()) // 28800 + 1) * 28800000)}
+
+    @staticmethod
+    def klines(symbol, minutes, limit):
+        # Newest first and starting with the forming candle, like Bybit. A candle only
+        # depends on its symbol, interval and timestamp, so repeated requests agree
+        step = minutes * 60000
+        start = int(time.time() * 1000) // step * step
+        candles = []
+        for i in range(limit):
+            timestamp = start - i * step
+            bar = random.Random(f"{symbol}:{minutes}:{timestamp}")
+            price = 100.0 * (1 + bar.uniform(-0.05, 0.05))
+            candles.append([str(timestamp), f"{price:.4f}", f"{price * 1.002:.4f}", f"{price * 0.998:.4f}",
+                            f"{price * (1 + bar.uniform(-0.001, 0.001)):.4f}", f"{bar.uniform(100, 5000):.1f}", "0"])
+        return candles
+
+
+def serve(symbols, latency, port_queue):
+    BybitStandIn.symbols = symbols
+    BybitStandIn.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BybitStandIn)
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def take_counts(base_url):
+    with urllib.request.urlopen(f"{base_url}/stats?reset=1") as response:
+        return Counter(json.loads(response.read()))
+
+
+def check_incremental(scraper, df):
+    """Columns that differ from a fresh fetch and analysis of the same bars, None when a new bar closed meanwhile."""
+    frames = CombinedScraper.fetch_all_symbols(scraper, retry_limit=5)
+    if any(frames[symbol]["1m"]["timestamp"].iat[-1] != scraper.klines.buffers[(symbol, "1m")].last_timestamp for symbol in frames):
+        return None
+    fresh = CombinedScraper.analyse_frames(scraper, frames).sort_values("Asset").reset_index(drop=True)
+    rows = df.sort_values("Asset").reset_index(drop=True)
+    if list(fresh["Asset"]) != list(rows["Asset"]):
+        return ["Asset"]
+    return [column for column in CombinedScraper.OUTPUT_COLUMNS if column != "Timestamp" and not fresh[column].equals(rows[column])]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Count kline requests and time CombinedScraper cycles against a local Bybit stand-in')
+    parser.add_argument('--symbols', type=int, default=400, help='Symbols in the universe')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds the stand-in waits before answering')
+    parser.add_argument('--cycles', type=int, default=2, help='Scraper cycles per mode')
+    parser.add_argument('--modes', nargs='*', default=['pool', 'async'], choices=['pool', 'async', 'incremental'], help='Implementations to run')
+    parser.add_argument('--interval', type=float, default=10, help='Seconds between the start of incremental cycles')
+    parser.add_argument('--check', action='store_true', help='Compare incremental cycles with a fresh fetch and analysis')
+    parser.add_argument('--volume', action='store_true', help='Time the historical volume collection')
+    args = parser.parse_args()
+
+    # In its own process so the stand-in does not compete with the scraper for the GIL
+    port_queue = Queue()
+    server = Process(target=serve, args=([f"SYM{i}USDT" for i in range(args.symbols)], args.latency, port_queue), daemon=True)
+    server.start()
+    Bybit.futures_api_url = f"http://127.0.0.1:{port_queue.get()}"
+
+    filters = {"quote_symbols": ["USDT"], "top_volume": args.symbols}
+    results = []
+    for mode in args.modes:
+        scraper = None
+        for cycle in range(args.cycles):
+            take_counts(Bybit.futures_api_url)
+            with PeakMemory(exclude=(server.pid,)) as memory:
+                started_at = time.monotonic()
+                if mode == "incremental":
+                    scraper = scraper or IncrementalScraper(exchange_name="bybit", filters=filters)
+                    df = scraper.analyse_all_symbols()
+                    assets = len(df)
+                else:
+                    scraper = CombinedScraper(exchange_name="bybit", filters=filters)
+                    assets = len(analyse_with_pool(scraper)) if mode == "pool" else len(scraper.analyse_all_symbols())
+                elapsed = time.monotonic() - started_at
+            counts = take_counts(Bybit.futures_api_url)
+            klines = counts["/v5/market/kline"]
+            line = (f"  {mode:11} cycle {cycle + 1}: {assets} assets in {elapsed:.1f}s, peak {memory.peak / 2**20:.0f} MiB, "
+                    f"{sum(counts.values())} requests, {klines} kline ({klines / max(assets, 1):.1f} per symbol)")
+            if mode == "incremental" and args.check:
+                mismatches = check_incremental(scraper, df)
+                take_counts(Bybit.futures_api_url)
+                line += ", check skipped (new bar)" if mismatches is None else f", mismatches {mismatches}" if mismatches else ", matches a fresh scrape"
+            results.append(line)
+            if mode == "incremental":
+                time.sleep(max(0.0, args.interval - (time.monotonic() - started_at)))
+
+    if args.volume:
+        scraper = CombinedScraper(exchange_name="bybit", filters=filters)
+        take_counts(Bybit.futures_api_url)
+
+        def sequential():
+            # What get_all_historical_volume did before the collector: one blocking kline request per symbol
+            return {
+                symbol: (symbol, [candle["volume"] for candle in scraper.exchange.get_futures_kline(symbol=symbol, interval="1h", limit=24)])
+                for symbol in scraper.symbols
+            }
+
+        runs = [("sequential", sequential)] + [
+            (f"collector {label}", lambda: scraper.get_all_historical_volume(exchange_name="bybit", interval="1h", limit=24))
+            for label in ("first", "second")
+        ]
+        collected = {}
+        for label, collect in runs:
+            started_at = time.monotonic()
+            collected[label] = collect()
+            elapsed = time.monotonic() - started_at
+            counts = take_counts(Bybit.futures_api_url)
+            results.append(f"  volume {label:16}: {len(collected[label])} symbols in {elapsed:.1f}s, {counts['/v5/market/kline']} kline requests")
+        same = all(collected[label] == collected["sequential"] for label in collected)
+        results.append("  volume parity: " + ("collector matches the sequential volumes" if same else "collector differs from the sequential volumes"))
+
+    print(f"{args.symbols} symbols, {args.latency * 1000:.0f} ms per request, {os.cpu_count()} CPUs")
+    print("\n".join(results))
+
+    server.terminate()
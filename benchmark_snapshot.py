@@ -0,0 +1,159 @@
+"""
+Cost of publishing and reading one scraper cycle as JSON files versus an Arrow snapshot.
+
+Builds a synthetic scraper result, writes the JSON files run_scraper_for_exchange
+writes (all assets, whattotrade, rotatorsymbols, negative and positive funding) and the
+Arrow snapshot, then times what a consumer pays per refresh: parsing every JSON file,
+or mapping the snapshot and building each view (through a snapshot-mode Manager), or
+only reading a column. Every view is checked against its JSON file. No network is used.
+
+    python benchmark_snapshot.py --symbols 400 --rounds 20
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_dir = str(Path(__file__).resolve().parent)
+sys.path.insert(0, project_dir)
+
+from api.manager import Manager
+from api.multiprocessing_api import CombinedScraper
+from api.snapshot import FUNDING_COLUMNS, write_snapshot
+
+JSON_VIEWS = {
+    "quantdatav2_bybit.json": "assets",
+    "whattotrade_bybit.json": "whattotrade",
+    "rotatorsymbols_bybit.json": "rotatorsymbols",
+    "negativefunding_bybit.json": "negativefunding",
+    "positivefunding_bybit.json": "positivefunding",
+}
+
+
+def scraper_result(rng, symbols):
+    price = rng.lognormal(0, 2, symbols)
+    df = pd.DataFrame({
+        "Asset": [f"SYM{i}USDT" for i in range(symbols)],
+        "Min qty": rng.choice([0.001, 0.1, 1.0, 10.0], symbols),
+        "Price": price,
+        "1m 1x Volume (USDT)": rng.lognormal(9, 2, symbols).round(),
+        "5m 1x Volume (USDT)": rng.lognormal(10, 2, symbols).round(),
+        "30m 1x Volume (USDT)": rng.lognormal(12, 2, symbols).round(),
+        "1h 1x Volume (USDT)": rng.lognormal(13, 2, symbols).round(),
+        "1m Spread": rng.uniform(0, 1, symbols).round(4),
+        "5m Spread": rng.uniform(0, 2, symbols).round(4),
+        "30m Spread": rng.uniform(0, 4, symbols).round(4),
+        "1h Spread": rng.uniform(0, 6, symbols).round(4),
+        "4h Spread": rng.uniform(0, 10, symbols).round(4),
+        "trend%": rng.normal(0, 1, symbols).round(4),
+        "Trend": rng.choice(["long", "short"], symbols),
+        "HMA Trend": rng.choice(["long", "short"], symbols),
+        "5m MA6 high": price * 1.01,
+        "5m MA6 low": price * 0.99,
+        "Funding": rng.normal(0, 0.01, symbols),
+        "Timestamp": str(int(time.time())),
+        "MFI": rng.choice(["buy", "sell", "neutral"], symbols),
+        "ERI Bull Power": rng.normal(0, 1, symbols),
+        "ERI Bear Power": rng.normal(0, 1, symbols),
+        "ERI Trend": rng.choice(["bullish", "bearish"], symbols),
+        "Top Signal 5m": rng.uniform(0, 1, symbols) > 0.9,
+        "Bottom Signal 5m": rng.uniform(0, 1, symbols) > 0.9,
+        "Top Signal 1m": rng.uniform(0, 1, symbols) > 0.9,
+        "Bottom Signal 1m": rng.uniform(0, 1, symbols) > 0.9,
+    })
+    df.loc[df.sample(frac=0.02, random_state=1).index, "ERI Bull Power"] = np.nan  # Short 15m history
+    return df[CombinedScraper.OUTPUT_COLUMNS]
+
+
+def write_json_files(scraper, df, directory):
+    # The same cuts as run_scraper_for_exchange
+    to_trade = scraper.filter_df(dataframe=df, filter_col="5m 1x Volume (USDT)", operator=">", value=15000)
+    rotator = scraper.filter_df(dataframe=df, filter_col="1m 1x Volume (USDT)", operator=">", value=15000)
+    rotator = rotator.sort_values(by="1m 1x Volume (USDT)", ascending=False, kind="stable")
+    negative = scraper.reduce_df(dataframe=scraper.filter_df(dataframe=df, filter_col="Funding", operator="<", value=0), columns=FUNDING_COLUMNS)
+    positive = scraper.reduce_df(dataframe=scraper.filter_df(dataframe=df, filter_col="Funding", operator=">", value=0), columns=FUNDING_COLUMNS)
+    for name, frame in zip(JSON_VIEWS, (df, to_trade, rotator, negative, positive)):
+        scraper.output_df(dataframe=frame, path=os.path.join(directory, name), to="json")
+
+
+def read_json_files(directory):
+    datasets = {}
+    for name in JSON_VIEWS:
+        with open(os.path.join(directory, name)) as f:
+            datasets[name] = json.load(f)
+    return datasets
+
+
+def same_records(expected, actual):
+    if len(expected) != len(actual):
+        return False
+    for left, right in zip(expected, actual):
+        if left.keys() != right.keys():
+            return False
+        for key, value in left.items():
+            other = right[key]
+            if isinstance(value, float) or isinstance(other, float):
+                # pandas writes JSON floats rounded to 10 decimals
+                if value is None or other is None or not np.isclose(value, other, rtol=1e-9, atol=1e-10):
+                    if not (value is None and other is None):
+                        return False
+            elif value != other:
+                return False
+    return True
+
+
+def time_it(function, rounds):
+    timings = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started_at)
+    return result, min(timings) * 1000
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare JSON files and the Arrow snapshot for scraper output')
+    parser.add_argument('--symbols', type=int, default=400, help='Rows in the scraper result')
+    parser.add_argument('--rounds', type=int, default=20, help='Timed runs per step, the best is reported')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    df = scraper_result(np.random.default_rng(args.seed), args.symbols)
+    scraper = CombinedScraper.__new__(CombinedScraper)
+    scraper.exchange_name = "bybit"
+    directory = tempfile.mkdtemp(prefix="snapshot_")
+    snapshot_path = os.path.join(directory, "quantdatav2_bybit.arrow")
+
+    _, json_write = time_it(lambda: write_json_files(scraper, df, directory), args.rounds)
+    _, arrow_write = time_it(lambda: scraper.output_df(dataframe=df, path=snapshot_path, to="arrow"), args.rounds)
+    json_size = sum(os.path.getsize(os.path.join(directory, name)) for name in JSON_VIEWS)
+
+    datasets, json_read = time_it(lambda: read_json_files(directory), args.rounds)
+
+    manager = Manager(None, api="snapshot", path=Path(snapshot_path))
+
+    def read_views():
+        # What a consumer pays after each publish: remap the new file and build its views
+        write_snapshot(df, snapshot_path)
+        return {name: manager.get_snapshot_dataset(name) for name in JSON_VIEWS}
+
+    views, arrow_read = time_it(read_views, args.rounds)
+    _, arrow_write_only = time_it(lambda: write_snapshot(df, snapshot_path), args.rounds)
+    arrow_read -= arrow_write_only
+    _, cached_read = time_it(lambda: {name: manager.get_snapshot_dataset(name) for name in JSON_VIEWS}, args.rounds)
+    _, column_read = time_it(lambda: manager.get_snapshot_column("1m 1x Volume (USDT)"), args.rounds)
+
+    mismatched = [name for name in JSON_VIEWS if not same_records(datasets[name], views[name])]
+    print(f"{args.symbols} assets, {len(JSON_VIEWS)} datasets")
+    print(f"  publish   JSON files {json_write:7.2f} ms ({json_size / 1024:.0f} KiB)   "
+          f"Arrow snapshot {arrow_write:7.2f} ms ({os.path.getsize(snapshot_path) / 1024:.0f} KiB)")
+    print(f"  refresh   parse JSON {json_read:7.2f} ms   map snapshot + views {arrow_read:7.2f} ms")
+    print(f"  reread    unchanged snapshot {cached_read:7.3f} ms   one column {column_read:7.3f} ms")
+    print("  parity: " + ("every view matches its JSON file" if not mismatched else f"mismatches in {mismatched}"))
+    sys.exit(1 if mismatched else 0)
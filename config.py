@@ -28,6 +28,8 @@ class API(BaseModel):
     mode: str = "remote"
     url: str = "https://api.quantumvoid.org/volumedata/"
     data_source_exchange: str = "bybit"
+    http_pool_maxsize: int = 32  # Keep-alive connections per host for the public data requests
+    embedded_refresh_seconds: int = 10  # Scraper cadence when mode is "embedded"
 
 class Hotkeys(BaseModel):
     hotkeys_enabled: bool = False
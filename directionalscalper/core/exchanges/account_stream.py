@@ -0,0 +1,201 @@
+import hashlib
+import hmac
+import threading
+import time
+from collections import deque
+
+from directionalscalper.core.exchanges.bybit_stream import BybitStream
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="AccountStream", filename="AccountStream.log", stream=True)
+
+BYBIT_PRIVATE_URL = "wss://stream.bybit.com/v5/private"
+
+PRIVATE_TOPICS = ["position", "order", "execution", "wallet"]
+
+# Order statuses after which an order is no longer open
+CLOSED_ORDER_STATUSES = {"Filled", "Cancelled", "Rejected", "Deactivated", "PartiallyFilledCanceled"}
+
+
+class AccountStream(BybitStream):
+    """
+    Authenticated Bybit v5 private stream holding live account state for one API key.
+
+    Positions, open orders, recent executions and wallet balances are kept as raw
+    Bybit payloads and shared by every strategy thread using the same account. The
+    stream only pushes changes, so the state is seeded and periodically reconciled
+    from REST through ``reconcile``. Until the first reconciliation after a (re)connect
+    ``is_synced`` is False and callers should use REST directly.
+    """
+
+    name = "AccountStream"
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, api_key, secret_key, url=BYBIT_PRIVATE_URL, category="linear", reconcile_interval=60,
+                 max_executions=1000, **kwargs):
+        super().__init__(url, **kwargs)
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.category = category  # Pushes for other categories (spot, inverse, option) are ignored
+        self.reconcile_interval = reconcile_interval
+
+        self.authenticated = threading.Event()
+        self.reconcile_lock = threading.Lock()
+        self.last_reconcile_time = None
+
+        self.positions = {}  # (market id, positionIdx) -> raw position
+        self.orders = {}  # orderId -> raw open order
+        self.closed_orders = {}  # orderId -> updatedTime, protects against stale REST snapshots
+        self.executions = deque(maxlen=max_executions)
+        self.wallets = {}  # accountType -> raw wallet entry
+        self.updated_at = {}  # topic -> monotonic time of the last push
+
+    @classmethod
+    def get_instance(cls, api_key, secret_key, url=BYBIT_PRIVATE_URL, **kwargs):
+        with cls._instances_lock:
+            stream = cls._instances.get((url, api_key))
+            if stream is None:
+                stream = cls(api_key, secret_key, url=url, **kwargs)
+                cls._instances[(url, api_key)] = stream
+            stream.start()
+            return stream
+
+    # Connection
+
+    def _auth_message(self):
+        expires = int((time.time() + 10) * 1000)
+        signature = hmac.new(
+            self.secret_key.encode("utf-8"), f"GET/realtime{expires}".encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+        return {"op": "auth", "args": [self.api_key, expires, signature]}
+
+    def on_connected(self):
+        self.authenticated.clear()
+        with self.lock:
+            # Anything may have changed while disconnected, force a fresh REST seed
+            self.last_reconcile_time = None
+        self.send(self._auth_message())
+
+    def on_op(self, msg):
+        if msg.get("op") == "auth":
+            if msg.get("success"):
+                self.authenticated.set()
+                logging.info("Private stream authenticated, subscribing account topics")
+                self.send({"op": "subscribe", "args": PRIVATE_TOPICS})
+            else:
+                logging.info(f"Private stream authentication failed: {msg.get('ret_msg')}")
+            return
+        super().on_op(msg)
+
+    def _on_close(self, ws, close_status_code=None, close_msg=None):
+        self.authenticated.clear()
+        super()._on_close(ws, close_status_code, close_msg)
+
+    def on_data(self, topic, msg, now):
+        data = msg["data"]
+        if not topic.startswith("wallet"):
+            data = [entry for entry in data if entry.get("category", self.category) == self.category]
+        with self.lock:
+            if topic.startswith("position"):
+                for position in data:
+                    self._store_position(position)
+            elif topic.startswith("order"):
+                for order in data:
+                    self._store_order(order)
+            elif topic.startswith("execution"):
+                self.executions.extend(data)
+            elif topic.startswith("wallet"):
+                for wallet in data:
+                    self.wallets[wallet.get("accountType")] = wallet
+            else:
+                return
+            self.updated_at[topic.split(".")[0]] = now
+
+    def _store_position(self, position):
+        key = (position.get("symbol"), int(position.get("positionIdx", 0) or 0))
+        current = self.positions.get(key)
+        if current is not None and int(current.get("updatedTime") or 0) > int(position.get("updatedTime") or 0):
+            return
+        self.positions[key] = position
+
+    def _store_order(self, order):
+        order_id = order.get("orderId")
+        updated = int(order.get("updatedTime") or 0)
+        if order.get("orderStatus") in CLOSED_ORDER_STATUSES:
+            self.orders.pop(order_id, None)
+            self.closed_orders[order_id] = updated
+            return
+        if self.closed_orders.get(order_id, -1) >= updated:
+            return
+        current = self.orders.get(order_id)
+        if current is not None and int(current.get("updatedTime") or 0) > updated:
+            return
+        self.orders[order_id] = order
+
+    # Reconciliation
+
+    def is_synced(self):
+        """True when the stream is live, authenticated and seeded from REST."""
+        return self.is_live() and self.authenticated.is_set() and self.last_reconcile_time is not None
+
+    def needs_reconcile(self):
+        if not self.authenticated.is_set():
+            return False
+        return self.last_reconcile_time is None or time.monotonic() - self.last_reconcile_time >= self.reconcile_interval
+
+    def reconcile(self, started_at, positions=None, orders=None, wallets=None):
+        """
+        Replace state with REST snapshots of raw Bybit payloads requested at ``started_at``
+        (epoch ms). Anything the stream pushed after that moment is newer than the snapshot
+        and is kept.
+        """
+        def _updated(entry):
+            return int(entry.get("updatedTime") or 0)
+
+        with self.lock:
+            if positions is not None:
+                previous = self.positions
+                self.positions = {}
+                for position in positions:
+                    self._store_position(position)
+                for key, position in previous.items():
+                    if _updated(position) > started_at:
+                        self._store_position(position)
+            if orders is not None:
+                previous = self.orders
+                self.orders = {}
+                for order in orders:
+                    self._store_order(order)
+                for order in previous.values():
+                    if _updated(order) > started_at:
+                        self._store_order(order)
+                cutoff = int(time.time() * 1000) - 600000
+                self.closed_orders = {k: v for k, v in self.closed_orders.items() if v >= cutoff}
+            if wallets is not None:
+                for wallet in wallets:
+                    self.wallets[wallet.get("accountType")] = wallet
+            self.last_reconcile_time = time.monotonic()
+
+    # Readers
+
+    def get_positions(self, market_id=None):
+        with self.lock:
+            return [dict(p) for (symbol, _), p in self.positions.items() if market_id is None or symbol == market_id]
+
+    def get_open_orders(self, market_id=None):
+        with self.lock:
+            return [dict(o) for o in self.orders.values() if market_id is None or o.get("symbol") == market_id]
+
+    def get_executions(self, market_id=None, since=None):
+        with self.lock:
+            return [
+                dict(e) for e in self.executions
+                if (market_id is None or e.get("symbol") == market_id)
+                and (since is None or int(e.get("execTime") or 0) >= since)
+            ]
+
+    def get_wallets(self):
+        with self.lock:
+            return [dict(w) for w in self.wallets.values()]
@@ -0,0 +1,326 @@
+import asyncio
+import os
+import time
+import urllib.parse
+
+try:
+    import ccxt.async_support as ccxt_async
+except ImportError:  # Only the async runtime needs it (and aiohttp)
+    ccxt_async = None
+
+from directionalscalper.core.exchanges.market_registry import MarketRegistry
+from directionalscalper.core.strategies.logger import Logger
+from rate_limit import get_rate_limiter, request_weight
+
+logging = Logger(logger_name="AsyncBybitExchange", filename="AsyncBybitExchange.log", stream=True)
+
+
+class AsyncBybitExchange:
+    """
+    Bybit linear adapter on ``ccxt.async_support`` for the async strategy runtime.
+
+    One client is shared by every symbol coroutine. Requests go through the same
+    process-wide endpoint rate limiter as the threaded adapters, waiting with
+    ``asyncio.sleep``, and report the exchange's rate limit headers back to it.
+    Markets come from the shared ``MarketRegistry`` when it is already loaded.
+    """
+
+    def __init__(self, api_key=None, secret_key=None, market_type='swap'):
+        if ccxt_async is None:
+            raise RuntimeError("ccxt.async_support is not available, install aiohttp to use the async runtime")
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.market_type = market_type
+        self.exchange_id = 'bybit'
+
+        exchange_params = {
+            "apiKey": api_key,
+            "secret": secret_key,
+            "enableRateLimit": False,  # Paced by the shared limiter instead
+            "options": {
+                'defaultType': market_type,
+                'adjustForTimeDifference': True,
+                'brokerId': 'Nu000450',
+            },
+        }
+        if os.environ.get('HTTPS_PROXY'):
+            exchange_params["aiohttp_proxy"] = os.environ.get('HTTPS_PROXY')
+        self.exchange = ccxt_async.bybit(exchange_params)
+        self.max_batch_orders = 10  # Orders per /v5/order/*-batch request
+        self.request_limiter = get_rate_limiter()
+        self.market_registry = MarketRegistry.get_instance(f"{self.exchange_id}:{market_type}")
+        self.markets_loaded = asyncio.Lock()
+        self._limit_requests()
+
+    def endpoint_group(self, url):
+        """Rate limit group of a REST request, see rate_limit.ENDPOINT_GROUPS."""
+        path = urllib.parse.urlparse(url).path.lower()
+        if 'order' in path and 'orderbook' not in path:
+            if 'amend' in path:
+                return 'order_amend'
+            if 'cancel' in path:
+                return 'order_cancel'
+            return 'orders'
+        if any(hint in path for hint in ('market', 'ticker', 'kline', 'orderbook', 'instrument', 'public')):
+            return 'market_data'
+        return 'account'
+
+    def _limit_requests(self):
+        fetch = self.exchange.fetch
+        on_rest_response = self.exchange.on_rest_response
+
+        async def limited_fetch(url, method='GET', headers=None, body=None):
+            endpoint = urllib.parse.urlparse(url).path
+            weight = request_weight(endpoint, body)
+            await self.request_limiter.acquire_async(self.endpoint_group(url), weight, endpoint)
+            return await fetch(url, method, headers, body)
+
+        def record_quota(code, reason, url, method, response_headers, response_body, request_headers, request_body):
+            endpoint = urllib.parse.urlparse(url).path
+            self.request_limiter.update_quota_from_headers(endpoint, response_headers)
+            return on_rest_response(code, reason, url, method, response_headers, response_body, request_headers, request_body)
+
+        self.exchange.fetch = limited_fetch
+        self.exchange.on_rest_response = record_quota
+
+    async def load_markets(self):
+        if self.exchange.markets:
+            return self.exchange.markets
+        async with self.markets_loaded:
+            if not self.exchange.markets:
+                symbols = self.market_registry.symbols()
+                if symbols:
+                    self.exchange.set_markets([self.market_registry.get_market(symbol) for symbol in symbols])
+                else:
+                    await self.exchange.load_markets()
+                    logging.info(f"Loaded {len(self.exchange.markets)} markets")
+        return self.exchange.markets
+
+    async def close(self):
+        await self.exchange.close()
+
+    async def get_market_info(self, symbol):
+        """Minimum quantity, quantity step, tick size and maximum leverage of a symbol."""
+        await self.load_markets()
+        market = self.exchange.market(symbol)
+        limits = market.get('limits', {})
+        return {
+            'min_qty': float(limits.get('amount', {}).get('min') or 0),
+            'qty_step': float(market.get('precision', {}).get('amount') or 0),
+            'tick_size': float(market.get('precision', {}).get('price') or 0),
+            'max_leverage': float(limits.get('leverage', {}).get('max') or 1),
+        }
+
+    async def get_balance(self, quote='USDT'):
+        """Total futures balance in ``quote``, None when it could not be fetched."""
+        try:
+            balance = await self.exchange.fetch_balance()
+            return balance['total'].get(quote)
+        except Exception as e:
+            logging.info(f"Error fetching balance from Bybit: {e}")
+            return None
+
+    async def set_leverage(self, leverage, symbol):
+        await self.load_markets()
+        try:
+            await self.exchange.set_leverage(leverage, symbol)
+            logging.info(f"Leverage set to {leverage} for symbol {symbol}")
+        except Exception as e:
+            logging.info(f"Error setting leverage: {e}")
+
+    # Per-iteration data
+
+    async def get_positions(self, symbol):
+        await self.load_markets()
+        return await self.exchange.fetch_positions([symbol])
+
+    async def get_open_orders(self, symbol):
+        await self.load_markets()
+        return await self.exchange.fetch_open_orders(symbol)
+
+    async def get_orderbook(self, symbol, max_retries=3, retry_delay=1):
+        await self.load_markets()
+        for attempt in range(max_retries):
+            try:
+                orderbook = await self.exchange.fetch_order_book(symbol)
+                return {
+                    'bids': orderbook['bids'],
+                    'asks': orderbook['asks'],
+                }
+            except Exception as e:
+                logging.info(f"Error fetching order book for {symbol}: {e}, attempt {attempt + 1}/{max_retries}")
+                await asyncio.sleep(retry_delay)
+        return {'bids': [], 'asks': []}
+
+    async def get_ticker(self, symbol):
+        await self.load_markets()
+        return await self.exchange.fetch_ticker(symbol)
+
+    async def fetch_candles(self, symbol, timeframe='1m', limit=100):
+        await self.load_markets()
+        return await self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+
+    async def get_snapshot(self, symbol, private=True):
+        """
+        Positions, open orders, order book and ticker of a symbol, fetched concurrently.
+        A failed part is logged and left as None so one error does not drop the iteration.
+        """
+        started_at = time.monotonic()
+        parts = {
+            'orderbook': self.get_orderbook(symbol),
+            'ticker': self.get_ticker(symbol),
+        }
+        if private and self.api_key:
+            parts['positions'] = self.get_positions(symbol)
+            parts['open_orders'] = self.get_open_orders(symbol)
+
+        results = await asyncio.gather(*parts.values(), return_exceptions=True)
+        snapshot = {'symbol': symbol}
+        for name, result in zip(parts, results):
+            if isinstance(result, Exception):
+                logging.info(f"Error fetching {name} for {symbol}: {result}")
+                result = None
+            snapshot[name] = result
+        snapshot['fetch_time'] = time.monotonic() - started_at
+        return snapshot
+
+    # Orders
+
+    async def create_limit_order(self, symbol, side, qty, price, positionIdx=0, postOnly=True, params={}):
+        await self.load_markets()
+        extra_params = {
+            "positionIdx": positionIdx,
+            "timeInForce": "PostOnly" if postOnly else "GTC",
+        }
+        extra_params.update(params)
+        try:
+            return await self.exchange.create_order(symbol, 'limit', side, qty, price, extra_params)
+        except Exception as e:
+            logging.info(f"An error occurred in create_limit_order() for {symbol}: {e}")
+            return {"error": str(e)}
+
+    async def create_limit_orders(self, symbol, orders, postOnly=True):
+        """
+        Place several tagged limit orders for one symbol through /v5/order/create-batch,
+        like BybitExchange.create_tagged_limit_orders_bybit. ``orders`` are dicts with
+        ``side``, ``qty``, ``price`` and optionally ``positionIdx``, ``orderLinkId`` and
+        ``reduceOnly``. Returns one entry per order: the placed ccxt order, or
+        ``{"error": ...}`` when it was rejected.
+        """
+        await self.load_markets()
+        time_in_force = "PostOnly" if postOnly else "GTC"
+        results = []
+        for start in range(0, len(orders), self.max_batch_orders):
+            chunk = orders[start:start + self.max_batch_orders]
+            order_requests = []
+            for order in chunk:
+                extra_params = {
+                    "positionIdx": order.get('positionIdx', 0),
+                    "timeInForce": time_in_force
+                }
+                if order.get('orderLinkId'):
+                    extra_params["orderLinkId"] = order['orderLinkId']
+                if order.get('reduceOnly'):
+                    extra_params["reduceOnly"] = True
+                order_requests.append({
+                    'symbol': symbol,
+                    'type': 'limit',
+                    'side': order['side'],
+                    'amount': order['qty'],
+                    'price': order['price'],
+                    'params': extra_params
+                })
+
+            try:
+                placed = await self.exchange.create_orders(order_requests)
+            except Exception as e:
+                logging.info(f"An error occurred in create_limit_orders() for {symbol}: {e}")
+                results.extend({"error": str(e)} for _ in chunk)
+                continue
+
+            for result in placed:
+                info = result.get('info', {})
+                if result.get('id') and int(info.get('code', 0)) == 0:
+                    results.append(result)
+                else:
+                    results.append({"error": info.get('msg', 'order rejected')})
+        return results
+
+    async def amend_orders(self, symbol, amendments):
+        """
+        Move open orders to a new price and quantity through /v5/order/amend-batch,
+        keeping their ids. ``amendments`` are dicts with ``id``, ``price`` and ``qty``.
+        Returns the ids that were amended.
+        """
+        if not amendments:
+            return []
+        await self.load_markets()
+        market_id = self.exchange.market(symbol)['id']
+        requests = [
+            {
+                'symbol': market_id,
+                'orderId': amendment['id'],
+                'price': self.exchange.price_to_precision(symbol, amendment['price']),
+                'qty': self.exchange.amount_to_precision(symbol, amendment['qty'])
+            }
+            for amendment in amendments
+        ]
+        amended = []
+        for start in range(0, len(requests), self.max_batch_orders):
+            chunk = requests[start:start + self.max_batch_orders]
+            try:
+                response = await self.exchange.private_post_v5_order_amend_batch({'category': 'linear', 'request': chunk})
+            except Exception as e:
+                logging.info(f"Batch amend failed for {symbol}: {e}")
+                continue
+            codes = response.get('retExtInfo', {}).get('list', [])
+            for index, request in enumerate(chunk):
+                code = codes[index] if index < len(codes) else {}
+                if int(code.get('code', 0)) == 0:
+                    amended.append(request['orderId'])
+                else:
+                    logging.info(f"Could not amend order {request['orderId']} for {symbol}: {code.get('msg')}")
+        return amended
+
+    async def cancel_orders(self, symbol, order_ids):
+        """Cancel several orders of one symbol through /v5/order/cancel-batch. Returns the cancelled ids."""
+        order_ids = [order_id for order_id in order_ids if order_id]
+        if not order_ids:
+            return []
+        await self.load_markets()
+        market_id = self.exchange.market(symbol)['id']
+        canceled = []
+        for start in range(0, len(order_ids), self.max_batch_orders):
+            chunk = order_ids[start:start + self.max_batch_orders]
+            try:
+                response = await self.exchange.private_post_v5_order_cancel_batch({
+                    'category': 'linear',
+                    'request': [{'symbol': market_id, 'orderId': order_id} for order_id in chunk]
+                })
+            except Exception as e:
+                logging.info(f"Batch cancel failed for {symbol}: {e}")
+                continue
+            codes = response.get('retExtInfo', {}).get('list', [])
+            for index, order_id in enumerate(chunk):
+                code = codes[index] if index < len(codes) else {}
+                if int(code.get('code', 0)) == 0:
+                    canceled.append(order_id)
+                else:
+                    logging.info(f"Could not cancel order {order_id} for {symbol}: {code.get('msg')}")
+        return canceled
+
+    async def cancel_all_orders(self, symbol):
+        await self.load_markets()
+        try:
+            result = await self.exchange.cancel_all_orders(symbol)
+            logging.info(f"All open orders for {symbol} have been cancelled.")
+            return result
+        except Exception as e:
+            logging.info(f"Error cancelling open orders for {symbol}: {e}")
+            return None
+
+    async def cancel_order_by_id(self, order_id, symbol):
+        try:
+            return await self.exchange.cancel_order(order_id, symbol)
+        except Exception as e:
+            logging.info(f"Error occurred in cancel_order_by_id: {e}")
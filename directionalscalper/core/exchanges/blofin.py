@@ -10,8 +10,6 @@ import ccxt
 import traceback
 from directionalscalper.core.strategies.logger import Logger
 
-from rate_limit import RateLimit
-
 logging = Logger(logger_name="BlofinExchange", filename="BlofinExchange.log", stream=True)
 
 class BlofinExchange(Exchange):
@@ -23,7 +21,7 @@ class BlofinExchange(Exchange):
         self.last_active_long_order_time = {}
         self.last_active_short_order_time = {}
         self.last_active_time = {}
-        self.rate_limiter = RateLimit(10, 1)
+        self.rate_limiter = self.request_limiter
 
     def log_order_active_times(self):
         try:
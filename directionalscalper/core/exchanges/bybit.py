@@ -9,13 +9,14 @@ from ccxt.base.errors import RateLimitExceeded, NetworkError
 import ccxt
 import traceback
 from directionalscalper.core.strategies.logger import Logger
-
-from rate_limit import RateLimit
+from directionalscalper.core.exchanges.account_stream import AccountStream
+from directionalscalper.core.exchanges.leverage_tiers import LeverageTierCache
+from directionalscalper.core.exchanges.market_data_hub import MarketDataHub, BYBIT_PUBLIC_LINEAR_URL, BYBIT_PUBLIC_SPOT_URL
 
 logging = Logger(logger_name="BybitExchange", filename="BybitExchange.log", stream=True)
 
 class BybitExchange(Exchange):
-    def __init__(self, api_key, secret_key, passphrase=None, market_type='swap'):
+    def __init__(self, api_key, secret_key, passphrase=None, market_type='swap', use_market_data_stream=True, use_account_stream=True):
         if market_type == 'spot':
             super().__init__('bybit', api_key, secret_key, passphrase, market_type)
         else:
@@ -23,10 +24,83 @@ class BybitExchange(Exchange):
 
         self.max_retries = 100  # Maximum retries for rate-limited requests
         self.retry_wait = 5  # Seconds to wait between retries
+        self.max_batch_orders = 10  # Orders per /v5/order/create-batch request
         self.last_active_long_order_time = {}
         self.last_active_short_order_time = {}
         self.last_active_time = {}
-        self.rate_limiter = RateLimit(10, 1)
+        # Requests are paced by the shared endpoint limiter installed on the ccxt client
+        self.rate_limiter = self.request_limiter
+        self.leverage_tier_cache = LeverageTierCache.get_instance(f"{self.exchange_id}:{market_type}")
+
+        # Serve prices and order books from the shared public stream, REST is the fallback
+        if use_market_data_stream and MarketDataHub.is_available():
+            stream_url = BYBIT_PUBLIC_SPOT_URL if market_type == 'spot' else BYBIT_PUBLIC_LINEAR_URL
+            self.market_data_hub = MarketDataHub.get_instance(stream_url)
+
+        # Positions, orders and balances come from the shared private stream, REST only reconciles it
+        self.account_stream = None
+        if use_account_stream and market_type != 'spot' and api_key and secret_key and AccountStream.is_available():
+            self.account_stream = AccountStream.get_instance(api_key, secret_key)
+
+        # Set in sharded worker processes, positions and balance then come from the supervisor
+        self.account_coordinator = None
+
+    def _account_state_ready(self):
+        """Reconcile the shared account stream when due and report whether it can be read."""
+        stream = self.account_stream
+        if stream is None:
+            return False
+        # Only one thread reconciles, the others keep reading the current state
+        if stream.needs_reconcile() and stream.reconcile_lock.acquire(blocking=False):
+            try:
+                if stream.needs_reconcile():
+                    self._reconcile_account_stream()
+            finally:
+                stream.reconcile_lock.release()
+        return stream.is_synced()
+
+    def _fetch_v5_list(self, method, params):
+        """Collect every page of a cursor-paginated v5 list endpoint."""
+        entries = []
+        cursor = None
+        while True:
+            request = dict(params)
+            if cursor:
+                request['cursor'] = cursor
+            response = method(request)
+            result = response.get('result', {})
+            entries.extend(result.get('list', []))
+            cursor = result.get('nextPageCursor')
+            if not cursor:
+                return entries
+
+    def _reconcile_account_stream(self):
+        started_at = int(time.time() * 1000)
+        try:
+            positions = self._fetch_v5_list(self.exchange.private_get_v5_position_list, {'category': 'linear', 'settleCoin': 'USDT', 'limit': 200})
+            orders = self._fetch_v5_list(self.exchange.private_get_v5_order_realtime, {'category': 'linear', 'settleCoin': 'USDT', 'limit': 50})
+            balance = self.exchange.fetch_balance({'type': 'swap'})
+            wallets = balance.get('info', {}).get('result', {}).get('list')
+            self.account_stream.reconcile(started_at, positions=positions, orders=orders, wallets=wallets)
+            logging.info(f"Reconciled account stream: {len(positions)} positions, {len(orders)} open orders")
+        except Exception as e:
+            logging.info(f"Error reconciling account stream: {e}")
+
+    def _fetch_swap_balance(self):
+        coordinator = self.account_coordinator
+        if coordinator is not None and coordinator.is_fresh():
+            balance = coordinator.get_balance()
+            if balance:
+                return balance
+        if self._account_state_ready():
+            wallets = self.account_stream.get_wallets()
+            if wallets:
+                return self.exchange.parse_balance({'result': {'list': wallets}})
+        return self.exchange.fetch_balance({'type': 'swap'})
+
+    def get_swap_balance_bybit(self):
+        """Full swap balance (total, free and used per currency), as published to sharded workers."""
+        return self._fetch_swap_balance()
 
     def log_order_active_times(self):
         try:
@@ -83,21 +157,20 @@ class BybitExchange(Exchange):
     def get_market_data_bybit(self, symbol: str) -> dict:
         values = {"precision": 0.0, "leverage": 0.0, "min_qty": 0.0}
         try:
-            self.exchange.load_markets()
-            symbol_data = self.exchange.market(symbol)
+            symbol_data = self.market_registry.get_market(symbol)
             
             #print("Symbol data:", symbol_data)  # Debug print
             
-            if "info" in symbol_data:
+            if symbol_data and "info" in symbol_data:
                 values["precision"] = symbol_data["precision"]["price"]
                 values["min_qty"] = symbol_data["limits"]["amount"]["min"]
 
-            # Fetch positions
-            positions = self.exchange.fetch_positions()
+            # Only this symbol's positions are needed for the leverage
+            positions = self._fetch_symbol_positions(symbol)
 
             for position in positions:
-                if position['symbol'] == symbol:
-                    values["leverage"] = float(position['leverage'])
+                if position['symbol'] == symbol or (symbol_data and position['symbol'] == symbol_data['symbol']):
+                    values["leverage"] = float(position['leverage'] or 0)
 
         # except Exception as e:
         #     logging.info(f"An unknown error occurred in get_market_data_bybit(): {e}")
@@ -156,7 +229,7 @@ class BybitExchange(Exchange):
         if self.exchange.has['fetchBalance']:
             try:
                 # Fetch the balance with params to specify the account type if needed
-                balance_response = self.exchange.fetch_balance({'type': 'swap'})
+                balance_response = self._fetch_swap_balance()
 
                 # Log the raw response for debugging purposes
                 #logging.info(f"Raw balance response from Bybit: {balance_response}")
@@ -176,7 +249,7 @@ class BybitExchange(Exchange):
         if self.exchange.has['fetchBalance']:
             try:
                 # Fetch the balance with params to specify the account type
-                balance_response = self.exchange.fetch_balance({'type': 'swap'})
+                balance_response = self._fetch_swap_balance()
 
                 # Log the raw response for debugging purposes
                 #logging.info(f"Raw available balance response from Bybit: {balance_response}")
@@ -297,6 +370,59 @@ class BybitExchange(Exchange):
             logging.info(f"An error occurred in create_tagged_limit_order_bybit() for {symbol}: {e}")
             return {"error": str(e)}
 
+    def create_tagged_limit_orders_bybit(self, symbol: str, orders: list, isLeverage=False, postOnly=True):
+        """
+        Place several tagged limit orders for one symbol through the v5 batch endpoint.
+
+        ``orders`` is a list of dicts with ``side``, ``qty``, ``price`` and optionally
+        ``positionIdx`` and ``orderLinkId``. Requests are sent in chunks of
+        ``max_batch_orders``. Returns one entry per requested order, in the same order:
+        the placed ccxt order, or ``{"error": ...}`` when that order was rejected.
+        """
+        time_in_force = "PostOnly" if postOnly else "GTC"
+        results = []
+        for start in range(0, len(orders), self.max_batch_orders):
+            chunk = orders[start:start + self.max_batch_orders]
+            order_requests = []
+            for order in chunk:
+                extra_params = {
+                    "positionIdx": order.get('positionIdx', 0),
+                    "timeInForce": time_in_force
+                }
+                if isLeverage:
+                    extra_params["isLeverage"] = 1
+                if order.get('orderLinkId'):
+                    extra_params["orderLinkId"] = order['orderLinkId']
+                order_requests.append({
+                    'symbol': symbol,
+                    'type': 'limit',
+                    'side': order['side'],
+                    'amount': order['qty'],
+                    'price': order['price'],
+                    'params': extra_params
+                })
+
+            try:
+                placed = self.exchange.create_orders(order_requests)
+            except Exception as e:
+                logging.info(f"An error occurred in create_tagged_limit_orders_bybit() for {symbol}: {e}")
+                results.extend({"error": str(e)} for _ in chunk)
+                continue
+
+            current_time = time.time()
+            for order, result in zip(chunk, placed):
+                info = result.get('info', {})
+                if result.get('id') and int(info.get('code', 0)) == 0:
+                    results.append(result)
+                    if order['side'].lower() == 'buy':
+                        self.last_active_long_order_time[symbol] = current_time
+                    elif order['side'].lower() == 'sell':
+                        self.last_active_short_order_time[symbol] = current_time
+                else:
+                    results.append({"error": info.get('msg', 'order rejected')})
+            logging.info(f"Placed batch of {len(chunk)} orders for {symbol}")
+        return results
+
         
     def create_limit_order_bybit_unified(self, symbol: str, side: str, qty: float, price: float, positionIdx=0, params={}):
         try:
@@ -375,33 +501,19 @@ class BybitExchange(Exchange):
             return None
         
     def get_precision_and_limits_bybit(self, symbol):
-        # Fetch the market data
-        markets = self.exchange.fetch_markets()
+        market = self.market_registry.get_market(symbol)
 
-        # Filter for the specific symbol
-        for market in markets:
-            if market['symbol'] == symbol:
-                precision_amount = market['precision']['amount']
-                precision_price = market['precision']['price']
-                min_amount = market['limits']['amount']['min']
+        if market:
+            precision_amount = market['precision']['amount']
+            precision_price = market['precision']['price']
+            min_amount = market['limits']['amount']['min']
 
-                return precision_amount, precision_price, min_amount
+            return precision_amount, precision_price, min_amount
 
         return None, None, None
 
     def get_market_precision_data_bybit(self, symbol):
-        # Fetch the market data
-        markets = self.exchange.fetch_markets()
-        
-        # Print the first market from the list
-        logging.info(markets[0])
-
-        # Filter for the specific symbol
-        for market in markets:
-            if market['symbol'] == symbol:
-                return market['precision']
-        
-        return None
+        return self.market_registry.get_precision(symbol)
     
     def transfer_funds_bybit(self, code: str, amount: float, from_account: str, to_account: str, params={}):
         """
@@ -480,7 +592,7 @@ class BybitExchange(Exchange):
         if self.exchange.has['fetchBalance']:
             try:
                 # Fetch the balance with params to specify the account type if needed
-                balance_response = self.exchange.fetch_balance({'type': 'swap'})
+                balance_response = self._fetch_swap_balance()
 
                 # Log the raw response for debugging purposes
                 #logging.info(f"Raw balance response from Bybit: {balance_response}")
@@ -498,11 +610,7 @@ class BybitExchange(Exchange):
 
     def get_symbol_precision_bybit(self, symbol):
         try:
-            # Use fetch_markets to retrieve data for all markets
-            all_markets = self.exchange.fetch_markets()
-
-            # Find the market data for the specific symbol
-            market_data = next((market for market in all_markets if market['id'] == symbol), None)
+            market_data = self.market_registry.get_market(symbol)
 
             if market_data:
                 # Extract precision data
@@ -517,6 +625,14 @@ class BybitExchange(Exchange):
             logging.info("Traceback: %s", traceback.format_exc())
             return None, None
 
+    def _fetch_symbol_positions(self, symbol):
+        if self._account_state_ready():
+            market_id = self._stream_market_id(symbol)
+            raw_positions = sorted(self.account_stream.get_positions(market_id), key=lambda p: int(p.get('positionIdx', 0) or 0))
+            if len(raw_positions) == 2:
+                return [self.exchange.parse_position(raw) for raw in raw_positions]
+        return self.exchange.fetch_positions(symbol)
+
     def get_positions_bybit(self, symbol, max_retries=100, retry_delay=5) -> dict:
         values = {
             "long": {
@@ -543,7 +659,7 @@ class BybitExchange(Exchange):
 
         for i in range(max_retries):
             try:
-                data = self.exchange.fetch_positions(symbol)
+                data = self._fetch_symbol_positions(symbol)
                 if len(data) == 2:
                     sides = ["long", "short"]
                     for side in [0, 1]:
@@ -579,8 +695,8 @@ class BybitExchange(Exchange):
         
     def get_current_max_leverage_bybit(self, symbol):
         try:
-            # Fetch leverage tiers for the symbol
-            leverage_tiers = self.exchange.fetch_market_leverage_tiers(symbol)
+            # Leverage tiers for the symbol, served from the shared cache
+            leverage_tiers = self.leverage_tier_cache.get_tiers(self.exchange, symbol)
 
             # Process leverage tiers to find the maximum leverage
             max_leverage = max([tier['maxLeverage'] for tier in leverage_tiers if 'maxLeverage' in tier])
@@ -592,6 +708,13 @@ class BybitExchange(Exchange):
             logging.info(f"Error retrieving leverage tiers for {symbol}: {e}")
             return None
 
+    def get_max_leverage_at_notional_bybit(self, symbol, notional):
+        try:
+            return self.leverage_tier_cache.get_max_leverage_at_notional(self.exchange, symbol, notional)
+        except Exception as e:
+            logging.info(f"Error retrieving leverage tiers for {symbol}: {e}")
+            return None
+
     def set_leverage_bybit(self, leverage, symbol):
         try:
             self.exchange.set_leverage(leverage, symbol)
@@ -665,6 +788,14 @@ class BybitExchange(Exchange):
                         return []
                     
     def get_all_open_positions_bybit(self, retries=10, delay_factor=10, max_delay=60) -> List[dict]:
+        coordinator = self.account_coordinator
+        if coordinator is not None and coordinator.is_fresh():
+            return coordinator.get_positions()
+
+        if self._account_state_ready():
+            positions = [self.exchange.parse_position(raw) for raw in self.account_stream.get_positions()]
+            return [position for position in positions if float(position.get('contracts') or 0) != 0]
+
         now = datetime.now()
 
         # Check if the shared cache is still valid
@@ -738,14 +869,13 @@ class BybitExchange(Exchange):
                     
     def fetch_leverage_tiers(self, symbol: str) -> dict:
         """
-        Fetch leverage tiers for a given symbol using CCXT's fetch_market_leverage_tiers method.
+        Fetch leverage tiers for a given symbol from the shared leverage tier cache.
 
         :param symbol: The trading symbol to fetch leverage tiers for.
         :return: A dictionary containing leverage tiers information if successful, None otherwise.
         """
         try:
-            params = {'category': 'linear'}  # Adjust parameters based on the specific needs and API documentation
-            leverage_tiers = self.exchange.fetch_derivatives_market_leverage_tiers(symbol, params)
+            leverage_tiers = self.leverage_tier_cache.get_tiers(self.exchange, symbol)
             return leverage_tiers
         except Exception as e:
             logging.info(f"Error fetching leverage tiers for {symbol}: {e}")
@@ -799,10 +929,11 @@ class BybitExchange(Exchange):
 
     def get_all_open_orders(self):
         """Fetches open orders for all symbols."""
+        if self._account_state_ready():
+            return [self.exchange.parse_order(raw) for raw in self.account_stream.get_open_orders()]
         for _ in range(self.max_retries):
             try:
-                with self.rate_limiter:
-                    open_orders = self.exchange.fetch_open_orders()
+                open_orders = self.exchange.fetch_open_orders()
                 return open_orders
             except RateLimitExceeded:
                 logging.info(f"Rate limit exceeded when fetching open orders. Retrying in {self.retry_wait} seconds...")
@@ -815,11 +946,14 @@ class BybitExchange(Exchange):
 
     def get_open_orders(self, symbol, max_retries=100, retry_wait=1):
         """Fetches open orders for the given symbol with exponential backoff."""
+        if self._account_state_ready():
+            market_id = self._stream_market_id(symbol)
+            return [self.exchange.parse_order(raw) for raw in self.account_stream.get_open_orders(market_id)]
+
         backoff = retry_wait
         for attempt in range(max_retries):
             try:
-                with self.rate_limiter:
-                    open_orders = self.exchange.fetch_open_orders(symbol)
+                open_orders = self.exchange.fetch_open_orders(symbol)
                 return open_orders
             except RateLimitExceeded:
                 logging.info(f"Rate limit exceeded when fetching open orders for {symbol}. Retrying in {retry_wait} seconds...")
@@ -919,25 +1053,11 @@ class BybitExchange(Exchange):
         while retries < max_retries:
             try:
                 orders = self.exchange.fetch_open_orders(symbol)
-                if len(orders) > 0:
-                    for order in orders:
-                        if "info" in order:
-                            order_id = order["info"]["orderId"]
-                            order_status = order["info"]["orderStatus"]
-                            order_side = order["info"]["side"]
-                            reduce_only = order["info"]["reduceOnly"]
-                            position_idx = order["info"]["positionIdx"]
-
-                            if (
-                                order_status != "Filled"
-                                and order_side.lower() == side
-                                and order_status != "Cancelled"
-                                and reduce_only
-                                and position_idx == position_idx_map[side]
-                            ):
-                                # use the new cancel_derivatives_order function
-                                self.exchange.cancel_derivatives_order(order_id, symbol)
-                                logging.info(f"Cancelling order: {order_id}")
+                canceled = self.cancel_orders_by_side_bybit(
+                    symbol, side, reduce_only=True, position_idx=position_idx_map[side], open_orders=orders
+                )
+                for order_id in canceled:
+                    logging.info(f"Cancelling order: {order_id}")
                 # If the code reaches this point without an exception, break out of the loop
                 break
 
@@ -1065,6 +1185,131 @@ class BybitExchange(Exchange):
             logging.info(f"Canceled order - ID: {order_id}, Response: {result}")
         except Exception as e:
             logging.info(f"Error occurred in cancel_order_by_id: {e}")
+
+    def market_category(self, symbol):
+        """Bybit v5 ``category`` of a symbol's market: spot, linear, inverse or option."""
+        market = self.exchange.market(symbol)
+        if market.get('spot'):
+            return 'spot'
+        if market.get('option'):
+            return 'option'
+        return 'inverse' if market.get('inverse') else 'linear'
+
+    def cancel_orders_by_id_bybit(self, order_ids, symbol, category=None):
+        """
+        Cancel several orders of one symbol through /v5/order/cancel-batch, ``max_batch_orders``
+        per request. ``category`` defaults to the one of the symbol's market. A chunk whose
+        batch request fails is cancelled order by order. Returns the ids that were cancelled.
+        """
+        order_ids = [order_id for order_id in order_ids if order_id]
+        if not order_ids:
+            return []
+        market_id = self.exchange.market(symbol)['id']
+        category = category or self.market_category(symbol)
+        canceled = []
+        for start in range(0, len(order_ids), self.max_batch_orders):
+            chunk = order_ids[start:start + self.max_batch_orders]
+            try:
+                response = self.exchange.private_post_v5_order_cancel_batch({
+                    'category': category,
+                    'request': [{'symbol': market_id, 'orderId': order_id} for order_id in chunk]
+                })
+            except Exception as e:
+                logging.info(f"Batch cancel failed for {symbol}, cancelling orders one by one: {e}")
+                for order_id in chunk:
+                    try:
+                        self.exchange.cancel_order(order_id, symbol)
+                        canceled.append(order_id)
+                    except Exception as e:
+                        logging.info(f"Error cancelling order {order_id} for {symbol}: {e}")
+                continue
+
+            codes = response.get('retExtInfo', {}).get('list', [])
+            for index, order_id in enumerate(chunk):
+                code = codes[index] if index < len(codes) else {}
+                if int(code.get('code', 0)) == 0:
+                    canceled.append(order_id)
+                else:
+                    logging.info(f"Could not cancel order {order_id} for {symbol}: {code.get('msg')}")
+        logging.info(f"Canceled {len(canceled)} of {len(order_ids)} orders for {symbol}")
+        return canceled
+
+    def cancel_orders_by_side_bybit(self, symbol, side=None, order_link_id_prefix=None, reduce_only=None, position_idx=None, open_orders=None, category=None):
+        """
+        Cancel the open orders of ``side`` (buy/sell or long/short, None for both) for a
+        symbol in batches. Optionally only orders whose orderLinkId starts with
+        ``order_link_id_prefix``, whose reduce-only flag matches ``reduce_only`` or whose
+        positionIdx is ``position_idx``. Returns the ids that were cancelled.
+        """
+        if side is not None:
+            side = side.lower()
+            side_map = {"long": "buy", "short": "sell"}
+            side = side_map.get(side, side)
+
+        if open_orders is None:
+            open_orders = self.get_open_orders(symbol)
+        order_ids = []
+        for order in open_orders:
+            info = order.get('info') or {}
+            if side is not None and order['side'].lower() != side:
+                continue
+            if order_link_id_prefix is not None and not (order.get('clientOrderId') or info.get('orderLinkId') or '').startswith(order_link_id_prefix):
+                continue
+            if reduce_only is not None:
+                order_reduce_only = order.get('reduceOnly')
+                if order_reduce_only is None:
+                    order_reduce_only = info.get('reduceOnly')
+                if bool(order_reduce_only) != reduce_only:
+                    continue
+            if position_idx is not None and info.get('positionIdx') != position_idx:
+                continue
+            order_ids.append(order['id'])
+        return self.cancel_orders_by_id_bybit(order_ids, symbol, category)
+
+    def amend_orders_bybit(self, symbol, amendments, category=None):
+        """
+        Change price and quantity of open orders in place through /v5/order/amend-batch,
+        keeping their order ids. ``amendments`` is a list of dicts with ``id``, ``price``
+        and ``qty``. ``category`` defaults to the one of the symbol's market. A chunk whose
+        batch request fails is amended order by order. Returns the ids that were amended.
+        """
+        if not amendments:
+            return []
+        market_id = self.exchange.market(symbol)['id']
+        category = category or self.market_category(symbol)
+        requests = [
+            {
+                'symbol': market_id,
+                'orderId': amendment['id'],
+                'price': self.exchange.price_to_precision(symbol, amendment['price']),
+                'qty': self.exchange.amount_to_precision(symbol, amendment['qty'])
+            }
+            for amendment in amendments
+        ]
+        amended = []
+        for start in range(0, len(requests), self.max_batch_orders):
+            chunk = requests[start:start + self.max_batch_orders]
+            try:
+                response = self.exchange.private_post_v5_order_amend_batch({'category': category, 'request': chunk})
+            except Exception as e:
+                logging.info(f"Batch amend failed for {symbol}, amending orders one by one: {e}")
+                for request in chunk:
+                    try:
+                        self.exchange.private_post_v5_order_amend(dict(request, category=category))
+                        amended.append(request['orderId'])
+                    except Exception as e:
+                        logging.info(f"Error amending order {request['orderId']} for {symbol}: {e}")
+                continue
+
+            codes = response.get('retExtInfo', {}).get('list', [])
+            for index, request in enumerate(chunk):
+                code = codes[index] if index < len(codes) else {}
+                if int(code.get('code', 0)) == 0:
+                    amended.append(request['orderId'])
+                else:
+                    logging.info(f"Could not amend order {request['orderId']} for {symbol}: {code.get('msg')}")
+        logging.info(f"Amended {len(amended)} of {len(amendments)} orders for {symbol}")
+        return amended
            
     def cancel_take_profit_orders_bybit(self, symbol, side):
         side = side.lower()
@@ -1075,15 +1320,11 @@ class BybitExchange(Exchange):
             open_orders = self.exchange.fetch_open_orders(symbol)
             position_idx_map = {"buy": 1, "sell": 2}
 
-            for order in open_orders:
-                if (
-                    order['side'].lower() == side
-                    and order['info'].get('reduceOnly')
-                    and order['info'].get('positionIdx') == position_idx_map[side]
-                ):
-                    order_id = order['id']  # Assuming 'id' is the standard format expected by cancel_order
-                    self.exchange.cancel_order(order_id, symbol)
-                    logging.info(f"Canceled take profit order - ID: {order_id}")
+            canceled = self.cancel_orders_by_side_bybit(
+                symbol, side, reduce_only=True, position_idx=position_idx_map[side], open_orders=open_orders
+            )
+            for order_id in canceled:
+                logging.info(f"Canceled take profit order - ID: {order_id}")
 
         except Exception as e:
             logging.info(f"An unknown error occurred in cancel_take_profit_orders: {e}")
@@ -1130,7 +1371,7 @@ class BybitExchange(Exchange):
         #logging.info(f"Called get_max_leverage_bybit with symbol: {symbol}")
         for retry in range(max_retries):
             try:
-                tiers = self.exchange.fetch_derivatives_market_leverage_tiers(symbol)
+                tiers = self.leverage_tier_cache.get_tiers(self.exchange, symbol)
                 for tier in tiers:
                     info = tier.get('info', {})
                     if info.get('symbol') == symbol:
@@ -1170,26 +1411,21 @@ class BybitExchange(Exchange):
 
     def bybit_fetch_precision(self, symbol):
         try:
-            markets = self.exchange.fetch_derivatives_markets()
-            for market in markets['result']['list']:
-                if market['symbol'] == symbol:
-                    qty_step = market['lotSizeFilter']['qtyStep']
-                    self.market_precisions[symbol] = {'amount': float(qty_step)}
-                    break
+            market = self.market_registry.get_market(symbol)
+            if market:
+                qty_step = market['info']['lotSizeFilter']['qtyStep']
+                self.market_precisions[symbol] = {'amount': float(qty_step)}
         except Exception as e:
             logging.info(f"Exception in bybit_fetch_precision: {e}")
 
     def get_market_tick_size_bybit(self, symbol):
-        # Fetch the market data
-        markets = self.exchange.fetch_markets()
-
-        # Filter for the specific symbol
-        for market in markets:
-            if market['symbol'] == symbol:
-                tick_size = market['info']['priceFilter']['tickSize']
-                return tick_size
-        
-        return None
+        return self.market_registry.get_tick_size(symbol)
+
+    def get_min_qty_bybit(self, symbol):
+        return self.market_registry.get_min_qty(symbol)
+
+    def get_min_notional_bybit(self, symbol):
+        return self.market_registry.get_min_notional(symbol)
 
     def fetch_recent_trades(self, symbol, since=None, limit=100):
         """
@@ -1202,7 +1438,7 @@ class BybitExchange(Exchange):
         """
         try:
             # Ensure the markets are loaded
-            self.exchange.load_markets()
+            self.market_registry.load(self.exchange)
 
             # Fetch trades using ccxt
             trades = self.exchange.fetch_trades(symbol, since=since, limit=limit)
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+
+try:
+    import websocket
+except ImportError:  # websocket-client is optional, callers fall back to REST
+    websocket = None
+
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="BybitStream", filename="BybitStream.log", stream=True)
+
+
+class BybitStream:
+    """
+    Reconnecting Bybit v5 WebSocket connection run on a daemon thread.
+
+    Subclasses implement ``on_connected`` (subscribe, authenticate, reset state) and
+    ``on_data`` (apply a decoded topic message). ``handle_message`` is public so a stream
+    can be driven by a local WebSocket stand-in or fed messages directly.
+    """
+
+    name = "BybitStream"
+
+    def __init__(self, url, stale_after=15, heartbeat_interval=10, reconnect_delay=5):
+        self.url = url
+        self.stale_after = stale_after  # Max silence on the socket before data is stale
+        self.heartbeat_interval = heartbeat_interval
+        self.reconnect_delay = reconnect_delay
+
+        self.lock = threading.Lock()
+        self.last_message_time = 0.0
+
+        self.ws = None
+        self.thread = None
+        self.heartbeat_thread = None
+        self.connected = threading.Event()
+        self.running = False
+
+    @staticmethod
+    def is_available():
+        return websocket is not None
+
+    def start(self):
+        if websocket is None:
+            return False
+        with self.lock:
+            if self.running:
+                return True
+            self.running = True
+        self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self.thread.start()
+        self.heartbeat_thread = threading.Thread(target=self._heartbeat, name=f"{self.name}Heartbeat", daemon=True)
+        self.heartbeat_thread.start()
+        return True
+
+    def stop(self):
+        self.running = False
+        self.connected.clear()
+        if self.ws is not None:
+            try:
+                self.ws.close()
+            except Exception as e:
+                logging.info(f"[{self.name}] Error closing stream: {e}")
+
+    def is_live(self):
+        """True while the socket is connected and has not gone silent."""
+        return self.connected.is_set() and time.monotonic() - self.last_message_time <= self.stale_after
+
+    def send(self, message):
+        try:
+            self.ws.send(json.dumps(message))
+            return True
+        except Exception as e:
+            logging.info(f"[{self.name}] Failed to send {message.get('op')}: {e}")
+            return False
+
+    def _run(self):
+        while self.running:
+            try:
+                self.ws = websocket.WebSocketApp(
+                    self.url,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=self._on_error,
+                    on_close=self._on_close,
+                )
+                self.ws.run_forever()
+            except Exception as e:
+                logging.info(f"[{self.name}] Stream crashed: {e}")
+            self.connected.clear()
+            if self.running:
+                logging.info(f"[{self.name}] Disconnected. Reconnecting in {self.reconnect_delay} seconds...")
+                time.sleep(self.reconnect_delay)
+
+    def _heartbeat(self):
+        while self.running:
+            time.sleep(self.heartbeat_interval)
+            if self.connected.is_set():
+                self.send({"op": "ping"})
+
+    def _on_open(self, ws):
+        with self.lock:
+            self.last_message_time = time.monotonic()
+        self.connected.set()
+        logging.info(f"[{self.name}] Connected to {self.url}")
+        self.on_connected()
+
+    def _on_message(self, ws, message):
+        self.handle_message(message)
+
+    def _on_error(self, ws, error):
+        logging.info(f"[{self.name}] Stream error: {error}")
+
+    def _on_close(self, ws, close_status_code=None, close_msg=None):
+        self.connected.clear()
+        logging.info(f"[{self.name}] Stream closed: {close_status_code} {close_msg}")
+
+    def handle_message(self, message):
+        """Decode a raw stream message and dispatch it to ``on_op`` or ``on_data``."""
+        try:
+            msg = json.loads(message) if isinstance(message, (str, bytes)) else message
+        except ValueError:
+            logging.info(f"[{self.name}] Unparseable message: {message}")
+            return
+
+        now = time.monotonic()
+        with self.lock:
+            self.last_message_time = now
+
+        if "op" in msg:
+            self.on_op(msg)
+            return
+
+        topic = msg.get("topic", "")
+        if topic and msg.get("data") is not None:
+            self.on_data(topic, msg, now)
+
+    def on_connected(self):
+        pass
+
+    def on_op(self, msg):
+        if msg.get("op") == "subscribe" and not msg.get("success", True):
+            logging.info(f"[{self.name}] Subscription rejected: {msg.get('ret_msg')}")
+
+    def on_data(self, topic, msg, now):
+        pass
@@ -0,0 +1,194 @@
+import threading
+import time
+
+import numpy as np
+
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="CandleStore", filename="CandleStore.log", stream=True)
+
+TIMEFRAME_MS = {
+    '1m': 60000,
+    '3m': 180000,
+    '5m': 300000,
+    '15m': 900000,
+    '30m': 1800000,
+    '1h': 3600000,
+    '2h': 7200000,
+    '4h': 14400000,
+    '6h': 21600000,
+    '12h': 43200000,
+    '1d': 86400000,
+}
+
+# Timeframes that may be built from 1m candles instead of being fetched
+RESAMPLE_FROM_1M = {'3m', '5m', '15m', '30m', '1h', '2h', '4h'}
+
+# Columns of a candle row, same order as ccxt OHLCV
+TIMESTAMP, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+
+
+class CandleBuffer:
+    """Fixed-size ring buffer of OHLCV rows ordered by timestamp."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = np.zeros((capacity, 6), dtype=np.float64)
+        self.start = 0
+        self.size = 0
+        self.history_complete = False  # The exchange has no older candles than we hold
+
+    def clear(self):
+        self.start = 0
+        self.size = 0
+        self.history_complete = False
+
+    @property
+    def last_timestamp(self):
+        if self.size == 0:
+            return None
+        return self.data[(self.start + self.size - 1) % self.capacity, TIMESTAMP]
+
+    def append(self, row):
+        """Append a candle, or replace the last one if it is the same (in-progress) bar."""
+        last = self.last_timestamp
+        if last is not None:
+            if row[TIMESTAMP] == last:
+                self.data[(self.start + self.size - 1) % self.capacity] = row
+                return
+            if row[TIMESTAMP] < last:
+                return
+        if self.size < self.capacity:
+            self.data[(self.start + self.size) % self.capacity] = row
+            self.size += 1
+        else:
+            self.data[self.start] = row
+            self.start = (self.start + 1) % self.capacity
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def view(self, limit=None):
+        """Copy of the newest ``limit`` candles, oldest first."""
+        count = self.size if limit is None else min(limit, self.size)
+        first = (self.start + self.size - count) % self.capacity
+        indices = (np.arange(count) + first) % self.capacity
+        return self.data[indices].copy()
+
+
+def resample(candles, target_ms):
+    """
+    Aggregate OHLCV rows into a higher timeframe aligned to epoch boundaries.
+    A leading bucket that does not start on a boundary is incomplete and is dropped.
+    """
+    if len(candles) == 0:
+        return candles
+    buckets = (candles[:, TIMESTAMP] // target_ms).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(candles)]
+
+    result = np.empty((len(starts), 6), dtype=np.float64)
+    result[:, TIMESTAMP] = buckets[starts] * target_ms
+    result[:, OPEN] = candles[starts, OPEN]
+    result[:, HIGH] = np.maximum.reduceat(candles[:, HIGH], starts)
+    result[:, LOW] = np.minimum.reduceat(candles[:, LOW], starts)
+    result[:, CLOSE] = candles[ends - 1, CLOSE]
+    result[:, VOLUME] = np.add.reduceat(candles[:, VOLUME], starts)
+
+    if candles[0, TIMESTAMP] % target_ms != 0:
+        result = result[1:]
+    return result
+
+
+class CandleStore:
+    """
+    Process-wide OHLCV cache keyed by (symbol, timeframe).
+
+    Each key is backed by a ``CandleBuffer``. The first read does a full fetch, and later
+    reads only fetch candles ``since`` the newest one held, at most once per
+    ``refresh_interval`` seconds. Supported higher timeframes are resampled from the
+    1m buffer when it holds enough history. ``apply_candle`` lets a kline stream push
+    candles directly.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, capacity=1500, max_fetch=1000, refresh_interval=5):
+        self.capacity = capacity
+        self.max_fetch = max_fetch  # Largest kline page the exchange returns
+        self.refresh_interval = refresh_interval
+
+        self.lock = threading.Lock()
+        self.buffers = {}
+        self.key_locks = {}
+        self.last_refresh = {}
+
+    @classmethod
+    def get_instance(cls, name, **kwargs):
+        with cls._instances_lock:
+            store = cls._instances.get(name)
+            if store is None:
+                store = cls(**kwargs)
+                cls._instances[name] = store
+            return store
+
+    def _buffer(self, key):
+        with self.lock:
+            if key not in self.buffers:
+                self.buffers[key] = CandleBuffer(self.capacity)
+                self.key_locks[key] = threading.Lock()
+            return self.buffers[key], self.key_locks[key]
+
+    def apply_candle(self, symbol, timeframe, row):
+        buffer, key_lock = self._buffer((symbol, timeframe))
+        with key_lock:
+            buffer.append(row)
+
+    def _refresh(self, fetch, symbol, timeframe, limit):
+        key = (symbol, timeframe)
+        buffer, key_lock = self._buffer(key)
+        timeframe_ms = TIMEFRAME_MS.get(timeframe)
+        with key_lock:
+            now = time.monotonic()
+            has_history = buffer.size >= limit or buffer.history_complete
+            if has_history and now - self.last_refresh.get(key, 0) < self.refresh_interval:
+                return buffer.view(limit)
+
+            last = buffer.last_timestamp
+            missing = None
+            if last is not None and timeframe_ms:
+                missing = (time.time() * 1000 - last) / timeframe_ms
+            if not has_history or missing is None or missing >= self.max_fetch:
+                if missing is not None and missing >= self.max_fetch:
+                    logging.info(f"[{symbol}] {timeframe} candles are {missing:.0f} bars behind, refetching")
+                fetch_limit = min(max(limit, 1), self.max_fetch)
+                rows = fetch(symbol, timeframe, limit=fetch_limit)
+                buffer.clear()
+                buffer.extend(rows)
+                buffer.history_complete = len(rows) < fetch_limit
+            else:
+                buffer.extend(fetch(symbol, timeframe, since=int(last), limit=self.max_fetch))
+            self.last_refresh[key] = now
+            return buffer.view(limit)
+
+    def get_candles(self, fetch, symbol, timeframe, limit):
+        """
+        Newest ``limit`` candles as an (n, 6) array, oldest first, the last row being the
+        in-progress candle as with ccxt. ``fetch`` has the ccxt ``fetch_ohlcv`` signature.
+        """
+        if timeframe in RESAMPLE_FROM_1M:
+            factor = TIMEFRAME_MS[timeframe] // TIMEFRAME_MS['1m']
+            needed = (limit + 1) * factor
+            with self.lock:
+                source = self.buffers.get((symbol, '1m'))
+                usable = source is not None and source.size >= needed
+            if usable:
+                candles = self._refresh(fetch, symbol, '1m', needed)
+                return resample(candles, TIMEFRAME_MS[timeframe])[-limit:]
+        return self._refresh(fetch, symbol, timeframe, limit)
+
+    def get_ohlcv(self, fetch, symbol, timeframe, limit):
+        """``get_candles`` as ccxt-style ``[timestamp, open, high, low, close, volume]`` lists."""
+        return [[int(row[0])] + row[1:] for row in self.get_candles(fetch, symbol, timeframe, limit).tolist()]
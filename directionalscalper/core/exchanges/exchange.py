@@ -13,6 +13,9 @@ import traceback
 from typing import Optional, Tuple, List
 from ccxt.base.errors import RateLimitExceeded
 from ..strategies.logger import Logger
+from rate_limit import get_rate_limiter, request_weight
+from .candle_store import CandleStore
+from .market_registry import MarketRegistry
 from requests.exceptions import HTTPError
 from datetime import datetime, timedelta
 from ccxt.base.errors import NetworkError
@@ -21,10 +24,6 @@ logging = Logger(logger_name="Exchange", filename="Exchange.log", stream=True)
 
 class Exchange:
     # Shared class-level cache variables
-    symbols_cache = None
-    symbols_cache_time = None
-    symbols_cache_duration = 300  # Cache duration in seconds
-
     open_positions_shared_cache = None
     last_open_positions_time_shared = None
     open_positions_semaphore = threading.Semaphore()
@@ -38,6 +37,7 @@ class Exchange:
         self.market_type = market_type  # Store the market type
         self.name = exchange_id
         self.initialise()
+        self.market_registry = MarketRegistry.get_instance(f"{self.exchange_id}:{self.market_type}")
         self.symbols = self._get_symbols()
         self.market_precisions = {}
         self.open_positions_cache = None
@@ -45,6 +45,12 @@ class Exchange:
 
         self.entry_order_ids = {}  # Initialize order history
         self.entry_order_ids_lock = threading.Lock()  # For thread safety
+
+        # Optional streaming market data, set by exchanges that support it
+        self.market_data_hub = None
+
+        # Candles are shared by every instance talking to the same market
+        self.candle_store = CandleStore.get_instance(f"{self.exchange_id}:{self.market_type}")
         
     def initialise(self):
         exchange_class = getattr(ccxt, self.exchange_id)
@@ -100,10 +106,49 @@ class Exchange:
             
         # Initializing the exchange object
         self.exchange = exchange_class(exchange_params)
+        self._limit_requests()
+
+    def endpoint_group(self, url):
+        """Rate limit group of a REST request, see rate_limit.ENDPOINT_GROUPS."""
+        path = urllib.parse.urlparse(url).path.lower()
+        if 'order' in path and 'orderbook' not in path:
+            if 'amend' in path:
+                return 'order_amend'
+            if 'cancel' in path:
+                return 'order_cancel'
+            return 'orders'
+        if any(hint in path for hint in ('market', 'ticker', 'kline', 'depth', 'orderbook', 'instrument', 'exchangeinfo', 'public')):
+            return 'market_data'
+        return 'account'
+
+    def _limit_requests(self):
+        """
+        Route every REST request of the ccxt client through the shared endpoint rate limiter,
+        and feed the quota the exchange reports in each response back into it.
+        """
+        self.request_limiter = get_rate_limiter()
+        fetch = self.exchange.fetch
+
+        def limited_fetch(url, method='GET', headers=None, body=None):
+            endpoint = urllib.parse.urlparse(url).path
+            weight = request_weight(endpoint, body)
+            with self.request_limiter.limit(self.endpoint_group(url), weight, endpoint):
+                return fetch(url, method, headers, body)
+
+        def record_quota(response, *args, **kwargs):
+            endpoint = urllib.parse.urlparse(response.url).path
+            self.request_limiter.update_quota_from_headers(endpoint, response.headers)
+
+        self.exchange.fetch = limited_fetch
+        self.exchange.session.hooks['response'].append(record_quota)
+
+    def get_rate_limit_quotas(self):
+        """Remaining request quota per endpoint, as last reported by the exchange."""
+        return self.request_limiter.quota_metrics()
         
     def get_mfirsi_ema_secondary_ema(self, symbol: str, limit: int = 100, lookback: int = 1, ema_period: int = 5, secondary_ema_period: int = 3) -> str:
         # Fetch OHLCV data
-        ohlcv_data = self.exchange.fetch_ohlcv(symbol=symbol, timeframe='1m', limit=limit)
+        ohlcv_data = self.fetch_candles(symbol, timeframe='1m', limit=limit)
         df = pd.DataFrame(ohlcv_data, columns=["timestamp", "open", "high", "low", "close", "volume"])
 
         # Calculate MFI and RSI
@@ -184,18 +229,12 @@ class Exchange:
                 logging.error(f"Exception occurred while processing trades for {symbol}: {e}")
 
     def _get_symbols(self):
-        current_time = time.time()
-        if Exchange.symbols_cache and (current_time - Exchange.symbols_cache_time) < Exchange.symbols_cache_duration:
-            logging.info("Returning cached symbols")
-            return Exchange.symbols_cache
-
+        # The registry downloads the markets once per exchange and market type and
+        # seeds every later client from memory, so each instance goes through it
         while True:
             try:
-                markets = self.exchange.load_markets()
-                symbols = [market['symbol'] for market in markets.values()]
-                Exchange.symbols_cache = symbols
-                Exchange.symbols_cache_time = current_time
-                return symbols
+                markets = self.market_registry.load(self.exchange)
+                return list(markets.keys())
             except ccxt.errors.RateLimitExceeded as e:
                 logging.info(f"Get symbols Rate limit exceeded: {e}, retrying in 10 seconds...")
                 time.sleep(10)
@@ -337,17 +376,12 @@ class Exchange:
         raise Exception(f"Failed to execute the API function after {max_retries} retries.")
     
     def get_price_precision(self, symbol):
-        market = self.exchange.market(symbol)
-        smallest_increment = market['precision']['price']
+        smallest_increment = self.market_registry.get_precision(symbol)['price']
         price_precision = len(str(smallest_increment).split('.')[-1])
         return price_precision
 
     def get_precision_bybit(self, symbol):
-        markets = self.exchange.fetch_derivatives_markets()
-        for market in markets:
-            if market['symbol'] == symbol:
-                return market['precision']
-        return None
+        return self.market_registry.get_precision(symbol)
 
     def get_balance(self, quote: str) -> dict:
         values = {
@@ -383,13 +417,24 @@ class Exchange:
 
     def is_valid_symbol(self, symbol: str) -> bool:
         try:
-            markets = self.exchange.load_markets()
-            return symbol in markets
+            self.market_registry.load(self.exchange)
+            return symbol in self.market_registry.markets_by_symbol
         except Exception as e:
             logging.error(f"Error checking symbol validity: {e}")
             logging.error(traceback.format_exc())
             return False
         
+    def fetch_candles(self, symbol, timeframe='1m', limit=100):
+        """
+        Fetch the newest OHLCV rows for the given symbol and timeframe from the shared candle store.
+
+        :param symbol: Trading symbol.
+        :param timeframe: Timeframe string.
+        :param limit: Number of candles to return.
+        :return: List of [timestamp, open, high, low, close, volume] rows, oldest first.
+        """
+        return self.candle_store.get_ohlcv(self.exchange.fetch_ohlcv, symbol, timeframe, limit)
+
     def fetch_ohlcv(self, symbol, timeframe='1d', limit=None):
         """
         Fetch OHLCV data for the given symbol and timeframe.
@@ -483,7 +528,18 @@ class Exchange:
             
     #         return pd.DataFrame()
 
+    def _stream_market_id(self, symbol):
+        try:
+            return self.exchange.market(symbol)['id']
+        except Exception:
+            return symbol
+
     def get_orderbook(self, symbol, max_retries=3, retry_delay=5) -> dict:
+        if self.market_data_hub is not None:
+            orderbook = self.market_data_hub.get_orderbook(self._stream_market_id(symbol))
+            if orderbook is not None:
+                return orderbook
+
         values = {"bids": [], "asks": []}
 
         for attempt in range(max_retries):
@@ -585,6 +641,10 @@ class Exchange:
 
     # Universal
     def get_current_price(self, symbol: str) -> float:
+        if self.market_data_hub is not None:
+            price = self.market_data_hub.get_current_price(self._stream_market_id(symbol))
+            if price is not None:
+                return price
         try:
             ticker = self.exchange.fetch_ticker(symbol)
             if "bid" in ticker and "ask" in ticker:
@@ -623,14 +683,12 @@ class Exchange:
 
     def get_symbol_info_binance(self, symbol):
         try:
-            markets = self.exchange.fetch_markets()
-            print(markets)
-            for market in markets:
-                if market['symbol'] == symbol:
-                    filters = market['info']['filters']
-                    min_notional = [f['minNotional'] for f in filters if f['filterType'] == 'MIN_NOTIONAL'][0]
-                    min_qty = [f['minQty'] for f in filters if f['filterType'] == 'LOT_SIZE'][0]
-                    return min_notional, min_qty
+            market = self.market_registry.get_market(symbol)
+            if market:
+                filters = market['info']['filters']
+                min_notional = [f['minNotional'] for f in filters if f['filterType'] == 'MIN_NOTIONAL'][0]
+                min_qty = [f['minQty'] for f in filters if f['filterType'] == 'LOT_SIZE'][0]
+                return min_notional, min_qty
         except Exception as e:
             logging.error(f"An error occurred while fetching symbol info: {e}")
 
@@ -661,7 +719,7 @@ class Exchange:
         values = {"MA_3_H": 0.0, "MA_3_L": 0.0, "MA_6_H": 0.0, "MA_6_L": 0.0}
         for i in range(max_retries):
             try:
-                bars = self.exchange.fetch_ohlcv(symbol=symbol, timeframe=timeframe, limit=num_bars)
+                bars = self.fetch_candles(symbol, timeframe=timeframe, limit=num_bars)
                 if not bars:
                     logging.info(f"No data returned for {symbol} on {timeframe}. Retrying...")
                     time.sleep(retry_delay)
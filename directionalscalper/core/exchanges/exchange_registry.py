@@ -0,0 +1,85 @@
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="ExchangeRegistry", filename="ExchangeRegistry.log", stream=True)
+
+
+class ExchangeRegistry:
+    """
+    Account-scoped registry of exchange adapters.
+
+    Every strategy thread and signal worker of an account shares one adapter, and with
+    it one ccxt client, one HTTP connection pool, the loaded markets and every
+    per-instance cache. Adapters are built on first use. Concurrent callers for the
+    same account wait for that build instead of starting their own.
+    """
+
+    _adapters = {}
+    _build_times = {}
+    _reuse_counts = {}
+    _lock = threading.Lock()
+    _key_locks = {}
+
+    # Connections kept alive per host on the shared ccxt session
+    pool_maxsize = 50
+
+    @classmethod
+    def get_or_create(cls, key, factory):
+        """
+        Return the adapter registered under ``key`` (e.g. exchange and account name),
+        building it with the zero-argument ``factory`` the first time.
+        """
+        with cls._lock:
+            adapter = cls._adapters.get(key)
+            if adapter is None:
+                key_lock = cls._key_locks.setdefault(key, threading.Lock())
+        if adapter is not None:
+            return cls._reuse(key, adapter)
+
+        with key_lock:
+            with cls._lock:
+                adapter = cls._adapters.get(key)
+            if adapter is not None:
+                return cls._reuse(key, adapter)
+
+            start_time = time.time()
+            adapter = factory()
+            cls._share_session(adapter)
+            build_time = time.time() - start_time
+
+            with cls._lock:
+                cls._adapters[key] = adapter
+                cls._build_times[key] = build_time
+                cls._reuse_counts[key] = 0
+            logging.info(f"Created exchange adapter for {key} in {build_time:.2f} seconds")
+            return adapter
+
+    @classmethod
+    def _reuse(cls, key, adapter):
+        with cls._lock:
+            cls._reuse_counts[key] += 1
+            reuses = cls._reuse_counts[key]
+            build_time = cls._build_times[key]
+        logging.info(f"Reusing exchange adapter for {key} (reuse #{reuses}, about {build_time * reuses:.2f} seconds of setup saved so far)")
+        return adapter
+
+    @classmethod
+    def _share_session(cls, adapter):
+        session = getattr(getattr(adapter, 'exchange', None), 'session', None)
+        if session is None:
+            return
+        http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=cls.pool_maxsize)
+        session.mount('https://', http_adapter)
+        session.mount('http://', http_adapter)
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            return {
+                key: {"build_time": cls._build_times[key], "reuses": cls._reuse_counts[key]}
+                for key in cls._adapters
+            }
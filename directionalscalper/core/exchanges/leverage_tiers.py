@@ -0,0 +1,101 @@
+import threading
+import time
+
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="LeverageTiers", filename="LeverageTiers.log", stream=True)
+
+
+class LeverageTierCache:
+    """
+    Process-wide cache of ccxt leverage tier structures keyed by unified symbol.
+
+    The first lookup prefetches the tiers of every linear contract in one paginated
+    call, then a daemon thread refreshes them every ``ttl`` seconds. Symbols missing
+    from the bulk snapshot (new listings) are fetched individually and cached.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, ttl=21600, retry_delay=300):
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+
+        self.lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.tiers = {}
+        self.fetched_at = {}
+        self.prefetched_at = None
+
+        self.client = None
+        self.refresh_thread = None
+
+    @classmethod
+    def get_instance(cls, name, **kwargs):
+        with cls._instances_lock:
+            cache = cls._instances.get(name)
+            if cache is None:
+                cache = cls(**kwargs)
+                cls._instances[name] = cache
+            return cache
+
+    def _prefetch(self, client):
+        all_tiers = client.fetch_leverage_tiers(None, {'subType': 'linear'})
+        now = time.time()
+        with self.lock:
+            self.tiers.update(all_tiers)
+            for symbol in all_tiers:
+                self.fetched_at[symbol] = now
+            self.prefetched_at = now
+        logging.info(f"Prefetched leverage tiers for {len(all_tiers)} symbols")
+
+    def ensure_loaded(self, client):
+        if self.prefetched_at is not None:
+            return
+        with self.load_lock:
+            if self.prefetched_at is not None or self.client is not None:
+                return
+            self.client = client
+            try:
+                self._prefetch(client)
+            except Exception as e:
+                logging.info(f"Error prefetching leverage tiers, falling back to per-symbol fetches: {e}")
+            self.refresh_thread = threading.Thread(target=self._refresh_loop, name="LeverageTierRefresh", daemon=True)
+            self.refresh_thread.start()
+
+    def _refresh_loop(self):
+        while True:
+            delay = self.ttl if self.prefetched_at is not None else self.retry_delay
+            time.sleep(delay)
+            try:
+                self._prefetch(self.client)
+            except Exception as e:
+                logging.info(f"Error refreshing leverage tiers: {e}")
+
+    def get_tiers(self, client, symbol):
+        """Tier list for a symbol (unified or exchange id), ordered from the lowest notional."""
+        self.ensure_loaded(client)
+        unified = client.market(symbol)['symbol']
+        with self.lock:
+            tiers = self.tiers.get(unified)
+            fetched_at = self.fetched_at.get(unified, 0)
+        if tiers is not None and time.time() - fetched_at < self.ttl:
+            return tiers
+
+        tiers = client.fetch_derivatives_market_leverage_tiers(unified, {'category': 'linear'})
+        with self.lock:
+            self.tiers[unified] = tiers
+            self.fetched_at[unified] = time.time()
+        return tiers
+
+    def get_max_leverage(self, client, symbol):
+        tiers = self.get_tiers(client, symbol)
+        return max(tier['maxLeverage'] for tier in tiers if tier.get('maxLeverage') is not None)
+
+    def get_max_leverage_at_notional(self, client, symbol, notional):
+        """Max leverage allowed for a position of ``notional`` value, None above the last tier."""
+        for tier in self.get_tiers(client, symbol):
+            if tier['maxNotional'] is None or notional <= tier['maxNotional']:
+                return tier['maxLeverage']
+        return None
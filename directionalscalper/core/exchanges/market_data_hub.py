@@ -0,0 +1,163 @@
+import threading
+import time
+
+from directionalscalper.core.exchanges.bybit_stream import BybitStream
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="MarketDataHub", filename="MarketDataHub.log", stream=True)
+
+BYBIT_PUBLIC_LINEAR_URL = "wss://stream.bybit.com/v5/public/linear"
+BYBIT_PUBLIC_SPOT_URL = "wss://stream.bybit.com/v5/public/spot"
+
+
+class MarketDataHub(BybitStream):
+    """
+    Process-wide Bybit v5 public stream of ``orderbook.<depth>`` and ``tickers``.
+
+    One hub exists per WebSocket URL and is shared by every strategy thread in the
+    process. Symbols are subscribed lazily the first time they are requested, and the
+    latest snapshot is served from memory. Getters return ``None`` whenever the stream
+    is not connected or the data is stale so callers can fall back to REST.
+    """
+
+    name = "MarketDataHub"
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, url=BYBIT_PUBLIC_LINEAR_URL, depth=50, max_symbol_age=60, subscribe_chunk=10, **kwargs):
+        super().__init__(url, **kwargs)
+        self.depth = depth
+        self.max_symbol_age = max_symbol_age  # Max age of a single symbol before it is stale
+        self.subscribe_chunk = subscribe_chunk
+
+        self.subscribed = set()
+        self.tickers = {}
+        self.orderbooks = {}
+        self.ticker_times = {}
+        self.orderbook_times = {}
+
+    @classmethod
+    def get_instance(cls, url=BYBIT_PUBLIC_LINEAR_URL, **kwargs):
+        with cls._instances_lock:
+            hub = cls._instances.get(url)
+            if hub is None:
+                hub = cls(url=url, **kwargs)
+                cls._instances[url] = hub
+            return hub
+
+    @staticmethod
+    def market_id(symbol):
+        """Convert a unified ccxt symbol (``BTC/USDT:USDT``) to a Bybit id (``BTCUSDT``)."""
+        return symbol.split(':')[0].replace('/', '').upper()
+
+    def subscribe(self, symbol):
+        """Subscribe a symbol once. Returns False if streaming is unavailable."""
+        if not self.is_available():
+            return False
+        market_id = self.market_id(symbol)
+        with self.lock:
+            if market_id in self.subscribed:
+                return True
+            self.subscribed.add(market_id)
+        if not self.start():
+            return False
+        if self.connected.is_set():
+            self._send_subscribe([market_id])
+        return True
+
+    def _send_subscribe(self, market_ids):
+        args = []
+        for market_id in market_ids:
+            args.append(f"orderbook.{self.depth}.{market_id}")
+            args.append(f"tickers.{market_id}")
+        for i in range(0, len(args), self.subscribe_chunk):
+            self.send({"op": "subscribe", "args": args[i:i + self.subscribe_chunk]})
+
+    def on_connected(self):
+        with self.lock:
+            # Books are rebuilt from the snapshot Bybit sends after every subscribe
+            self.orderbooks.clear()
+            self.orderbook_times.clear()
+            self.tickers.clear()
+            self.ticker_times.clear()
+            market_ids = list(self.subscribed)
+        logging.info(f"Subscribing {len(market_ids)} symbols on {self.url}")
+        if market_ids:
+            self._send_subscribe(market_ids)
+
+    def on_data(self, topic, msg, now):
+        if topic.startswith("orderbook."):
+            self._apply_orderbook(msg.get("type"), msg["data"], now)
+        elif topic.startswith("tickers."):
+            self._apply_ticker(msg.get("type"), msg["data"], now)
+
+    def _apply_orderbook(self, msg_type, data, now):
+        market_id = data.get("s")
+        with self.lock:
+            book = self.orderbooks.get(market_id)
+            if msg_type == "snapshot" or book is None:
+                if msg_type != "snapshot":
+                    return  # Delta without a snapshot cannot be applied
+                book = {"bids": {}, "asks": {}}
+                self.orderbooks[market_id] = book
+            for side, key in (("bids", "b"), ("asks", "a")):
+                levels = book[side]
+                for price, size in data.get(key, []):
+                    if float(size) == 0:
+                        levels.pop(float(price), None)
+                    else:
+                        levels[float(price)] = float(size)
+            book["update_id"] = data.get("u")
+            self.orderbook_times[market_id] = now
+
+    def _apply_ticker(self, msg_type, data, now):
+        market_id = data.get("symbol")
+        with self.lock:
+            if msg_type == "snapshot" or market_id not in self.tickers:
+                self.tickers[market_id] = dict(data)
+            else:
+                self.tickers[market_id].update(data)
+            self.ticker_times[market_id] = now
+
+    # Readers
+
+    def _is_fresh(self, updated_at):
+        if updated_at is None or not self.is_live():
+            return False
+        return time.monotonic() - updated_at <= self.max_symbol_age
+
+    def get_ticker(self, symbol):
+        market_id = self.market_id(symbol)
+        if not self.subscribe(symbol):
+            return None
+        with self.lock:
+            if not self._is_fresh(self.ticker_times.get(market_id)):
+                return None
+            return dict(self.tickers[market_id])
+
+    def get_orderbook(self, symbol, depth=None):
+        market_id = self.market_id(symbol)
+        if not self.subscribe(symbol):
+            return None
+        with self.lock:
+            if not self._is_fresh(self.orderbook_times.get(market_id)):
+                return None
+            book = self.orderbooks[market_id]
+            bids = sorted(book["bids"].items(), reverse=True)
+            asks = sorted(book["asks"].items())
+        if not bids or not asks:
+            return None
+        if depth is not None:
+            bids, asks = bids[:depth], asks[:depth]
+        return {"bids": [[price, size] for price, size in bids], "asks": [[price, size] for price, size in asks]}
+
+    def get_current_price(self, symbol):
+        """Mid price from the ticker stream, or from the book if the ticker lacks quotes."""
+        ticker = self.get_ticker(symbol)
+        if ticker and ticker.get("bid1Price") and ticker.get("ask1Price"):
+            return (float(ticker["bid1Price"]) + float(ticker["ask1Price"])) / 2
+        orderbook = self.get_orderbook(symbol, depth=1)
+        if orderbook:
+            return (orderbook["bids"][0][0] + orderbook["asks"][0][0]) / 2
+        return None
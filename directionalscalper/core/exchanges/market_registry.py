@@ -0,0 +1,133 @@
+import threading
+import time
+
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="MarketRegistry", filename="MarketRegistry.log", stream=True)
+
+
+class MarketRegistry:
+    """
+    Process-wide instrument metadata for one exchange and market type.
+
+    Markets are loaded once through a ccxt client and indexed by exchange id
+    (``BTCUSDT``) and unified symbol (``BTC/USDT:USDT``), so precision, tick size,
+    minimum quantity and minimum notional lookups are dictionary reads. A daemon
+    thread reloads the markets every ``ttl`` seconds. Other ccxt clients are seeded
+    from the registry instead of downloading the markets again.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, ttl=3600, retry_delay=60):
+        self.ttl = ttl
+        self.retry_delay = retry_delay
+
+        self.lock = threading.Lock()
+        self.load_lock = threading.Lock()
+        self.markets_by_symbol = {}
+        self.markets_by_id = {}
+        self.loaded_at = None
+
+        self.client = None
+        self.refresh_thread = None
+
+    @classmethod
+    def get_instance(cls, name, **kwargs):
+        with cls._instances_lock:
+            registry = cls._instances.get(name)
+            if registry is None:
+                registry = cls(**kwargs)
+                cls._instances[name] = registry
+            return registry
+
+    def _index(self, markets):
+        by_symbol = {}
+        by_id = {}
+        for market in markets.values():
+            by_symbol[market['symbol']] = market
+            # Linear contracts win over spot markets that share the same id
+            if market['id'] not in by_id or market.get('linear'):
+                by_id[market['id']] = market
+        with self.lock:
+            self.markets_by_symbol = by_symbol
+            self.markets_by_id = by_id
+            self.loaded_at = time.time()
+
+    def load(self, client):
+        """
+        Make sure the registry and the given ccxt client both hold the markets.
+        Only the first call downloads them, later clients are seeded from memory.
+        Returns the markets keyed by unified symbol.
+        """
+        with self.lock:
+            loaded = self.loaded_at is not None
+            markets = self.markets_by_symbol
+        if not loaded:
+            with self.load_lock:
+                if self.loaded_at is None:
+                    self._index(client.load_markets())
+                    self.client = client
+                    self._start_refresh()
+                    logging.info(f"Loaded {len(self.markets_by_symbol)} markets")
+            with self.lock:
+                markets = self.markets_by_symbol
+        if not client.markets:
+            client.set_markets(list(markets.values()))
+        return markets
+
+    def _start_refresh(self):
+        if self.refresh_thread is None:
+            self.refresh_thread = threading.Thread(target=self._refresh_loop, name="MarketRegistryRefresh", daemon=True)
+            self.refresh_thread.start()
+
+    def _refresh_loop(self):
+        delay = self.ttl
+        while True:
+            time.sleep(delay)
+            try:
+                self._index(self.client.load_markets(reload=True))
+                logging.info(f"Refreshed {len(self.markets_by_symbol)} markets")
+                delay = self.ttl
+            except Exception as e:
+                logging.info(f"Error refreshing markets: {e}, retrying in {self.retry_delay} seconds...")
+                delay = self.retry_delay
+
+    # Lookups
+
+    def get_market(self, symbol):
+        """Market by unified symbol or exchange id, None if unknown."""
+        with self.lock:
+            return self.markets_by_symbol.get(symbol) or self.markets_by_id.get(symbol)
+
+    def has_market(self, symbol):
+        return self.get_market(symbol) is not None
+
+    def symbols(self):
+        with self.lock:
+            return list(self.markets_by_symbol.keys())
+
+    def get_precision(self, symbol):
+        market = self.get_market(symbol)
+        return market['precision'] if market else None
+
+    def get_tick_size(self, symbol):
+        market = self.get_market(symbol)
+        if market is None:
+            return None
+        price_filter = market.get('info', {}).get('priceFilter', {})
+        return price_filter.get('tickSize', market['precision']['price'])
+
+    def get_min_qty(self, symbol):
+        market = self.get_market(symbol)
+        return market['limits']['amount']['min'] if market else None
+
+    def get_min_notional(self, symbol):
+        market = self.get_market(symbol)
+        if market is None:
+            return None
+        min_cost = market['limits'].get('cost', {}).get('min')
+        if min_cost is None:
+            min_cost = market.get('info', {}).get('lotSizeFilter', {}).get('minNotionalValue')
+        return float(min_cost) if min_cost is not None else None
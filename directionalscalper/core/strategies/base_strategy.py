@@ -23,11 +23,14 @@ from threading import Thread, Lock
 
 from ..bot_metrics import BotDatabase
 
-from rate_limit import RateLimit
+from rate_limit import get_rate_limiter
 
 
 logging = Logger(logger_name="BaseStrategy", filename="BaseStrategy.log", stream=True)
 
+# orderLinkId prefix of auto-reduce orders, so they can be cancelled by prefix
+AUTO_REDUCE_ORDER_LINK_PREFIX = "ar-"
+
 class BaseStrategy:
     initialized_symbols = set()
     initialized_symbols_lock = threading.Lock()
@@ -98,7 +101,7 @@ class BaseStrategy:
         self.dynamic_amount_per_symbol = {}
         self.max_trade_qty_per_symbol = {}
         self.last_auto_reduce_time = {}
-        self.rate_limiter = RateLimit(10, 1)
+        self.rate_limiter = get_rate_limiter()
 
         # self.bybit = self.Bybit(self)
 
@@ -207,7 +210,7 @@ class BaseStrategy:
         return -MaxAbsFundingRate <= funding_rate <= MaxAbsFundingRate
 
     def fetch_historical_data(self, symbol, timeframe, limit=15):
-        ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
+        ohlcv = self.exchange.fetch_candles(symbol, timeframe=timeframe, limit=limit)
         df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
         df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
         return df
@@ -395,6 +398,17 @@ class BaseStrategy:
     def cancel_take_profit_orders(self, symbol, side):
         self.exchange.cancel_close_bybit(symbol, side)
 
+    def cancel_orders_bybit(self, symbol, order_ids):
+        """Cancel several orders, in batches when the exchange supports it. Returns the cancelled ids."""
+        order_ids = [order_id for order_id in order_ids if order_id]
+        if not order_ids:
+            return []
+        if hasattr(self.exchange, 'cancel_orders_by_id_bybit'):
+            return self.exchange.cancel_orders_by_id_bybit(order_ids, symbol)
+        for order_id in order_ids:
+            self.exchange.cancel_order_by_id(order_id, symbol)
+        return order_ids
+
     def limit_order_binance(self, symbol, side, amount, price, reduceOnly=False):
         try:
             params = {"reduceOnly": reduceOnly}
@@ -1220,8 +1234,8 @@ class BaseStrategy:
         retries = 0
         while retries < max_retries:
             try:
-                with self.rate_limiter:
-                    return function(*args, **kwargs)
+                # Requests are paced by the shared endpoint limiter on the exchange client
+                return function(*args, **kwargs)
             except ccxt.RateLimitExceeded as e:
                 retries += 1
                 delay = min(base_delay * (2 ** retries) + random.uniform(0, 0.1 * (2 ** retries)), max_delay)
@@ -1437,9 +1451,9 @@ class BaseStrategy:
             for order in helper_orders:
                 if 'id' in order:
                     logging.info(f"Helper order for {symbol}: {order}")
-                    self.exchange.cancel_order_by_id(order['id'], symbol)
                 else:
                     logging.warning(f"Could not place helper order for {symbol}: {order.get('error', 'Unknown error')}")
+            self.cancel_orders_bybit(symbol, [order['id'] for order in helper_orders if 'id' in order])
 
             # Deactivate helper for the next cycle
             self.helper_active = False
@@ -1485,7 +1499,7 @@ class BaseStrategy:
 
     def calculate_qfl_levels(self, symbol: str, timeframe='5m', lookback_period=12):
         # Fetch historical candle data
-        candles = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=lookback_period)
+        candles = self.exchange.fetch_candles(symbol, timeframe=timeframe, limit=lookback_period)
         df = pd.DataFrame(candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
 
         # Convert timestamps to readable dates (optional)
@@ -1499,7 +1513,7 @@ class BaseStrategy:
 
     def calculate_qfl_base(self, symbol: str, timeframe='5m', lookback_period=12):
         # Fetch historical candle data
-        candles = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=lookback_period)
+        candles = self.exchange.fetch_candles(symbol, timeframe=timeframe, limit=lookback_period)
         df = pd.DataFrame(candles, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
 
         # Convert timestamps to readable dates (optional)
@@ -1625,9 +1639,7 @@ class BaseStrategy:
             logging.info(f"Error in quote stuffing: {e}")
 
         # Cancel orders
-        for order in placed_orders:
-            if order and 'id' in order:
-                self.exchange.cancel_order_by_id(order['id'], symbol)
+        self.cancel_orders_bybit(symbol, [order['id'] for order in placed_orders if order and 'id' in order])
 
         return long_amount if larger_position == "long" else short_amount
 
@@ -1688,9 +1700,7 @@ class BaseStrategy:
                     logging.info(f"Error placing order: {e}")
 
         # Cancel orders
-        for order in placed_orders:
-            if order and 'id' in order:
-                self.exchange.cancel_order_by_id(order['id'], symbol)
+        self.cancel_orders_bybit(symbol, [order['id'] for order in placed_orders if order and 'id' in order])
 
         return amount
 
@@ -2724,7 +2734,7 @@ class BaseStrategy:
             Generate a trading signal based on Lorentzian distance prediction.
             """
             # Fetch OHLCV data
-            ohlcv_data = self.exchange.fetch_ohlcv(symbol=symbol, timeframe='1m', limit=limit)
+            ohlcv_data = self.exchange.fetch_candles(symbol, timeframe='1m', limit=limit)
             df = pd.DataFrame(ohlcv_data, columns=["timestamp", "open", "high", "low", "close", "volume"])
 
             # Calculate Features
@@ -2981,16 +2991,18 @@ class BaseStrategy:
 
     def cancel_all_auto_reduce_orders_bybit(self, symbol: str) -> None:
         try:
+            # Auto-reduce orders carry their orderLinkId prefix, so ones placed before a restart go too
+            try:
+                canceled = self.exchange.cancel_orders_by_side_bybit(symbol, order_link_id_prefix=AUTO_REDUCE_ORDER_LINK_PREFIX)
+            except Exception as e:
+                canceled = []
+                logging.warning(f"An error occurred while cancelling auto-reduce orders for {symbol}: {e}")
+            for order_id in canceled:
+                logging.info(f"Cancelled auto-reduce order: {order_id}")
+            if not canceled:
+                logging.info(f"No auto-reduce orders found for {symbol}")
             if symbol in self.auto_reduce_orders:
-                for order_id in self.auto_reduce_orders[symbol]:
-                    try:
-                        self.exchange.cancel_order(order_id, symbol)
-                        logging.info(f"Cancelling auto-reduce order: {order_id}")
-                    except Exception as e:
-                        logging.warning(f"An error occurred while cancelling auto-reduce order {order_id}: {e}")
                 self.auto_reduce_orders[symbol].clear()  # Clear the list after cancellation
-            else:
-                logging.info(f"No auto-reduce orders found for {symbol}")
 
         except Exception as e:
             logging.warning(f"An unknown error occurred in cancel_all_auto_reduce_orders_bybit(): {e}")
@@ -3654,9 +3666,13 @@ class BaseStrategy:
             logging.info(f"Error calculating auto-reduce levels for short position in {symbol}: {e}")
             return None, None
 
+    @staticmethod
+    def auto_reduce_order_link_id():
+        return f"{AUTO_REDUCE_ORDER_LINK_PREFIX}{uuid.uuid4().hex[:24]}"
+
     def auto_reduce_long(self, symbol, long_dynamic_amount, step_price):
         try:
-            order = self.limit_order_bybit_reduce_nolimit(symbol, 'sell', long_dynamic_amount, float(step_price), positionIdx=1, reduceOnly=True)
+            order = self.limit_order_bybit_reduce_nolimit(symbol, 'sell', long_dynamic_amount, float(step_price), positionIdx=1, reduceOnly=True, orderLinkId=self.auto_reduce_order_link_id())
             logging.info(f"Auto-reduce long order placed for {symbol} at {step_price} with amount {long_dynamic_amount}")
             return order.get('id', None) if order else None
         except Exception as e:
@@ -3666,7 +3682,7 @@ class BaseStrategy:
 
     def auto_reduce_short(self, symbol, short_dynamic_amount, step_price):
         try:
-            order = self.limit_order_bybit_reduce_nolimit(symbol, 'buy', short_dynamic_amount, float(step_price), positionIdx=2, reduceOnly=True)
+            order = self.limit_order_bybit_reduce_nolimit(symbol, 'buy', short_dynamic_amount, float(step_price), positionIdx=2, reduceOnly=True, orderLinkId=self.auto_reduce_order_link_id())
             logging.info(f"Auto-reduce short order placed for {symbol} at {step_price} with amount {short_dynamic_amount}")
             return order.get('id', None) if order else None
         except Exception as e:
@@ -4998,13 +5014,12 @@ class BaseStrategy:
 
         # If mismatched TP orders exist, cancel them
         if mismatched_qty_orders:
-            for order in mismatched_qty_orders:
-                try:
-                    self.exchange.cancel_order_by_id(order['id'], symbol)
-                    logging.info(f"{order_side.capitalize()} take profit {order['id']} canceled due to mismatched quantity.")
-                    time.sleep(0.05)
-                except Exception as e:
-                    logging.info(f"Error in cancelling {order_side} TP order {order['id']}. Error: {e}")
+            try:
+                canceled = self.cancel_orders_bybit(symbol, [order['id'] for order in mismatched_qty_orders])
+                for order_id in canceled:
+                    logging.info(f"{order_side.capitalize()} take profit {order_id} canceled due to mismatched quantity.")
+            except Exception as e:
+                logging.info(f"Error in cancelling {order_side} TP orders. Error: {e}")
 
         # Proceed to set or update TP orders
         now = datetime.now()
@@ -5066,14 +5081,14 @@ class BaseStrategy:
 
             if update_now and new_tp_price is not None:
                 # Cancel mismatched or incorrectly priced TP orders if any
-                for order in orders_to_cancel:
-                    try:
-                        self.exchange.cancel_order_by_id(order['id'], symbol)
-                        logging.info(f"Cancelled TP order {order['id']} for update.")
-                        time.sleep(0.05)  # Delay to ensure orders are cancelled
+                try:
+                    canceled = self.cancel_orders_bybit(symbol, [order['id'] for order in orders_to_cancel])
+                    for order_id in canceled:
+                        logging.info(f"Cancelled TP order {order_id} for update.")
+                    if canceled:
                         orders_updated = True
-                    except Exception as e:
-                        logging.info(f"Error in cancelling {order_side} TP order {order['id']}. Error: {e}")
+                except Exception as e:
+                    logging.info(f"Error in cancelling {order_side} TP orders. Error: {e}")
 
                 # Set new TP order at the updated market price
                 try:
@@ -5105,13 +5120,12 @@ class BaseStrategy:
         mismatched_qty_orders = [order for order in long_tp_orders if order['qty'] != pos_qty or order['price'] != current_market_price]
 
         # Cancel mismatched TP orders if any
-        for order in mismatched_qty_orders:
-            try:
-                self.exchange.cancel_order_by_id(order['id'], symbol)
-                logging.info(f"Cancelled TP order {order['id']} for update.")
-                time.sleep(0.05)
-            except Exception as e:
-                logging.info(f"Error in cancelling TP order {order['id']}. Error: {e}")
+        try:
+            canceled = self.cancel_orders_bybit(symbol, [order['id'] for order in mismatched_qty_orders])
+            for order_id in canceled:
+                logging.info(f"Cancelled TP order {order_id} for update.")
+        except Exception as e:
+            logging.info(f"Error in cancelling TP orders. Error: {e}")
 
         now = datetime.now()
         if now >= last_tp_update or mismatched_qty_orders:
@@ -5144,13 +5158,12 @@ class BaseStrategy:
         mismatched_qty_orders = [order for order in relevant_tp_orders if order['qty'] != pos_qty]
 
         # Cancel mismatched TP orders if any
-        for order in mismatched_qty_orders:
-            try:
-                self.exchange.cancel_order_by_id(order['id'], symbol)
-                logging.info(f"Cancelled TP order {order['id']} for update.")
-                time.sleep(0.05)
-            except Exception as e:
-                logging.info(f"Error in cancelling {order_side} TP order {order['id']}. Error: {e}")
+        try:
+            canceled = self.cancel_orders_bybit(symbol, [order['id'] for order in mismatched_qty_orders])
+            for order_id in canceled:
+                logging.info(f"Cancelled TP order {order_id} for update.")
+        except Exception as e:
+            logging.info(f"Error in cancelling {order_side} TP orders. Error: {e}")
 
         now = datetime.now()
         if now >= next_tp_update or mismatched_qty_orders:
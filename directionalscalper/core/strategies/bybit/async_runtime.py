@@ -0,0 +1,137 @@
+import asyncio
+import statistics
+import time
+
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="AsyncRuntime", filename="AsyncRuntime.log", stream=True)
+
+
+class AsyncBybitStrategy:
+    """
+    Loop contract of a strategy run on the async runtime.
+
+    The runtime calls ``setup`` once per symbol, then every ``iteration_interval``
+    seconds fetches a snapshot (positions, open orders, order book, ticker) and
+    passes it to ``iterate``. ``iterate`` returns False to stop trading the symbol.
+    Strategies must only await, any blocking call stalls every other symbol.
+    """
+
+    iteration_interval = 5
+    private_data = True  # Fetch positions and open orders in the snapshot
+
+    def __init__(self, exchange, manager, config, symbols_allowed=None):
+        self.exchange = exchange
+        self.manager = manager
+        self.config = config
+        self.symbols_allowed = symbols_allowed
+
+    async def setup(self, symbol):
+        pass
+
+    async def iterate(self, symbol, snapshot):
+        raise NotImplementedError
+
+    async def teardown(self, symbol):
+        pass
+
+
+# Strategies available on the async runtime, by the name used with --strategy. Filled in
+# by register_async_strategy as the strategy packages are imported (scalping: basicgrid)
+ASYNC_STRATEGIES = {}
+
+
+def register_async_strategy(name):
+    def register(strategy_class):
+        ASYNC_STRATEGIES[name.lower()] = strategy_class
+        return strategy_class
+    return register
+
+
+class AsyncStrategyRuntime:
+    """
+    Runs one coroutine per symbol on a single event loop.
+
+    Symbols can be added and removed while running. Per-iteration fetch and total
+    latency are kept for the last ``latency_window`` iterations of each symbol.
+    """
+
+    def __init__(self, exchange, strategy, latency_window=100):
+        self.exchange = exchange
+        self.strategy = strategy
+        self.latency_window = latency_window
+        self.tasks = {}
+        self.fetch_latency = {}
+        self.iteration_latency = {}
+
+    def add_symbol(self, symbol):
+        if symbol in self.tasks and not self.tasks[symbol].done():
+            return
+        self.tasks[symbol] = asyncio.create_task(self._run_symbol(symbol), name=f"symbol-{symbol}")
+        logging.info(f"Started coroutine for {symbol}")
+
+    def remove_symbol(self, symbol):
+        task = self.tasks.pop(symbol, None)
+        if task is not None:
+            task.cancel()
+            logging.info(f"Stopped coroutine for {symbol}")
+
+    def active_symbols(self):
+        return {symbol for symbol, task in self.tasks.items() if not task.done()}
+
+    def _record(self, latencies, symbol, value):
+        samples = latencies.setdefault(symbol, [])
+        samples.append(value)
+        if len(samples) > self.latency_window:
+            del samples[0]
+
+    async def run_iteration(self, symbol):
+        started_at = time.monotonic()
+        snapshot = await self.exchange.get_snapshot(symbol, private=self.strategy.private_data)
+        self._record(self.fetch_latency, symbol, snapshot['fetch_time'])
+        keep_running = await self.strategy.iterate(symbol, snapshot)
+        self._record(self.iteration_latency, symbol, time.monotonic() - started_at)
+        return keep_running is not False
+
+    async def _run_symbol(self, symbol):
+        try:
+            await self.strategy.setup(symbol)
+            while True:
+                started_at = time.monotonic()
+                try:
+                    if not await self.run_iteration(symbol):
+                        break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logging.info(f"Exception caught in async iteration for {symbol}: {e}")
+                elapsed = time.monotonic() - started_at
+                await asyncio.sleep(max(0.0, self.strategy.iteration_interval - elapsed))
+        finally:
+            try:
+                await self.strategy.teardown(symbol)
+            except Exception as e:
+                logging.info(f"Exception caught in teardown for {symbol}: {e}")
+            logging.info(f"Coroutine for {symbol} has completed.")
+
+    async def run(self, symbols):
+        for symbol in symbols:
+            self.add_symbol(symbol)
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks.values()), return_exceptions=True)
+            self.tasks = {symbol: task for symbol, task in self.tasks.items() if not task.done()}
+
+    def latency_stats(self):
+        """Mean, median and p95 per-iteration latency in seconds over every symbol."""
+        stats = {}
+        for name, latencies in (("fetch", self.fetch_latency), ("iteration", self.iteration_latency)):
+            samples = sorted(value for values in latencies.values() for value in values)
+            if not samples:
+                continue
+            stats[name] = {
+                "count": len(samples),
+                "mean": statistics.fmean(samples),
+                "median": statistics.median(samples),
+                "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            }
+        return stats
@@ -26,6 +26,7 @@ from threading import Thread, Lock
 from ...bot_metrics import BotDatabase
 
 from directionalscalper.core.strategies.base_strategy import BaseStrategy
+from directionalscalper.core.strategies.grid_reconciler import grid_order_amounts, grid_order_link_id, grid_total_amount, plan_grid_orders
 
 logging = Logger(logger_name="BybitBaseStrategy", filename="BybitBaseStrategy.log", stream=True)
 
@@ -88,6 +89,8 @@ class BybitStrategy(BaseStrategy):
         self.last_empty_grid_time = {}
         self.last_reissue_price_long = {}
         self.last_reissue_price_short = {}
+        self.grid_reconcile_dry_run = False  # Log grid reconcile plans without sending orders
+        self.grid_tolerance_ticks = 1  # Live grid orders within this many ticks of a level are kept
 
         try:
             # Hotkey-related attributes
@@ -589,12 +592,12 @@ class BybitStrategy(BaseStrategy):
         mismatched_qty_orders = [order for order in relevant_tp_orders if order['qty'] != pos_qty and order['id'] not in self.auto_reduce_order_ids.get(symbol, [])]
 
         # Cancel mismatched TP orders if any
-        for order in mismatched_qty_orders:
-            try:
-                self.exchange.cancel_order_by_id(order['id'], symbol)
-                logging.info(f"Cancelled TP order {order['id']} for update.")
-            except Exception as e:
-                logging.info(f"Error in cancelling {order_side} TP order {order['id']}. Error: {e}")
+        try:
+            canceled = self.cancel_orders_bybit(symbol, [order['id'] for order in mismatched_qty_orders])
+            for order_id in canceled:
+                logging.info(f"Cancelled TP order {order_id} for update.")
+        except Exception as e:
+            logging.info(f"Error in cancelling {order_side} TP orders. Error: {e}")
 
         # Using datetime.now() for checking if update is needed
         now = datetime.now()
@@ -647,12 +650,12 @@ class BybitStrategy(BaseStrategy):
         mismatched_qty_orders = [order for order in relevant_tp_orders if order['qty'] != pos_qty and order['id'] not in self.auto_reduce_order_ids.get(symbol, [])]
 
         # Cancel mismatched TP orders if any
-        for order in mismatched_qty_orders:
-            try:
-                self.exchange.cancel_order_by_id(order['id'], symbol)
-                logging.info(f"Cancelled TP order {order['id']} for update.")
-            except Exception as e:
-                logging.info(f"Error in cancelling {order_side} TP order {order['id']}. Error: {e}")
+        try:
+            canceled = self.cancel_orders_bybit(symbol, [order['id'] for order in mismatched_qty_orders])
+            for order_id in canceled:
+                logging.info(f"Cancelled TP order {order_id} for update.")
+        except Exception as e:
+            logging.info(f"Error in cancelling {order_side} TP orders. Error: {e}")
 
         now = datetime.now()
         if now >= last_tp_update or mismatched_qty_orders:
@@ -1201,8 +1204,10 @@ class BybitStrategy(BaseStrategy):
 
         return order
 
-    def limit_order_bybit_reduce_nolimit(self, symbol, side, amount, price, positionIdx, reduceOnly=False):
+    def limit_order_bybit_reduce_nolimit(self, symbol, side, amount, price, positionIdx, reduceOnly=False, orderLinkId=None):
         params = {"reduceOnly": reduceOnly}
+        if orderLinkId:
+            params["orderLinkId"] = orderLinkId
         logging.info(f"Placing {side} limit order for {symbol} at {price} with qty {amount} and params {params}...")
         try:
             order = self.exchange.create_limit_order_bybit(symbol, side, amount, price, positionIdx=positionIdx, params=params)
@@ -1351,13 +1356,12 @@ class BybitStrategy(BaseStrategy):
         mismatched_qty_orders = [order for order in relevant_tp_orders if order['qty'] != pos_qty]
 
         # Cancel mismatched TP orders if any
-        for order in mismatched_qty_orders:
-            try:
-                self.exchange.cancel_order_by_id(order['id'], symbol)
-                logging.info(f"Cancelled TP order {order['id']} for update.")
-                time.sleep(0.05)
-            except Exception as e:
-                logging.info(f"Error in cancelling {order_side} TP order {order['id']}. Error: {e}")
+        try:
+            canceled = self.cancel_orders_bybit(symbol, [order['id'] for order in mismatched_qty_orders])
+            for order_id in canceled:
+                logging.info(f"Cancelled TP order {order_id} for update.")
+        except Exception as e:
+            logging.info(f"Error in cancelling {order_side} TP orders. Error: {e}")
 
         now = datetime.now()
         if now >= last_tp_update or mismatched_qty_orders:
@@ -2748,7 +2752,7 @@ class BybitStrategy(BaseStrategy):
         :return: The ATRP value as a percentage of the current price
         """
         # Fetch OHLCV data
-        ohlcv_data = self.exchange.fetch_ohlcv(symbol=symbol, timeframe=timeframe, limit=limit)
+        ohlcv_data = self.exchange.fetch_candles(symbol, timeframe=timeframe, limit=limit)
         df = pd.DataFrame(ohlcv_data, columns=["timestamp", "open", "high", "low", "close", "volume"])
         
         # Calculate the True Range (TR)
@@ -3203,12 +3207,11 @@ class BybitStrategy(BaseStrategy):
             if (replace_long_grid or (replace_empty_long_grid and (current_time - self.last_empty_grid_time[symbol].get('long', 0) > 240))) and not self.auto_reduce_active_long.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_long:
                     logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'buy')
                     buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                     buffer_distance_long = current_price * buffer_percentage_long
                     price_range_long = dynamic_outer_price_distance * current_price
                     grid_levels_long = [current_price - buffer_distance_long - price_range_long * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                    self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                    self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['long'] = current_time
                     logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
@@ -3219,12 +3222,11 @@ class BybitStrategy(BaseStrategy):
             if (replace_short_grid or (replace_empty_short_grid and (current_time - self.last_empty_grid_time[symbol].get('short', 0) > 240))) and not self.auto_reduce_active_short.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_short:
                     logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'sell')
                     buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                     buffer_distance_short = current_price * buffer_percentage_short
                     price_range_short = dynamic_outer_price_distance * current_price
                     grid_levels_short = [current_price + buffer_distance_short + price_range_short * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                    self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                    self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['short'] = current_time
                     logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
@@ -3254,10 +3256,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -3266,10 +3267,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -3282,16 +3282,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -3541,25 +3539,23 @@ class BybitStrategy(BaseStrategy):
 
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False) and symbol not in self.max_qty_reached_symbol_long:
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                 buffer_distance_long = current_price * buffer_percentage_long
                 dynamic_outer_price_distance_long = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_long = current_price * dynamic_outer_price_distance_long
                 grid_levels_long = [current_price - buffer_distance_long - (outer_price_distance_long - buffer_distance_long) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False) and symbol not in self.max_qty_reached_symbol_short:
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                 buffer_distance_short = current_price * buffer_percentage_short
                 dynamic_outer_price_distance_short = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_short = current_price * dynamic_outer_price_distance_short
                 grid_levels_short = [current_price + buffer_distance_short + (outer_price_distance_short - buffer_distance_short) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -3756,25 +3752,23 @@ class BybitStrategy(BaseStrategy):
 
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False) and symbol not in self.max_qty_reached_symbol_long:
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                 buffer_distance_long = current_price * buffer_percentage_long
                 dynamic_outer_price_distance_long = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_long = current_price * dynamic_outer_price_distance_long
                 grid_levels_long = [current_price - buffer_distance_long - (outer_price_distance_long - buffer_distance_long) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False) and symbol not in self.max_qty_reached_symbol_short:
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                 buffer_distance_short = current_price * buffer_percentage_short
                 dynamic_outer_price_distance_short = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_short = current_price * dynamic_outer_price_distance_short
                 grid_levels_short = [current_price + buffer_distance_short + (outer_price_distance_short - buffer_distance_short) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -3998,12 +3992,11 @@ class BybitStrategy(BaseStrategy):
             if (replace_long_grid or (replace_empty_long_grid and (current_time - self.last_empty_grid_time[symbol].get('long', 0) > 240))) and not self.auto_reduce_active_long.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_long:
                     logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'buy')
                     buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                     buffer_distance_long = current_price * buffer_percentage_long
                     price_range_long = dynamic_outer_price_distance * current_price
                     grid_levels_long = [current_price - buffer_distance_long - price_range_long * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                    self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                    self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['long'] = current_time
                     logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
@@ -4014,12 +4007,11 @@ class BybitStrategy(BaseStrategy):
             if (replace_short_grid or (replace_empty_short_grid and (current_time - self.last_empty_grid_time[symbol].get('short', 0) > 240))) and not self.auto_reduce_active_short.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_short:
                     logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'sell')
                     buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                     buffer_distance_short = current_price * buffer_percentage_short
                     price_range_short = dynamic_outer_price_distance * current_price
                     grid_levels_short = [current_price + buffer_distance_short + price_range_short * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                    self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                    self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['short'] = current_time
                     logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
@@ -4046,10 +4038,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -4058,10 +4049,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -4074,16 +4064,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -4412,10 +4400,9 @@ class BybitStrategy(BaseStrategy):
                 if (replace_long_grid or (replace_empty_long_grid and (current_time - self.last_empty_grid_time[symbol].get('long', 0) > 240))) and not self.auto_reduce_active_long.get(symbol, False):
                     if symbol not in self.max_qty_reached_symbol_long:
                         logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer or empty grid timeout.")
-                        self.clear_grid(symbol, 'buy')
                         buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                         buffer_distance_long = current_price * buffer_percentage_long
-                        self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                        self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                         self.active_grids.add(symbol)
                         self.last_empty_grid_time[symbol]['long'] = current_time
                         logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
@@ -4426,10 +4413,9 @@ class BybitStrategy(BaseStrategy):
                 if (replace_short_grid or (replace_empty_short_grid and (current_time - self.last_empty_grid_time[symbol].get('short', 0) > 240))) and not self.auto_reduce_active_short.get(symbol, False):
                     if symbol not in self.max_qty_reached_symbol_short:
                         logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer or empty grid timeout.")
-                        self.clear_grid(symbol, 'sell')
                         buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                         buffer_distance_short = current_price * buffer_percentage_short
-                        self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                        self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                         self.active_grids.add(symbol)
                         self.last_empty_grid_time[symbol]['short'] = current_time
                         logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
@@ -4446,10 +4432,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -4458,10 +4443,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -4474,16 +4458,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -4814,10 +4796,9 @@ class BybitStrategy(BaseStrategy):
                 if (replace_long_grid or (replace_empty_long_grid and (current_time - self.last_empty_grid_time[symbol].get('long', 0) > 240))) and not self.auto_reduce_active_long.get(symbol, False):
                     if symbol not in self.max_qty_reached_symbol_long:
                         logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer or empty grid timeout.")
-                        self.clear_grid(symbol, 'buy')
                         buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                         buffer_distance_long = current_price * buffer_percentage_long
-                        self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                        self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                         self.active_grids.add(symbol)
                         self.last_empty_grid_time[symbol]['long'] = current_time
                         logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
@@ -4828,10 +4809,9 @@ class BybitStrategy(BaseStrategy):
                 if (replace_short_grid or (replace_empty_short_grid and (current_time - self.last_empty_grid_time[symbol].get('short', 0) > 240))) and not self.auto_reduce_active_short.get(symbol, False):
                     if symbol not in self.max_qty_reached_symbol_short:
                         logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer or empty grid timeout.")
-                        self.clear_grid(symbol, 'sell')
                         buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                         buffer_distance_short = current_price * buffer_percentage_short
-                        self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                        self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                         self.active_grids.add(symbol)
                         self.last_empty_grid_time[symbol]['short'] = current_time
                         logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
@@ -4848,10 +4828,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -4860,10 +4839,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -4876,16 +4854,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -5193,10 +5169,9 @@ class BybitStrategy(BaseStrategy):
             if (replace_long_grid or (replace_empty_long_grid and (current_time - self.last_empty_grid_time[symbol].get('long', 0) > 240))) and not self.auto_reduce_active_long.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_long:
                     logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'buy')
                     buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                     buffer_distance_long = current_price * buffer_percentage_long
-                    self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                    self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['long'] = current_time
                     logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
@@ -5207,10 +5182,9 @@ class BybitStrategy(BaseStrategy):
             if (replace_short_grid or (replace_empty_short_grid and (current_time - self.last_empty_grid_time[symbol].get('short', 0) > 240))) and not self.auto_reduce_active_short.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_short:
                     logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'sell')
                     buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                     buffer_distance_short = current_price * buffer_percentage_short
-                    self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                    self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['short'] = current_time
                     logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
@@ -5240,10 +5214,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -5252,10 +5225,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -5268,16 +5240,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -5554,12 +5524,11 @@ class BybitStrategy(BaseStrategy):
             if (replace_long_grid or (replace_empty_long_grid and (current_time - self.last_empty_grid_time[symbol].get('long', 0) > 240))) and not self.auto_reduce_active_long.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_long:
                     logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'buy')
                     buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                     buffer_distance_long = current_price * buffer_percentage_long
                     price_range_long = dynamic_outer_price_distance * current_price
                     grid_levels_long = [current_price - buffer_distance_long - price_range_long * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                    self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                    self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['long'] = current_time
                     logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
@@ -5570,12 +5539,11 @@ class BybitStrategy(BaseStrategy):
             if (replace_short_grid or (replace_empty_short_grid and (current_time - self.last_empty_grid_time[symbol].get('short', 0) > 240))) and not self.auto_reduce_active_short.get(symbol, False):
                 if symbol not in self.max_qty_reached_symbol_short:
                     logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer or empty grid timeout.")
-                    self.clear_grid(symbol, 'sell')
                     buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                     buffer_distance_short = current_price * buffer_percentage_short
                     price_range_short = dynamic_outer_price_distance * current_price
                     grid_levels_short = [current_price + buffer_distance_short + price_range_short * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                    self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                    self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                     self.active_grids.add(symbol)
                     self.last_empty_grid_time[symbol]['short'] = current_time
                     logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
@@ -5606,10 +5574,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -5618,10 +5585,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -5634,16 +5600,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -5930,7 +5894,6 @@ class BybitStrategy(BaseStrategy):
             if replace_long_grid or (replace_empty_long_grid and (current_time - self.last_empty_grid_time[symbol].get('long', 0) > 240)):
                 if not self.auto_reduce_active_long.get(symbol, False) and symbol not in self.max_qty_reached_symbol_long:
                     logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer or empty grid for open position.")
-                    self.clear_grid(symbol, 'buy')
                     buffer_percentage_long = min_buffer_percentage + (average_spread * (max_buffer_percentage - min_buffer_percentage))
                     buffer_percentage_long = min(max(buffer_percentage_long, min_buffer_percentage), max_buffer_percentage)
                     buffer_distance_long = current_price * buffer_percentage_long
@@ -5938,7 +5901,7 @@ class BybitStrategy(BaseStrategy):
                     grid_levels_long = self.calculate_grid_levels_orderbook_based(
                         symbol, current_price, buffer_distance_long, levels, 'buy', min_outer_price_distance, max_outer_price_distance, strength
                     )
-                    self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                    self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                     self.active_grids.add(symbol)
                     logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
                     self.last_empty_grid_time[symbol]['long'] = current_time
@@ -5947,7 +5910,6 @@ class BybitStrategy(BaseStrategy):
             if replace_short_grid or (replace_empty_short_grid and (current_time - self.last_empty_grid_time[symbol].get('short', 0) > 240)):
                 if not self.auto_reduce_active_short.get(symbol, False) and symbol not in self.max_qty_reached_symbol_short:
                     logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer or empty grid for open position.")
-                    self.clear_grid(symbol, 'sell')
                     buffer_percentage_short = min_buffer_percentage + (average_spread * (max_buffer_percentage - min_buffer_percentage))
                     buffer_percentage_short = min(max(buffer_percentage_short, min_buffer_percentage), max_buffer_percentage)
                     buffer_distance_short = current_price * buffer_percentage_short
@@ -5955,7 +5917,7 @@ class BybitStrategy(BaseStrategy):
                     grid_levels_short = self.calculate_grid_levels_orderbook_based(
                         symbol, current_price, buffer_distance_short, levels, 'sell', min_outer_price_distance, max_outer_price_distance, strength
                     )
-                    self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                    self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                     self.active_grids.add(symbol)
                     logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
                     self.last_empty_grid_time[symbol]['short'] = current_time
@@ -6046,10 +6008,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -6058,10 +6019,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -6074,16 +6034,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -6329,27 +6287,25 @@ class BybitStrategy(BaseStrategy):
 
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False) and symbol not in self.max_qty_reached_symbol_long:
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 self.active_grids.discard(symbol)
                 buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                 buffer_distance_long = current_price * buffer_percentage_long
                 dynamic_outer_price_distance_long = self.calculate_dynamic_outer_price_distance_orderbook(order_book, current_price, max_outer_price_distance=max_outer_price_distance, min_outer_price_distance=min_outer_price_distance)
                 outer_price_distance_long = current_price * dynamic_outer_price_distance_long
                 grid_levels_long = [current_price - buffer_distance_long - (outer_price_distance_long - buffer_distance_long) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False) and symbol not in self.max_qty_reached_symbol_short:
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 self.active_grids.discard(symbol)
                 buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                 buffer_distance_short = current_price * buffer_percentage_short
                 dynamic_outer_price_distance_short = self.calculate_dynamic_outer_price_distance_orderbook(order_book, current_price, max_outer_price_distance=max_outer_price_distance, min_outer_price_distance=min_outer_price_distance)
                 outer_price_distance_short = current_price * dynamic_outer_price_distance_short
                 grid_levels_short = [current_price + buffer_distance_short + (outer_price_distance_short - buffer_distance_short) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -6375,10 +6331,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -6387,10 +6342,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -6403,16 +6357,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -6680,25 +6632,23 @@ class BybitStrategy(BaseStrategy):
 
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False) and symbol not in self.max_qty_reached_symbol_long:
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                 buffer_distance_long = current_price * buffer_percentage_long
                 dynamic_outer_price_distance_long = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_long = current_price * dynamic_outer_price_distance_long
                 grid_levels_long = [current_price - buffer_distance_long - (outer_price_distance_long - buffer_distance_long) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False) and symbol not in self.max_qty_reached_symbol_short:
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                 buffer_distance_short = current_price * buffer_percentage_short
                 dynamic_outer_price_distance_short = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_short = current_price * dynamic_outer_price_distance_short
                 grid_levels_short = [current_price + buffer_distance_short + (outer_price_distance_short - buffer_distance_short) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -6729,10 +6679,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -6741,10 +6690,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -6757,16 +6705,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -7049,26 +6995,24 @@ class BybitStrategy(BaseStrategy):
             # Replace long grid if necessary
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False):
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                 buffer_distance_long = current_price * buffer_percentage_long
                 dynamic_outer_price_distance_long = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_long = current_price * dynamic_outer_price_distance_long
                 grid_levels_long = [current_price - buffer_distance_long - (outer_price_distance_long - buffer_distance_long) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             # Replace short grid if necessary
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False):
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                 buffer_distance_short = current_price * buffer_percentage_short
                 dynamic_outer_price_distance_short = self.calculate_dynamic_outer_price_distance(order_book, current_price, max_outer_price_distance=outer_price_distance)
                 outer_price_distance_short = current_price * dynamic_outer_price_distance_short
                 grid_levels_short = [current_price + buffer_distance_short + (outer_price_distance_short - buffer_distance_short) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -7403,23 +7347,21 @@ class BybitStrategy(BaseStrategy):
 
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False) and symbol not in self.max_qty_reached_symbol_long:
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                 buffer_distance_long = current_price * buffer_percentage_long
                 outer_price_distance_long = current_price * outer_price_distance
                 grid_levels_long = [current_price - buffer_distance_long - (outer_price_distance_long - buffer_distance_long) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False) and symbol not in self.max_qty_reached_symbol_short:
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                 buffer_distance_short = current_price * buffer_percentage_short
                 outer_price_distance_short = current_price * outer_price_distance
                 grid_levels_short = [current_price + buffer_distance_short + (outer_price_distance_short - buffer_distance_short) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -7446,10 +7388,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -7458,10 +7399,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -7474,16 +7414,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -7765,24 +7703,22 @@ class BybitStrategy(BaseStrategy):
             # Replace long grid if necessary
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False):
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 buffer_percentage_long = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - long_pos_price) / long_pos_price)
                 buffer_distance_long = current_price * buffer_percentage_long
                 outer_price_distance_long = current_price * outer_price_distance  # Direct usage of outer price distance
                 grid_levels_long = [current_price - buffer_distance_long - (outer_price_distance_long - buffer_distance_long) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             # Replace short grid if necessary
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False):
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 buffer_percentage_short = min_buffer_percentage + (max_buffer_percentage - min_buffer_percentage) * (abs(current_price - short_pos_price) / short_pos_price)
                 buffer_distance_short = current_price * buffer_percentage_short
                 outer_price_distance_short = current_price * outer_price_distance  # Direct usage of outer price distance
                 grid_levels_short = [current_price + buffer_distance_short + (outer_price_distance_short - buffer_distance_short) * factor for factor in np.linspace(0.0, 1.0, num=levels)**strength]
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
                 
@@ -8135,7 +8071,6 @@ class BybitStrategy(BaseStrategy):
 
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False) and symbol not in self.max_qty_reached_symbol_long:
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 self.active_grids.discard(symbol)
 
                 buffer_distance_long = current_price * buffer_percentage_long
@@ -8148,13 +8083,12 @@ class BybitStrategy(BaseStrategy):
                 price_range_long = current_price - outer_price_long
                 grid_levels_long = [current_price - buffer_distance_long - price_range_long * factor for factor in np.linspace(0.0, 1.0, num=self.levels)**self.strength]
 
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False) and symbol not in self.max_qty_reached_symbol_short:
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 self.active_grids.discard(symbol)
 
                 buffer_distance_short = current_price * buffer_percentage_short
@@ -8167,7 +8101,7 @@ class BybitStrategy(BaseStrategy):
                 price_range_short = outer_price_short - current_price
                 grid_levels_short = [current_price + buffer_distance_short + price_range_short * factor for factor in np.linspace(0.0, 1.0, num=self.levels)**self.strength]
 
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -8192,10 +8126,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_long.get(symbol, False):
                             if symbol in self.active_grids and "buy" in self.filled_levels[symbol] and has_open_long_order:
                                 logging.info(f"[{symbol}] Reissuing long orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'buy')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new long orders.")
-                                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active long grid for the symbol. Skipping long grid reissue.")
@@ -8204,10 +8137,9 @@ class BybitStrategy(BaseStrategy):
                         if entry_during_autoreduce or not self.auto_reduce_active_short.get(symbol, False):
                             if symbol in self.active_grids and "sell" in self.filled_levels[symbol] and has_open_short_order:
                                 logging.info(f"[{symbol}] Reissuing short orders due to price movement beyond the threshold.")
-                                self.clear_grid(symbol, 'sell')
                                 self.active_grids.discard(symbol)
                                 logging.info(f"[{symbol}] Placing new short orders.")
-                                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                                 self.active_grids.add(symbol)
                             elif symbol not in self.active_grids:
                                 logging.info(f"[{symbol}] No active short grid for the symbol. Skipping short grid reissue.")
@@ -8220,16 +8152,14 @@ class BybitStrategy(BaseStrategy):
                     if long_pos_qty > 0 and not long_grid_active and symbol not in self.max_qty_reached_symbol_long:
                         if not self.auto_reduce_active_long.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing long grid orders for existing open position.")
-                            self.clear_grid(symbol, 'buy')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                            self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                             self.active_grids.add(symbol)
                     if short_pos_qty > 0 and not short_grid_active and symbol not in self.max_qty_reached_symbol_short:
                         if not self.auto_reduce_active_short.get(symbol, False) or entry_during_autoreduce:
                             logging.info(f"[{symbol}] Placing short grid orders for existing open position.")
-                            self.clear_grid(symbol, 'sell')
                             self.active_grids.discard(symbol)
-                            self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                            self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                             self.active_grids.add(symbol)
 
                 current_time = datetime.now()
@@ -8508,7 +8438,6 @@ class BybitStrategy(BaseStrategy):
             # Replace long grid if necessary
             if replace_long_grid and not self.auto_reduce_active_long.get(symbol, False):
                 logging.info(f"[{symbol}] Replacing long grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'buy')
                 self.active_grids.discard(symbol)
 
                 # Calculate buffer distance from the current market price
@@ -8524,14 +8453,13 @@ class BybitStrategy(BaseStrategy):
                 price_range_long = current_price - outer_price_long
                 grid_levels_long = [current_price - buffer_distance_long - price_range_long * factor for factor in np.linspace(0.0, 1.0, num=self.levels)**self.strength]
 
-                self.issue_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
+                self.reconcile_grid_orders(symbol, "buy", grid_levels_long, amounts_long, True, self.filled_levels[symbol]["buy"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated long grid levels with updated buffer: {grid_levels_long}")
 
             # Replace short grid if necessary
             if replace_short_grid and not self.auto_reduce_active_short.get(symbol, False):
                 logging.info(f"[{symbol}] Replacing short grid orders due to updated buffer.")
-                self.clear_grid(symbol, 'sell')
                 self.active_grids.discard(symbol)
 
                 # Calculate buffer distance from the current market price
@@ -8547,7 +8475,7 @@ class BybitStrategy(BaseStrategy):
                 price_range_short = outer_price_short - current_price
                 grid_levels_short = [current_price + buffer_distance_short + price_range_short * factor for factor in np.linspace(0.0, 1.0, num=self.levels)**self.strength]
 
-                self.issue_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
+                self.reconcile_grid_orders(symbol, "sell", grid_levels_short, amounts_short, False, self.filled_levels[symbol]["sell"])
                 self.active_grids.add(symbol)
                 logging.info(f"[{symbol}] Recalculated short grid levels with updated buffer: {grid_levels_short}")
 
@@ -10766,52 +10694,146 @@ class BybitStrategy(BaseStrategy):
         """
         Generates a unique, short, and descriptive OrderLinkedID for Bybit orders.
         """
-        timestamp = int(time.time() * 1000) % 100000  # Use last 5 digits of current timestamp for uniqueness
-        level_str = f"{level:.5f}".replace('.', '')[:5]  # Convert level to string, remove '.', and use first 5 characters
-        unique_id = f"{symbol[:3]}_{side[0]}_{level_str}_{timestamp}"  # Build a compact OrderLinkedID
-        return unique_id[:45]  # Ensure the ID does not exceed 45 characters
+        return grid_order_link_id(symbol, side, level)
+
+    def place_grid_orders(self, symbol, side, pending):
+        """
+        Place grid orders described by dicts with ``side``, ``qty``, ``price``, ``positionIdx``
+        and ``orderLinkId``, in batches when the exchange supports it. Returns one result
+        per order, a dict with ``id`` when it was placed.
+        """
+        if pending and hasattr(self.exchange, 'create_tagged_limit_orders_bybit'):
+            try:
+                results = self.exchange.create_tagged_limit_orders_bybit(symbol, pending)
+            except Exception as e:
+                logging.info(f"Exception when placing {side} batch orders for {symbol}: {e}")
+                results = [{"error": str(e)} for _ in pending]
+        else:
+            results = []
+            for request in pending:
+                try:
+                    results.append(self.exchange.create_tagged_limit_order_bybit(symbol, side, request['qty'], request['price'], positionIdx=request['positionIdx'], orderLinkId=request['orderLinkId']))
+                except Exception as e:
+                    logging.info(f"Exception when placing {side} order at level {request['price']} for {symbol}: {e}")
+                    results.append(None)
+        return results
+
+    def reconcile_grid_orders(self, symbol: str, side: str, grid_levels: list, amounts: list, is_long: bool, filled_levels: set, dry_run=None):
+        """
+        Move the live grid of one side to the desired levels with as few requests as possible.
+
+        Live orders within ``grid_tolerance_ticks`` of a level keep their place in the queue,
+        the others are amended onto the new levels and only the surplus is cancelled or
+        created. With ``dry_run`` (default ``grid_reconcile_dry_run``) the plan is only
+        logged. Returns the ``GridPlan``.
+        """
+        if dry_run is None:
+            dry_run = self.grid_reconcile_dry_run
+        start_time = time.time()
+        open_orders = self.retry_api_call(self.exchange.get_open_orders, symbol)
+        live_orders = [order for order in open_orders if order['side'].lower() == side.lower() and not order.get('reduceOnly')]
+
+        tick_size = self.exchange.market_registry.get_tick_size(symbol)
+        precision = self.exchange.market_registry.get_precision(symbol) or {}
+        plan = plan_grid_orders(
+            symbol, side, list(zip(grid_levels, amounts)), live_orders,
+            tick_size=float(tick_size) if tick_size else None,
+            qty_step=precision.get('amount'),
+            tolerance_ticks=self.grid_tolerance_ticks
+        )
+        logging.info(plan.describe() if dry_run else plan.summary())
+        if dry_run:
+            return plan
+
+        filled_levels.clear()
+        for order, price in plan.keep:
+            filled_levels.add(price)
+
+        if plan.cancel:
+            self.cancel_orders_bybit(symbol, [order['id'] for order in plan.cancel])
+
+        if plan.amend:
+            amendments = [{'id': order['id'], 'price': price, 'qty': qty} for order, price, qty in plan.amend]
+            if hasattr(self.exchange, 'amend_orders_bybit'):
+                amended = set(self.exchange.amend_orders_bybit(symbol, amendments))
+            else:
+                amended = set()
+            # Amends that were rejected (e.g. the order filled meanwhile) fall back to cancel and create
+            rejected = [(order, price, qty) for order, price, qty in plan.amend if order['id'] not in amended]
+            for order, price, qty in plan.amend:
+                if order['id'] in amended:
+                    filled_levels.add(price)
+            if rejected:
+                self.cancel_orders_bybit(symbol, [order['id'] for order, price, qty in rejected])
+                plan.create.extend((price, qty) for order, price, qty in rejected)
+
+        position_idx = 1 if is_long else 2
+        pending = [
+            {
+                'side': side,
+                'qty': qty,
+                'price': price,
+                'positionIdx': position_idx,
+                'orderLinkId': self.generate_order_link_id(symbol, side, price)
+            }
+            for price, qty in plan.create
+        ]
+        for request, order in zip(pending, self.place_grid_orders(symbol, side, pending)):
+            if order and 'id' in order:
+                filled_levels.add(request['price'])
+            else:
+                logging.info(f"Failed to place {side} order at level {request['price']} for {symbol} with amount {request['qty']}")
+
+        logging.info(f"[{symbol}] {side.capitalize()} grid reconciled in {time.time() - start_time:.3f} seconds.")
+        return plan
 
     def issue_grid_orders(self, symbol: str, side: str, grid_levels: list, amounts: list, is_long: bool, filled_levels: set):
         """
         Check the status of existing grid orders and place new orders for unfilled levels.
         """
+        start_time = time.time()
         open_orders = self.retry_api_call(self.exchange.get_open_orders, symbol)
         #logging.info(f"Open orders data for {symbol}: {open_orders}")
 
         # Clear the filled_levels set before placing new orders
         filled_levels.clear()
 
-        # Place new grid orders for unfilled levels
+        # Collect the unfilled levels, then place them in as few requests as possible
+        position_idx = 1 if is_long else 2
+        pending = []
         for level, amount in zip(grid_levels, amounts):
             order_exists = any(order['price'] == level and order['side'].lower() == side.lower() for order in open_orders)
             if not order_exists:
-                order_link_id = self.generate_order_link_id(symbol, side, level)
-                position_idx = 1 if is_long else 2
-                try:
-                    order = self.exchange.create_tagged_limit_order_bybit(symbol, side, amount, level, positionIdx=position_idx, orderLinkId=order_link_id)
-                    if order and 'id' in order:
-                        logging.info(f"Placed {side} order at level {level} for {symbol} with amount {amount}")
-                        filled_levels.add(level)  # Add the level to filled_levels
-                    else:
-                        logging.info(f"Failed to place {side} order at level {level} for {symbol} with amount {amount}")
-                except Exception as e:
-                    logging.info(f"Exception when placing {side} order at level {level} for {symbol}: {e}")
+                pending.append({
+                    'side': side,
+                    'qty': amount,
+                    'price': level,
+                    'positionIdx': position_idx,
+                    'orderLinkId': self.generate_order_link_id(symbol, side, level)
+                })
             else:
                 logging.info(f"Skipping {side} order at level {level} for {symbol} as it already exists.")
 
-        logging.info(f"[{symbol}] {side.capitalize()} grid orders issued for unfilled levels.")
+        results = self.place_grid_orders(symbol, side, pending)
+
+        for request, order in zip(pending, results):
+            level, amount = request['price'], request['qty']
+            if order and 'id' in order:
+                logging.info(f"Placed {side} order at level {level} for {symbol} with amount {amount}")
+                filled_levels.add(level)  # Add the level to filled_levels
+            else:
+                logging.info(f"Failed to place {side} order at level {level} for {symbol} with amount {amount}")
+
+        logging.info(f"[{symbol}] {side.capitalize()} grid orders issued for unfilled levels in {time.time() - start_time:.3f} seconds.")
         
     def cancel_grid_orders(self, symbol: str, side: str):
         try:
             open_orders = self.retry_api_call(self.exchange.get_open_orders, symbol)
             #logging.info(f"Open orders data for {symbol}: {open_orders}")
 
-            orders_canceled = 0
-            for order in open_orders:
-                if order['side'].lower() == side.lower():
-                    self.exchange.cancel_order_by_id(order['id'], symbol)
-                    orders_canceled += 1
-                    logging.info(f"Canceled order for {symbol}")
+            start_time = time.time()
+            orders_canceled = len(self.exchange.cancel_orders_by_side_bybit(symbol, side, open_orders=open_orders))
+            logging.info(f"[{symbol}] Canceling {side} grid orders took {time.time() - start_time:.3f} seconds")
 
             if orders_canceled > 0:
                 logging.info(f"Canceled {orders_canceled} {side} grid orders for {symbol}")
@@ -10829,86 +10851,22 @@ class BybitStrategy(BaseStrategy):
     def calculate_total_amount(self, symbol: str, total_equity: float, best_ask_price: float, best_bid_price: float, wallet_exposure_limit: float, user_defined_leverage: float, side: str, levels: int, min_qty: float, enforce_full_grid: bool) -> float:
         logging.info(f"Calculating total amount for {symbol} with total_equity: {total_equity}, best_ask_price: {best_ask_price}, best_bid_price: {best_bid_price}, wallet_exposure_limit: {wallet_exposure_limit}, user_defined_leverage: {user_defined_leverage}, side: {side}, levels: {levels}, min_qty: {min_qty}, enforce_full_grid: {enforce_full_grid}")
         
-        # Fetch market data to get the minimum trade quantity for the symbol
-        market_data = self.get_market_data_with_retry(symbol, max_retries=100, retry_delay=5)
-        logging.info(f"Minimum quantity for {symbol}: {min_qty}")
-        
-        # Calculate the minimum quantity in USD value based on the side
+        # The minimum quantity is valued at the price the side trades at
         if side == "buy":
-            min_qty_usd_value = min_qty * best_ask_price
+            price = best_ask_price
         elif side == "sell":
-            min_qty_usd_value = min_qty * best_bid_price
+            price = best_bid_price
         else:
             raise ValueError(f"Invalid side: {side}")
-        logging.info(f"Minimum quantity USD value for {symbol}: {min_qty_usd_value}")
-        
-        # Calculate the maximum position value based on total equity, wallet exposure limit, and user-defined leverage
-        max_position_value = total_equity * wallet_exposure_limit * user_defined_leverage
-        logging.info(f"Maximum position value for {symbol}: {max_position_value}")
-        
-        if enforce_full_grid:
-            # Calculate the total amount based on the maximum position value and number of levels
-            total_amount = max(max_position_value // levels, min_qty_usd_value) * levels
-        else:
-            # Calculate the total amount as a multiple of the minimum quantity USD value
-            total_amount = max(max_position_value // min_qty_usd_value, 1) * min_qty_usd_value
-        
+
+        total_amount = grid_total_amount(total_equity, price, wallet_exposure_limit, user_defined_leverage, levels, min_qty, enforce_full_grid)
         logging.info(f"Calculated total amount for {symbol}: {total_amount}")
         
         return total_amount
 
     def calculate_order_amounts(self, symbol: str, total_amount: float, levels: int, strength: float, qty_precision: float, min_qty: float, enforce_full_grid: bool) -> List[float]:
         logging.info(f"Calculating order amounts for {symbol} with total_amount: {total_amount}, levels: {levels}, strength: {strength}, qty_precision: {qty_precision}, min_qty: {min_qty}, enforce_full_grid: {enforce_full_grid}")
-        
-        # Calculate the order amounts based on the strength
-        amounts = []
-        total_ratio = sum([(j + 1) ** strength for j in range(levels)])
-        remaining_amount = total_amount
-        logging.info(f"Total ratio: {total_ratio}, Remaining amount: {remaining_amount}")
-        
-        for i in range(levels):
-            ratio = (i + 1) ** strength
-            amount = total_amount * (ratio / total_ratio)
-            logging.info(f"Level {i+1} - Ratio: {ratio}, Amount: {amount}")
-            
-            if enforce_full_grid:
-                # Round the order amount to the nearest multiple of min_qty
-                rounded_amount = round(amount / min_qty) * min_qty
-            else:
-                # Round the order amount to the nearest multiple of qty_precision or min_qty, whichever is larger
-                rounded_amount = round(amount / max(qty_precision, min_qty)) * max(qty_precision, min_qty)
-            
-            logging.info(f"Level {i+1} - Rounded amount: {rounded_amount}")
-            
-            # Ensure the order amount is greater than or equal to the minimum quantity
-            adjusted_amount = max(rounded_amount, min_qty * (i + 1))
-            logging.info(f"Level {i+1} - Adjusted amount: {adjusted_amount}")
-            
-            amounts.append(adjusted_amount)
-            remaining_amount -= adjusted_amount
-            logging.info(f"Level {i+1} - Remaining amount: {remaining_amount}")
-        
-        # If enforce_full_grid is True and there is remaining amount, distribute it among the levels
-        if enforce_full_grid and remaining_amount > 0:
-            # Sort the amounts in ascending order
-            sorted_amounts = sorted(amounts)
-            
-            # Iterate over the sorted amounts and add the remaining amount until it is fully distributed
-            for i in range(len(sorted_amounts)):
-                if remaining_amount <= 0:
-                    break
-                
-                # Calculate the additional amount to add to the current level
-                additional_amount = min(remaining_amount, min_qty)
-                
-                # Find the index of the current amount in the original amounts list
-                index = amounts.index(sorted_amounts[i])
-                
-                # Update the amount in the original amounts list
-                amounts[index] += additional_amount
-                
-                remaining_amount -= additional_amount
-        
+        amounts = grid_order_amounts(total_amount, levels, strength, qty_precision, min_qty, enforce_full_grid)
         logging.info(f"Calculated order amounts: {amounts}")
         return amounts
 
@@ -10919,7 +10877,7 @@ class BybitStrategy(BaseStrategy):
     def get_effective_leverage(self, user_defined_leverage, symbol, side):
         if user_defined_leverage in (0, None):
             # Log the defaulting action for clarity
-            max_leverage = self.exchange.get_current_max_leverage_bybit(symbol, side)
+            max_leverage = self.exchange.get_current_max_leverage_bybit(symbol)
             logging.info(f"No user-defined leverage specified for {symbol} on {side} side, using exchange max leverage: {max_leverage}")
             return max_leverage
         return user_defined_leverage
@@ -10,6 +10,7 @@ from .quickscalp_trend_ob import BybitQuickScalpTrendOB
 from .quickscalp_trend_unified import BybitQuickScalpUnified
 from .quickscalp_trend_emas import BybitQSTrendDoubleMA
 from .basicgrid import BybitBasicGrid
+from .async_basicgrid import AsyncBybitBasicGrid
 from .basicgridmfirsi import BybitBasicGridMFIRSI
 from .basicgridmfirsi_persistent import BybitBasicGridMFIRSIPersisent
 from .quickscalp_trend_spot import BybitQuickScalpTrendSpot
@@ -0,0 +1,269 @@
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+from directionalscalper.core.strategies.bybit.async_runtime import AsyncBybitStrategy, register_async_strategy
+from directionalscalper.core.strategies.grid_reconciler import (
+    grid_order_amounts, grid_order_link_id, grid_total_amount, linear_grid_levels, plan_grid_orders
+)
+from directionalscalper.core.strategies.logger import Logger
+from live_table_manager import shared_symbols_data
+
+logging = Logger(logger_name="AsyncBybitBasicGrid", filename="AsyncBybitBasicGrid.log", stream=True)
+
+# Risk features of BybitBasicGrid that are not on the async runtime yet. A config that
+# enables one of them has to stay on the thread runtime.
+UNPORTED_FEATURES = (
+    'stoploss_enabled',
+    'liq_stoploss_enabled',
+    'auto_reduce_enabled',
+    'auto_reduce_marginbased_enabled',
+    'percentile_auto_reduce_enabled',
+    'test_orders_enabled',
+)
+
+
+@register_async_strategy('basicgrid')
+class AsyncBybitBasicGrid(AsyncBybitStrategy):
+    """
+    BybitBasicGrid on the async runtime.
+
+    Every iteration works from the runtime's snapshot: a linear grid is laid on each
+    enabled side when there is none yet, or moved once the price has drifted by
+    ``reissue_threshold`` since it was laid, and an open position gets a reduce-only
+    take profit ``upnl_profit_pct`` away from its entry price. Grids are moved with
+    ``plan_grid_orders``, so orders still on a level are kept and the rest amended,
+    and all orders go through the batch endpoints. Risk features listed in
+    ``UNPORTED_FEATURES`` are not available here and are refused at start.
+    """
+
+    iteration_interval = 3
+    equity_refresh_interval = 1800  # Seconds between balance fetches
+
+    def __init__(self, exchange, manager, config, symbols_allowed=None):
+        super().__init__(exchange, manager, config, symbols_allowed)
+        enabled = [feature for feature in UNPORTED_FEATURES if getattr(config, feature, False)]
+        if enabled:
+            raise ValueError(f"basicgrid on the async runtime does not support {enabled}, use --runtime thread")
+        self.wallet_exposure_limit = min(config.wallet_exposure_limit, 1.0)
+        self.user_defined_leverage_long = config.user_defined_leverage_long
+        self.user_defined_leverage_short = config.user_defined_leverage_short
+        self.levels = config.linear_grid['levels']
+        self.strength = config.linear_grid['strength']
+        self.outer_price_distance = config.linear_grid['outer_price_distance']
+        self.long_mode = config.linear_grid['long_mode']
+        self.short_mode = config.linear_grid['short_mode']
+        self.reissue_threshold = config.linear_grid['reissue_threshold']
+        self.buffer_percentage = config.linear_grid['buffer_percentage']
+        self.enforce_full_grid = config.linear_grid['enforce_full_grid']
+        self.upnl_profit_pct = config.upnl_profit_pct
+        self.grid_tolerance_ticks = 1
+        self.state = {}  # symbol -> per-symbol state, see setup
+
+    async def setup(self, symbol):
+        await self.exchange.cancel_all_orders(symbol)
+        market = await self.exchange.get_market_info(symbol)
+        await self.exchange.set_leverage(market['max_leverage'], symbol)
+        self.state[symbol] = {
+            'market': market,
+            'leverage_long': self._leverage(self.user_defined_leverage_long, market['max_leverage']),
+            'leverage_short': self._leverage(self.user_defined_leverage_short, market['max_leverage']),
+            'total_equity': None,
+            'equity_fetched_at': 0,
+            'grid_price': {},  # side -> price the grid was laid at
+            'previous_qty': {'long': 0, 'short': 0},
+        }
+        logging.info(f"[{symbol}] Async basic grid ready, max leverage {market['max_leverage']}")
+
+    async def teardown(self, symbol):
+        self.state.pop(symbol, None)
+
+    @staticmethod
+    def _leverage(user_defined_leverage, exchange_max_leverage):
+        """Same bounds as BybitStrategy.adjust_risk_parameters: 0 means the exchange maximum."""
+        if user_defined_leverage == 0:
+            return exchange_max_leverage
+        return max(1, min(user_defined_leverage, exchange_max_leverage))
+
+    async def iterate(self, symbol, snapshot):
+        state = self.state[symbol]
+        if symbol in getattr(self.config, 'blacklist', []):
+            logging.info(f"Symbol {symbol} is in the blacklist. Stopping operations for this symbol.")
+            return False
+        if snapshot.get('positions') is None or snapshot.get('open_orders') is None or not snapshot.get('ticker'):
+            logging.info(f"[{symbol}] Incomplete snapshot, skipping this iteration")
+            return True
+
+        now = time.time()
+        if state['total_equity'] is None or now - state['equity_fetched_at'] > self.equity_refresh_interval:
+            total_equity = await self.exchange.get_balance('USDT')
+            if total_equity is not None:
+                state['total_equity'] = total_equity
+                state['equity_fetched_at'] = now
+        if state['total_equity'] is None:
+            logging.warning(f"[{symbol}] Failed to fetch total_equity. Skipping this iteration.")
+            return True
+
+        positions = self.parse_positions(snapshot['positions'])
+        open_orders = snapshot['open_orders']
+        current_price = float(snapshot['ticker']['last'])
+        order_book = snapshot.get('orderbook') or {}
+        best_ask_price = order_book['asks'][0][0] if order_book.get('asks') else current_price
+        best_bid_price = order_book['bids'][0][0] if order_book.get('bids') else current_price
+
+        sides = (
+            ('long', 'buy', self.long_mode, best_ask_price, state['leverage_long']),
+            ('short', 'sell', self.short_mode, best_bid_price, state['leverage_short']),
+        )
+        grid_levels_long, grid_levels_short = linear_grid_levels(
+            current_price, self.levels, self.strength, self.outer_price_distance, self.buffer_percentage
+        )
+        grid_levels = {'buy': grid_levels_long, 'sell': grid_levels_short}
+        for position_side, order_side, enabled, price, leverage in sides:
+            position = positions[position_side]
+            entry_orders = [order for order in open_orders if order['side'].lower() == order_side and not order.get('reduceOnly')]
+
+            # A closed position takes its grid with it, like the thread strategy
+            if state['previous_qty'][position_side] > 0 and position['qty'] == 0 and entry_orders:
+                logging.info(f"{position_side.capitalize()} position closed for {symbol}. Canceling {order_side} grid orders.")
+                await self.exchange.cancel_orders(symbol, [order['id'] for order in entry_orders])
+                entry_orders = []
+                state['grid_price'].pop(order_side, None)
+            state['previous_qty'][position_side] = position['qty']
+
+            if enabled and self.should_lay_grid(state, order_side, current_price, entry_orders):
+                total_amount = grid_total_amount(
+                    state['total_equity'], price, self.wallet_exposure_limit, leverage,
+                    self.levels, state['market']['min_qty'], self.enforce_full_grid
+                )
+                amounts = grid_order_amounts(
+                    total_amount, self.levels, self.strength, state['market']['qty_step'],
+                    state['market']['min_qty'], self.enforce_full_grid
+                )
+                await self.reconcile_grid(symbol, order_side, grid_levels[order_side], amounts, position_side == 'long', entry_orders)
+                state['grid_price'][order_side] = current_price
+
+            await self.update_take_profit(symbol, position_side, position, open_orders, best_ask_price, best_bid_price)
+
+        shared_symbols_data[symbol] = {
+            'symbol': symbol,
+            'min_qty': state['market']['min_qty'],
+            'current_price': current_price,
+            'balance': state['total_equity'],
+            'available_bal': None,
+            'volume': None,
+            'spread': None,
+            'trend': None,
+            'long_pos_qty': positions['long']['qty'],
+            'short_pos_qty': positions['short']['qty'],
+            'long_upnl': positions['long']['upnl'],
+            'short_upnl': positions['short']['upnl'],
+            'long_cum_pnl': None,
+            'short_cum_pnl': None,
+            'long_pos_price': positions['long']['price'],
+            'short_pos_price': positions['short']['price'],
+        }
+        return True
+
+    @staticmethod
+    def parse_positions(positions):
+        """Quantity, entry price and unrealized PnL of each side from ccxt positions."""
+        parsed = {side: {'qty': 0.0, 'price': None, 'upnl': 0.0} for side in ('long', 'short')}
+        for position in positions:
+            side = position.get('side')
+            qty = float(position.get('contracts') or 0)
+            if side in parsed and qty > 0:
+                parsed[side] = {
+                    'qty': qty,
+                    'price': float(position['entryPrice']) if position.get('entryPrice') else None,
+                    'upnl': float(position.get('unrealizedPnl') or 0),
+                }
+        return parsed
+
+    def should_lay_grid(self, state, order_side, current_price, entry_orders):
+        """A side gets a grid when it has none, or when the price has moved ``reissue_threshold`` since."""
+        grid_price = state['grid_price'].get(order_side)
+        if grid_price is None or not entry_orders:
+            return True
+        return abs(current_price - grid_price) / grid_price >= self.reissue_threshold
+
+    async def reconcile_grid(self, symbol, side, grid_levels, amounts, is_long, entry_orders):
+        """Move the live entry orders of one side onto ``grid_levels``, see BybitStrategy.reconcile_grid_orders."""
+        market = self.state[symbol]['market']
+        plan = plan_grid_orders(
+            symbol, side, list(zip(grid_levels, amounts)), entry_orders,
+            tick_size=market['tick_size'] or None, qty_step=market['qty_step'] or None,
+            tolerance_ticks=self.grid_tolerance_ticks
+        )
+        logging.info(plan.summary())
+        if plan.cancel:
+            await self.exchange.cancel_orders(symbol, [order['id'] for order in plan.cancel])
+        if plan.amend:
+            amended = set(await self.exchange.amend_orders(
+                symbol, [{'id': order['id'], 'price': price, 'qty': qty} for order, price, qty in plan.amend]
+            ))
+            # Amends that were rejected (e.g. the order filled meanwhile) fall back to cancel and create
+            rejected = [(order, price, qty) for order, price, qty in plan.amend if order['id'] not in amended]
+            if rejected:
+                await self.exchange.cancel_orders(symbol, [order['id'] for order, price, qty in rejected])
+                plan.create.extend((price, qty) for order, price, qty in rejected)
+        if plan.create:
+            position_idx = 1 if is_long else 2
+            pending = [
+                {
+                    'side': side,
+                    'qty': qty,
+                    'price': price,
+                    'positionIdx': position_idx,
+                    'orderLinkId': grid_order_link_id(symbol, side, price)
+                }
+                for price, qty in plan.create
+            ]
+            for request, order in zip(pending, await self.exchange.create_limit_orders(symbol, pending)):
+                if 'error' in order:
+                    logging.info(f"Failed to place {side} order at level {request['price']} for {symbol}: {order['error']}")
+        return plan
+
+    def take_profit_price(self, symbol, position_side, entry_price):
+        """Entry price ``upnl_profit_pct`` into profit, on the tick grid (calculate_quickscalp_*_take_profit)."""
+        direction = 1 if position_side == 'long' else -1
+        target = Decimal(entry_price) * (1 + direction * Decimal(self.upnl_profit_pct))
+        tick_size = self.state[symbol]['market']['tick_size']
+        if tick_size:
+            target = (target / Decimal(str(tick_size))).quantize(Decimal(1), rounding=ROUND_HALF_UP) * Decimal(str(tick_size))
+        return float(target)
+
+    async def update_take_profit(self, symbol, position_side, position, open_orders, best_ask_price, best_bid_price):
+        """
+        Keep one reduce-only take profit covering the whole position of a side. An existing
+        one is amended when the position size changed; a missing one is placed, at the best
+        price when the position is already past its target.
+        """
+        if position['qty'] <= 0 or position['price'] is None:
+            return
+        is_long = position_side == 'long'
+        close_side = 'sell' if is_long else 'buy'
+        take_profit_price = self.take_profit_price(symbol, position_side, position['price'])
+        if is_long and position['price'] >= take_profit_price:
+            take_profit_price = best_ask_price
+        elif not is_long and position['price'] <= take_profit_price:
+            take_profit_price = best_bid_price
+
+        take_profits = [order for order in open_orders if order['side'].lower() == close_side and order.get('reduceOnly')]
+        if take_profits:
+            take_profit = take_profits[0]
+            if len(take_profits) > 1:
+                await self.exchange.cancel_orders(symbol, [order['id'] for order in take_profits[1:]])
+            qty_step = self.state[symbol]['market']['qty_step'] or 0
+            if abs(float(take_profit['amount']) - position['qty']) > qty_step / 2:
+                amended = await self.exchange.amend_orders(symbol, [{'id': take_profit['id'], 'price': take_profit_price, 'qty': position['qty']}])
+                logging.info(f"[{symbol}] {position_side.capitalize()} take profit resized to {position['qty']} @ {take_profit_price}: {bool(amended)}")
+            return
+
+        placed = await self.exchange.create_limit_orders(symbol, [{
+            'side': close_side,
+            'qty': position['qty'],
+            'price': take_profit_price,
+            'positionIdx': 1 if is_long else 2,
+            'reduceOnly': True,
+        }])
+        logging.info(f"[{symbol}] {position_side.capitalize()} take profit set at {take_profit_price}: {placed[0]}")
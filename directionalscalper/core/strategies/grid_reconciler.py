@@ -0,0 +1,170 @@
+import math
+import uuid
+
+# Bybit accepts orderLinkIds of up to 36 characters and rejects one already in use
+ORDER_LINK_ID_MAX_LENGTH = 36
+
+
+class GridPlan:
+    """
+    Actions that turn the live grid orders of one symbol and side into the desired grid.
+
+    ``keep`` holds (order, price) pairs left untouched, ``amend`` holds
+    (order, price, qty) changes made in place, ``cancel`` holds orders to remove and
+    ``create`` holds (price, qty) levels to place. Prices are the desired grid levels.
+    """
+
+    def __init__(self, symbol, side):
+        self.symbol = symbol
+        self.side = side
+        self.keep = []
+        self.amend = []
+        self.cancel = []
+        self.create = []
+
+    def is_noop(self):
+        return not (self.amend or self.cancel or self.create)
+
+    def request_count(self, batch_size=10):
+        """Requests needed to execute the plan when every action type is batched."""
+        return sum(math.ceil(len(actions) / batch_size) for actions in (self.amend, self.cancel, self.create))
+
+    def summary(self):
+        return (f"[{self.symbol}] {self.side} grid plan: keep {len(self.keep)}, amend {len(self.amend)}, "
+                f"cancel {len(self.cancel)}, create {len(self.create)}")
+
+    def describe(self):
+        """Summary followed by one line per action, for dry-run logging."""
+        lines = [self.summary()]
+        for order, price in self.keep:
+            lines.append(f"  keep   {order['id']} @ {order['price']} x {order['amount']}")
+        for order, price, qty in self.amend:
+            lines.append(f"  amend  {order['id']} {order['price']} x {order['amount']} -> {price} x {qty}")
+        for order in self.cancel:
+            lines.append(f"  cancel {order['id']} @ {order['price']} x {order['amount']}")
+        for price, qty in self.create:
+            lines.append(f"  create {price} x {qty}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return self.summary()
+
+
+def grid_order_link_id(symbol, side, level):
+    """
+    A short, descriptive orderLinkId for a grid order: symbol, side and level prefix,
+    followed by a random suffix so every order of a batch gets its own id, even on
+    levels that share the prefix.
+    """
+    level_str = f"{level:.5f}".replace('.', '')[:5]
+    unique_id = f"{symbol[:3]}_{side[0]}_{level_str}_{uuid.uuid4().hex[:16]}"
+    return unique_id[:ORDER_LINK_ID_MAX_LENGTH]
+
+
+def linear_grid_levels(current_price, levels, strength, outer_price_distance, buffer_percentage):
+    """
+    Long and short grid prices around ``current_price``, as laid by linear_grid_handle_positions:
+    ``levels`` prices from ``buffer_percentage`` percent away out to ``outer_price_distance``,
+    spaced by ``strength``.
+    """
+    outer_price_long = current_price * (1 - outer_price_distance)
+    outer_price_short = current_price * (1 + outer_price_distance)
+    buffer_distance = current_price * buffer_percentage / 100
+    factors = [(index / (levels - 1) if levels > 1 else 0.0) ** strength for index in range(levels)]
+    grid_levels_long = [current_price - buffer_distance - (current_price - outer_price_long) * factor for factor in factors]
+    grid_levels_short = [current_price + buffer_distance + (outer_price_short - current_price) * factor for factor in factors]
+    return grid_levels_long, grid_levels_short
+
+
+def grid_total_amount(total_equity, price, wallet_exposure_limit, leverage, levels, min_qty, enforce_full_grid):
+    """Total USD value of a grid side, see BybitStrategy.calculate_total_amount."""
+    min_qty_usd_value = min_qty * price
+    max_position_value = total_equity * wallet_exposure_limit * leverage
+    if enforce_full_grid:
+        return max(max_position_value // levels, min_qty_usd_value) * levels
+    return max(max_position_value // min_qty_usd_value, 1) * min_qty_usd_value
+
+
+def grid_order_amounts(total_amount, levels, strength, qty_precision, min_qty, enforce_full_grid):
+    """
+    Order quantity of each grid level, growing with ``strength`` and rounded to ``min_qty``
+    (or the larger of ``qty_precision`` and ``min_qty``). Level ``i`` gets at least
+    ``i + 1`` minimum quantities. With ``enforce_full_grid`` what rounding leaves of
+    ``total_amount`` is spread over the smallest levels, one minimum quantity each.
+    """
+    amounts = []
+    total_ratio = sum([(j + 1) ** strength for j in range(levels)])
+    remaining_amount = total_amount
+    for i in range(levels):
+        amount = total_amount * ((i + 1) ** strength / total_ratio)
+        if enforce_full_grid:
+            rounded_amount = round(amount / min_qty) * min_qty
+        else:
+            rounded_amount = round(amount / max(qty_precision, min_qty)) * max(qty_precision, min_qty)
+        adjusted_amount = max(rounded_amount, min_qty * (i + 1))
+        amounts.append(adjusted_amount)
+        remaining_amount -= adjusted_amount
+
+    if enforce_full_grid and remaining_amount > 0:
+        sorted_amounts = sorted(amounts)
+        for i in range(len(sorted_amounts)):
+            if remaining_amount <= 0:
+                break
+            additional_amount = min(remaining_amount, min_qty)
+            index = amounts.index(sorted_amounts[i])
+            amounts[index] += additional_amount
+            remaining_amount -= additional_amount
+    return amounts
+
+
+def _close(a, b, tolerance):
+    # A difference of exactly the tolerance counts, even when float error leaves it a hair over
+    difference = abs(float(a) - float(b))
+    return difference <= tolerance or math.isclose(difference, tolerance, rel_tol=1e-9)
+
+
+def plan_grid_orders(symbol, side, desired_levels, live_orders, tick_size, qty_step=None, tolerance_ticks=1):
+    """
+    Diff the desired grid against the live orders of one side.
+
+    ``desired_levels`` is a list of (price, qty) and ``live_orders`` are ccxt orders with
+    ``id``, ``price`` and ``amount``. A live order within ``tolerance_ticks`` ticks of a
+    desired price and half a ``qty_step`` of its quantity is kept. The remaining live
+    orders are amended onto the remaining levels, nearest price first, and whatever is
+    left over on either side is cancelled or created.
+    """
+    plan = GridPlan(symbol, side)
+    price_tolerance = float(tick_size) * tolerance_ticks if tick_size else 0.0
+    qty_tolerance = float(qty_step) / 2 if qty_step else 0.0
+
+    desired = sorted(((float(price), float(qty)) for price, qty in desired_levels if qty and float(qty) > 0), key=lambda level: level[0])
+    unmatched = sorted(live_orders, key=lambda order: float(order['price']))
+
+    remaining = []
+    for price, qty in desired:
+        match = None
+        for order in unmatched:
+            if _close(order['price'], price, price_tolerance) and _close(order['amount'], qty, qty_tolerance):
+                match = order
+                break
+        if match is not None:
+            unmatched.remove(match)
+            plan.keep.append((match, price))
+        else:
+            remaining.append((price, qty))
+
+    # Pair leftovers nearest first so amended orders move as little as possible
+    while remaining and unmatched:
+        best = min(
+            ((abs(float(order['price']) - price), index, order_index)
+             for index, (price, qty) in enumerate(remaining)
+             for order_index, order in enumerate(unmatched)),
+            key=lambda candidate: candidate[0]
+        )
+        _, index, order_index = best
+        price, qty = remaining.pop(index)
+        plan.amend.append((unmatched.pop(order_index), price, qty))
+
+    plan.cancel.extend(unmatched)
+    plan.create.extend(remaining)
+    return plan
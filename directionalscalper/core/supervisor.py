@@ -0,0 +1,183 @@
+import bisect
+import hashlib
+import multiprocessing
+import time
+
+from directionalscalper.core.strategies.logger import Logger
+
+logging = Logger(logger_name="Supervisor", filename="Supervisor.log", stream=True)
+
+
+class ConsistentHashRing:
+    """
+    Maps keys to nodes so that a key keeps its node while the key set changes, and
+    only about 1/n of the keys move when a node is added or removed.
+    """
+
+    def __init__(self, nodes, replicas=160):
+        self.replicas = replicas
+        self.ring = []
+        self.node_at = {}
+        for node in nodes:
+            self.add_node(node)
+
+    @staticmethod
+    def _hash(value):
+        return int(hashlib.md5(str(value).encode()).hexdigest()[:16], 16)
+
+    def add_node(self, node):
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}:{replica}")
+            self.node_at[point] = node
+            bisect.insort(self.ring, point)
+
+    def remove_node(self, node):
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}:{replica}")
+            if self.node_at.pop(point, None) is not None:
+                self.ring.remove(point)
+
+    def node_for(self, key):
+        index = bisect.bisect(self.ring, self._hash(key)) % len(self.ring)
+        return self.node_at[self.ring[index]]
+
+    def assign(self, keys):
+        """Keys grouped by node, every node present even when it gets nothing."""
+        assignment = {node: set() for node in set(self.node_at.values())}
+        for key in keys:
+            assignment[self.node_for(key)].add(key)
+        return assignment
+
+
+class AccountCoordinator:
+    """
+    Account-wide state shared by the supervisor and its worker processes.
+
+    The supervisor publishes positions, the balance and the set of symbols with open
+    positions, and the symbol assignment of every worker. Workers claim a slot
+    before trading a new symbol so the ``symbols_allowed`` limit holds across
+    processes. The instance is picklable and is passed to the workers as is.
+    """
+
+    max_age = 15  # Seconds after which workers stop trusting the published account state
+
+    def __init__(self, mp_manager):
+        self.lock = mp_manager.Lock()
+        self.state = mp_manager.dict()
+        self.claims = mp_manager.dict()
+        self.assignments = mp_manager.dict()
+
+    def publish_account(self, positions, balance, open_symbols):
+        with self.lock:
+            self.state['positions'] = positions
+            self.state['balance'] = balance
+            self.state['open_symbols'] = set(open_symbols)
+            self.state['updated'] = time.time()
+
+    def get_positions(self):
+        return self.state.get('positions', [])
+
+    def get_balance(self):
+        return self.state.get('balance')
+
+    def is_fresh(self):
+        updated = self.state.get('updated')
+        return updated is not None and time.time() - updated < self.max_age
+
+    def try_claim(self, symbol, worker_id, symbols_allowed):
+        """Reserve a symbol slot for a worker, False when the account is at its limit."""
+        with self.lock:
+            if self.claims.get(symbol) == worker_id:
+                return True
+            open_symbols = self.state.get('open_symbols', set())
+            in_use = open_symbols | set(self.claims.keys())
+            if symbol not in open_symbols and len(in_use) >= symbols_allowed:
+                return False
+            self.claims[symbol] = worker_id
+            return True
+
+    def release(self, symbol, worker_id):
+        with self.lock:
+            if self.claims.get(symbol) == worker_id:
+                del self.claims[symbol]
+
+    def release_worker(self, worker_id):
+        """Drop every claim of a worker, used when its process died."""
+        with self.lock:
+            for symbol, owner in list(self.claims.items()):
+                if owner == worker_id:
+                    del self.claims[symbol]
+
+    def set_assignments(self, assignment):
+        with self.lock:
+            for worker_id, symbols in assignment.items():
+                self.assignments[worker_id] = set(symbols)
+
+    def get_assignment(self, worker_id):
+        return self.assignments.get(worker_id, set())
+
+
+class SymbolSupervisor:
+    """
+    Shards symbols across ``num_workers`` worker processes with consistent hashing.
+
+    Each worker runs ``target(worker_id, coordinator, *args)`` in its own process
+    (spawned, so nothing but the arguments is inherited) and trades the symbols
+    assigned to it in the coordinator. ``rebalance`` reassigns the current symbol set,
+    ``check_workers`` restarts workers that died.
+    """
+
+    def __init__(self, num_workers, target, args=(), replicas=160):
+        self.num_workers = num_workers
+        self.target = target
+        self.args = args
+        self.context = multiprocessing.get_context('spawn')
+        self.mp_manager = self.context.Manager()
+        self.coordinator = AccountCoordinator(self.mp_manager)
+        self.ring = ConsistentHashRing(range(num_workers), replicas=replicas)
+        self.assignment = {}
+        self.processes = {}
+
+    def start(self):
+        for worker_id in range(self.num_workers):
+            self.start_worker(worker_id)
+
+    def start_worker(self, worker_id):
+        process = self.context.Process(
+            target=self.target,
+            args=(worker_id, self.coordinator, *self.args),
+            name=f"SymbolWorker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        self.processes[worker_id] = process
+        logging.info(f"Started worker {worker_id} (pid {process.pid})")
+
+    def rebalance(self, symbols):
+        assignment = self.ring.assign(symbols)
+        moved = {
+            symbol for worker_id, assigned in assignment.items()
+            for symbol in assigned
+            if any(symbol in previous for other_id, previous in self.assignment.items() if other_id != worker_id)
+        }
+        added = set(symbols) - {symbol for assigned in self.assignment.values() for symbol in assigned}
+        self.coordinator.set_assignments(assignment)
+        self.assignment = assignment
+        if moved or added:
+            logging.info(f"Rebalanced {len(symbols)} symbols over {self.num_workers} workers, {len(added)} new, {len(moved)} moved: "
+                         f"{ {worker_id: len(assigned) for worker_id, assigned in assignment.items()} }")
+        return assignment
+
+    def check_workers(self):
+        for worker_id, process in list(self.processes.items()):
+            if not process.is_alive():
+                logging.info(f"Worker {worker_id} exited with code {process.exitcode}, restarting it")
+                self.coordinator.release_worker(worker_id)
+                self.start_worker(worker_id)
+
+    def stop(self):
+        for process in self.processes.values():
+            process.terminate()
+        for process in self.processes.values():
+            process.join(timeout=5)
+        self.mp_manager.shutdown()
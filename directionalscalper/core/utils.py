@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import json
 import logging
+import os
+import threading
 import time
 import random
 from collections import OrderedDict
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlparse
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # Optional, the standard library decoder is used without it
+    orjson = None
 
 log = logging.getLogger(__name__)
 
@@ -28,6 +37,77 @@ class BlankResponse:
         self.content = ""
 
 
+def loads_json(content):
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class HTTPSessionPool:
+    """
+    Keep-alive ``requests`` sessions shared per process and per host.
+
+    Every public request to a host reuses the connections of one session instead of
+    paying a TCP and TLS handshake per call. Instances are per process id, so a forked
+    or spawned worker opens its own connections instead of sharing sockets.
+    """
+
+    _instances = {}
+    _lock = threading.Lock()
+
+    pool_connections = 4  # Connection pools kept per session
+    pool_maxsize = 32  # Connections kept alive per pool, raise it for wide threaded sweeps
+
+    def __init__(self):
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        pid = os.getpid()
+        with cls._lock:
+            if pid not in cls._instances:
+                cls._instances[pid] = cls()
+            return cls._instances[pid]
+
+    @classmethod
+    def configure(cls, pool_connections=None, pool_maxsize=None):
+        """Set the pool sizes, sessions opened before are closed and reopened on next use."""
+        if (pool_connections in (None, cls.pool_connections)) and (pool_maxsize in (None, cls.pool_maxsize)):
+            return
+        if pool_connections is not None:
+            cls.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            cls.pool_maxsize = pool_maxsize
+        with cls._lock:
+            instance = cls._instances.pop(os.getpid(), None)
+        if instance is not None:
+            instance.close()
+
+    def session_for(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            session = self.sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+                self.sessions[host] = session
+            return session
+
+    def request(self, method, url, **kwargs):
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def close(self):
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+
 def get_timestamp():
     return int(time.time() * 1000)
 
@@ -87,8 +167,14 @@ def send_public_request(
     json_in: dict | None = None,
     json_out: bool = True,
     max_retries: int = 10000,
-    base_delay: float = 0.5  # base delay for exponential backoff
+    base_delay: float = 0.5,  # base delay for exponential backoff
+    headers: dict | None = None,
 ):
+    """
+    Public GET/POST with retries. Returns (headers, payload), (headers, None) for a
+    304 Not Modified answer to conditional ``headers``, and (None, None) when every
+    attempt failed.
+    """
     if url_path is not None:
         url += url_path
     if payload is None:
@@ -100,11 +186,13 @@ def send_public_request(
     attempt = 0
     while attempt < max_retries:
         try:
-            response = requests.request(method, url, json=json_in, timeout=30)
+            response = HTTPSessionPool.get_instance().request(method, url, json=json_in, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return response.headers, None
             if not json_out:
                 return response.headers, response.text
 
-            json_response = response.json()
+            json_response = loads_json(response.content)
             if response.status_code != 200:
                 raise HTTPRequestError(url, response.status_code, json_response.get("msg"))
 
@@ -115,10 +203,10 @@ def send_public_request(
             log.warning(f"Request timed out for {url}: {e}")
         except requests.exceptions.TooManyRedirects as e:
             log.warning(f"Too many redirects for {url}: {e}")
-        except requests.exceptions.JSONDecodeError as e:
-            log.warning(f"JSON decode error at {url}: {e}")
         except requests.exceptions.RequestException as e:
             log.warning(f"Request exception at {url}: {e}")
+        except ValueError as e:  # json and orjson decode errors
+            log.warning(f"JSON decode error at {url}: {e}")
         except HTTPRequestError as e:
             log.warning(str(e))
 
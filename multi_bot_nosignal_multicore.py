@@ -22,6 +22,7 @@ import config
 from config import load_config, Config
 from config import VERSION
 from api.manager import Manager
+from api.snapshot import ARROW_AVAILABLE
 
 from directionalscalper.core.exchanges.lbank import LBankExchange
 from directionalscalper.core.exchanges.mexc import MexcExchange
@@ -31,6 +32,8 @@ from directionalscalper.core.exchanges.binance import BinanceExchange
 from directionalscalper.core.exchanges.hyperliquid import HyperLiquidExchange
 from directionalscalper.core.exchanges.bybit import BybitExchange
 from directionalscalper.core.exchanges.exchange import Exchange
+from directionalscalper.core.exchanges.exchange_registry import ExchangeRegistry
+from directionalscalper.core.supervisor import SymbolSupervisor
 
 
 import directionalscalper.core.strategies.bybit.nosignal.hotkeys_base_strategy as hotkeysbase
@@ -66,6 +69,10 @@ latest_rotator_symbols = set()
 last_rotator_update_time = time.time()
 tried_symbols = set()
 
+# Set in supervised worker processes (--workers > 1)
+shard_coordinator = None
+shard_worker_id = None
+
 logging = Logger(logger_name="MultiBot", filename="MultiBot.log", stream=True)
 
 colorama.init()
@@ -170,26 +177,30 @@ class DirectionalMarketMaker:
         secret_key = exchange_config.api_secret
         passphrase = exchange_config.passphrase
         
-        if exchange_name.lower() == 'bybit':
-            market_type = 'swap'
-            self.exchange = BybitExchange(api_key, secret_key, passphrase, market_type)
-        elif exchange_name.lower() == 'bybit_spot':
-            market_type = 'spot'
-            self.exchange = BybitExchange(api_key, secret_key, passphrase, market_type)
-        elif exchange_name.lower() == 'hyperliquid':
-            self.exchange = HyperLiquidExchange(api_key, secret_key, passphrase)
-        elif exchange_name.lower() == 'huobi':
-            self.exchange = HuobiExchange(api_key, secret_key, passphrase)
-        elif exchange_name.lower() == 'bitget':
-            self.exchange = BitgetExchange(api_key, secret_key, passphrase)
-        elif exchange_name.lower() == 'binance':
-            self.exchange = BinanceExchange(api_key, secret_key, passphrase)
-        elif exchange_name.lower() == 'mexc':
-            self.exchange = MexcExchange(api_key, secret_key, passphrase)
-        elif exchange_name.lower() == 'lbank':
-            self.exchange = LBankExchange(api_key, secret_key, passphrase)
-        else:
-            self.exchange = Exchange(self.exchange_name, api_key, secret_key, passphrase)
+        def create_exchange():
+            if exchange_name.lower() == 'bybit':
+                market_type = 'swap'
+                return BybitExchange(api_key, secret_key, passphrase, market_type)
+            elif exchange_name.lower() == 'bybit_spot':
+                market_type = 'spot'
+                return BybitExchange(api_key, secret_key, passphrase, market_type)
+            elif exchange_name.lower() == 'hyperliquid':
+                return HyperLiquidExchange(api_key, secret_key, passphrase)
+            elif exchange_name.lower() == 'huobi':
+                return HuobiExchange(api_key, secret_key, passphrase)
+            elif exchange_name.lower() == 'bitget':
+                return BitgetExchange(api_key, secret_key, passphrase)
+            elif exchange_name.lower() == 'binance':
+                return BinanceExchange(api_key, secret_key, passphrase)
+            elif exchange_name.lower() == 'mexc':
+                return MexcExchange(api_key, secret_key, passphrase)
+            elif exchange_name.lower() == 'lbank':
+                return LBankExchange(api_key, secret_key, passphrase)
+            else:
+                return Exchange(self.exchange_name, api_key, secret_key, passphrase)
+
+        # One adapter per account, shared by every symbol thread and signal worker
+        self.exchange = ExchangeRegistry.get_or_create((exchange_name.lower(), account_name), create_exchange)
 
     def run_strategy(self, symbol, strategy_name, config, account_name, symbols_to_trade=None, rotator_symbols_standardized=None):
         logging.info(f"Received rotator symbols in run_strategy for {symbol}: {rotator_symbols_standardized}")
@@ -474,9 +485,15 @@ def bybit_auto_rotation(args, manager, symbols_allowed, whitelist, blacklist, ma
 
             open_position_data = getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")()
             open_position_symbols = {standardize_symbol(pos['symbol']) for pos in open_position_data}
+            if shard_coordinator is not None:
+                # Only trade the symbols the supervisor assigned to this worker
+                assigned_symbols = shard_coordinator.get_assignment(shard_worker_id)
+                open_position_symbols &= assigned_symbols
             logging.info(f"Open position symbols: {open_position_symbols}")
 
-            if not latest_rotator_symbols or current_time - last_rotator_update_time >= 60:
+            if shard_coordinator is not None:
+                latest_rotator_symbols = assigned_symbols - open_position_symbols
+            elif not latest_rotator_symbols or current_time - last_rotator_update_time >= 60:
                 latest_rotator_symbols = fetch_updated_symbols(args, manager, blacklist=blacklist, whitelist=whitelist, max_usd_value=max_usd_value)
                 last_rotator_update_time = current_time
                 logging.info(f"Refreshed latest rotator symbols: {latest_rotator_symbols}")
@@ -520,6 +537,8 @@ def bybit_auto_rotation(args, manager, symbols_allowed, whitelist, blacklist, ma
                     active_symbols.discard(symbol)
                     del threads[symbol]
                     del thread_start_time[symbol]
+                    if shard_coordinator is not None:
+                        shard_coordinator.release(symbol, shard_worker_id)
                     logging.info(f"Thread and symbol management completed for: {symbol}")
 
         except Exception as e:
@@ -560,7 +579,7 @@ def process_signal(symbol, args, manager, symbols_allowed, open_position_data):
 
     logging.info(f"Evaluated action for {symbol}: {action_desc}")
 
-    if action and (symbol not in threads or not threads[symbol][0].is_alive()):
+    if action and (symbol not in threads or not threads[symbol][0].is_alive()) and claim_symbol_slot(symbol, symbols_allowed, open_position_data):
         if start_thread_for_symbol(symbol, args, manager):
             active_symbols.add(symbol)
             logging.info(f"Successfully started thread for {symbol} based on '{action}' signal.")
@@ -571,6 +590,17 @@ def process_signal(symbol, args, manager, symbols_allowed, open_position_data):
     if not action_taken:
         logging.info(f"No action taken for {symbol}.")
 
+def claim_symbol_slot(symbol, symbols_allowed, open_position_data):
+    """Reserve an account-wide symbol slot across worker processes, always granted in a single process."""
+    if shard_coordinator is None:
+        return True
+    if any(standardize_symbol(pos['symbol']) == symbol for pos in open_position_data):
+        return True
+    if shard_coordinator.try_claim(symbol, shard_worker_id, symbols_allowed):
+        return True
+    logging.info(f"Symbols allowed ({symbols_allowed}) reached across workers, not starting {symbol}")
+    return False
+
 def update_active_symbols():
     global active_symbols
     active_symbols = {symbol for symbol in active_symbols if symbol in threads and threads[symbol][0].is_alive()}
@@ -772,6 +802,84 @@ def lbank_auto_rotation(args, manager, symbols_allowed):
     logging.info(f"Open position symbols: {open_position_symbols}")
     
 
+def create_manager(config, market_maker, worker=False, share_embedded=False):
+    """
+    The API Manager of this process. In embedded mode only the supervisor runs the
+    scraper: with ``share_embedded`` it publishes each snapshot next to the data file,
+    and the workers map that snapshot in 'snapshot' mode.
+    """
+    api_mode = config.api.mode
+    if api_mode == "embedded" and worker:
+        api_mode = "snapshot"
+    path = Path("data", config.api.filename)
+    return Manager(
+        market_maker.exchange,
+        exchange_name=market_maker.exchange_name,
+        data_source_exchange=config.api.data_source_exchange,
+        api=api_mode,
+        path=path,
+        url=f"{config.api.url}{config.api.filename}",
+        http_pool_maxsize=config.api.http_pool_maxsize,
+        embedded_refresh_seconds=config.api.embedded_refresh_seconds,
+        embedded_snapshot_path=path.with_suffix(".arrow") if share_embedded else None
+    )
+
+def shard_worker(worker_id, coordinator, worker_args, worker_symbols_allowed):
+    """Entry point of a supervised worker process, trades the symbols assigned to worker_id."""
+    global args, config, manager, symbols_allowed, shard_coordinator, shard_worker_id
+    args = worker_args
+    symbols_allowed = worker_symbols_allowed
+    shard_coordinator = coordinator
+    shard_worker_id = worker_id
+
+    config_file_path = Path('configs/' + args.config) if not args.config.startswith('configs/') else Path(args.config)
+    config = load_config(config_file_path)
+
+    market_maker = DirectionalMarketMaker(config, args.exchange, args.account_name)
+    market_maker.exchange.account_coordinator = coordinator
+    manager = create_manager(config, market_maker, worker=True)
+    logging.info(f"Worker {worker_id} started")
+
+    while True:
+        try:
+            bybit_auto_rotation(args, manager, symbols_allowed, config.bot.whitelist, config.bot.blacklist, config.bot.max_usd_value)
+        except Exception as e:
+            logging.info(f"Exception caught in worker {worker_id}: {e}")
+            logging.info(traceback.format_exc())
+        time.sleep(5)
+
+def run_supervisor(args, config, market_maker, manager, symbols_allowed, num_workers):
+    """
+    Shard the open position and rotator symbols over worker processes. The supervisor
+    publishes the account positions and balance for the workers and rebalances the
+    shards when the rotator symbols change.
+    """
+    supervisor = SymbolSupervisor(num_workers, shard_worker, (args, symbols_allowed))
+    supervisor.start()
+    rotator_symbols = set()
+    last_rotator_update = 0
+    try:
+        while True:
+            try:
+                positions = market_maker.exchange.get_all_open_positions_bybit()
+                open_symbols = {standardize_symbol(pos['symbol']) for pos in positions}
+                balance = market_maker.exchange.get_swap_balance_bybit()
+                supervisor.coordinator.publish_account(positions, balance, open_symbols)
+
+                if time.time() - last_rotator_update >= 60:
+                    rotator_symbols = fetch_updated_symbols(args, manager, blacklist=config.bot.blacklist, whitelist=config.bot.whitelist, max_usd_value=config.bot.max_usd_value)
+                    last_rotator_update = time.time()
+                    logging.info(f"Refreshed latest rotator symbols: {rotator_symbols}")
+
+                supervisor.rebalance(open_symbols | rotator_symbols)
+                supervisor.check_workers()
+            except Exception as e:
+                logging.info(f"Exception caught in supervisor loop: {e}")
+                logging.info(traceback.format_exc())
+            time.sleep(5)
+    finally:
+        supervisor.stop()
+
 if __name__ == '__main__':
     sword = "====||====>"
 
@@ -796,6 +904,7 @@ if __name__ == '__main__':
     parser.add_argument('--strategy', type=str, help='The name of the strategy to use')
     parser.add_argument('--symbol', type=str, help='The trading symbol to use')
     parser.add_argument('--amount', type=str, help='The size to use')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes to shard the symbols over (bybit only, default 1 keeps a single process)')
 
     args = parser.parse_args()
 
@@ -814,14 +923,12 @@ if __name__ == '__main__':
     exchange_name = args.exchange
     market_maker = DirectionalMarketMaker(config, exchange_name, args.account_name)
 
-    manager = Manager(
-        market_maker.exchange, 
-        exchange_name=args.exchange, 
-        data_source_exchange=config.api.data_source_exchange,
-        api=config.api.mode, 
-        path=Path("data", config.api.filename), 
-        url=f"{config.api.url}{config.api.filename}"
-    )
+    share_embedded = args.workers > 1 and exchange_name.lower() == 'bybit' and config.api.mode == "embedded"
+    if share_embedded and not ARROW_AVAILABLE:
+        logging.warning("Embedded mode with --workers needs pyarrow to share the scraper snapshot, running in a single process")
+        args.workers = 1
+        share_embedded = False
+    manager = create_manager(config, market_maker, share_embedded=share_embedded)
 
     print(f"Using exchange {config.api.data_source_exchange} for API data")
 
@@ -854,6 +961,12 @@ if __name__ == '__main__':
 
     print(f"Symbols to trade: {symbols_to_trade}")
 
+    if args.workers > 1:
+        if exchange_name.lower() == 'bybit':
+            run_supervisor(args, config, market_maker, manager, symbols_allowed, args.workers)
+            sys.exit(0)
+        logging.warning(f"--workers is only supported on bybit, running {exchange_name} in a single process")
+
     while True:
         try:
             whitelist = config.bot.whitelist
@@ -45,13 +45,8 @@ from live_table_manager import LiveTableManager, shared_symbols_data
 
 from directionalscalper.core.strategies.logger import Logger
 
-from rate_limit import RateLimit
-
 from collections import deque
 
-general_rate_limiter = RateLimit(50, 1)
-order_rate_limiter = RateLimit(5, 1) 
-
 thread_management_lock = threading.Lock()
 thread_to_symbol = {}
 thread_to_symbol_lock = threading.Lock()
@@ -278,13 +273,11 @@ class DirectionalMarketMaker:
         return self.exchange.create_order(symbol, order_type, side, amount, price)
 
     def get_symbols(self):
-        with general_rate_limiter:
-            return self.exchange.symbols
+        return self.exchange.symbols
 
     def get_mfirsi_signal(self, symbol):
         # Retrieve the MFI/RSI signal
-        with general_rate_limiter:
-            return self.exchange.get_mfirsi_ema_secondary_ema(symbol, limit=100, lookback=1, ema_period=5, secondary_ema_period=3)
+        return self.exchange.get_mfirsi_ema_secondary_ema(symbol, limit=100, lookback=1, ema_period=5, secondary_ema_period=3)
 
 BALANCE_REFRESH_INTERVAL = 600  # in seconds
 
@@ -330,8 +323,7 @@ def run_bot(symbol, args, manager, account_name, symbols_allowed, rotator_symbol
 
         time.sleep(2)
 
-        with general_rate_limiter:
-            market_maker.run_strategy(symbol, args.strategy, config, account_name, symbols_to_trade=symbols_allowed, rotator_symbols_standardized=latest_rotator_symbols, mfirsi_signal=mfirsi_signal)
+        market_maker.run_strategy(symbol, args.strategy, config, account_name, symbols_to_trade=symbols_allowed, rotator_symbols_standardized=latest_rotator_symbols, mfirsi_signal=mfirsi_signal)
 
     except Exception as e:
         logging.info(f"An error occurred in run_bot for symbol {symbol}: {e}")
@@ -365,8 +357,7 @@ def bybit_spot_auto_rotation(args, manager, symbols_allowed):
     logging.info(f"Short mode: {short_mode}")
 
     def fetch_open_positions():
-        with general_rate_limiter:
-            return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")('spot')
+        return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")('spot')
 
     def process_futures(futures):
         for future in as_completed(futures):
@@ -388,8 +379,7 @@ def bybit_spot_auto_rotation(args, manager, symbols_allowed):
             logging.info(f"Current long positions: {current_long_positions}, Current short positions: {current_short_positions}")
 
             if not latest_rotator_symbols or current_time - last_rotator_update_time >= 60:
-                with general_rate_limiter:
-                    latest_rotator_symbols = fetch_updated_symbols(args, manager)
+                latest_rotator_symbols = fetch_updated_symbols(args, manager)
                 last_rotator_update_time = current_time
                 logging.info(f"Refreshed latest rotator symbols: {latest_rotator_symbols}")
             else:
@@ -402,8 +392,7 @@ def bybit_spot_auto_rotation(args, manager, symbols_allowed):
                 open_position_futures = []
                 for symbol in open_position_symbols:
                     if symbol not in long_threads and symbol not in short_threads:
-                        with general_rate_limiter:
-                            mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
+                        mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
                         has_open_long = any(pos['side'].lower() == 'long' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         has_open_short = any(pos['side'].lower() == 'short' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         open_position_futures.append(signal_executor.submit(start_thread_for_open_symbol, symbol, args, manager, mfirsi_signal, has_open_long, has_open_short, long_mode, short_mode))
@@ -464,8 +453,7 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
     logging.info(f"Short mode: {short_mode}")
 
     def fetch_open_positions():
-        with general_rate_limiter:
-            return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")()
+        return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")()
 
     def process_futures(futures):
         for future in as_completed(futures):
@@ -487,8 +475,7 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
             logging.info(f"Current long positions: {current_long_positions}, Current short positions: {current_short_positions}")
 
             if not latest_rotator_symbols or current_time - last_rotator_update_time >= 60:
-                with general_rate_limiter:
-                    latest_rotator_symbols = fetch_updated_symbols(args, manager)
+                latest_rotator_symbols = fetch_updated_symbols(args, manager)
                 last_rotator_update_time = current_time
                 logging.info(f"Refreshed latest rotator symbols: {latest_rotator_symbols}")
             else:
@@ -501,8 +488,7 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
                 open_position_futures = []
                 for symbol in open_position_symbols:
                     if symbol not in long_threads and symbol not in short_threads:
-                        with general_rate_limiter:
-                            mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
+                        mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
                         has_open_long = any(pos['side'].lower() == 'long' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         has_open_short = any(pos['side'].lower() == 'short' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         open_position_futures.append(signal_executor.submit(start_thread_for_open_symbol, symbol, args, manager, mfirsi_signal, has_open_long, has_open_short, long_mode, short_mode))
@@ -543,8 +529,7 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
 def process_signal_for_open_position(symbol, args, manager, symbols_allowed, open_position_data, long_mode, short_mode):
     market_maker = DirectionalMarketMaker(config, args.exchange, args.account_name)
     market_maker.manager = manager
-    with general_rate_limiter:
-        mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
+    mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
     logging.info(f"Processing signal for open position symbol {symbol}. MFIRSI signal: {mfirsi_signal}")
 
     action_taken = handle_signal(symbol, args, manager, mfirsi_signal, open_position_data, symbols_allowed, True, long_mode, short_mode)
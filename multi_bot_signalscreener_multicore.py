@@ -1,6 +1,7 @@
 import sys
 import os
 import time
+import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import random
@@ -22,6 +23,7 @@ import config
 from config import load_config, Config
 from config import VERSION
 from api.manager import Manager
+from api.snapshot import ARROW_AVAILABLE
 
 from directionalscalper.core.exchanges.blofin import BlofinExchange
 from directionalscalper.core.exchanges.lbank import LBankExchange
@@ -32,6 +34,10 @@ from directionalscalper.core.exchanges.binance import BinanceExchange
 from directionalscalper.core.exchanges.hyperliquid import HyperLiquidExchange
 from directionalscalper.core.exchanges.bybit import BybitExchange
 from directionalscalper.core.exchanges.exchange import Exchange
+from directionalscalper.core.exchanges.exchange_registry import ExchangeRegistry
+from directionalscalper.core.exchanges.async_bybit import AsyncBybitExchange
+from directionalscalper.core.strategies.bybit.async_runtime import AsyncStrategyRuntime, ASYNC_STRATEGIES
+from directionalscalper.core.supervisor import SymbolSupervisor
 
 import directionalscalper.core.strategies.bybit.notional.instantsignals as instant_signals
 import directionalscalper.core.strategies.bybit.notional as bybit_notional
@@ -44,13 +50,8 @@ from live_table_manager import LiveTableManager, shared_symbols_data
 
 from directionalscalper.core.strategies.logger import Logger
 
-from rate_limit import RateLimit
-
 from collections import deque
 
-general_rate_limiter = RateLimit(50, 1)
-order_rate_limiter = RateLimit(5, 1) 
-
 thread_management_lock = threading.Lock()
 thread_to_symbol = {}
 thread_to_symbol_lock = threading.Lock()
@@ -71,6 +72,10 @@ latest_rotator_symbols = set()
 last_rotator_update_time = time.time()
 tried_symbols = set()
 
+# Set in supervised worker processes (--workers > 1)
+shard_coordinator = None
+shard_worker_id = None
+
 logging = Logger(logger_name="MultiBot", filename="MultiBot.log", stream=True)
 
 colorama.init()
@@ -187,12 +192,16 @@ class DirectionalMarketMaker:
         exchange_class = exchange_classes.get(exchange_name.lower(), Exchange)
 
         # Initialize the exchange based on whether a passphrase is required
-        if exchange_name.lower() in ['bybit', 'binance']:  # Add other exchanges here that do not require a passphrase
-            self.exchange = exchange_class(api_key, secret_key)
-        elif exchange_name.lower() == 'bybit_spot':
-            self.exchange = exchange_class(api_key, secret_key, 'spot')
-        else:
-            self.exchange = exchange_class(api_key, secret_key, passphrase)
+        def create_exchange():
+            if exchange_name.lower() in ['bybit', 'binance']:  # Add other exchanges here that do not require a passphrase
+                return exchange_class(api_key, secret_key)
+            elif exchange_name.lower() == 'bybit_spot':
+                return exchange_class(api_key, secret_key, 'spot')
+            else:
+                return exchange_class(api_key, secret_key, passphrase)
+
+        # One adapter per account, shared by every symbol thread and signal worker
+        self.exchange = ExchangeRegistry.get_or_create((exchange_name.lower(), account_name), create_exchange)
 
 
     def run_strategy(self, symbol, strategy_name, config, account_name, symbols_to_trade=None, rotator_symbols_standardized=None, mfirsi_signal=None):
@@ -277,13 +286,11 @@ class DirectionalMarketMaker:
         return self.exchange.create_order(symbol, order_type, side, amount, price)
 
     def get_symbols(self):
-        with general_rate_limiter:
-            return self.exchange.symbols
+        return self.exchange.symbols
 
     def get_mfirsi_signal(self, symbol):
         # Retrieve the MFI/RSI signal
-        with general_rate_limiter:
-            return self.exchange.get_mfirsi_ema_secondary_ema(symbol, limit=100, lookback=1, ema_period=5, secondary_ema_period=3)
+        return self.exchange.get_mfirsi_ema_secondary_ema(symbol, limit=100, lookback=1, ema_period=5, secondary_ema_period=3)
 
 BALANCE_REFRESH_INTERVAL = 600  # in seconds
 
@@ -329,8 +336,7 @@ def run_bot(symbol, args, manager, account_name, symbols_allowed, rotator_symbol
 
         time.sleep(2)
 
-        with general_rate_limiter:
-            market_maker.run_strategy(symbol, args.strategy, config, account_name, symbols_to_trade=symbols_allowed, rotator_symbols_standardized=latest_rotator_symbols, mfirsi_signal=mfirsi_signal)
+        market_maker.run_strategy(symbol, args.strategy, config, account_name, symbols_to_trade=symbols_allowed, rotator_symbols_standardized=latest_rotator_symbols, mfirsi_signal=mfirsi_signal)
 
     except Exception as e:
         logging.info(f"An error occurred in run_bot for symbol {symbol}: {e}")
@@ -368,8 +374,7 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
     logging.info(f"Short mode: {short_mode}")
 
     def fetch_open_positions():
-        with general_rate_limiter:
-            return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")()
+        return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")()
 
     def process_futures(futures):
         for future in as_completed(futures):
@@ -384,15 +389,20 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
             current_time = time.time()
             open_position_data = fetch_open_positions()
             open_position_symbols = {standardize_symbol(pos['symbol']) for pos in open_position_data}
+            if shard_coordinator is not None:
+                # Only trade the symbols the supervisor assigned to this worker
+                assigned_symbols = shard_coordinator.get_assignment(shard_worker_id)
+                open_position_symbols &= assigned_symbols
             logging.info(f"Open position symbols: {open_position_symbols}")
 
             current_long_positions = sum(1 for pos in open_position_data if pos['side'].lower() == 'long')
             current_short_positions = sum(1 for pos in open_position_data if pos['side'].lower() == 'short')
             logging.info(f"Current long positions: {current_long_positions}, Current short positions: {current_short_positions}")
 
-            if not latest_rotator_symbols or current_time - last_rotator_update_time >= 60:
-                with general_rate_limiter:
-                    latest_rotator_symbols = fetch_updated_symbols(args, manager)
+            if shard_coordinator is not None:
+                latest_rotator_symbols = assigned_symbols - open_position_symbols
+            elif not latest_rotator_symbols or current_time - last_rotator_update_time >= 60:
+                latest_rotator_symbols = fetch_updated_symbols(args, manager)
                 last_rotator_update_time = current_time
                 logging.info(f"Refreshed latest rotator symbols: {latest_rotator_symbols}")
             else:
@@ -405,8 +415,7 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
                 open_position_futures = []
                 for symbol in open_position_symbols:
                     if symbol not in long_threads and symbol not in short_threads:
-                        with general_rate_limiter:
-                            mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
+                        mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
                         has_open_long = any(pos['side'].lower() == 'long' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         has_open_short = any(pos['side'].lower() == 'short' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         open_position_futures.append(trading_executor.submit(start_thread_for_open_symbol, symbol, args, manager, mfirsi_signal, has_open_long, has_open_short, long_mode, short_mode))
@@ -437,6 +446,8 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
                         del long_threads[symbol]
                     if symbol in short_threads:
                         del short_threads[symbol]
+                    if shard_coordinator is not None and symbol not in long_threads and symbol not in short_threads:
+                        shard_coordinator.release(symbol, shard_worker_id)
                     logging.info(f"Thread and symbol management completed for: {symbol}")
 
         except Exception as e:
@@ -447,8 +458,7 @@ def bybit_auto_rotation(args, manager, symbols_allowed):
 def process_signal_for_open_position(symbol, args, manager, symbols_allowed, open_position_data, long_mode, short_mode):
     market_maker = DirectionalMarketMaker(config, args.exchange, args.account_name)
     market_maker.manager = manager
-    with general_rate_limiter:
-        mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
+    mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
     logging.info(f"Processing signal for open position symbol {symbol}. MFIRSI signal: {mfirsi_signal}")
 
     action_taken = handle_signal(symbol, args, manager, mfirsi_signal, open_position_data, symbols_allowed, True, long_mode, short_mode)
@@ -497,14 +507,23 @@ def handle_signal(symbol, args, manager, mfirsi_signal, open_position_data, symb
             return start_thread_for_symbol(symbol, args, manager, mfirsi_signal, "short")
     else:
         if unique_open_symbols < symbols_allowed:
-            if mfi_signal_long and long_mode:
+            if mfi_signal_long and long_mode and claim_symbol_slot(symbol, symbols_allowed):
                 return start_thread_for_symbol(symbol, args, manager, mfirsi_signal, "long")
-            elif mfi_signal_short and short_mode:
+            elif mfi_signal_short and short_mode and claim_symbol_slot(symbol, symbols_allowed):
                 return start_thread_for_symbol(symbol, args, manager, mfirsi_signal, "short")
 
     logging.info(f"Evaluated action for {'open position' if is_open_position else 'new rotator'} symbol {symbol}: No action due to existing position or lack of clear signal.")
     return False
 
+def claim_symbol_slot(symbol, symbols_allowed):
+    """Reserve an account-wide symbol slot across worker processes, always granted in a single process."""
+    if shard_coordinator is None:
+        return True
+    if shard_coordinator.try_claim(symbol, shard_worker_id, symbols_allowed):
+        return True
+    logging.info(f"Symbols allowed ({symbols_allowed}) reached across workers, not starting {symbol}")
+    return False
+
 def update_active_symbols(open_position_symbols):
     global active_symbols
     active_symbols = open_position_symbols
@@ -680,8 +699,7 @@ def bybit_spot_auto_rotation(args, manager, symbols_allowed):
     logging.info(f"Short mode: {short_mode}")
 
     def fetch_open_positions():
-        with general_rate_limiter:
-            return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")()
+        return getattr(manager.exchange, f"get_all_open_positions_{args.exchange.lower()}")()
 
     def process_futures(futures):
         for future in as_completed(futures):
@@ -703,8 +721,7 @@ def bybit_spot_auto_rotation(args, manager, symbols_allowed):
             logging.info(f"Current long positions: {current_long_positions}, Current short positions: {current_short_positions}")
 
             if not latest_rotator_symbols or current_time - last_rotator_update_time >= 60:
-                with general_rate_limiter:
-                    latest_rotator_symbols = fetch_updated_symbols(args, manager)
+                latest_rotator_symbols = fetch_updated_symbols(args, manager)
                 last_rotator_update_time = current_time
                 logging.info(f"Refreshed latest rotator symbols: {latest_rotator_symbols}")
             else:
@@ -717,8 +734,7 @@ def bybit_spot_auto_rotation(args, manager, symbols_allowed):
                 open_position_futures = []
                 for symbol in open_position_symbols:
                     if symbol not in long_threads and symbol not in short_threads:
-                        with general_rate_limiter:
-                            mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
+                        mfirsi_signal = market_maker.get_mfirsi_signal(symbol)
                         has_open_long = any(pos['side'].lower() == 'long' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         has_open_short = any(pos['side'].lower() == 'short' for pos in open_position_data if standardize_symbol(pos['symbol']) == symbol)
                         open_position_futures.append(trading_executor.submit(start_thread_for_open_symbol, symbol, args, manager, mfirsi_signal, has_open_long, has_open_short, long_mode, short_mode))
@@ -786,6 +802,116 @@ def lbank_auto_rotation(args, manager, symbols_allowed):
     open_position_symbols = {standardize_symbol(pos['symbol']) for pos in market_maker.exchange.get_all_open_positions_binance()}
     logging.info(f"Open position symbols: {open_position_symbols}")
 
+def create_manager(config, market_maker, worker=False, share_embedded=False):
+    """
+    The API Manager of this process. In embedded mode only the supervisor runs the
+    scraper: with ``share_embedded`` it publishes each snapshot next to the data file,
+    and the workers map that snapshot in 'snapshot' mode.
+    """
+    api_mode = config.api.mode
+    if api_mode == "embedded" and worker:
+        api_mode = "snapshot"
+    path = Path("data", config.api.filename)
+    return Manager(
+        market_maker.exchange,
+        exchange_name=market_maker.exchange_name,
+        data_source_exchange=config.api.data_source_exchange,
+        api=api_mode,
+        path=path,
+        url=f"{config.api.url}{config.api.filename}",
+        http_pool_maxsize=config.api.http_pool_maxsize,
+        embedded_refresh_seconds=config.api.embedded_refresh_seconds,
+        embedded_snapshot_path=path.with_suffix(".arrow") if share_embedded else None
+    )
+
+def shard_worker(worker_id, coordinator, worker_args, worker_symbols_allowed):
+    """Entry point of a supervised worker process, trades the symbols assigned to worker_id."""
+    global args, config, manager, symbols_allowed, whitelist, blacklist, max_usd_value, shard_coordinator, shard_worker_id
+    args = worker_args
+    symbols_allowed = worker_symbols_allowed
+    shard_coordinator = coordinator
+    shard_worker_id = worker_id
+
+    config_file_path = Path('configs/' + args.config) if not args.config.startswith('configs/') else Path(args.config)
+    config = load_config(config_file_path)
+    whitelist = config.bot.whitelist
+    blacklist = config.bot.blacklist
+    max_usd_value = config.bot.max_usd_value
+
+    market_maker = DirectionalMarketMaker(config, args.exchange, args.account_name)
+    market_maker.exchange.account_coordinator = coordinator
+    manager = create_manager(config, market_maker, worker=True)
+    logging.info(f"Worker {worker_id} started")
+
+    while True:
+        try:
+            bybit_auto_rotation(args, manager, symbols_allowed)
+        except Exception as e:
+            logging.info(f"Exception caught in worker {worker_id}: {e}")
+            logging.info(traceback.format_exc())
+        time.sleep(10)
+
+def run_supervisor(args, market_maker, manager, symbols_allowed, num_workers):
+    """
+    Shard the open position and rotator symbols over worker processes. The supervisor
+    publishes the account positions and balance for the workers and rebalances the
+    shards when the rotator symbols change.
+    """
+    supervisor = SymbolSupervisor(num_workers, shard_worker, (args, symbols_allowed))
+    supervisor.start()
+    rotator_symbols = set()
+    last_rotator_update = 0
+    try:
+        while True:
+            try:
+                positions = market_maker.exchange.get_all_open_positions_bybit()
+                open_symbols = {standardize_symbol(pos['symbol']) for pos in positions}
+                balance = market_maker.exchange.get_swap_balance_bybit()
+                supervisor.coordinator.publish_account(positions, balance, open_symbols)
+
+                if time.time() - last_rotator_update >= 60:
+                    rotator_symbols = fetch_updated_symbols(args, manager)
+                    last_rotator_update = time.time()
+                    logging.info(f"Refreshed latest rotator symbols: {rotator_symbols}")
+
+                supervisor.rebalance(open_symbols | rotator_symbols)
+                supervisor.check_workers()
+            except Exception as e:
+                logging.info(f"Exception caught in supervisor loop: {e}")
+                logging.info(traceback.format_exc())
+            time.sleep(5)
+    finally:
+        supervisor.stop()
+
+def run_async_runtime(args, config, manager, symbols, symbols_allowed):
+    """Trade every symbol as a coroutine on one event loop instead of one thread per symbol."""
+    strategy_class = ASYNC_STRATEGIES.get(args.strategy.lower())
+    if strategy_class is None:
+        logging.error(f"Strategy {args.strategy} is not available on the async runtime, use --runtime thread. Async strategies: {list(ASYNC_STRATEGIES)}")
+        return
+    if args.exchange.lower() != 'bybit':
+        logging.error(f"The async runtime only supports bybit, got {args.exchange}")
+        return
+
+    exchange_config = next((exch for exch in config.exchanges if exch.name == args.exchange and exch.account_name == args.account_name), None)
+
+    async def main():
+        exchange = AsyncBybitExchange(exchange_config.api_key, exchange_config.api_secret)
+        try:
+            strategy = strategy_class(exchange, manager, config.bot, symbols_allowed)
+        except ValueError as e:
+            logging.error(f"Cannot start {args.strategy} on the async runtime: {e}")
+            await exchange.close()
+            return
+        runtime = AsyncStrategyRuntime(exchange, strategy)
+        try:
+            await runtime.run(symbols)
+        finally:
+            logging.info(f"Async runtime latency: {runtime.latency_stats()}")
+            await exchange.close()
+
+    asyncio.run(main())
+
 if __name__ == '__main__':
     sword = "====||====>"
 
@@ -810,6 +936,8 @@ if __name__ == '__main__':
     parser.add_argument('--strategy', type=str, help='The name of the strategy to use')
     parser.add_argument('--symbol', type=str, help='The trading symbol to use')
     parser.add_argument('--amount', type=str, help='The size to use')
+    parser.add_argument('--runtime', type=str, choices=['thread', 'async'], default='thread', help='Run each symbol as a thread (default) or as a coroutine on one event loop')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes to shard the symbols over (bybit only, default 1 keeps a single process)')
 
     args = parser.parse_args()
     args = ask_for_missing_arguments(args)
@@ -826,14 +954,12 @@ if __name__ == '__main__':
     exchange_name = args.exchange
     market_maker = DirectionalMarketMaker(config, exchange_name, args.account_name)
 
-    manager = Manager(
-        market_maker.exchange,
-        exchange_name=args.exchange,
-        data_source_exchange=config.api.data_source_exchange,
-        api=config.api.mode,
-        path=Path("data", config.api.filename),
-        url=f"{config.api.url}{config.api.filename}"
-    )
+    share_embedded = args.workers > 1 and args.runtime != 'async' and exchange_name.lower() == 'bybit' and config.api.mode == "embedded"
+    if share_embedded and not ARROW_AVAILABLE:
+        logging.warning("Embedded mode with --workers needs pyarrow to share the scraper snapshot, running in a single process")
+        args.workers = 1
+        share_embedded = False
+    manager = create_manager(config, market_maker, share_embedded=share_embedded)
 
     print(f"Using exchange {config.api.data_source_exchange} for API data")
 
@@ -864,6 +990,16 @@ if __name__ == '__main__':
 
     print(f"Symbols to trade: {symbols_to_trade}")
 
+    if args.runtime == 'async':
+        run_async_runtime(args, config, manager, symbols_to_trade, symbols_allowed)
+        sys.exit(0)
+
+    if args.workers > 1:
+        if exchange_name.lower() == 'bybit':
+            run_supervisor(args, market_maker, manager, symbols_allowed, args.workers)
+            sys.exit(0)
+        logging.warning(f"--workers is only supported on bybit, running {exchange_name} in a single process")
+
     while True:
         try:
             whitelist = config.bot.whitelist
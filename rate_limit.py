@@ -1,26 +1,277 @@
+import asyncio
+import json
+import math
+import os
+import struct
 import time
 import threading
+import tempfile
 from pathlib import Path
-from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-class RateLimit:
-    def __init__(self, calls, period):
-        self.calls = calls
-        self.period = period
-        self.lock = threading.Lock()
-        self.call_times = deque()
+try:
+    import fcntl
+except ImportError:  # Cross-process coordination needs POSIX file locks
+    fcntl = None
+
+# Requests per second and burst size for each endpoint group, shared by every
+# exchange adapter, strategy and runner thread in the process
+ENDPOINT_GROUPS = {
+    "market_data": {"rate": 50, "burst": 50},
+    # Placing and reading orders; amends and cancels have limits of their own
+    "orders": {"rate": 10, "burst": 10},
+    "order_amend": {"rate": 10, "burst": 10},
+    "order_cancel": {"rate": 10, "burst": 10},
+    "account": {"rate": 10, "burst": 10},
+}
+
+# Tokens a request takes from its group's bucket, 1 unless listed. Bybit v5 allows
+# 50 requests/s on these reads against 10/s on order writes
+ENDPOINT_WEIGHTS = {
+    "/v5/order/realtime": 0.2,
+    "/v5/order/history": 0.2,
+    "/v5/execution/list": 0.2,
+    "/v5/position/list": 0.2,
+    "/v5/position/closed-pnl": 0.2,
+    "/v5/account/wallet-balance": 0.2,
+}
+
+# Batch endpoints count every order of the request against the order limit
+BATCH_ENDPOINTS = ("/v5/order/create-batch", "/v5/order/amend-batch", "/v5/order/cancel-batch")
+
+SHARED_RATE_LIMIT_ENV = "DIRECTIONALSCALPER_SHARED_RATE_LIMIT"
+
+
+def request_weight(endpoint, body=None):
+    """Tokens a request to ``endpoint`` takes, ``body`` being the JSON body ccxt sends."""
+    if endpoint in BATCH_ENDPOINTS and body:
+        try:
+            orders = json.loads(body).get("request")
+        except (TypeError, ValueError, AttributeError):
+            orders = None
+        if orders:
+            return len(orders)
+    return ENDPOINT_WEIGHTS.get(endpoint, 1)
+
+
+class _SharedBucketState:
+    """Bucket level and refill time kept in a small file shared by every process on the host."""
+
+    _format = "dd"
+
+    def __init__(self, name, tokens):
+        self.path = Path(tempfile.gettempdir()) / f"directionalscalper_ratelimit_{name}.bin"
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._initial_tokens = tokens
 
     def __enter__(self):
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def read(self):
+        data = os.pread(self.fd, struct.calcsize(self._format), 0)
+        if len(data) < struct.calcsize(self._format):
+            return self._initial_tokens, time.time()
+        return struct.unpack(self._format, data)
+
+    def write(self, tokens, updated):
+        os.pwrite(self.fd, struct.pack(self._format, tokens, updated), 0)
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    ``acquire`` reserves the tokens under the lock and sleeps for any deficit after
+    releasing it, so waiting callers never block each other and are served in
+    arrival order. With ``shared_name`` the bucket lives in a file locked with
+    ``flock`` and is shared by every process using the same name.
+    """
+
+    def __init__(self, rate, burst=None, shared_name=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else rate)
+        self.lock = threading.Lock()
+        self.tokens = self.burst
+        self.updated = time.time()
+        self.shared = None
+        if shared_name and fcntl is not None:
+            self.shared = _SharedBucketState(shared_name, self.burst)
+
+    def _reserve(self, weight):
+        now = time.time()
+        if self.shared is not None:
+            with self.shared:
+                tokens, updated = self.shared.read()
+                tokens = min(self.burst, tokens + (now - updated) * self.rate) - weight
+                self.shared.write(tokens, now)
+        else:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - weight
+            self.updated = now
+            tokens = self.tokens
+        return -tokens / self.rate if tokens < 0 else 0.0
+
+    def reserve(self, weight=1):
+        """Take the tokens and return how long the caller has to wait before using them."""
         with self.lock:
-            now = time.time()
-            while self.call_times and now - self.call_times[0] > self.period:
-                self.call_times.popleft()
-            if len(self.call_times) >= self.calls:
-                time_to_wait = self.period - (now - self.call_times[0])
-                if time_to_wait > 0:
-                    time.sleep(time_to_wait)
-            self.call_times.append(now)
+            return self._reserve(weight)
+
+    def acquire(self, weight=1):
+        wait = self.reserve(weight)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def __enter__(self):
+        self.acquire()
 
     def __exit__(self, exc_type, exc_value, traceback):
         pass
+
+
+class _Limit:
+    def __init__(self, limiter, group, weight, endpoint):
+        self.limiter = limiter
+        self.group = group
+        self.weight = weight
+        self.endpoint = endpoint
+
+    def __enter__(self):
+        self.limiter.acquire(self.group, self.weight, self.endpoint)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+class RateLimiter:
+    """
+    Per endpoint group token buckets, see ``ENDPOINT_GROUPS``.
+
+    On top of the static buckets the limiter tracks the quota the exchange reports
+    for each endpoint (Bybit ``X-Bapi-Limit-Status`` headers). When an endpoint runs
+    low the remaining requests are spread until its reset time, and when it is
+    exhausted callers wait for the reset instead of hitting a rate limit error.
+    """
+
+    # Start spreading requests once less than this share of an endpoint's quota is left
+    low_quota_ratio = 0.2
+
+    def __init__(self, groups=None, shared_prefix=None):
+        self.buckets = {}
+        for name, limits in (groups or ENDPOINT_GROUPS).items():
+            shared_name = f"{shared_prefix}_{name}" if shared_prefix else None
+            self.buckets[name] = TokenBucket(limits["rate"], limits.get("burst"), shared_name=shared_name)
+        self.quota_lock = threading.Lock()
+        self.quotas = {}
+
+    def group(self, name):
+        return self.buckets[name]
+
+    def limit(self, name, weight=1, endpoint=None):
+        """Context manager that takes ``weight`` tokens from the group's bucket."""
+        return _Limit(self, name, weight, endpoint)
+
+    def reserve(self, name, weight=1, endpoint=None):
+        """Take ``weight`` from the group (and endpoint quota), return the wait in seconds."""
+        wait = self.buckets[name].reserve(weight)
+        if endpoint is not None:
+            # The exchange counts every request at least once against its endpoint quota
+            wait += self._reserve_quota(endpoint, math.ceil(weight))
+        return wait
+
+    def acquire(self, name, weight=1, endpoint=None):
+        wait = self.reserve(name, weight, endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, name, weight=1, endpoint=None):
+        """``acquire`` for coroutines, waits without blocking the event loop."""
+        wait = self.reserve(name, weight, endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _reserve_quota(self, endpoint, weight):
+        with self.quota_lock:
+            quota = self.quotas.get(endpoint)
+            if quota is None:
+                return 0.0
+            now = time.time()
+            if now >= quota["reset_at"]:
+                # Window has rolled over, the next response will report the new quota
+                return 0.0
+            wait = 0.0
+            if quota["remaining"] <= 0:
+                wait = quota["reset_at"] - now
+            elif quota["remaining"] < quota["limit"] * self.low_quota_ratio:
+                # Give each caller the next free slot after the ones already handed out,
+                # spreading what is left of the quota over what is left of the window
+                start = max(now, quota.get("next_slot", 0.0))
+                slot = start + (quota["reset_at"] - start) / quota["remaining"] * weight
+                quota["next_slot"] = slot
+                wait = slot - now
+            quota["remaining"] -= weight
+            return wait
+
+    def update_quota(self, endpoint, remaining, limit=None, reset_at=None):
+        """Record the quota reported for ``endpoint``. ``reset_at`` is an epoch in seconds."""
+        with self.quota_lock:
+            quota = self.quotas.setdefault(endpoint, {"remaining": remaining, "limit": remaining, "reset_at": 0.0})
+            quota["remaining"] = remaining
+            if limit is not None:
+                quota["limit"] = limit
+            quota["reset_at"] = reset_at if reset_at is not None else time.time() + 1
+            quota["updated"] = time.time()
+
+    def update_quota_from_headers(self, endpoint, headers):
+        """Feed Bybit v5 rate limit headers of a response into the endpoint quota."""
+        if not headers:
+            return
+        headers = {key.lower(): value for key, value in headers.items()}
+        remaining = headers.get("x-bapi-limit-status")
+        if remaining is None:
+            return
+        try:
+            limit = headers.get("x-bapi-limit")
+            reset = headers.get("x-bapi-limit-reset-timestamp")
+            self.update_quota(
+                endpoint,
+                int(remaining),
+                int(limit) if limit is not None else None,
+                int(reset) / 1000 if reset is not None else None,
+            )
+        except ValueError:
+            pass
+
+    def quota_metrics(self):
+        """Remaining quota per endpoint as reported by the exchange."""
+        now = time.time()
+        with self.quota_lock:
+            return {
+                endpoint: {
+                    "remaining": quota["remaining"],
+                    "limit": quota["limit"],
+                    "reset_in": max(0.0, quota["reset_at"] - now),
+                }
+                for endpoint, quota in self.quotas.items()
+            }
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Process-wide ``RateLimiter``. Set DIRECTIONALSCALPER_SHARED_RATE_LIMIT to a name
+    (e.g. the account) to share the buckets with other bot processes on the host.
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(shared_prefix=os.environ.get(SHARED_RATE_LIMIT_ENV) or None)
+        return _rate_limiter
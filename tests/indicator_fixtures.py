@@ -0,0 +1,70 @@
+"""Synthetic candles and an offline scraper for the indicator stage, shared by the tests and benchmark_indicator_panel.py."""
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from api.exchanges.bybit import Bybit
+from api.multiprocessing_api import CANDLE_COLUMNS, CombinedScraper
+
+MINUTE_MS = 60000
+
+
+def candles(rng, bars, minutes, end_ms):
+    step = minutes * MINUTE_MS
+    timestamps = end_ms // step * step - step * np.arange(bars - 1, -1, -1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002 * np.sqrt(minutes), bars)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.002, bars))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.002, bars))
+    volume = rng.uniform(10, 5000, bars) * (rng.uniform(0, 1, bars) > 0.02)  # Some bars without trades
+    return pd.DataFrame({"timestamp": timestamps, "open": open_, "high": high, "low": low, "close": close, "volume": volume}, columns=CANDLE_COLUMNS)
+
+
+def synthetic_universe(symbols, short, bars=None, seed=7):
+    """1m, 15m and 4h candles like the fetch stage, the ``short`` last symbols with half the 1m history."""
+    rng = np.random.default_rng(seed)
+    end_ms = int(time.time() * 1000) // MINUTE_MS * MINUTE_MS - MINUTE_MS
+    bars = bars or CombinedScraper.KLINE_SERIES["1m"]
+    universe = {}
+    for i in range(symbols + short):
+        universe[f"SYM{i}USDT"] = {
+            "1m": candles(rng, bars if i < symbols else bars // 2, 1, end_ms),
+            "15m": candles(rng, CombinedScraper.KLINE_SERIES["15m"], 15, end_ms),
+            "4h": candles(rng, CombinedScraper.KLINE_SERIES["4h"], 240, end_ms),
+        }
+    return universe
+
+
+def offline_scraper(symbols):
+    # A scraper with the state analyse_frames reads, without the network calls of __init__
+    scraper = CombinedScraper.__new__(CombinedScraper)
+    scraper.exchange = Bybit()
+    scraper.exchange_name = "bybit"
+    scraper.FUNDING_CACHE_DURATION = timedelta(hours=4)
+    scraper.symbols = list(symbols)
+    scraper.symbols_info = {symbol: {"min_order_qty": 1.0} for symbol in symbols}
+    scraper.prices = {symbol: float(frames["1m"]["close"].iat[-1]) for symbol, frames in symbols.items()}
+    now = pd.Timestamp.now().to_pydatetime()
+    scraper.funding_cache = {symbol: (now, 0.01) for symbol in symbols}
+    return scraper
+
+
+def compare(expected, actual):
+    """{column: mismatched rows} between two analyse_frames results, empty when they agree."""
+    expected = expected.sort_values("Asset").reset_index(drop=True)
+    actual = actual.sort_values("Asset").reset_index(drop=True)
+    assert list(expected["Asset"]) == list(actual["Asset"]), "different symbols"
+    mismatches = {}
+    for column in CombinedScraper.OUTPUT_COLUMNS:
+        if column == "Timestamp":
+            continue
+        left, right = expected[column], actual[column]
+        if pd.api.types.is_float_dtype(left) or pd.api.types.is_float_dtype(right):
+            same = np.isclose(left.astype(float), right.astype(float), rtol=1e-9, atol=1e-12, equal_nan=True)
+        else:
+            same = (left == right).to_numpy()
+        if not same.all():
+            mismatches[column] = int((~same).sum())
+    return mismatches
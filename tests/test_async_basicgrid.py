@@ -0,0 +1,139 @@
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+async_basicgrid = pytest.importorskip("directionalscalper.core.strategies.bybit.scalping.async_basicgrid")
+
+
+class FakeAsyncExchange:
+    """AsyncBybitExchange stand-in keeping an order book of the strategy's own orders."""
+
+    def __init__(self):
+        self.orders = {}
+        self.ids = itertools.count(1)
+        self.calls = []
+
+    async def cancel_all_orders(self, symbol):
+        self.calls.append("cancel_all")
+        self.orders.clear()
+
+    async def get_market_info(self, symbol):
+        return {"min_qty": 1.0, "qty_step": 1.0, "tick_size": 0.001, "max_leverage": 25.0}
+
+    async def set_leverage(self, leverage, symbol):
+        self.calls.append("set_leverage")
+
+    async def get_balance(self, quote="USDT"):
+        self.calls.append("balance")
+        return 1000.0
+
+    async def create_limit_orders(self, symbol, orders):
+        self.calls.append(("create", len(orders)))
+        results = []
+        for order in orders:
+            order_id = str(next(self.ids))
+            self.orders[order_id] = {
+                "id": order_id, "side": order["side"], "price": order["price"], "amount": order["qty"],
+                "reduceOnly": order.get("reduceOnly", False), "clientOrderId": order.get("orderLinkId"),
+            }
+            results.append({"id": order_id})
+        return results
+
+    async def amend_orders(self, symbol, amendments):
+        self.calls.append(("amend", len(amendments)))
+        for amendment in amendments:
+            self.orders[amendment["id"]].update(price=amendment["price"], amount=amendment["qty"])
+        return [amendment["id"] for amendment in amendments]
+
+    async def cancel_orders(self, symbol, order_ids):
+        self.calls.append(("cancel", len(order_ids)))
+        for order_id in order_ids:
+            self.orders.pop(order_id, None)
+        return order_ids
+
+    def snapshot(self, price, long_qty=0.0, long_price=None):
+        positions = []
+        if long_qty:
+            positions.append({"side": "long", "contracts": long_qty, "entryPrice": long_price, "unrealizedPnl": 0.0})
+        return {
+            "symbol": "DOGEUSDT",
+            "ticker": {"last": price},
+            "orderbook": {"bids": [[price - 0.001, 100]], "asks": [[price + 0.001, 100]]},
+            "positions": positions,
+            "open_orders": [dict(order) for order in self.orders.values()],
+        }
+
+    def entry_orders(self, side):
+        return [order for order in self.orders.values() if order["side"] == side and not order["reduceOnly"]]
+
+
+def bot_config(**overrides):
+    config = SimpleNamespace(
+        wallet_exposure_limit=0.5,
+        user_defined_leverage_long=5,
+        user_defined_leverage_short=5,
+        linear_grid={
+            "levels": 5, "strength": 1.4, "outer_price_distance": 0.05, "long_mode": True, "short_mode": True,
+            "reissue_threshold": 0.01, "buffer_percentage": 0.1, "enforce_full_grid": True,
+        },
+        upnl_profit_pct=0.01,
+        blacklist=[],
+    )
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return config
+
+
+def test_basicgrid_is_registered_on_the_async_runtime():
+    from directionalscalper.core.strategies.bybit.async_runtime import ASYNC_STRATEGIES
+
+    assert ASYNC_STRATEGIES["basicgrid"] is async_basicgrid.AsyncBybitBasicGrid
+
+
+def test_basicgrid_refuses_risk_features_it_does_not_run():
+    with pytest.raises(ValueError, match="stoploss_enabled"):
+        async_basicgrid.AsyncBybitBasicGrid(FakeAsyncExchange(), None, bot_config(stoploss_enabled=True))
+
+
+def test_basicgrid_lays_keeps_moves_grids_and_takes_profit():
+    exchange = FakeAsyncExchange()
+    strategy = async_basicgrid.AsyncBybitBasicGrid(exchange, None, bot_config())
+
+    async def scenario():
+        await strategy.setup("DOGEUSDT")
+
+        # First iteration lays both grids, five levels each, in one batch per side
+        assert await strategy.iterate("DOGEUSDT", exchange.snapshot(0.5))
+        assert exchange.calls[-2:] == [("create", 5), ("create", 5)]
+        buy_prices = sorted(order["price"] for order in exchange.entry_orders("buy"))
+        assert len(buy_prices) == 5 and max(buy_prices) < 0.5
+        assert len({order["clientOrderId"] for order in exchange.orders.values()}) == 10
+
+        # A small move keeps every order
+        calls = len(exchange.calls)
+        await strategy.iterate("DOGEUSDT", exchange.snapshot(0.502))
+        assert exchange.calls[calls:] == []
+
+        # Past the reissue threshold the grids are amended in place, not recreated
+        await strategy.iterate("DOGEUSDT", exchange.snapshot(0.52))
+        assert ("create", 5) not in exchange.calls[calls:]
+        assert all(call[0] == "amend" for call in exchange.calls[calls:])
+        assert max(order["price"] for order in exchange.entry_orders("buy")) > max(buy_prices)
+
+        # A long position gets one reduce-only take profit, resized when the position grows
+        await strategy.iterate("DOGEUSDT", exchange.snapshot(0.52, long_qty=40.0, long_price=0.5))
+        take_profits = [order for order in exchange.orders.values() if order["reduceOnly"]]
+        assert [(order["side"], order["amount"], order["price"]) for order in take_profits] == [("sell", 40.0, 0.505)]
+
+        await strategy.iterate("DOGEUSDT", exchange.snapshot(0.52, long_qty=60.0, long_price=0.49))
+        take_profits = [order for order in exchange.orders.values() if order["reduceOnly"]]
+        assert [(order["amount"], order["price"]) for order in take_profits] == [(60.0, 0.495)]
+
+        # Closing the position cancels the long grid, which is laid again right away
+        calls = len(exchange.calls)
+        await strategy.iterate("DOGEUSDT", exchange.snapshot(0.52))
+        assert exchange.calls[calls:calls + 2] == [("cancel", 5), ("create", 5)]
+
+    asyncio.run(scenario())
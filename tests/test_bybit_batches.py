@@ -0,0 +1,82 @@
+import pytest
+
+bybit = pytest.importorskip("directionalscalper.core.exchanges.bybit")
+
+
+class FakeClient:
+    """ccxt bybit stand-in recording the v5 batch requests."""
+
+    def __init__(self):
+        self.requests = []
+
+    def market(self, symbol):
+        settle = symbol.split(":")[1] if ":" in symbol else None
+        return {
+            "id": symbol.split(":")[0].replace("/", ""),
+            "spot": settle is None,
+            "linear": settle == "USDT",
+            "inverse": settle is not None and settle != "USDT",
+        }
+
+    def price_to_precision(self, symbol, price):
+        return f"{price:.2f}"
+
+    def amount_to_precision(self, symbol, amount):
+        return f"{amount:.0f}"
+
+    def private_post_v5_order_cancel_batch(self, params):
+        self.requests.append(("cancel", params))
+        return {"retExtInfo": {"list": [{"code": 0} for _ in params["request"]]}}
+
+    def private_post_v5_order_amend_batch(self, params):
+        self.requests.append(("amend", params))
+        return {"retExtInfo": {"list": [{"code": 0} for _ in params["request"]]}}
+
+
+@pytest.fixture
+def exchange():
+    exchange = bybit.BybitExchange.__new__(bybit.BybitExchange)
+    exchange.exchange = FakeClient()
+    exchange.max_batch_orders = 2
+    return exchange
+
+
+def test_batch_cancel_chunks_and_defaults_to_linear(exchange):
+    assert exchange.cancel_orders_by_id_bybit(["1", None, "2", "3"], "BTC/USDT:USDT") == ["1", "2", "3"]
+    assert [(kind, params["category"], len(params["request"])) for kind, params in exchange.exchange.requests] == [
+        ("cancel", "linear", 2), ("cancel", "linear", 1),
+    ]
+
+
+def test_batch_helpers_use_the_category_of_the_market(exchange):
+    exchange.cancel_orders_by_id_bybit(["1"], "BTC/USD:BTC")
+    amended = exchange.amend_orders_bybit("BTC/USD:BTC", [{"id": "2", "price": 100.123, "qty": 5}])
+
+    assert amended == ["2"]
+    assert [(kind, params["category"]) for kind, params in exchange.exchange.requests] == [("cancel", "inverse"), ("amend", "inverse")]
+    assert exchange.exchange.requests[1][1]["request"] == [{"symbol": "BTCUSD", "orderId": "2", "price": "100.12", "qty": "5"}]
+
+
+def test_spot_orders_are_cancelled_as_spot(exchange):
+    exchange.cancel_orders_by_id_bybit(["1"], "BTC/USDT")
+    exchange.cancel_orders_by_id_bybit(["2"], "BTC/USDT", category="linear")
+    assert [params["category"] for kind, params in exchange.exchange.requests] == ["spot", "linear"]
+
+
+def open_order(order_id, side, link_id="", reduce_only=False, position_idx=0):
+    return {"id": order_id, "side": side, "clientOrderId": link_id, "reduceOnly": reduce_only,
+            "info": {"orderLinkId": link_id, "reduceOnly": reduce_only, "positionIdx": position_idx}}
+
+
+def test_cancel_by_side_filters_side_prefix_and_reduce_only(exchange):
+    open_orders = [
+        open_order("1", "buy", "BTC_b_0_aa"),
+        open_order("2", "buy", "ar-1", reduce_only=True, position_idx=2),
+        open_order("3", "sell", "ar-2", reduce_only=True, position_idx=1),
+        open_order("4", "sell", "BTC_s_0_bb"),
+    ]
+    cancel = exchange.cancel_orders_by_side_bybit
+    assert cancel("BTC/USDT:USDT", "long", open_orders=open_orders) == ["1", "2"]
+    assert cancel("BTC/USDT:USDT", order_link_id_prefix="ar-", open_orders=open_orders) == ["2", "3"]
+    assert cancel("BTC/USDT:USDT", "sell", reduce_only=True, position_idx=1, open_orders=open_orders) == ["3"]
+    assert cancel("BTC/USDT:USDT", "sell", reduce_only=False, open_orders=open_orders) == ["4"]
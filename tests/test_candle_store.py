@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from directionalscalper.core.exchanges.candle_store import CandleBuffer, CandleStore, resample
+
+MINUTE_MS = 60000
+
+
+def bar(timestamp, close, volume=1.0):
+    return [timestamp, close, close + 1, close - 1, close, volume]
+
+
+def test_append_replaces_the_in_progress_bar_and_drops_older_ones():
+    buffer = CandleBuffer(capacity=3)
+    buffer.extend([bar(0, 10), bar(60000, 11), bar(60000, 12), bar(0, 99)])
+
+    assert buffer.view().tolist() == [bar(0, 10), bar(60000, 12)]
+
+    buffer.extend([bar(120000, 13), bar(180000, 14)])
+    # Full: the oldest bar makes room, views stay oldest first
+    assert buffer.view()[:, 0].tolist() == [60000, 120000, 180000]
+    assert buffer.view(limit=2)[:, 4].tolist() == [13, 14]
+
+
+def test_resample_aggregates_aligned_buckets():
+    # 1m bars from 00:03 to 00:14, the 00:00 bucket is incomplete and dropped
+    candles = np.array([bar(minute * MINUTE_MS, 100 + minute, volume=minute) for minute in range(3, 15)], dtype=np.float64)
+    five_minutes = resample(candles, 5 * MINUTE_MS)
+
+    assert five_minutes.tolist() == [
+        [5 * MINUTE_MS, 105, 110, 104, 109, 5 + 6 + 7 + 8 + 9],
+        [10 * MINUTE_MS, 110, 115, 109, 114, 10 + 11 + 12 + 13 + 14],
+    ]
+
+
+class KlineFetcher:
+    """fetch_ohlcv stand-in over a growing 1m series, recording every call."""
+
+    def __init__(self, end_ms, bars):
+        self.calls = []
+        self.series = [bar(end_ms - MINUTE_MS * i, 100.0 + i) for i in range(bars - 1, -1, -1)]
+
+    def __call__(self, symbol, timeframe, since=None, limit=None):
+        self.calls.append({"since": since, "limit": limit})
+        rows = [row for row in self.series if since is None or row[0] >= since]
+        return [list(row) for row in rows[-limit:]]
+
+
+def test_refresh_only_fetches_since_the_newest_bar():
+    end_ms = int(time.time() * 1000) // MINUTE_MS * MINUTE_MS
+    fetch = KlineFetcher(end_ms, bars=50)
+    store = CandleStore(capacity=100, max_fetch=1000, refresh_interval=0)
+
+    assert len(store.get_candles(fetch, "BTCUSDT", "1m", 50)) == 50
+    assert fetch.calls == [{"since": None, "limit": 50}]
+
+    # The in-progress bar moved and a new one opened
+    fetch.series[-1] = bar(end_ms, 200.0)
+    fetch.series.append(bar(end_ms + MINUTE_MS, 201.0))
+    candles = store.get_candles(fetch, "BTCUSDT", "1m", 50)
+
+    assert fetch.calls[-1] == {"since": end_ms, "limit": 1000}
+    assert candles[-2:, 4].tolist() == [200.0, 201.0]
+    assert candles[0, 0] == end_ms - 48 * MINUTE_MS
+
+
+def test_refresh_interval_serves_the_buffer():
+    fetch = KlineFetcher(int(time.time() * 1000) // MINUTE_MS * MINUTE_MS, bars=20)
+    store = CandleStore(capacity=100, refresh_interval=60)
+    store.get_candles(fetch, "BTCUSDT", "1m", 20)
+    store.get_candles(fetch, "BTCUSDT", "1m", 10)
+    assert len(fetch.calls) == 1
+
+
+def test_a_stale_buffer_is_fetched_again_in_full():
+    end_ms = int(time.time() * 1000) // MINUTE_MS * MINUTE_MS
+    fetch = KlineFetcher(end_ms - 30 * MINUTE_MS, bars=20)
+    store = CandleStore(capacity=100, max_fetch=25, refresh_interval=0)
+    store.get_candles(fetch, "BTCUSDT", "1m", 20)
+
+    # 30 bars behind with a page of 25: a since fetch could leave a gap
+    store.get_candles(fetch, "BTCUSDT", "1m", 20)
+    assert fetch.calls == [{"since": None, "limit": 20}, {"since": None, "limit": 20}]
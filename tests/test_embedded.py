@@ -0,0 +1,56 @@
+import pytest
+
+from api import snapshot
+from api.embedded import EmbeddedDataSource
+
+ASSETS = {
+    "Asset": ["AUSDT", "BUSDT", "CUSDT", "DUSDT"],
+    "1m 1x Volume (USDT)": [20000.0, 90000.0, 100.0, None],
+    "5m 1x Volume (USDT)": [80000.0, 400000.0, 20000.0, 1000.0],
+    "ERI Trend": ["bullish", "bearish", "bullish", "bearish"],
+    "Funding": [0.0001, -0.0002, 0.0, None],
+}
+
+
+@pytest.fixture
+def source():
+    source = EmbeddedDataSource("bybit")
+    source.publish({"columns": ASSETS, "generated_at": 1700000000.0})
+    return source
+
+
+def assets(records):
+    return [record["Asset"] for record in records]
+
+
+def test_urls_are_served_from_the_snapshot_views(source):
+    assert assets(source.dataset_for("https://api.quantumvoid.org/volumedata/quantdatav2_bybit.json")) == ["AUSDT", "BUSDT", "CUSDT", "DUSDT"]
+    assert assets(source.dataset_for("rotatorsymbols_bybit.json")) == ["BUSDT", "AUSDT"]
+    assert assets(source.dataset_for("rotatorsymbols_bybit_bullish.json")) == ["AUSDT"]
+    assert assets(source.dataset_for("rotatorsymbols_bybit_bearish.json")) == ["BUSDT"]
+    assert source.dataset_for("negativefunding_bybit.json") == [
+        {"Asset": "BUSDT", "1m 1x Volume (USDT)": 90000.0, "Funding": -0.0002},
+    ]
+    assert source.dataset_for("rotatorsymbols_bybit_atrp.json") is None
+
+
+def test_records_and_arrow_views_agree():
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    table = snapshot.pa.Table.from_pandas(pd.DataFrame(ASSETS), preserve_index=False)
+    records = table.to_pylist()
+    for view in snapshot.VIEWS:
+        assert snapshot.select_records(records, view) == snapshot.select(table, view).to_pylist(), view
+
+
+def test_shared_snapshot_serves_the_same_views(tmp_path):
+    pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    source = EmbeddedDataSource("bybit", snapshot_path=tmp_path / "data" / "quantdatav2_bybit.arrow")
+    source.publish({"columns": ASSETS, "generated_at": 1700000000.0})
+
+    # What a worker process maps in 'snapshot' mode
+    reader = snapshot.SnapshotReader(tmp_path / "data" / "quantdatav2_bybit.arrow")
+    for view in snapshot.VIEWS:
+        assert reader.records(view) == source.datasets[view], view
+    assert reader.generated_at == 1700000000.0
@@ -0,0 +1,174 @@
+import pytest
+
+from directionalscalper.core.strategies.grid_reconciler import ORDER_LINK_ID_MAX_LENGTH, grid_order_link_id, plan_grid_orders
+
+
+def test_grid_order_link_ids_are_unique_within_a_batch():
+    # Close levels on a sub-$1 symbol share the level prefix and the millisecond
+    levels = [0.0123 + i * 0.00001 for i in range(10)]
+    ids = [grid_order_link_id("DOGEUSDT", "buy", level) for level in levels]
+
+    assert len(set(ids)) == len(ids)
+    assert all(len(order_link_id) <= ORDER_LINK_ID_MAX_LENGTH for order_link_id in ids)
+
+
+def test_grid_order_link_id_fits_long_symbols():
+    order_link_id = grid_order_link_id("1000000BABYDOGEUSDT", "sell", 123456.789)
+
+    assert order_link_id.startswith("100_s_12345_")
+    assert len(order_link_id) <= ORDER_LINK_ID_MAX_LENGTH
+
+
+def live_order(order_id, price, amount):
+    return {"id": order_id, "price": price, "amount": amount}
+
+
+def test_plan_keeps_matching_orders():
+    live = [live_order("a", 100.0, 1.0), live_order("b", 101.0, 1.0)]
+
+    plan = plan_grid_orders("BTCUSDT", "buy", [(100.0, 1.0), (101.0, 1.0)], live, tick_size=0.5)
+
+    assert [(order["id"], price) for order, price in plan.keep] == [("a", 100.0), ("b", 101.0)]
+    assert plan.is_noop()
+    assert plan.request_count() == 0
+
+
+def test_plan_price_tolerance_edges():
+    live = [live_order("a", 100.5, 1.0), live_order("b", 102.0, 1.0)]
+    desired = [(100.0, 1.0), (103.0, 1.0)]
+
+    # One tick away is kept, two ticks away is amended
+    plan = plan_grid_orders("BTCUSDT", "buy", desired, live, tick_size=0.5, tolerance_ticks=1)
+    assert [(order["id"], price) for order, price in plan.keep] == [("a", 100.0)]
+    assert [(order["id"], price, qty) for order, price, qty in plan.amend] == [("b", 103.0, 1.0)]
+
+    plan = plan_grid_orders("BTCUSDT", "buy", desired, live, tick_size=0.5, tolerance_ticks=2)
+    assert [order["id"] for order, price in plan.keep] == ["a", "b"]
+    assert plan.is_noop()
+
+
+def test_plan_without_tick_size_needs_exact_prices():
+    live = [live_order("a", 100.5, 1.0)]
+
+    plan = plan_grid_orders("BTCUSDT", "buy", [(100.0, 1.0)], live, tick_size=None)
+
+    assert plan.keep == []
+    assert [(order["id"], price) for order, price, qty in plan.amend] == [("a", 100.0)]
+
+
+def test_plan_quantity_tolerance_edges():
+    live = [live_order("a", 100.0, 1.05), live_order("b", 101.0, 1.25)]
+
+    plan = plan_grid_orders("BTCUSDT", "buy", [(100.0, 1.0), (101.0, 1.0)], live, tick_size=0.5, qty_step=0.1)
+
+    # Within half a qty step is kept, more is amended to the desired size
+    assert [order["id"] for order, price in plan.keep] == ["a"]
+    assert [(order["id"], price, qty) for order, price, qty in plan.amend] == [("b", 101.0, 1.0)]
+
+
+def test_plan_amends_nearest_orders_first():
+    live = [live_order("a", 90.0, 1.0), live_order("b", 110.0, 1.0)]
+
+    plan = plan_grid_orders("BTCUSDT", "sell", [(111.0, 1.0), (91.0, 1.0)], live, tick_size=0.5)
+
+    assert sorted((order["id"], price) for order, price, qty in plan.amend) == [("a", 91.0), ("b", 111.0)]
+    assert plan.cancel == [] and plan.create == []
+
+
+def test_plan_cancels_surplus_orders():
+    live = [live_order("a", 100.0, 1.0), live_order("b", 105.0, 1.0), live_order("c", 106.0, 1.0)]
+
+    plan = plan_grid_orders("BTCUSDT", "buy", [(100.0, 1.0), (106.0, 1.0)], live, tick_size=0.5)
+
+    assert [order["id"] for order, price in plan.keep] == ["a", "c"]
+    assert [order["id"] for order in plan.cancel] == ["b"]
+    assert plan.amend == [] and plan.create == []
+    assert plan.request_count() == 1
+
+
+def test_plan_creates_missing_levels_and_skips_empty_ones():
+    live = [live_order("a", 100.0, 1.0)]
+    desired = [(100.0, 1.0), (99.0, 2.0), (98.0, 0), (97.0, None)]
+
+    plan = plan_grid_orders("BTCUSDT", "buy", desired, live, tick_size=0.5)
+
+    assert [order["id"] for order, price in plan.keep] == ["a"]
+    assert plan.create == [(99.0, 2.0)]
+    assert plan.cancel == [] and plan.amend == []
+
+
+def test_plan_keeps_sub_dollar_orders_one_tick_away():
+    live = [live_order("a", 0.0124, 1000.0)]
+
+    plan = plan_grid_orders("DOGEUSDT", "buy", [(0.0123, 1000.0)], live, tick_size=0.0001)
+
+    assert [order["id"] for order, price in plan.keep] == ["a"]
+    assert plan.is_noop()
+
+
+class FakeMarketRegistry:
+    def get_tick_size(self, symbol):
+        return 0.0001
+
+    def get_precision(self, symbol):
+        return {"amount": 1.0}
+
+
+class FakeExchange:
+    """Bybit adapter stand-in that records batch calls and rejects chosen amends and creates."""
+
+    def __init__(self, open_orders, rejected_amends=(), failed_prices=()):
+        self.market_registry = FakeMarketRegistry()
+        self.open_orders = open_orders
+        self.rejected_amends = set(rejected_amends)
+        self.failed_prices = set(failed_prices)
+        self.cancelled = []
+        self.amended = []
+        self.created = []
+
+    def get_open_orders(self, symbol):
+        return self.open_orders
+
+    def cancel_orders_by_id_bybit(self, order_ids, symbol):
+        self.cancelled.extend(order_ids)
+        return order_ids
+
+    def amend_orders_bybit(self, symbol, amendments):
+        self.amended.extend(amendments)
+        return [amendment["id"] for amendment in amendments if amendment["id"] not in self.rejected_amends]
+
+    def create_tagged_limit_orders_bybit(self, symbol, orders):
+        self.created.extend(orders)
+        return [
+            {"error": "rejected"} if order["price"] in self.failed_prices else {"id": f"new-{index}"}
+            for index, order in enumerate(orders)
+        ]
+
+
+def test_reconcile_tracks_filled_levels_and_sends_unique_ids():
+    bybit_strategy = pytest.importorskip("directionalscalper.core.strategies.bybit.bybit_strategy")
+    levels = [round(0.0120 + i * 0.0001, 4) for i in range(10)]
+    open_orders = [
+        {"id": "kept", "side": "buy", "price": 0.0120, "amount": 1000.0},
+        {"id": "moved", "side": "buy", "price": 0.0150, "amount": 1000.0},
+        {"id": "filled-meanwhile", "side": "buy", "price": 0.0160, "amount": 1000.0},
+        {"id": "take-profit", "side": "buy", "price": 0.0200, "amount": 1000.0, "reduceOnly": True},
+    ]
+    exchange = FakeExchange(open_orders, rejected_amends={"filled-meanwhile"}, failed_prices={0.0121})
+    strategy = bybit_strategy.BybitStrategy.__new__(bybit_strategy.BybitStrategy)
+    strategy.exchange = exchange
+    strategy.grid_reconcile_dry_run = False
+    strategy.grid_tolerance_ticks = 1
+    filled_levels = {0.0300}
+
+    plan = strategy.reconcile_grid_orders("DOGEUSDT", "buy", levels, [1000.0] * len(levels), True, filled_levels)
+
+    assert [order["id"] for order, price in plan.keep] == ["kept"]
+    assert sorted(amendment["id"] for amendment in exchange.amended) == ["filled-meanwhile", "moved"]
+    # The rejected amend is cancelled and its level placed again; the reduce-only order is left alone
+    assert exchange.cancelled == ["filled-meanwhile"]
+    assert len(exchange.created) == 8
+    order_link_ids = [order["orderLinkId"] for order in exchange.created]
+    assert len(set(order_link_ids)) == len(order_link_ids)
+    # Every level with a live order is filled, except the one whose create failed
+    assert filled_levels == set(levels) - {0.0121}
@@ -0,0 +1,19 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+pytest.importorskip("ta")
+
+from tests.indicator_fixtures import compare, offline_scraper, synthetic_universe
+
+
+def test_panel_matches_analyse_symbol():
+    # 40 symbols through the panel and 3 short-history ones through the per-symbol fallback
+    universe = synthetic_universe(symbols=40, short=3)
+    scraper = offline_scraper(universe)
+
+    per_symbol = scraper.analyse_frames(universe, processes=1, vectorised=False)
+    panel = scraper.analyse_frames(universe, processes=1, vectorised=True)
+
+    assert len(panel) == len(per_symbol) == 43
+    assert compare(per_symbol, panel) == {}
@@ -0,0 +1,28 @@
+import pytest
+
+pytest.importorskip("pandas")
+
+from api import manager as manager_module
+from api.manager import Manager
+
+
+def test_failed_refresh_backs_off_instead_of_retrying_every_poll(monkeypatch):
+    responses = [({"ETag": "v1"}, [{"Asset": "BTCUSDT"}])]
+    calls = []
+
+    def send_public_request(url, max_retries=5, headers=None):
+        calls.append(url)
+        return responses.pop(0) if responses else (None, None)
+
+    monkeypatch.setattr(manager_module, "send_public_request", send_public_request)
+    manager = Manager(None, url="https://example.invalid/quantdata.json", cache_life_seconds=60, background_refresh=False)
+    entry = manager.url_cache[manager.url]
+    assert manager.data == [{"Asset": "BTCUSDT"}]
+
+    # Expired and the remote API down: the cached payload is kept, the next try waits
+    entry.expires_at = 0.0
+    started_at = manager_module.time.time()
+    assert manager.refresh_url(manager.url) == [{"Asset": "BTCUSDT"}]
+    assert len(calls) == 2
+    assert entry.expires_at >= started_at + manager.refresh_retry_seconds
+    assert not entry.refreshing
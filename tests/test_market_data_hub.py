@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from directionalscalper.core.exchanges import bybit_stream
+from directionalscalper.core.exchanges.market_data_hub import MarketDataHub
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(json.loads(message))
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    # A connected hub without its WebSocket thread, frames are fed to handle_message
+    monkeypatch.setattr(bybit_stream, "websocket", object())
+    hub = MarketDataHub(depth=50)
+    hub.running = True
+    hub.ws = FakeSocket()
+    hub._on_open(hub.ws)
+    return hub
+
+
+def orderbook_frame(kind, bids, asks, update_id, symbol="BTCUSDT"):
+    return json.dumps({
+        "topic": f"orderbook.50.{symbol}", "type": kind, "ts": 1700000000000,
+        "data": {"s": symbol, "b": bids, "a": asks, "u": update_id, "seq": update_id},
+    })
+
+
+def ticker_frame(kind, data, symbol="BTCUSDT"):
+    return json.dumps({"topic": f"tickers.{symbol}", "type": kind, "ts": 1700000000000, "data": {"symbol": symbol, **data}})
+
+
+def test_subscribes_each_symbol_once(hub):
+    hub.subscribe("BTC/USDT:USDT")
+    hub.subscribe("BTCUSDT")
+    assert hub.ws.sent == [{"op": "subscribe", "args": ["orderbook.50.BTCUSDT", "tickers.BTCUSDT"]}]
+
+
+def test_orderbook_snapshot_and_deltas(hub):
+    hub.handle_message(orderbook_frame("snapshot", [["100.0", "1"], ["99.5", "2"]], [["100.5", "3"], ["101.0", "4"]], 1))
+    # Delta: resize a bid, drop an ask, add a better bid
+    hub.handle_message(orderbook_frame("delta", [["99.5", "5"], ["100.2", "0.5"]], [["100.5", "0"]], 2))
+
+    assert hub.get_orderbook("BTC/USDT:USDT") == {
+        "bids": [[100.2, 0.5], [100.0, 1.0], [99.5, 5.0]],
+        "asks": [[101.0, 4.0]],
+    }
+    assert hub.get_orderbook("BTCUSDT", depth=1) == {"bids": [[100.2, 0.5]], "asks": [[101.0, 4.0]]}
+    assert hub.orderbooks["BTCUSDT"]["update_id"] == 2
+
+
+def test_delta_without_snapshot_is_ignored(hub):
+    hub.handle_message(orderbook_frame("delta", [["1.0", "1"]], [["1.1", "1"]], 5, symbol="ETHUSDT"))
+    assert hub.get_orderbook("ETHUSDT") is None
+
+
+def test_ticker_deltas_update_the_snapshot(hub):
+    hub.handle_message(ticker_frame("snapshot", {"lastPrice": "100.1", "bid1Price": "100.0", "ask1Price": "100.2", "volume24h": "5000"}))
+    hub.handle_message(ticker_frame("delta", {"bid1Price": "100.4", "ask1Price": "100.6"}))
+
+    ticker = hub.get_ticker("BTC/USDT:USDT")
+    assert ticker["lastPrice"] == "100.1" and ticker["volume24h"] == "5000"
+    assert hub.get_current_price("BTCUSDT") == pytest.approx(100.5)
+
+
+def test_current_price_falls_back_to_the_book(hub):
+    hub.handle_message(ticker_frame("snapshot", {"lastPrice": "100.1"}))
+    hub.handle_message(orderbook_frame("snapshot", [["100.0", "1"]], [["100.4", "1"]], 1))
+    assert hub.get_current_price("BTCUSDT") == pytest.approx(100.2)
+
+
+def test_nothing_is_served_while_disconnected_or_silent(hub):
+    hub.handle_message(ticker_frame("snapshot", {"bid1Price": "1", "ask1Price": "2"}))
+    hub.handle_message(orderbook_frame("snapshot", [["1", "1"]], [["2", "1"]], 1))
+
+    hub.last_message_time -= hub.stale_after + 1
+    assert hub.get_ticker("BTCUSDT") is None
+
+    hub.handle_message(json.dumps({"op": "pong", "success": True}))
+    assert hub.get_ticker("BTCUSDT") is not None
+
+    hub._on_close(hub.ws)
+    assert hub.get_ticker("BTCUSDT") is None and hub.get_orderbook("BTCUSDT") is None
+
+
+def test_reconnect_resubscribes_and_waits_for_new_snapshots(hub):
+    hub.subscribe("BTCUSDT")
+    hub.handle_message(orderbook_frame("snapshot", [["1", "1"]], [["2", "1"]], 1))
+
+    hub._on_close(hub.ws)
+    hub.ws = FakeSocket()
+    hub._on_open(hub.ws)
+
+    assert hub.ws.sent == [{"op": "subscribe", "args": ["orderbook.50.BTCUSDT", "tickers.BTCUSDT"]}]
+    assert hub.get_orderbook("BTCUSDT") is None
+    hub.handle_message(orderbook_frame("delta", [["1", "2"]], [], 2))
+    assert hub.get_orderbook("BTCUSDT") is None
@@ -0,0 +1,60 @@
+import pytest
+
+pytest.importorskip("ccxt")
+pytest.importorskip("pandas")
+
+from directionalscalper.core.exchanges.exchange import Exchange
+from directionalscalper.core.exchanges.market_registry import MarketRegistry
+
+MARKETS = {
+    "swap": {"BTC/USDT:USDT": {"id": "BTCUSDT", "symbol": "BTC/USDT:USDT", "linear": True, "precision": {"price": 0.1, "amount": 0.001}}},
+    "spot": {"BTC/USDT": {"id": "BTCUSDT", "symbol": "BTC/USDT", "spot": True, "precision": {"price": 0.01, "amount": 0.0001}}},
+}
+
+
+class FakeClient:
+    """ccxt client that counts market downloads."""
+
+    downloads = []
+
+    def __init__(self, market_type):
+        self.market_type = market_type
+        self.markets = {}
+
+    def load_markets(self, reload=False):
+        FakeClient.downloads.append(self.market_type)
+        self.markets = dict(MARKETS[self.market_type])
+        return self.markets
+
+    def set_markets(self, markets):
+        self.markets = {market["symbol"]: market for market in markets}
+
+
+class OfflineExchange(Exchange):
+    def initialise(self):
+        self.exchange = FakeClient(self.market_type)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registries(monkeypatch):
+    monkeypatch.setattr(MarketRegistry, "_instances", {})
+    monkeypatch.setattr(MarketRegistry, "_start_refresh", lambda self: None)
+    FakeClient.downloads = []
+
+
+def test_every_instance_gets_a_seeded_client():
+    first = OfflineExchange("fake", "key", "secret")
+    second = OfflineExchange("fake", "key", "secret")
+
+    assert FakeClient.downloads == ["swap"]
+    assert second.exchange.markets == first.exchange.markets
+    assert first.symbols == second.symbols == ["BTC/USDT:USDT"]
+
+
+def test_each_market_type_loads_its_own_registry():
+    OfflineExchange("fake", "key", "secret")
+    spot = OfflineExchange("fake", "key", "secret", market_type="spot")
+
+    assert FakeClient.downloads == ["swap", "spot"]
+    assert spot.symbols == ["BTC/USDT"]
+    assert spot.get_price_precision("BTC/USDT") == 2
@@ -0,0 +1,44 @@
+import json
+import time
+
+import pytest
+
+from rate_limit import RateLimiter, request_weight
+
+
+def test_request_weight_charges_reads_at_their_own_limit():
+    assert request_weight("/v5/position/list") == 0.2
+    assert request_weight("/v5/order/realtime") == 0.2
+    assert request_weight("/v5/order/create") == 1
+    assert request_weight("/v5/market/tickers") == 1
+
+
+def test_request_weight_counts_every_order_of_a_batch():
+    body = json.dumps({"category": "linear", "request": [{"orderId": str(i)} for i in range(7)]})
+    assert request_weight("/v5/order/amend-batch", body) == 7
+    assert request_weight("/v5/order/cancel-batch", None) == 1
+    assert request_weight("/v5/order/create-batch", "not json") == 1
+
+
+def test_weights_take_tokens_from_the_group_bucket():
+    limiter = RateLimiter({"orders": {"rate": 10, "burst": 10}})
+    # 45 reads take 9 of the 10 tokens, a flat weight would have waited after 10
+    for _ in range(45):
+        assert limiter.reserve("orders", request_weight("/v5/order/realtime")) == 0
+    assert limiter.reserve("orders", 2) > 0
+
+
+def test_a_read_counts_once_against_its_endpoint_quota():
+    limiter = RateLimiter({"account": {"rate": 10, "burst": 10}})
+    limiter.update_quota("/v5/position/list", remaining=40, limit=50, reset_at=2e9)
+    limiter.reserve("account", request_weight("/v5/position/list"), "/v5/position/list")
+    assert limiter.quotas["/v5/position/list"]["remaining"] == 39
+
+
+def test_low_quota_callers_get_successive_slots():
+    limiter = RateLimiter({"orders": {"rate": 1000, "burst": 1000}})
+    limiter.update_quota("/v5/order/create", remaining=5, limit=100, reset_at=time.time() + 1)
+    waits = [limiter.reserve("orders", 1, "/v5/order/create") for _ in range(5)]
+    # Five callers at once share the last second instead of all waiting the same 0.2s
+    assert waits == pytest.approx([0.2, 0.4, 0.6, 0.8, 1.0], abs=0.05)
+    assert limiter.reserve("orders", 1, "/v5/order/create") == pytest.approx(1.0, abs=0.05)
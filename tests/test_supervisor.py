@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from directionalscalper.core.supervisor import AccountCoordinator, ConsistentHashRing, SymbolSupervisor
+
+SYMBOLS = [f"SYM{i}USDT" for i in range(200)]
+
+
+class LocalManager:
+    """multiprocessing Manager stand-in, the coordinator's state stays in this process."""
+
+    Lock = threading.Lock
+    dict = dict
+
+
+@pytest.fixture
+def coordinator():
+    return AccountCoordinator(LocalManager())
+
+
+def owners(assignment):
+    return {symbol: node for node, symbols in assignment.items() for symbol in symbols}
+
+
+def test_assignment_is_stable_as_the_key_set_changes():
+    ring = ConsistentHashRing(range(4))
+    before = owners(ring.assign(SYMBOLS))
+    after = owners(ring.assign(SYMBOLS[20:] + ["NEW1USDT", "NEW2USDT"]))
+
+    assert set(before.values()) == {0, 1, 2, 3}
+    assert all(after[symbol] == before[symbol] for symbol in SYMBOLS[20:])
+    assert set(ConsistentHashRing(range(4)).assign([])) == {0, 1, 2, 3}
+
+
+def test_removing_a_node_only_moves_its_keys():
+    ring = ConsistentHashRing(range(4))
+    before = owners(ring.assign(SYMBOLS))
+    ring.remove_node(3)
+    after = owners(ring.assign(SYMBOLS))
+
+    assert {symbol for symbol in SYMBOLS if after[symbol] != before[symbol]} == {symbol for symbol in SYMBOLS if before[symbol] == 3}
+
+
+def test_rebalance_publishes_the_assignment(coordinator):
+    supervisor = SymbolSupervisor.__new__(SymbolSupervisor)
+    supervisor.num_workers = 3
+    supervisor.coordinator = coordinator
+    supervisor.ring = ConsistentHashRing(range(3))
+    supervisor.assignment = {}
+
+    first = supervisor.rebalance(SYMBOLS[:50])
+    second = supervisor.rebalance(SYMBOLS[10:60])
+
+    assert all(owners(second)[symbol] == owners(first)[symbol] for symbol in SYMBOLS[10:50])
+    assert {worker_id: coordinator.get_assignment(worker_id) for worker_id in range(3)} == second
+
+
+def test_claims_are_refused_at_the_limit(coordinator):
+    coordinator.publish_account([], {"USDT": 100}, ["BTCUSDT"])
+
+    assert coordinator.try_claim("ETHUSDT", 0, symbols_allowed=2)
+    assert not coordinator.try_claim("SOLUSDT", 1, symbols_allowed=2)
+    # Symbols with an open position and a worker's own claims are always granted
+    assert coordinator.try_claim("BTCUSDT", 1, symbols_allowed=2)
+    assert coordinator.try_claim("ETHUSDT", 0, symbols_allowed=2)
+
+    coordinator.release("ETHUSDT", 0)
+    assert coordinator.try_claim("SOLUSDT", 1, symbols_allowed=2)
+
+
+class DeadProcess:
+    exitcode = 1
+
+    def is_alive(self):
+        return False
+
+
+def test_a_dead_workers_claims_are_released(coordinator):
+    coordinator.try_claim("ETHUSDT", 0, symbols_allowed=3)
+    coordinator.try_claim("SOLUSDT", 0, symbols_allowed=3)
+    coordinator.try_claim("XRPUSDT", 1, symbols_allowed=3)
+
+    supervisor = SymbolSupervisor.__new__(SymbolSupervisor)
+    supervisor.coordinator = coordinator
+    supervisor.processes = {0: DeadProcess()}
+    restarted = []
+    supervisor.start_worker = restarted.append
+    supervisor.check_workers()
+
+    assert restarted == [0]
+    assert dict(coordinator.claims) == {"XRPUSDT": 1}
+    assert coordinator.try_claim("DOGEUSDT", 1, symbols_allowed=3)